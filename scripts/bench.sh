@@ -0,0 +1,5 @@
+#!/bin/sh
+
+set -eo pipefail
+
+uv run python -m benchmarks $@
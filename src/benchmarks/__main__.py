@@ -0,0 +1,129 @@
+import json
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+from benchmarks import fixtures
+from benchmarks.run import (
+    BACKENDS,
+    bench_adapter,
+    bench_pagination,
+    bench_parsing,
+    compare,
+    metadata,
+    report,
+)
+from benchmarks.server import BenchmarkServer
+from satvu.http import create_http_client
+
+parser = ArgumentParser(__package__, description="SDK benchmarks")
+commands = parser.add_subparsers(dest="command", required=True)
+
+run_parser = commands.add_parser("run", help="Run the benchmarks")
+run_parser.add_argument(
+    "--backend",
+    action="append",
+    choices=BACKENDS,
+    help="HTTP backend to benchmark, may be repeated (default: all installed)",
+)
+run_parser.add_argument(
+    "--service",
+    action="append",
+    help="Service to benchmark parsing and pagination of (default: all)",
+)
+run_parser.add_argument(
+    "--requests", type=int, default=1000, help="Requests timed per backend"
+)
+run_parser.add_argument(
+    "--download-mib", type=int, default=64, help="Size of the download in MiB"
+)
+run_parser.add_argument(
+    "--examples-dir",
+    type=Path,
+    default=fixtures.EXAMPLES_CACHE_DIR,
+    help="Cached hypothesis examples (default: .cache/hypothesis-examples)",
+)
+run_parser.add_argument(
+    "--output",
+    type=Path,
+    help="Write results as JSON (default: .benchmarks/{commit}.json)",
+)
+
+compare_parser = commands.add_parser("compare", help="Compare the results of two runs")
+compare_parser.add_argument("old", type=Path)
+compare_parser.add_argument("new", type=Path)
+compare_parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="Relative change counted as a regression (default: 0.1)",
+)
+
+args = parser.parse_args()
+
+if args.command == "compare":
+    changes = compare(
+        json.loads(args.old.read_text()),
+        json.loads(args.new.read_text()),
+        threshold=args.threshold,
+    )
+    for metric, old, new, change, regressed in changes:
+        flag = "  REGRESSED" if regressed else ""
+        print(f"{metric:<72} {old:>12.2f} {new:>12.2f} {change:>+8.1%}{flag}")
+    sys.exit(1 if any(change[-1] for change in changes) else 0)
+
+backends = []
+for backend in args.backend or BACKENDS:
+    try:
+        create_http_client(backend)
+    except ImportError:
+        if args.backend:
+            raise
+        print(f"Skipping {backend}: not installed", file=sys.stderr)
+        continue
+    backends.append(backend)
+
+operations = {}
+caches = {}
+for service in args.service or fixtures.services():
+    operations[service], caches[service] = fixtures.load(service, args.examples_dir)
+missing = [service for service, path in caches.items() if path is None]
+if missing:
+    print(
+        f"No cached examples for {', '.join(missing)} in {args.examples_dir}, "
+        "generate them with: python -m builder <API_NAME> --cached --generate-tests",
+        file=sys.stderr,
+    )
+
+results: dict = {"adapters": {}, "parsing": {}, "pagination": {}}
+served = {
+    fixtures.service_class(service).base_path: found
+    for service, found in operations.items()
+}
+with BenchmarkServer(served) as server:
+    for backend in backends:
+        print(f"Benchmarking {backend}", file=sys.stderr)
+        results["adapters"][backend] = bench_adapter(
+            backend,
+            server.url,
+            requests=args.requests,
+            download_size=args.download_mib * 2**20,
+        )
+        for service, found in operations.items():
+            for name, metrics in bench_pagination(
+                service, found, backend, server.url
+            ).items():
+                results["pagination"].setdefault(name, {})[backend] = metrics
+
+for service, found in operations.items():
+    print(f"Benchmarking {service} parsing", file=sys.stderr)
+    results["parsing"].update(bench_parsing(found))
+
+report(results)
+run = {"meta": metadata(caches), "results": results}
+output = (
+    args.output or Path(".benchmarks") / f"{run['meta']['commit'] or 'results'}.json"
+)
+output.parent.mkdir(parents=True, exist_ok=True)
+output.write_text(json.dumps(run, indent=2) + "\n")
+print(f"Results written to {output}", file=sys.stderr)
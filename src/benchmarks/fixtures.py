@@ -0,0 +1,236 @@
+"""
+Fixtures served by the benchmark server.
+
+Responses come from the hypothesis examples cached by the builder in
+.cache/hypothesis-examples/{api_name}-{spec_hash}.json, keyed by
+"{path}|{method}|response|{status}". They are matched to the generated
+services by reading each endpoint method's route and parsed response type
+from its source.
+"""
+
+import ast
+import importlib
+import inspect
+import json
+import pkgutil
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import satvu.services
+from satvu.core import SDKClient
+
+EXAMPLES_CACHE_DIR = Path.cwd() / ".cache" / "hypothesis-examples"
+
+SYNTHETIC_DOCUMENT = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "id": f"feature-{i}",
+            "geometry": {"type": "Point", "coordinates": [i * 0.5, 51.5]},
+            "properties": {
+                "datetime": "2025-01-01T00:00:00Z",
+                "platform": "HotSat-1",
+                "view:off_nadir": 12.5,
+                "eo:cloud_cover": i % 100,
+            },
+            "links": [],
+        }
+        for i in range(16)
+    ],
+    "links": [],
+}
+"""Served by /_bench/json, so adapter timings don't depend on the examples."""
+
+
+@dataclass
+class Operation:
+    """An endpoint method of a generated service."""
+
+    service: str
+    """Service package, e.g. "otm"."""
+    name: str
+    """Method name, e.g. "get_tasking_orders"."""
+    method: str
+    path: str
+    """Route template relative to the service's base path."""
+    responses: dict[int, Any] = field(default_factory=dict)
+    """Type each status code's JSON body is parsed into."""
+    examples: dict[int, list[Any]] = field(default_factory=dict)
+    """Cached response examples per status code."""
+
+
+def _route(node: ast.expr | None) -> str | None:
+    """The route template of a make_request(url=...) argument."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if not isinstance(node, ast.JoinedStr):
+        return None
+    parts = []
+    for value in node.values:
+        if isinstance(value, ast.Constant):
+            parts.append(value.value)
+        elif isinstance(value, ast.FormattedValue):
+            parts.append("{" + ast.unparse(value.value) + "}")
+    return "".join(parts)
+
+
+def _parsed_status(node: ast.If) -> int | None:
+    """Status of an ``if response.status_code == N`` test."""
+    test = node.test
+    if not (
+        isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Attribute)
+        and test.left.attr == "status_code"
+    ):
+        return None
+    status = test.comparators[0]
+    if isinstance(status, ast.Constant) and isinstance(status.value, int):
+        return status.value
+    return None
+
+
+def _request(function: ast.FunctionDef) -> tuple[str, str] | None:
+    """Method and route of the make_request() call of a function."""
+    for node in ast.walk(function):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "make_request"
+        ):
+            keywords = {keyword.arg: keyword.value for keyword in node.keywords}
+            method = keywords.get("method")
+            route = _route(keywords.get("route") or keywords.get("url"))
+            if (
+                isinstance(method, ast.Constant)
+                and isinstance(method.value, str)
+                and route is not None
+            ):
+                return method.value.lower(), route
+    return None
+
+
+def _operation(
+    service: str,
+    function: ast.FunctionDef,
+    requests: dict[str, tuple[str, str]],
+    namespace: dict[str, Any],
+) -> Operation | None:
+    request = requests.get(function.name)
+    responses: dict[int, Any] = {}
+    for node in ast.walk(function):
+        # Endpoints may send their request through a private _{name}_response()
+        if (
+            request is None
+            and isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in requests
+        ):
+            request = requests[node.func.attr]
+        elif isinstance(node, ast.If) and (status := _parsed_status(node)):
+            for statement in node.body:
+                call = statement.value if isinstance(statement, ast.Return) else None
+                if (
+                    isinstance(call, ast.Call)
+                    and isinstance(call.func, ast.Attribute)
+                    and call.func.attr == "parse_json"
+                ):
+                    responses[status] = eval(ast.unparse(call.args[1]), namespace)
+    if request is None:
+        return None
+    method, path = request
+    return Operation(service, function.name, method, path, responses)
+
+
+def service_class(service: str) -> type[SDKClient]:
+    """The SDKClient subclass of a generated service package."""
+    module = importlib.import_module(f"satvu.services.{service}.api")
+    return next(
+        value
+        for value in vars(module).values()
+        if inspect.isclass(value)
+        and issubclass(value, SDKClient)
+        and value.__module__ == module.__name__
+    )
+
+
+def services() -> list[str]:
+    """Generated service packages."""
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules(satvu.services.__path__)
+        if module.ispkg
+    )
+
+
+def operations(service: str) -> list[Operation]:
+    """Endpoint methods of a service, in source order."""
+    cls = service_class(service)
+    module = inspect.getmodule(cls)
+    tree = ast.parse(inspect.getsource(cls))
+    functions = [
+        node
+        for node in tree.body[0].body  # type: ignore[attr-defined]
+        if isinstance(node, ast.FunctionDef)
+    ]
+    requests = {
+        function.name: request
+        for function in functions
+        if (request := _request(function)) is not None
+    }
+    found = []
+    for function in functions:
+        if function.name.startswith("_"):
+            continue
+        operation = _operation(service, function, requests, vars(module))
+        if operation is not None:
+            found.append(operation)
+    return found
+
+
+def cache_file(service: str, cache_dir: Path = EXAMPLES_CACHE_DIR) -> Path | None:
+    """The most recent examples cache of a service, None if it was never built."""
+    files = sorted(
+        cache_dir.glob(f"{service}-*.json"), key=lambda path: path.stat().st_mtime
+    )
+    return files[-1] if files else None
+
+
+def load(
+    service: str, cache_dir: Path = EXAMPLES_CACHE_DIR
+) -> tuple[list[Operation], Path | None]:
+    """A service's operations, with the cached examples of their responses."""
+    found = operations(service)
+    path = cache_file(service, cache_dir)
+    if path is None:
+        return found, None
+    cached = json.loads(path.read_text())
+    for operation in found:
+        for status in operation.responses:
+            key = f"{operation.path}|{operation.method}|response|{status}"
+            if cached.get(key):
+                operation.examples[status] = cached[key]
+    return found, path
+
+
+def examples(operations: list[Operation]) -> Iterator[tuple[Operation, int, Any]]:
+    """Each cached response example, with its operation and status."""
+    for operation in operations:
+        for status, values in operation.examples.items():
+            for value in values:
+                yield operation, status, value
+
+
+__all__ = [
+    "EXAMPLES_CACHE_DIR",
+    "SYNTHETIC_DOCUMENT",
+    "Operation",
+    "cache_file",
+    "examples",
+    "load",
+    "operations",
+    "service_class",
+    "services",
+]
@@ -0,0 +1,344 @@
+"""
+Benchmarks of the HTTP adapters, response parsing and pagination.
+
+Results are nested dicts of metrics. Metric names end in their unit, and
+those ending in "_per_sec" are better when higher, all others when lower.
+"""
+
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from benchmarks.fixtures import Operation, service_class
+from benchmarks.server import PAGES
+from satvu.http import create_http_client
+from satvu.shared.parsing import ResponseAdapter, parse_response
+
+Backend = Literal["stdlib", "httpx", "urllib3", "requests"]
+
+BACKENDS: list[Backend] = ["stdlib", "httpx", "urllib3", "requests"]
+
+_ARGUMENTS: dict[Any, Any] = {
+    UUID: UUID(int=1),
+    str: "bench",
+    int: 1,
+    float: 1.0,
+    bool: True,
+}
+"""Values passed for the required parameters of paginated endpoints."""
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+
+def _close(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if close is not None:
+        close()
+
+
+def _timed(func: Callable[[], Any], min_time: float) -> tuple[int, float]:
+    """Call func repeatedly for at least min_time seconds."""
+    calls = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - started
+    return calls, elapsed
+
+
+def bench_adapter(
+    backend: Backend,
+    url: str,
+    requests: int = 1000,
+    download_size: int = 64 * 1024 * 1024,
+) -> dict[str, float]:
+    """
+    Latency, throughput and memory of one HTTP backend.
+
+    Requests are sent one at a time over a kept-alive connection.
+
+    Args:
+        backend: Backend name for create_http_client()
+        url: URL of a BenchmarkServer
+        requests: Requests to time
+        download_size: Bytes downloaded to measure throughput
+    """
+    client = create_http_client(backend, base_url=url)
+
+    def get(path: str) -> Any:
+        return client.request("GET", path, timeout=30.0).unwrap()
+
+    def fetch(path: str) -> bytes:
+        return get(path).body
+
+    try:
+        for _ in range(min(requests, 50)):
+            fetch("/_bench/json")
+
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(requests):
+            sent = time.perf_counter()
+            fetch("/_bench/json")
+            latencies.append(time.perf_counter() - sent)
+        elapsed = time.perf_counter() - started
+
+        download_times = []
+        for _ in range(3):
+            sent = time.perf_counter()
+            for _chunk in get(f"/_bench/bytes/{download_size}").iter_bytes(65536):
+                pass
+            download_times.append(time.perf_counter() - sent)
+
+        # Memory allocated while making a request, above what was already in use
+        peaks = []
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            for _ in range(100):
+                in_use = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                fetch("/_bench/json")
+                peaks.append(tracemalloc.get_traced_memory()[1] - in_use)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        retained = sum(stat.count_diff for stat in after.compare_to(before, "lineno"))
+    finally:
+        _close(client)
+
+    return {
+        "requests_per_sec": requests / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "download_mib_per_sec": download_size
+        / statistics.median(download_times)
+        / 2**20,
+        "alloc_peak_kib": statistics.median(peaks) / 1024,
+        "retained_blocks": retained / 100,
+    }
+
+
+def _model_name(annotation: Any) -> str:
+    if isinstance(annotation, ResponseAdapter):
+        annotation = annotation.annotation
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return repr(annotation).replace("typing.", "").rsplit(".", 1)[-1]
+
+
+def bench_parsing(
+    operations: list[Operation], min_time: float = 0.2
+) -> dict[str, dict[str, float]]:
+    """
+    Time decoding and validating each model's cached response examples.
+
+    Args:
+        operations: Operations of one service, with their examples
+        min_time: Seconds to spend parsing the examples of each model
+    """
+    bodies: dict[str, tuple[Any, list[bytes]]] = {}
+    for operation in operations:
+        for status, examples in operation.examples.items():
+            annotation = operation.responses[status]
+            name = f"{operation.service}.{_model_name(annotation)}"
+            bodies.setdefault(name, (annotation, []))[1].extend(
+                json.dumps(example).encode() for example in examples
+            )
+
+    results = {}
+    for name, (annotation, raw) in sorted(bodies.items()):
+        valid = []
+        for body in raw:
+            try:
+                parse_response(json.loads(body), annotation)
+                valid.append(body)
+            except ValidationError:
+                pass
+        if not valid:
+            continue
+        data = [json.loads(body) for body in valid]
+
+        def decode(raw: list[bytes] = valid) -> None:
+            for body in raw:
+                json.loads(body)
+
+        def validate(data: list[Any] = data, annotation: Any = annotation) -> None:
+            for value in data:
+                parse_response(value, annotation)
+
+        decode_calls, decode_time = _timed(decode, min_time / 2)
+        validate_calls, validate_time = _timed(validate, min_time / 2)
+        decode_us = decode_time / decode_calls / len(valid) * 1e6
+        validate_us = validate_time / validate_calls / len(valid) * 1e6
+        results[name] = {
+            "examples": len(valid),
+            "invalid_examples": len(raw) - len(valid),
+            "bytes": statistics.mean(len(body) for body in valid),
+            "decode_us": decode_us,
+            "validate_us": validate_us,
+            "parse_us": decode_us + validate_us,
+        }
+    return results
+
+
+def _arguments(method: Callable[..., Any]) -> dict[str, Any] | None:
+    """Values for the required parameters of method, None if one is unknown."""
+    arguments = {}
+    for name, parameter in inspect.signature(method).parameters.items():
+        if parameter.default is not inspect.Parameter.empty:
+            continue
+        if parameter.annotation not in _ARGUMENTS:
+            return None
+        arguments[name] = _ARGUMENTS[parameter.annotation]
+    return arguments
+
+
+def bench_pagination(
+    service: str,
+    operations: list[Operation],
+    backend: Backend,
+    url: str,
+    min_time: float = 0.5,
+) -> dict[str, dict[str, float]]:
+    """
+    Time following every page of the service's GET ``*_iter`` paginators.
+
+    Args:
+        service: Service package, e.g. "otm"
+        operations: Operations of the service, with their examples
+        backend: Backend name for create_http_client()
+        url: URL of a BenchmarkServer serving the operations
+        min_time: Seconds to spend paginating each endpoint
+    """
+    cls = service_class(service)
+    client = create_http_client(backend, base_url=url + cls.base_path)
+    sdk_client = cls(env=None, get_token=lambda: "bench", http_client=client)  # type: ignore[call-arg]
+    results = {}
+    try:
+        for operation in operations:
+            iterate = getattr(sdk_client, f"{operation.name}_iter", None)
+            examples = operation.examples.get(200, [])
+            if (
+                iterate is None
+                or operation.method != "get"
+                or not examples
+                or not isinstance(examples[0], dict)
+                or "links" not in examples[0]
+            ):
+                continue
+            arguments = _arguments(iterate)
+            if arguments is None:
+                continue
+
+            def paginate(iterate=iterate, arguments=arguments) -> int:
+                return sum(1 for _ in iterate(**arguments))
+
+            if paginate() != PAGES:
+                continue
+            calls, elapsed = _timed(paginate, min_time)
+            results[f"{service}.{operation.name}_iter"] = {
+                "pages_per_sec": calls * PAGES / elapsed,
+                "page_ms": elapsed / (calls * PAGES) * 1000,
+            }
+    finally:
+        _close(client)
+    return results
+
+
+def _commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def metadata(fixtures: dict[str, Path | None]) -> dict[str, Any]:
+    """Where and when results were measured."""
+    return {
+        "commit": _commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "fixtures": {
+            service: path.name if path else None for service, path in fixtures.items()
+        },
+    }
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Metrics keyed by their path, e.g. "adapters/httpx/p50_ms"."""
+    metrics = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{prefix}{key}/"))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[f"{prefix}{key}"] = float(value)
+    return metrics
+
+
+def compare(
+    old: dict[str, Any], new: dict[str, Any], threshold: float = 0.1
+) -> list[tuple[str, float, float, float, bool]]:
+    """
+    Compare the metrics of two runs.
+
+    Returns:
+        (metric, old, new, relative change, regressed) for each metric in
+        both runs. A metric regressed if it got worse by more than threshold.
+    """
+    before = flatten(old.get("results", {}))
+    after = flatten(new.get("results", {}))
+    changes = []
+    for metric in sorted(before.keys() & after.keys()):
+        unit = metric.rsplit("/", 1)[-1]
+        if not unit.endswith(("_per_sec", "_ms", "_us", "_kib")) or not before[metric]:
+            continue
+        change = (after[metric] - before[metric]) / before[metric]
+        worse = -change if unit.endswith("_per_sec") else change
+        changes.append(
+            (metric, before[metric], after[metric], change, worse > threshold)
+        )
+    return changes
+
+
+def report(results: dict[str, Any], file: Any = sys.stdout) -> None:
+    """Print results as a table."""
+    for metric, value in flatten(results).items():
+        print(f"{metric:<72} {value:>12.2f}", file=file)
+
+
+__all__ = [
+    "BACKENDS",
+    "Backend",
+    "bench_adapter",
+    "bench_pagination",
+    "bench_parsing",
+    "compare",
+    "flatten",
+    "metadata",
+    "report",
+]
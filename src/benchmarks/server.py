@@ -0,0 +1,173 @@
+"""
+Local stand-in for the SatVu APIs.
+
+Serves the cached response examples of the generated services under their
+base paths, so benchmarks run offline and without credentials. GET
+endpoints whose examples have STAC links are served as PAGES pages, linked
+by "next" links with a page number as the token.
+
+Also serves, for the HTTP adapter benchmarks:
+
+- /_bench/json: a fixed JSON document, independent of the examples
+- /_bench/bytes/{size}: size bytes of binary data
+"""
+
+import json
+import re
+import threading
+from collections.abc import Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.fixtures import SYNTHETIC_DOCUMENT, Operation
+
+PAGES = 5
+"""Pages served by paginated endpoints."""
+
+CHUNK_SIZE = 64 * 1024
+_CHUNK = bytes(range(256)) * (CHUNK_SIZE // 256)
+
+
+def _pattern(base_path: str, route: str) -> re.Pattern[str]:
+    """Match the paths of a route template, e.g. "/{contract_id}/search"."""
+    parts = re.split(r"\{[^}]+\}", base_path.rstrip("/") + route)
+    return re.compile("[^/]+".join(re.escape(part) for part in parts) + "$")
+
+
+def _paged(example: Any, url: str, page: int) -> Any:
+    """A page of a paginated example, linking to the next page."""
+    links = [link for link in example["links"] if link.get("rel") != "next"]
+    if page < PAGES:
+        template = example["links"][0] if example["links"] else {}
+        links.append(
+            {
+                **template,
+                "href": f"{url}?token={page + 1}",
+                "rel": "next",
+                "method": "GET",
+                "type": "application/json",
+            }
+        )
+    return {**example, "links": links}
+
+
+class _Route:
+    def __init__(self, base_path: str, operation: Operation):
+        self.pattern = _pattern(base_path, operation.path)
+        self.method = operation.method.upper()
+        self.status, examples = next(iter(operation.examples.items()))
+        self.example = examples[0]
+        self.paginated = (
+            self.method == "GET"
+            and isinstance(self.example, dict)
+            and isinstance(self.example.get("links"), list)
+        )
+
+    def body(self, url: str, query: str) -> bytes:
+        example = self.example
+        if self.paginated:
+            token = parse_qs(query).get("token", ["1"])[0]
+            example = _paged(example, url, int(token) if token.isdigit() else 1)
+        return json.dumps(example).encode()
+
+
+class BenchmarkServer(ThreadingHTTPServer):
+    """
+    HTTP server answering with the examples of the given services.
+
+    Example:
+        >>> with BenchmarkServer({"/otm/v2": operations}) as server:
+        ...     client = create_http_client("stdlib", base_url=server.url)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, services: dict[str, Iterable[Operation]] | None = None):
+        """
+        Args:
+            services: Operations of each service, keyed by its base path
+        """
+        super().__init__(("127.0.0.1", 0), _Handler)
+        routes = [
+            _Route(base_path, operation)
+            for base_path, operations in (services or {}).items()
+            for operation in operations
+            if operation.examples
+        ]
+        # Prefer literal segments, e.g. /webhooks/test over /webhooks/{id}
+        self.routes = sorted(
+            routes, key=lambda route: route.pattern.pattern.count("[^/]+")
+        )
+        self.document = json.dumps(SYNTHETIC_DOCUMENT).encode()
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="satvu-bench-server", daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "BenchmarkServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: BenchmarkServer
+
+    def parse_request(self) -> bool:
+        # The SDK sends lower case methods
+        parsed = super().parse_request()
+        self.command = self.command.upper()
+        return parsed
+
+    def _respond(self) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        if url.path == "/_bench/json":
+            return self._send(200, self.server.document)
+        if url.path.startswith("/_bench/bytes/"):
+            return self._send_bytes(int(url.path.rsplit("/", 1)[1]))
+        for route in self.server.routes:
+            if route.method == self.command and route.pattern.match(url.path):
+                return self._send(
+                    route.status, route.body(self.server.url + url.path, url.query)
+                )
+        self._send(404, b'{"detail": "Not Found"}')
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_bytes(self, size: int) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        while size > 0:
+            chunk = _CHUNK[: min(size, CHUNK_SIZE)]
+            self.wfile.write(chunk)
+            size -= len(chunk)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+__all__ = ["PAGES", "BenchmarkServer"]
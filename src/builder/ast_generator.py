@@ -12,21 +12,30 @@ from builder.streaming_detector import StreamingEndpointConfig
 class ASTMethodBuilder:
     """Builder for generating streaming method AST nodes."""
 
-    def __init__(self, config: StreamingEndpointConfig):
+    def __init__(self, config: StreamingEndpointConfig, is_async: bool = False):
         """
         Initialize builder with streaming endpoint configuration.
 
         Args:
             config: Configuration for the streaming endpoint
+            is_async: Generate a coroutine method for the async service
         """
         self.config = config
+        self.is_async = is_async
 
-    def build_method(self) -> ast.FunctionDef:
+    core_method = "download_to_file"
+    """SDKClient method the generated method delegates to."""
+
+    @property
+    def method_name(self) -> str:
+        return self.config.stream_method
+
+    def build_method(self) -> ast.FunctionDef | ast.AsyncFunctionDef:
         """
         Build complete streaming method as AST node.
 
         Returns:
-            AST FunctionDef node for the streaming method
+            AST FunctionDef (or AsyncFunctionDef) node for the streaming method
         """
         # Path params are always required (used in URL formatting)
         path_params = self.config.path_params
@@ -49,8 +58,9 @@ class ASTMethodBuilder:
         # Build return annotation
         return_annotation = self._build_return_annotation()
 
-        return ast.FunctionDef(
-            name=self.config.stream_method,
+        function_def = ast.AsyncFunctionDef if self.is_async else ast.FunctionDef
+        return function_def(
+            name=self.method_name,
             args=args,
             body=full_body,
             decorator_list=[],
@@ -71,17 +81,8 @@ class ASTMethodBuilder:
         for name, type_ in path_params:
             args.append(ast.arg(arg=name, annotation=parse_type_annotation(type_)))
 
-        # Add output_path (required positional)
-        args.append(
-            ast.arg(
-                arg="output_path",
-                annotation=ast.BinOp(
-                    left=ast.Name(id="Path", ctx=ast.Load()),
-                    op=ast.BitOr(),
-                    right=ast.Name(id="str", ctx=ast.Load()),
-                ),
-            )
-        )
+        # Add output_path, or output_dir and members (required positional)
+        args.extend(self._target_arguments())
 
         # Add query params as keyword-only with None defaults
         positional_args = []
@@ -99,64 +100,85 @@ class ASTMethodBuilder:
             kw_defaults.append(ast.Constant(value=None))
 
         # Add standard streaming params (chunk_size, progress_callback, timeout)
-        kw_args.extend(
-            [
+        for arg, default in self._option_arguments():
+            kw_args.append(arg)
+            kw_defaults.append(default)
+
+        return ast.arguments(
+            posonlyargs=positional_args,
+            args=args,
+            kwonlyargs=kw_args,
+            kw_defaults=kw_defaults,
+            defaults=[],
+        )
+
+    def _target_arguments(self) -> list[ast.arg]:
+        """Required arguments after the path params: where to save the download."""
+        return [ast.arg(arg="output_path", annotation=_path_or_str())]
+
+    def _option_arguments(self) -> list[tuple[ast.arg, ast.expr]]:
+        """Keyword-only transfer options with their defaults."""
+        return [
+            (
                 ast.arg(
                     arg="chunk_size", annotation=ast.Name(id="int", ctx=ast.Load())
                 ),
+                ast.Constant(value=self.config.default_chunk_size),
+            ),
+            (
+                ast.arg(arg="progress_callback", annotation=_progress_callback()),
+                ast.Constant(value=None),
+            ),
+            (
+                ast.arg(arg="timeout", annotation=_optional("int")),
+                ast.Constant(value=None),
+            ),
+            (
                 ast.arg(
-                    arg="progress_callback",
-                    annotation=ast.BinOp(
-                        left=ast.Subscript(
-                            value=ast.Name(id="Callable", ctx=ast.Load()),
-                            slice=ast.Tuple(
-                                elts=[
-                                    ast.List(
-                                        elts=[
-                                            ast.Name(id="int", ctx=ast.Load()),
-                                            ast.BinOp(
-                                                left=ast.Name(id="int", ctx=ast.Load()),
-                                                op=ast.BitOr(),
-                                                right=ast.Constant(value=None),
-                                            ),
-                                        ],
-                                        ctx=ast.Load(),
-                                    ),
-                                    ast.Constant(value=None),
-                                ],
-                                ctx=ast.Load(),
-                            ),
-                            ctx=ast.Load(),
-                        ),
-                        op=ast.BitOr(),
-                        right=ast.Constant(value=None),
-                    ),
+                    arg="max_connections",
+                    annotation=ast.Name(id="int", ctx=ast.Load()),
+                ),
+                ast.Constant(value=self.config.default_max_connections),
+            ),
+            (
+                ast.arg(arg="resume", annotation=ast.Name(id="bool", ctx=ast.Load())),
+                ast.Constant(value=False),
+            ),
+            (
+                ast.arg(arg="digest", annotation=_optional("DigestAlgorithm")),
+                ast.Constant(value=None),
+            ),
+            (
+                ast.arg(
+                    arg="bandwidth_limiter", annotation=_optional("BandwidthLimiter")
                 ),
+                ast.Constant(value=None),
+            ),
+            (
                 ast.arg(
-                    arg="timeout",
-                    annotation=ast.BinOp(
-                        left=ast.Name(id="int", ctx=ast.Load()),
-                        op=ast.BitOr(),
-                        right=ast.Constant(value=None),
+                    arg="transfer_client",
+                    annotation=_optional(
+                        "AsyncHttpClient" if self.is_async else "HttpClient"
                     ),
                 ),
-            ]
-        )
-        kw_defaults.extend(
-            [
-                ast.Constant(value=self.config.default_chunk_size),
-                ast.Constant(value=None),  # progress_callback default
-                ast.Constant(value=None),  # timeout default
-            ]
-        )
+                ast.Constant(value=None),
+            ),
+        ]
 
-        return ast.arguments(
-            posonlyargs=positional_args,
-            args=args,
-            kwonlyargs=kw_args,
-            kw_defaults=kw_defaults,
-            defaults=[],
-        )
+    def _passthrough(self) -> list[str]:
+        """Arguments passed on to the core method by name."""
+        return [
+            "output_path",
+            "params",
+            "chunk_size",
+            "progress_callback",
+            "timeout",
+            "max_connections",
+            "resume",
+            "digest",
+            "bandwidth_limiter",
+            "transfer_client",
+        ]
 
     def _build_body(
         self,
@@ -166,14 +188,13 @@ class ASTMethodBuilder:
         """Build method body statements."""
         body: list[ast.stmt] = []
 
-        # 1. Build params dict (redirect + all query params)
-        params_dict_keys: list[ast.expr | None] = [ast.Constant(value="redirect")]
-        params_dict_values: list[ast.expr] = [ast.Constant(value=True)]
-
-        # Add all query params to params dict
-        for name, _ in query_params:
-            params_dict_keys.append(ast.Constant(value=name))
-            params_dict_values.append(ast.Name(id=name, ctx=ast.Load()))
+        # 1. Build params dict (all query params; download_to_file sets redirect)
+        params_dict_keys: list[ast.expr | None] = [
+            ast.Constant(value=name) for name, _ in query_params
+        ]
+        params_dict_values: list[ast.expr] = [
+            ast.Name(id=name, ctx=ast.Load()) for name, _ in query_params
+        ]
 
         body.append(
             ast.Assign(
@@ -188,140 +209,54 @@ class ASTMethodBuilder:
             for name, _ in path_params
         ]
 
-        # 3. Call self.make_request()
+        # 3. Return self.download_to_file(), which resolves the signed URL and
+        # fetches the file (in parallel byte ranges where supported)
+        passthrough = self._passthrough()
         body.append(
-            ast.Assign(
-                targets=[ast.Name(id="result", ctx=ast.Store())],
-                value=ast.Call(
-                    func=ast.Attribute(
-                        value=ast.Name(id="self", ctx=ast.Load()),
-                        attr="make_request",
-                        ctx=ast.Load(),
-                    ),
-                    args=[],
-                    keywords=[
-                        ast.keyword(arg="method", value=ast.Constant(value="get")),
-                        ast.keyword(
-                            arg="url",
-                            value=ast.Call(
-                                func=ast.Attribute(
-                                    value=ast.Constant(value=self.config.url_pattern),
-                                    attr="format",
-                                    ctx=ast.Load(),
-                                ),
-                                args=[],
-                                keywords=url_format_keywords,
-                            ),
-                        ),
-                        ast.keyword(
-                            arg="params", value=ast.Name(id="params", ctx=ast.Load())
-                        ),
-                        ast.keyword(
-                            arg="follow_redirects", value=ast.Constant(value=True)
-                        ),
-                        ast.keyword(
-                            arg="timeout", value=ast.Name(id="timeout", ctx=ast.Load())
+            ast.Return(
+                value=self._maybe_await(
+                    ast.Call(
+                        func=ast.Attribute(
+                            value=ast.Name(id="self", ctx=ast.Load()),
+                            attr=self.core_method,
+                            ctx=ast.Load(),
                         ),
-                    ],
-                ),
-            )
-        )
-
-        # 4. Error check: if is_err(result): return ResultErr(result.error())
-        # We use the is_err() type guard function (not the method) so pyright can
-        # narrow the type and know result.error() is valid
-        body.append(
-            ast.If(
-                test=ast.Call(
-                    func=ast.Name(id="is_err", ctx=ast.Load()),
-                    args=[ast.Name(id="result", ctx=ast.Load())],
-                    keywords=[],
-                ),
-                body=[
-                    ast.Return(
-                        value=ast.Call(
-                            func=ast.Name(id="ResultErr", ctx=ast.Load()),
-                            args=[
-                                ast.Call(
+                        args=[],
+                        keywords=[
+                            ast.keyword(
+                                arg="url",
+                                value=ast.Call(
                                     func=ast.Attribute(
-                                        value=ast.Name(id="result", ctx=ast.Load()),
-                                        attr="error",
+                                        value=ast.Constant(
+                                            value=self.config.url_pattern
+                                        ),
+                                        attr="format",
                                         ctx=ast.Load(),
                                     ),
                                     args=[],
-                                    keywords=[],
-                                )
-                            ],
-                            keywords=[],
-                        )
+                                    keywords=url_format_keywords,
+                                ),
+                            ),
+                        ]
+                        + [
+                            ast.keyword(
+                                arg=name, value=ast.Name(id=name, ctx=ast.Load())
+                            )
+                            for name in passthrough
+                        ],
                     )
-                ],
-                orelse=[],
-            )
-        )
-
-        # 5. Unwrap response
-        body.append(
-            ast.Assign(
-                targets=[ast.Name(id="response", ctx=ast.Store())],
-                value=ast.Call(
-                    func=ast.Attribute(
-                        value=ast.Name(id="result", ctx=ast.Load()),
-                        attr="unwrap",
-                        ctx=ast.Load(),
-                    ),
-                    args=[],
-                    keywords=[],
-                ),
-            )
-        )
-
-        # 6. Call self.stream_to_file()
-        body.append(
-            ast.Assign(
-                targets=[ast.Name(id="downloaded_path", ctx=ast.Store())],
-                value=ast.Call(
-                    func=ast.Attribute(
-                        value=ast.Name(id="self", ctx=ast.Load()),
-                        attr="stream_to_file",
-                        ctx=ast.Load(),
-                    ),
-                    args=[],
-                    keywords=[
-                        ast.keyword(
-                            arg="response",
-                            value=ast.Name(id="response", ctx=ast.Load()),
-                        ),
-                        ast.keyword(
-                            arg="output_path",
-                            value=ast.Name(id="output_path", ctx=ast.Load()),
-                        ),
-                        ast.keyword(
-                            arg="chunk_size",
-                            value=ast.Name(id="chunk_size", ctx=ast.Load()),
-                        ),
-                        ast.keyword(
-                            arg="progress_callback",
-                            value=ast.Name(id="progress_callback", ctx=ast.Load()),
-                        ),
-                    ],
-                ),
-            )
-        )
-
-        # 7. Return ResultOk(downloaded_path)
-        body.append(
-            ast.Return(
-                value=ast.Call(
-                    func=ast.Name(id="ResultOk", ctx=ast.Load()),
-                    args=[ast.Name(id="downloaded_path", ctx=ast.Load())],
-                    keywords=[],
                 )
             )
         )
 
         return body
 
+    def _maybe_await(self, call: ast.Call) -> ast.expr:
+        """Wrap a call in ``await`` when building an async method."""
+        if self.is_async:
+            return ast.Await(value=call)
+        return call
+
     def _build_docstring(
         self,
         path_params: list[tuple[str, str]],
@@ -337,6 +272,8 @@ class ASTMethodBuilder:
             [
                 "Downloads directly to disk using streaming, avoiding loading",
                 "the entire file into memory. Ideal for large files (1GB+).",
+                "When the storage server supports range requests, the file is",
+                "fetched as parallel byte ranges over max_connections connections.",
             ],
             # Args
             ["Args:"]
@@ -354,11 +291,19 @@ class ASTMethodBuilder:
                 "    progress_callback: Optional callback for download progress tracking.",
                 "                     Signature: callback(bytes_downloaded: int, total_bytes: int | None)",
                 "    timeout: Optional request timeout in seconds. Overrides the instance timeout.",
+                f"    max_connections (int): Concurrent range requests (default: {self.config.default_max_connections}). Use 1 for a single connection.",
+                "    resume (bool): Resume an interrupted download from <output_path>.part (default: False).",
+                '    digest: Optional "sha256", "md5" or "crc32c" digest computed while writing,',
+                "            checked against the server's checksum headers when present.",
+                "    bandwidth_limiter: Optional limiter to read the file through. Overrides the instance's.",
+                "    transfer_client: Optional client to fetch the signed URL with. Overrides the instance's.",
             ],
             # Returns
             [
                 "Returns:",
-                "    Result[Path, HttpError]: Ok(Path) on success, Err(HttpError) on failure",
+                "    Result[Path | DownloadedFile, HttpError]: Ok(Path) on success, or",
+                "    Ok(DownloadedFile) with the path and digest when digest is given.",
+                "    Err(HttpError) on failure, including ChecksumMismatchError.",
             ],
         ]
 
@@ -372,12 +317,181 @@ class ASTMethodBuilder:
         return ast.Expr(value=ast.Constant(value="\n".join(parts)))
 
     def _build_return_annotation(self) -> ast.Subscript:
-        """Build Result[Path, HttpError] return annotation."""
+        """Build Result[Path | DownloadedFile, HttpError] return annotation."""
+        return ast.Subscript(
+            value=ast.Name(id="Result", ctx=ast.Load()),
+            slice=ast.Tuple(
+                elts=[
+                    ast.BinOp(
+                        left=ast.Name(id="Path", ctx=ast.Load()),
+                        op=ast.BitOr(),
+                        right=ast.Name(id="DownloadedFile", ctx=ast.Load()),
+                    ),
+                    ast.Name(id="HttpError", ctx=ast.Load()),
+                ],
+                ctx=ast.Load(),
+            ),
+            ctx=ast.Load(),
+        )
+
+
+class ASTMembersMethodBuilder(ASTMethodBuilder):
+    """Builder for methods extracting selected members of a zip download."""
+
+    core_method = "extract_members"
+
+    @property
+    def method_name(self) -> str:
+        return self.config.members_method
+
+    def _target_arguments(self) -> list[ast.arg]:
+        return [
+            ast.arg(arg="output_dir", annotation=_path_or_str()),
+            ast.arg(
+                arg="members", annotation=ast.Name(id="MemberSelector", ctx=ast.Load())
+            ),
+        ]
+
+    def _option_arguments(self) -> list[tuple[ast.arg, ast.expr]]:
+        # Members are verified by their CRC-32 instead of resumed or digested
+        return [
+            option
+            for option in super()._option_arguments()
+            if option[0].arg not in ("resume", "digest", "transfer_client")
+        ]
+
+    def _passthrough(self) -> list[str]:
+        return [
+            "output_dir",
+            "members",
+            "params",
+            "chunk_size",
+            "progress_callback",
+            "timeout",
+            "max_connections",
+            "bandwidth_limiter",
+        ]
+
+    def _build_docstring(
+        self,
+        path_params: list[tuple[str, str]],
+        query_params: list[tuple[str, str]],
+    ) -> ast.Expr:
+        lines = [
+            self.config.members_docstring,
+            "",
+            "Reads the zip archive's central directory with a range request, then",
+            "fetches only the selected members and writes them to output_dir,",
+            "verifying their CRC-32. Member paths are kept relative to output_dir.",
+            "",
+            "Args:",
+            *[
+                f"    {name} ({type_}): {_get_param_description(name)}"
+                for name, type_ in path_params
+            ],
+            "    output_dir (Path | str): Directory to extract the members into.",
+            '    members: Glob pattern(s) matched against member names, e.g. "*.tif",',
+            "             or a predicate called with each member's zipfile.ZipInfo.",
+            *[
+                f"    {name} ({type_}): {_get_param_description(name)}"
+                for name, type_ in query_params
+            ],
+            f"    chunk_size (int): Bytes per chunk (default: {self.config.default_chunk_size}).",
+            "    progress_callback: Optional callback for download progress tracking.",
+            "                     Signature: callback(bytes_downloaded: int, total_bytes: int | None)",
+            "    timeout: Optional request timeout in seconds. Overrides the instance timeout.",
+            f"    max_connections (int): Members fetched concurrently (default: {self.config.default_max_connections}).",
+            "    bandwidth_limiter: Optional limiter to read the members through. Overrides the instance's.",
+            "",
+            "Returns:",
+            "    Result[list[Path], HttpError]: Ok(list of extracted files) on success,",
+            "    Err(HttpError) on failure",
+        ]
+        return ast.Expr(value=ast.Constant(value="\n".join(lines)))
+
+    def _build_return_annotation(self) -> ast.Subscript:
+        """Build Result[list[Path], HttpError] return annotation."""
+        return ast.Subscript(
+            value=ast.Name(id="Result", ctx=ast.Load()),
+            slice=ast.Tuple(
+                elts=[
+                    ast.Subscript(
+                        value=ast.Name(id="list", ctx=ast.Load()),
+                        slice=ast.Name(id="Path", ctx=ast.Load()),
+                        ctx=ast.Load(),
+                    ),
+                    ast.Name(id="HttpError", ctx=ast.Load()),
+                ],
+                ctx=ast.Load(),
+            ),
+            ctx=ast.Load(),
+        )
+
+
+class ASTOpenMethodBuilder(ASTMethodBuilder):
+    """Builder for methods opening a download as a lazily fetched file."""
+
+    core_method = "open_download"
+
+    @property
+    def method_name(self) -> str:
+        return self.config.open_method
+
+    def _target_arguments(self) -> list[ast.arg]:
+        return []
+
+    def _option_arguments(self) -> list[tuple[ast.arg, ast.expr]]:
+        return [
+            option
+            for option in super()._option_arguments()
+            if option[0].arg == "timeout"
+        ]
+
+    def _passthrough(self) -> list[str]:
+        return ["params", "timeout"]
+
+    def _build_docstring(
+        self,
+        path_params: list[tuple[str, str]],
+        query_params: list[tuple[str, str]],
+    ) -> ast.Expr:
+        if self.is_async:
+            description = [
+                "Downloads the file into a SpooledTemporaryFile, which keeps up to",
+                "spool_threshold bytes in memory and moves to disk beyond that.",
+            ]
+        else:
+            description = [
+                "Returns a seekable, read-only file that fetches byte ranges of the",
+                "signed URL as they are read, so zipfile.ZipFile only downloads the",
+                "parts of an archive it needs. Fetched ranges are kept in memory up",
+                "to spool_threshold bytes and spooled to a temporary file beyond that.",
+            ]
+        lines = [
+            self.config.open_docstring,
+            "",
+            *description,
+            "",
+            "Args:",
+            *[
+                f"    {name} ({type_}): {_get_param_description(name)}"
+                for name, type_ in path_params + query_params
+            ],
+            "    timeout: Optional request timeout in seconds. Overrides the instance timeout.",
+            "",
+            "Returns:",
+            "    Result[RemoteFile, HttpError]: Ok(RemoteFile) positioned at the start",
+            "    of the file, Err(HttpError) on failure",
+        ]
+        return ast.Expr(value=ast.Constant(value="\n".join(lines)))
+
+    def _build_return_annotation(self) -> ast.Subscript:
+        """Build Result[RemoteFile, HttpError] return annotation."""
         return ast.Subscript(
             value=ast.Name(id="Result", ctx=ast.Load()),
             slice=ast.Tuple(
                 elts=[
-                    ast.Name(id="Path", ctx=ast.Load()),
+                    ast.Name(id="RemoteFile", ctx=ast.Load()),
                     ast.Name(id="HttpError", ctx=ast.Load()),
                 ],
                 ctx=ast.Load(),
@@ -386,6 +500,46 @@ class ASTMethodBuilder:
         )
 
 
+def _path_or_str() -> ast.expr:
+    """Path | str"""
+    return ast.BinOp(
+        left=ast.Name(id="Path", ctx=ast.Load()),
+        op=ast.BitOr(),
+        right=ast.Name(id="str", ctx=ast.Load()),
+    )
+
+
+def _optional(type_name: str) -> ast.expr:
+    """<type_name> | None"""
+    return ast.BinOp(
+        left=ast.Name(id=type_name, ctx=ast.Load()),
+        op=ast.BitOr(),
+        right=ast.Constant(value=None),
+    )
+
+
+def _progress_callback() -> ast.expr:
+    """Callable[[int, int | None], None] | None"""
+    return ast.BinOp(
+        left=ast.Subscript(
+            value=ast.Name(id="Callable", ctx=ast.Load()),
+            slice=ast.Tuple(
+                elts=[
+                    ast.List(
+                        elts=[ast.Name(id="int", ctx=ast.Load()), _optional("int")],
+                        ctx=ast.Load(),
+                    ),
+                    ast.Constant(value=None),
+                ],
+                ctx=ast.Load(),
+            ),
+            ctx=ast.Load(),
+        ),
+        op=ast.BitOr(),
+        right=ast.Constant(value=None),
+    )
+
+
 def parse_type_annotation(type_str: str) -> ast.expr:
     """
     Parse type annotation string into AST expression.
@@ -431,17 +585,32 @@ def _get_param_description(param_name: str) -> str:
     return descriptions.get(param_name, "Parameter")
 
 
-def generate_streaming_method(config: StreamingEndpointConfig) -> str:
+def generate_streaming_method(
+    config: StreamingEndpointConfig,
+    is_async: bool = False,
+    members: bool = False,
+    open_file: bool = False,
+) -> str:
     """
     Generate streaming method code from config using AST.
 
     Args:
         config: Streaming endpoint configuration
+        is_async: Generate a coroutine method for the async service
+        members: Generate the method extracting selected zip members instead
+            of the one saving the whole file
+        open_file: Generate the method opening the download as a lazily
+            fetched file instead of the one saving the whole file
 
     Returns:
         Generated method code as string
     """
-    builder = ASTMethodBuilder(config)
+    builder_class: type[ASTMethodBuilder] = ASTMethodBuilder
+    if members:
+        builder_class = ASTMembersMethodBuilder
+    elif open_file:
+        builder_class = ASTOpenMethodBuilder
+    builder = builder_class(config, is_async=is_async)
     method_node = builder.build_method()
 
     # Fix missing line numbers and column offsets
@@ -526,7 +695,7 @@ def insert_method_after_base(
     # Parse the new method code
     new_method_tree = ast.parse(new_method_code)
     new_method_node = new_method_tree.body[0]
-    if not isinstance(new_method_node, ast.FunctionDef):
+    if not isinstance(new_method_node, ast.FunctionDef | ast.AsyncFunctionDef):
         return tree  # Safety check - should never happen with our generated code
 
     # Find the class definition (should be first class in module)
@@ -542,7 +711,10 @@ def insert_method_after_base(
     # Find base method in class
     base_method_idx = None
     for i, node in enumerate(class_node.body):
-        if isinstance(node, ast.FunctionDef) and node.name == base_method:
+        if (
+            isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef)
+            and node.name == base_method
+        ):
             base_method_idx = i
             break
 
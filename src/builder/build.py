@@ -11,6 +11,7 @@ from openapi_python_client.parser.errors import GeneratorError
 from openapi_python_client.parser.openapi import Endpoint, GeneratorData
 from openapi_python_client.parser.properties.list_property import ListProperty
 from openapi_python_client.parser.properties.model_property import ModelProperty
+from openapi_python_client.parser.properties.protocol import PropertyProtocol
 from openapi_python_client.parser.properties.union import UnionProperty
 
 from builder.config import APIS
@@ -71,6 +72,9 @@ class PaginationInfo:
     has_limit_param: bool
     """Whether the endpoint has a 'limit' query parameter"""
 
+    items_property: PropertyProtocol | None = None
+    """Property describing a single item, used for the ``*_items`` return type"""
+
 
 @dataclass
 class EnhancedEndpoint:
@@ -208,6 +212,7 @@ class EndpointTransformer:
         # Check 5: Find items field (array field that isn't 'links')
         items_field = None
         items_type = None
+        items_property = None
 
         for prop in all_properties:
             if prop.name != "links" and isinstance(prop, ListProperty):
@@ -215,7 +220,8 @@ class EndpointTransformer:
 
                 # Extract item type directly from ListProperty.inner_property
                 if hasattr(prop, "inner_property") and prop.inner_property:
-                    items_type = prop.inner_property.get_type_string()
+                    items_property = prop.inner_property
+                    items_type = items_property.get_type_string()
 
                 break
 
@@ -231,6 +237,7 @@ class EndpointTransformer:
             items_field=items_field,
             items_type=items_type,
             has_limit_param=has_limit_param,
+            items_property=items_property,
         )
 
 
@@ -300,7 +307,7 @@ class ServiceCodeGenerator:
                 enhanced = self.transformer.transform(endpoint)
                 enhanced_endpoints.append(enhanced)
 
-        # Generate api.py
+        # Generate api.py (sync service)
         api_class_path = api_dir / "api.py"
         endpoint_template = self.project.env.get_template(
             "endpoint_module.py.jinja",
@@ -323,12 +330,19 @@ class ServiceCodeGenerator:
             endpoint.pagination = enhanced.pagination
 
         api_class_path.write_text(
-            endpoint_template.render(**template_context),
+            endpoint_template.render(**template_context, is_async=False),
+            encoding=self.project.config.file_encoding,
+        )
+
+        # Generate async_api.py from the same template
+        async_api_class_path = api_dir / "async_api.py"
+        async_api_class_path.write_text(
+            endpoint_template.render(**template_context, is_async=True),
             encoding=self.project.config.file_encoding,
         )
 
     def _add_streaming_methods(self, openapi_dict: dict):
-        """Add streaming download methods to generated API service."""
+        """Add streaming download methods to generated sync and async API services."""
 
         api_file = self.project.package_dir / "api.py"
 
@@ -351,6 +365,17 @@ class ServiceCodeGenerator:
             generate_tests=self.generate_tests,
         )
 
+        # Add the async streaming methods (tests are only generated for sync)
+        async_api_file = self.project.package_dir / "async_api.py"
+        if async_api_file.exists():
+            add_streaming_methods(
+                async_api_file,
+                self.context.api_id,
+                endpoints,
+                openapi_dict,
+                is_async=True,
+            )
+
     def _generate_tests(self):
         """Generate test files for this API service."""
         try:
@@ -0,0 +1,342 @@
+"""
+Tests that render the service templates for a small spec and exercise the
+generated code, so template changes are covered without regenerating the
+real services.
+"""
+
+import asyncio
+import io
+import sys
+import zipfile
+from importlib import import_module
+from uuid import uuid4
+
+import httpx
+import pook
+import pytest
+
+import satvu
+from builder import build
+from satvu.http.httpx_adapter import AsyncHttpxAdapter, HttpxAdapter
+
+API_ID = "buildtest"
+BASE_URL = f"https://api.satellitevu.com/{API_ID}/v1"
+
+_UUID = {"type": "string", "format": "uuid"}
+_CONTRACT_ID = {"name": "contract_id", "in": "path", "required": True, "schema": _UUID}
+_ORDER_ID = {"name": "order_id", "in": "path", "required": True, "schema": _UUID}
+
+
+def _json_response(ref: str) -> dict:
+    return {
+        "description": "OK",
+        "content": {"application/json": {"schema": {"$ref": ref}}},
+    }
+
+
+SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "Build test", "version": "1.0.0"},
+    "paths": {
+        "/{contract_id}/search": {
+            "get": {
+                "operationId": "get_search",
+                "summary": "Search",
+                "parameters": [
+                    _CONTRACT_ID,
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"type": "integer", "default": 10},
+                    },
+                    {
+                        "name": "token",
+                        "in": "query",
+                        "required": False,
+                        "schema": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+                    },
+                ],
+                "responses": {
+                    "200": _json_response("#/components/schemas/FeatureCollection")
+                },
+            }
+        },
+        "/{contract_id}/{order_id}/download": {
+            "get": {
+                "operationId": "download_order",
+                "summary": "Order download",
+                "x-streaming-download": True,
+                "parameters": [
+                    _CONTRACT_ID,
+                    _ORDER_ID,
+                    {
+                        "name": "redirect",
+                        "in": "query",
+                        "required": False,
+                        "schema": {
+                            "anyOf": [{"type": "boolean"}, {"type": "null"}],
+                            "default": True,
+                        },
+                    },
+                ],
+                "responses": {
+                    "200": _json_response("#/components/schemas/OrderDownloadUrl"),
+                    "302": {"description": "Redirect"},
+                },
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Link": {
+                "type": "object",
+                "required": ["href", "rel"],
+                "properties": {
+                    "href": {"type": "string"},
+                    "rel": {"type": "string"},
+                    "method": {
+                        "type": "string",
+                        "enum": ["GET", "POST"],
+                        "default": "GET",
+                    },
+                },
+            },
+            "Feature": {
+                "type": "object",
+                "required": ["id"],
+                "properties": {"id": {"type": "string"}},
+            },
+            "FeatureCollection": {
+                "type": "object",
+                "required": ["type", "features", "links"],
+                "properties": {
+                    "type": {"type": "string"},
+                    "features": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Feature"},
+                    },
+                    "links": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Link"},
+                    },
+                },
+            },
+            "OrderDownloadUrl": {
+                "type": "object",
+                "required": ["url", "ttl"],
+                "properties": {"url": {"type": "string"}, "ttl": {"type": "integer"}},
+            },
+        }
+    },
+}
+
+
+def search_page(request: httpx.Request) -> httpx.Response:
+    """Three pages of two features, linked by a ``token`` query parameter."""
+    page = int(request.url.params.get("token") or 0)
+    links = []
+    if page < 2:
+        links.append({"rel": "next", "href": f"{BASE_URL}/search?token={page + 1}"})
+    features = [{"id": f"{page}-{i}"} for i in range(2)]
+    return httpx.Response(
+        200, json={"type": "FeatureCollection", "features": features, "links": links}
+    )
+
+
+ITEM_IDS = [f"{page}-{i}" for page in range(3) for i in range(2)]
+
+
+@pytest.fixture(scope="module")
+def service_modules(tmp_path_factory):
+    """Build the spec into a temporary ``satvu.services`` package and import it."""
+    root = tmp_path_factory.mktemp("build")
+    spec_path = root / f"{API_ID}-0123456789.json"
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(build, "SRC_DIR", root / "satvu" / "services")
+        mp.setitem(build.APIS, API_ID, f"/{API_ID}/v1")
+        mp.setattr(build, "load_openapi", lambda api_id, use_cached: (SPEC, spec_path))
+        errors = build.build_service(API_ID, use_cached=True)
+        assert not errors, [error.detail for error in errors]
+
+        # satvu.services is a namespace package, so it picks up the new directory
+        mp.setattr(satvu, "__path__", [*satvu.__path__, str(root / "satvu")])
+        yield (
+            import_module(f"satvu.services.{API_ID}.api"),
+            import_module(f"satvu.services.{API_ID}.async_api"),
+        )
+
+    for name in list(sys.modules):
+        if name.startswith(f"satvu.services.{API_ID}"):
+            del sys.modules[name]
+
+
+@pytest.fixture
+def service(service_modules):
+    api, _ = service_modules
+    client = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(search_page))
+    return api.BuildtestService(
+        env=None, get_token=lambda: "token", http_client=HttpxAdapter(client=client)
+    )
+
+
+@pytest.fixture
+def async_service(service_modules):
+    _, async_api = service_modules
+    client = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(search_page)
+    )
+    return async_api.AsyncBuildtestService(
+        env=None,
+        get_token=lambda: "token",
+        http_client=AsyncHttpxAdapter(client=client),
+    )
+
+
+class TestPagination:
+    """Tests for the generated *_iter and *_items methods."""
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_iter_follows_pages(self, service, prefetch):
+        pages = list(service.get_search_iter(contract_id=uuid4(), prefetch=prefetch))
+
+        assert [feature.id for page in pages for feature in page.features] == ITEM_IDS
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_items_follow_pages(self, service, stream):
+        items = service.get_search_items(contract_id=uuid4(), stream=stream)
+
+        assert [feature.id for feature in items] == ITEM_IDS
+
+    def test_items_stop_at_max_items(self, service):
+        items = service.get_search_items(contract_id=uuid4(), max_items=3)
+
+        assert [feature.id for feature in items] == ITEM_IDS[:3]
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_async_items_follow_pages(self, async_service, stream):
+        async def collect():
+            items = async_service.get_search_items(
+                contract_id=uuid4(), prefetch=1, stream=stream
+            )
+            return [feature.id async for feature in items]
+
+        assert asyncio.run(collect()) == ITEM_IDS
+
+
+class TestResponseAdapters:
+    """Tests for the module-level ResponseAdapters."""
+
+    def test_warmup_builds_module_adapters(self, service, service_modules):
+        api, _ = service_modules
+
+        service.warmup()
+
+        assert api._GET_SEARCH_200._adapter is not None
+
+
+def archive() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("meta.json", "{}")
+    return buffer.getvalue()
+
+
+ARCHIVE = archive()
+
+
+def redirect_to_archive(request: httpx.Request) -> httpx.Response:
+    """Redirect the endpoint to a signed URL serving ARCHIVE, with range support."""
+    if request.url.host != "files.example.com":
+        return httpx.Response(
+            302, headers={"Location": "https://files.example.com/order.zip"}
+        )
+    if "Range" not in request.headers:
+        return httpx.Response(
+            200, content=ARCHIVE, headers={"Content-Type": "application/zip"}
+        )
+    start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+    if not start:
+        # Suffix range: the last `end` bytes
+        start, end = max(len(ARCHIVE) - int(end), 0), len(ARCHIVE) - 1
+    start, end = int(start), min(int(end), len(ARCHIVE) - 1)
+    return httpx.Response(
+        206,
+        content=ARCHIVE[start : end + 1],
+        headers={"Content-Range": f"bytes {start}-{end}/{len(ARCHIVE)}"},
+    )
+
+
+class TestDownload:
+    """Tests for the generated download methods."""
+
+    @pytest.fixture
+    def service(self, service_modules):
+        api, _ = service_modules
+        client = httpx.Client(
+            base_url=BASE_URL, transport=httpx.MockTransport(redirect_to_archive)
+        )
+        return api.BuildtestService(
+            env=None, get_token=lambda: "token", http_client=HttpxAdapter(client=client)
+        )
+
+    @pytest.fixture
+    def async_service(self, service_modules):
+        _, async_api = service_modules
+        client = httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(redirect_to_archive)
+        )
+        return async_api.AsyncBuildtestService(
+            env=None,
+            get_token=lambda: "token",
+            http_client=AsyncHttpxAdapter(client=client),
+        )
+
+    @pook.on
+    def test_download_returns_bytes_io(self, service_modules):
+        api, _ = service_modules
+        signed_url = "https://files.example.com/order.zip"
+        contract_id, order_id = uuid4(), uuid4()
+        pook.get(f"{BASE_URL}/{contract_id}/{order_id}/download").reply(302).header(
+            "Location", signed_url
+        )
+        pook.get(signed_url).reply(200).header("Content-Type", "application/zip").body(
+            ARCHIVE
+        )
+        service = api.BuildtestService(env=None, get_token=lambda: "token")
+
+        file = service.download_order(contract_id=contract_id, order_id=order_id)
+
+        assert isinstance(file, io.BytesIO)
+        assert file.getvalue() == ARCHIVE
+
+    def test_open_download(self, service):
+        result = service.open_download_order(contract_id=uuid4(), order_id=uuid4())
+
+        with result.unwrap() as file, zipfile.ZipFile(file) as zf:
+            assert zf.read("meta.json") == b"{}"
+
+    def test_async_open_download(self, async_service):
+        async def read():
+            result = await async_service.open_download_order(
+                contract_id=uuid4(), order_id=uuid4()
+            )
+            with result.unwrap() as file, zipfile.ZipFile(file) as zf:
+                return zf.read("meta.json")
+
+        assert asyncio.run(read()) == b"{}"
+
+    def test_download_to_file(self, service, tmp_path):
+        result = service.download_order_to_file(
+            contract_id=uuid4(), order_id=uuid4(), output_path=tmp_path / "order.zip"
+        )
+
+        assert result.unwrap().read_bytes() == ARCHIVE
+
+    def test_download_members(self, service, tmp_path):
+        result = service.download_order_members(
+            contract_id=uuid4(), order_id=uuid4(), output_dir=tmp_path, members="*.json"
+        )
+
+        assert result.unwrap() == [tmp_path / "meta.json"]
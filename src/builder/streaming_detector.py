@@ -15,6 +15,12 @@ class StreamingEndpointConfig:
     stream_method: str
     """Name for streaming variant (e.g., 'download_order_stream')"""
 
+    members_method: str
+    """Name for the zip member extraction variant (e.g., 'download_order_members')"""
+
+    open_method: str
+    """Name for the lazily fetched file variant (e.g., 'open_download_order')"""
+
     url_pattern: str
     """URL pattern for the endpoint"""
 
@@ -27,12 +33,21 @@ class StreamingEndpointConfig:
     docstring: str
     """Description for streaming method"""
 
+    members_docstring: str
+    """Description for the member extraction method"""
+
+    open_docstring: str
+    """Description for the lazily fetched file method"""
+
     example_filename: str
     """Example filename for docs"""
 
     default_chunk_size: int = 8192
     """Default chunk size in bytes"""
 
+    default_max_connections: int = 4
+    """Default number of concurrent range requests"""
+
 
 class StreamingEndpointDetector:
     """Detects which endpoints should have streaming download variants."""
@@ -132,6 +147,7 @@ class StreamingEndpointDetector:
 
         # Extract configuration values
         default_chunk_size = streaming_config.get("default_chunk_size", 8192)
+        default_max_connections = streaming_config.get("default_max_connections", 4)
         example_filename = streaming_config.get("example_filename", "download.zip")
         description_override = streaming_config.get("description_override")
 
@@ -140,6 +156,7 @@ class StreamingEndpointDetector:
             endpoint,
             example_filename=example_filename,
             default_chunk_size=default_chunk_size,
+            default_max_connections=default_max_connections,
             description_override=description_override,
         )
 
@@ -148,6 +165,7 @@ class StreamingEndpointDetector:
         endpoint: Endpoint,
         example_filename: str = "download.zip",
         default_chunk_size: int = 8192,
+        default_max_connections: int = 4,
         description_override: str | None = None,
     ) -> StreamingEndpointConfig:
         """Build streaming config from endpoint."""
@@ -155,6 +173,8 @@ class StreamingEndpointDetector:
         # Generate streaming method name
         base_method = endpoint.name
         stream_method = self._generate_stream_method_name(base_method)
+        members_method = f"{stream_method.removesuffix('_to_file')}_members"
+        open_method = f"open_{stream_method.removesuffix('_to_file')}"
 
         # Extract path parameters (used in URL format)
         path_params = [
@@ -179,12 +199,17 @@ class StreamingEndpointDetector:
         return StreamingEndpointConfig(
             base_method=base_method,
             stream_method=stream_method,
+            members_method=members_method,
+            open_method=open_method,
             url_pattern=endpoint.path,
             path_params=path_params,
             query_params=query_params,
             docstring=docstring,
+            members_docstring=self._generate_members_docstring(endpoint),
+            open_docstring=self._generate_open_docstring(endpoint),
             example_filename=example_filename,
             default_chunk_size=default_chunk_size,
+            default_max_connections=default_max_connections,
         )
 
     def _generate_stream_method_name(self, base_method: str) -> str:
@@ -212,3 +237,19 @@ class StreamingEndpointDetector:
             return f"{base} - save to disk (memory-efficient for large files)."
 
         return "Save download to disk (memory-efficient for large files)."
+
+    def _generate_members_docstring(self, endpoint: Endpoint) -> str:
+        """Generate docstring for the member extraction method."""
+        if endpoint.summary:
+            base = endpoint.summary.rstrip(".")
+            return f"{base} - extract selected files from the zip archive."
+
+        return "Extract selected files from the zip archive."
+
+    def _generate_open_docstring(self, endpoint: Endpoint) -> str:
+        """Generate docstring for the lazily fetched file method."""
+        if endpoint.summary:
+            base = endpoint.summary.rstrip(".")
+            return f"{base} - open as a file fetched as it is read."
+
+        return "Open the download as a file fetched as it is read."
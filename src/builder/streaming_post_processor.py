@@ -36,6 +36,7 @@ def add_streaming_methods(
     openapi_dict: dict,
     project: Project | None = None,
     generate_tests: bool = False,
+    is_async: bool = False,
 ) -> None:
     """
     Add streaming methods to generated API service file using AST.
@@ -47,6 +48,7 @@ def add_streaming_methods(
         openapi_dict: Raw OpenAPI spec dict for reading x-streaming extensions
         project: Optional Project object for test generation (provides Jinja2 env)
         generate_tests: Whether to generate tests for streaming methods
+        is_async: Whether api_file holds the async service (generates coroutine methods)
     """
     # Detect which endpoints need streaming variants
     detector = StreamingEndpointDetector(api_id, openapi_dict)
@@ -69,12 +71,10 @@ def add_streaming_methods(
         {
             "pathlib": [("Path", None)],
             "satvu.http.errors": [("HttpError", None)],
-            "satvu.result": [
-                ("Result", None),
-                ("Ok", "ResultOk"),
-                ("Err", "ResultErr"),
-                ("is_err", None),
-            ],
+            "satvu.result": [("Result", None)],
+            "satvu.archive": [("MemberSelector", None)],
+            "satvu.digest": [("DigestAlgorithm", None), ("DownloadedFile", None)],
+            "satvu.download": [("RemoteFile", None)],
         },
     )
 
@@ -91,12 +91,22 @@ def add_streaming_methods(
             continue
 
         # Generate method code using AST
-        method_code = generate_streaming_method(config)
-
-        # Insert method into AST
-        tree = insert_method_after_base(tree, config.base_method, method_code)
-
-        print(f"    ✓ Generated {config.stream_method}")
+        method_code = generate_streaming_method(config, is_async=is_async)
+        members_code = generate_streaming_method(
+            config, is_async=is_async, members=True
+        )
+        open_code = generate_streaming_method(config, is_async=is_async, open_file=True)
+
+        # Insert methods into AST: the lazily fetched file, the streaming one
+        # and the member extraction, in that order after the base method
+        tree = insert_method_after_base(tree, config.base_method, open_code)
+        tree = insert_method_after_base(tree, config.open_method, method_code)
+        tree = insert_method_after_base(tree, config.stream_method, members_code)
+
+        print(
+            f"    ✓ Generated {config.open_method}, {config.stream_method}, "
+            f"{config.members_method}"
+        )
 
     # Convert AST back to code
     final_code = ast.unparse(tree)
@@ -139,6 +149,3 @@ def add_streaming_methods(
 
                 print(f"    ⚠ Warning: Failed to generate streaming tests: {e}")
                 traceback.print_exc()
-
-
-# TODO: Add streaming to BytesIO method as well
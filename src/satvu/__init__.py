@@ -1,11 +1,42 @@
 from satvu.auth import AppDirCache, MemoryCache
-from satvu.http import HttpClient, create_http_client
-from satvu.sdk import SatVuSDK
+from satvu.bulk import AsyncDownloadManager, DownloadManager, DownloadTarget
+from satvu.cache import ResponseCache
+from satvu.circuit import CircuitBreakers
+from satvu.coalesce import RequestCoalescer
+from satvu.http import (
+    AsyncConnectionPool,
+    AsyncHttpClient,
+    ConnectionPool,
+    HttpClient,
+    create_async_http_client,
+    create_http_client,
+)
+from satvu.ratelimit import RateLimits
+from satvu.retry import RetryBudget, RetryPolicy
+from satvu.sdk import AsyncSatVuSDK, SatVuSDK
+from satvu.telemetry import RequestHooks
+from satvu.throttle import BandwidthLimiter
 
 __all__ = [
     "AppDirCache",
     "MemoryCache",
     "SatVuSDK",
+    "AsyncSatVuSDK",
+    "DownloadManager",
+    "AsyncDownloadManager",
+    "DownloadTarget",
+    "RetryPolicy",
+    "RetryBudget",
+    "CircuitBreakers",
+    "RateLimits",
+    "ResponseCache",
+    "RequestCoalescer",
+    "BandwidthLimiter",
+    "RequestHooks",
     "HttpClient",
+    "AsyncHttpClient",
     "create_http_client",
+    "create_async_http_client",
+    "ConnectionPool",
+    "AsyncConnectionPool",
 ]
@@ -0,0 +1,686 @@
+"""Extracting selected members of remote zip archives with range requests."""
+
+import asyncio
+import bz2
+import fnmatch
+import io
+import logging
+import shutil
+import struct
+import zipfile
+import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Protocol
+
+from satvu.download import (
+    DEFAULT_MAX_CONNECTIONS,
+    ProgressCallback,
+    RemoteFile,
+    _check_partial,
+    _Progress,
+    _range_headers,
+    content_range_total,
+)
+from satvu.http.buffers import iter_response
+from satvu.http.errors import (
+    ArchiveError,
+    ChecksumMismatchError,
+    HttpError,
+    IncompleteDownloadError,
+)
+from satvu.http.protocol import (
+    AsyncHttpClient,
+    AsyncHttpResponse,
+    HttpClient,
+    HttpResponse,
+)
+from satvu.result import Err, Ok, Result, is_err
+from satvu.throttle import BandwidthLimiter, BandwidthShare
+
+logger = logging.getLogger(__name__)
+
+MemberSelector = str | Sequence[str] | Callable[[zipfile.ZipInfo], bool]
+"""Glob pattern(s) matched against member names, or a predicate on ZipInfo."""
+
+
+class SeekableFile(Protocol):
+    """A readable, seekable binary file, such as a RemoteFile or io.BytesIO."""
+
+    def read(self, size: int = -1, /) -> bytes: ...
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET, /) -> int: ...
+
+    def tell(self) -> int: ...
+
+
+TAIL_SIZE = 22 + 0xFFFF
+"""Bytes fetched from the end of an archive: the end of central directory
+record and the longest comment that can follow it."""
+
+_EOCD = struct.Struct("<4s4H2LH")
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+def select_members(
+    infos: list[zipfile.ZipInfo], members: MemberSelector
+) -> list[zipfile.ZipInfo]:
+    """
+    Files of an archive matched by glob pattern(s) or a predicate.
+
+    Directory entries are never selected.
+    """
+    if callable(members):
+        return [info for info in infos if not info.is_dir() and members(info)]
+    patterns = [members] if isinstance(members, str) else list(members)
+    return [
+        info
+        for info in infos
+        if not info.is_dir()
+        and any(fnmatch.fnmatchcase(info.filename, p) for p in patterns)
+    ]
+
+
+def member_path(output_dir: Path, filename: str) -> Path:
+    """Where to extract a member, dropping absolute paths and ``..`` components."""
+    parts = PurePosixPath(filename.replace("\\", "/")).parts
+    return output_dir.joinpath(*(p for p in parts if p not in ("/", ".", "..")))
+
+
+class _Window(io.RawIOBase):
+    """The end of a file from ``offset`` onwards, enough to read a zip index."""
+
+    def __init__(self, data: bytes, offset: int, size: int):
+        super().__init__()
+        self.data = data
+        self.offset = offset
+        self.size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        start = self._pos - self.offset
+        if start < 0:
+            raise zipfile.BadZipFile("Central directory is not where the index says")
+        view = memoryview(buffer).cast("B")
+        data = self.data[start : start + len(view)]
+        view[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+def _central_directory_start(tail: bytes, tail_offset: int, url: str) -> int:
+    """Find where the central directory starts from the tail of an archive."""
+    pos = tail.rfind(_EOCD_SIGNATURE)
+    while pos >= 0 and pos + _EOCD.size > len(tail):
+        pos = tail.rfind(_EOCD_SIGNATURE, 0, pos)
+    if pos < 0:
+        raise ArchiveError("End of central directory record not found", url=url)
+
+    entries, cd_size, cd_offset = _EOCD.unpack_from(tail, pos)[4:7]
+    if cd_size == 0xFFFFFFFF:
+        raise ArchiveError("Central directory is too large", url=url)
+    if entries != 0xFFFF and cd_offset != 0xFFFFFFFF:
+        return tail_offset + pos - cd_size
+
+    # Zip64: the central directory is followed by the zip64 end record, whose
+    # offset is given by the locator right before the end record
+    locator = pos - _ZIP64_LOCATOR.size
+    if locator < 0:
+        raise ArchiveError("Zip64 end of central directory not found", url=url)
+    signature, _, zip64_offset, _ = _ZIP64_LOCATOR.unpack_from(tail, locator)
+    if signature != _ZIP64_LOCATOR_SIGNATURE:
+        raise ArchiveError("Zip64 end of central directory not found", url=url)
+    return zip64_offset - cd_size
+
+
+def _read_index(data: bytes, offset: int, size: int, url: str) -> list[zipfile.ZipInfo]:
+    """Parse the central directory from the end of an archive."""
+    try:
+        with zipfile.ZipFile(_Window(data, offset, size)) as archive:
+            return archive.infolist()
+    except (zipfile.BadZipFile, struct.error) as error:
+        raise ArchiveError(f"Invalid zip archive: {error}", url=url) from error
+
+
+def _member_ranges(
+    infos: list[zipfile.ZipInfo], selected: list[zipfile.ZipInfo], cd_start: int
+) -> list[tuple[zipfile.ZipInfo, int, int]]:
+    """
+    Byte range of each selected member, from its local header to the next one.
+
+    The range includes any data descriptor after the compressed data.
+    """
+    offsets = sorted({info.header_offset for info in infos} | {cd_start})
+    ranges = []
+    for info in selected:
+        end = next(o for o in offsets if o > info.header_offset)
+        ranges.append((info, info.header_offset, end - 1))
+    return ranges
+
+
+class _MemberWriter:
+    """
+    Write a member to disk from the bytes of its range.
+
+    Skips the local file header, decompresses the member data and checks its
+    size and CRC-32 against the central directory.
+    """
+
+    def __init__(self, info: zipfile.ZipInfo, path: Path, url: str):
+        self.info = info
+        self.path = path
+        self.url = url
+        if info.flag_bits & 0x1:
+            raise self._error("Encrypted members cannot be extracted")
+        if info.compress_type == zipfile.ZIP_STORED:
+            self._decompressor = None
+        elif info.compress_type == zipfile.ZIP_DEFLATED:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif info.compress_type == zipfile.ZIP_BZIP2:
+            self._decompressor = bz2.BZ2Decompressor()
+        else:
+            raise self._error(f"Unsupported compression method {info.compress_type}")
+
+        self._header: bytearray | None = bytearray()
+        self._remaining = info.compress_size
+        self._crc = 0
+        self._size = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("wb")
+
+    def _error(self, message: str) -> ArchiveError:
+        return ArchiveError(message, url=self.url, member=self.info.filename)
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        if self._header is not None:
+            self._header += chunk
+            if len(self._header) < _LOCAL_HEADER.size:
+                return
+            fields = _LOCAL_HEADER.unpack_from(self._header)
+            if fields[0] != _LOCAL_HEADER_SIGNATURE:
+                raise self._error("Bad local file header")
+            data_start = _LOCAL_HEADER.size + fields[10] + fields[11]
+            if len(self._header) < data_start:
+                return
+            chunk = bytes(self._header[data_start:])
+            self._header = None
+
+        data = chunk[: self._remaining]
+        self._remaining -= len(data)
+        if self._decompressor is not None:
+            try:
+                data = self._decompressor.decompress(data)
+            except (OSError, EOFError, zlib.error) as error:
+                raise self._error(f"Corrupt member data: {error}") from error
+        self._output(data)
+
+    def _output(self, data: bytes | memoryview) -> None:
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        self._file.write(data)
+
+    def finish(self) -> None:
+        """Close the file, raising if the member is incomplete or corrupt."""
+        flush = getattr(self._decompressor, "flush", None)
+        if flush is not None:
+            self._output(flush())
+        self._file.close()
+
+        if self._header is not None or self._remaining:
+            raise IncompleteDownloadError(
+                message=f"Member {self.info.filename} ended early",
+                url=self.url,
+                expected_bytes=self.info.compress_size,
+                received_bytes=self.info.compress_size - self._remaining,
+            )
+        if self._crc != self.info.CRC or self._size != self.info.file_size:
+            raise ChecksumMismatchError(
+                message=f"CRC-32 of {self.info.filename} does not match",
+                url=self.url,
+                algorithm="crc32",
+                expected=f"{self.info.CRC:08x}",
+                actual=f"{self._crc:08x}",
+            )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _Extraction:
+    """Bookkeeping shared by extract_url_members() and its async counterpart."""
+
+    def __init__(self, url: str, output_dir: Path | str, members: MemberSelector):
+        self.url = url
+        self.output_dir = Path(output_dir)
+        self.members = members
+        self.total: int | None = None
+        self.tail_offset = 0
+        self.cd_start = 0
+        self.data = b""
+
+    def ranged_tail(self, response: HttpResponse | AsyncHttpResponse) -> bool:
+        """Record the tail of the archive, or return False without range support."""
+        if response.status_code != 206:
+            return False
+        self.total = content_range_total(response.headers)
+        if self.total is None:
+            return False
+        self.data = response.body
+        self.tail_offset = self.total - len(self.data)
+        return True
+
+    def missing_range(self) -> tuple[int, int] | None:
+        """Range of the central directory still to fetch, if it is not in the tail."""
+        self.cd_start = _central_directory_start(self.data, self.tail_offset, self.url)
+        if self.cd_start >= self.tail_offset:
+            return None
+        return self.cd_start, self.tail_offset - 1
+
+    def prepend(self, response: HttpResponse | AsyncHttpResponse) -> None:
+        start, end = self.cd_start, self.tail_offset - 1
+        error = _check_partial(response, self.url, start, end)
+        if error is None and len(response.body) != end - start + 1:
+            error = IncompleteDownloadError(
+                message="Central directory ended early",
+                url=self.url,
+                expected_bytes=end - start + 1,
+                received_bytes=len(response.body),
+            )
+        if error is not None:
+            raise error
+        self.data = response.body + self.data
+        self.tail_offset = start
+
+    def plan(self) -> list[tuple[zipfile.ZipInfo, int, int]]:
+        """Ranges of the selected members."""
+        assert self.total is not None
+        infos = _read_index(self.data, self.tail_offset, self.total, self.url)
+        selected = select_members(infos, self.members)
+        logger.debug("Extracting %d of %d members", len(selected), len(infos))
+        return _member_ranges(infos, selected, self.cd_start)
+
+    def path(self, info: zipfile.ZipInfo) -> Path:
+        return member_path(self.output_dir, info.filename)
+
+
+def _tail_headers() -> dict[str, str]:
+    return {"Range": f"bytes=-{TAIL_SIZE}"}
+
+
+def _extract_member(
+    response: HttpResponse,
+    info: zipfile.ZipInfo,
+    path: Path,
+    url: str,
+    start: int,
+    end: int,
+    chunk_size: int,
+    progress: _Progress,
+    share: BandwidthShare | None = None,
+) -> Result[Path, HttpError]:
+    """Write the member in a 206 response for ``start-end`` to ``path``."""
+    range_error = _check_partial(response, url, start, end)
+    if range_error is not None:
+        return Err(range_error)
+
+    writer = None
+    try:
+        writer = _MemberWriter(info, path, url)
+        for chunk in iter_response(response, bytearray(chunk_size)):
+            if share is not None:
+                share.acquire(len(chunk))
+            writer.write(chunk)
+            progress.advance(len(chunk))
+        writer.finish()
+    except HttpError as error:
+        return _discard(writer, path, error)
+    return Ok(path)
+
+
+async def _extract_member_async(
+    response: AsyncHttpResponse,
+    info: zipfile.ZipInfo,
+    path: Path,
+    url: str,
+    start: int,
+    end: int,
+    chunk_size: int,
+    progress: _Progress,
+    share: BandwidthShare | None = None,
+) -> Result[Path, HttpError]:
+    """Async counterpart of _extract_member()."""
+    range_error = _check_partial(response, url, start, end)
+    if range_error is not None:
+        return Err(range_error)
+
+    writer = None
+    try:
+        writer = _MemberWriter(info, path, url)
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            if share is not None:
+                await share.acquire_async(len(chunk))
+            writer.write(chunk)
+            progress.advance(len(chunk))
+        writer.finish()
+    except HttpError as error:
+        return _discard(writer, path, error)
+    return Ok(path)
+
+
+def _discard(
+    writer: _MemberWriter | None, path: Path, error: HttpError
+) -> Result[Path, HttpError]:
+    """Remove a partially extracted member."""
+    if writer is not None:
+        writer.close()
+    path.unlink(missing_ok=True)
+    return Err(error)
+
+
+def extract_file_members(
+    file: SeekableFile,
+    output_dir: Path | str,
+    members: MemberSelector,
+    url: str = "",
+) -> Result[list[Path], HttpError]:
+    """
+    Extract selected members of a zip archive that is already available locally.
+
+    Used when the server does not support range requests. ``zipfile`` verifies
+    the CRC-32 of every member.
+
+    Args:
+        file: Seekable archive, e.g. a spooled RemoteFile
+        output_dir: Directory to extract the members into
+        members: Glob pattern(s) matched against member names, or a predicate
+            called with each member's ZipInfo
+        url: URL the archive was downloaded from, for error messages
+
+    Returns:
+        Result containing either:
+        - Ok(list[Path]) of the extracted files
+        - Err(HttpError) if the archive is invalid or a member is corrupt
+    """
+    output_dir = Path(output_dir)
+    try:
+        archive = zipfile.ZipFile(file)
+    except zipfile.BadZipFile as error:
+        return Err(ArchiveError(f"Invalid zip archive: {error}", url=url))
+
+    paths = []
+    with archive:
+        for info in select_members(archive.infolist(), members):
+            path = member_path(output_dir, info.filename)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with archive.open(info) as source, path.open("wb") as target:
+                    shutil.copyfileobj(source, target)
+            except zipfile.BadZipFile as error:
+                path.unlink(missing_ok=True)
+                if "CRC" in str(error):
+                    return Err(
+                        ChecksumMismatchError(
+                            message=f"CRC-32 of {info.filename} does not match",
+                            url=url,
+                            algorithm="crc32",
+                            expected=f"{info.CRC:08x}",
+                        )
+                    )
+                return Err(ArchiveError(str(error), url=url, member=info.filename))
+            except (NotImplementedError, RuntimeError) as error:
+                path.unlink(missing_ok=True)
+                return Err(ArchiveError(str(error), url=url, member=info.filename))
+            paths.append(path)
+    return Ok(paths)
+
+
+def extract_url_members(
+    client: HttpClient,
+    url: str,
+    output_dir: Path | str,
+    members: MemberSelector,
+    *,
+    chunk_size: int = 8192,
+    progress_callback: ProgressCallback | None = None,
+    timeout: float = 30.0,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+) -> Result[list[Path], HttpError]:
+    """
+    Extract selected members of a remote zip archive without downloading all of it.
+
+    The end of the archive is fetched first to read its central directory.
+    Each selected member is then fetched as one byte range, up to
+    ``max_connections`` at a time, and written straight to disk: it is
+    decompressed while it streams in and its size and CRC-32 are verified
+    against the central directory. Members that fail verification are
+    removed. A server that does not support range requests sends the whole
+    archive, which is spooled and extracted with ``zipfile``.
+
+    Member names are extracted relative to ``output_dir``; absolute paths and
+    ``..`` components are dropped.
+
+    Args:
+        client: HTTP client used for the transfer. It should not attach SDK
+            credentials, as signed URLs carry their own authorisation.
+        url: Absolute URL of the archive
+        output_dir: Directory to extract the members into
+        members: Glob pattern(s) matched against member names, e.g. "*.tif",
+            or a predicate called with each member's ZipInfo
+        chunk_size: Bytes per chunk read from each response
+        progress_callback: Optional callback called after each chunk, with the
+            compressed bytes received across all members. Signature:
+            callback(bytes_downloaded: int, total_bytes: int | None)
+        timeout: Request timeout in seconds
+        max_connections: Maximum number of members fetched concurrently
+        bandwidth_limiter: Limiter the members are read through. All members
+            draw on one fair share of it.
+
+    Returns:
+        Result containing either:
+        - Ok(list[Path]) of the extracted files, in central directory order
+        - Err(HttpError) if a request fails, the archive is invalid or a member
+          is corrupt
+    """
+    extraction = _Extraction(url, output_dir, members)
+    result = client.request(
+        "GET", url, headers=_tail_headers(), follow_redirects=True, timeout=timeout
+    )
+    if is_err(result):
+        return Err(result.error())
+    response = result.unwrap()
+
+    if not extraction.ranged_tail(response):
+        logger.debug("Range requests not supported, spooling %s", url)
+        with RemoteFile.from_response(response, url, chunk_size=chunk_size) as file:
+            return extract_file_members(file, output_dir, members, url)
+
+    try:
+        missing = extraction.missing_range()
+        if missing is not None:
+            result = client.request(
+                "GET",
+                url,
+                headers=_range_headers(*missing),
+                follow_redirects=True,
+                timeout=timeout,
+            )
+            if is_err(result):
+                return Err(result.error())
+            extraction.prepend(result.unwrap())
+        ranges = extraction.plan()
+    except HttpError as error:
+        return Err(error)
+
+    progress = _Progress(
+        sum(end - start + 1 for _, start, end in ranges), progress_callback
+    )
+    share = bandwidth_limiter.share() if bandwidth_limiter is not None else None
+
+    def fetch(info: zipfile.ZipInfo, start: int, end: int) -> Result[Path, HttpError]:
+        range_result = client.request(
+            "GET",
+            url,
+            headers=_range_headers(start, end),
+            follow_redirects=True,
+            timeout=timeout,
+        )
+        if is_err(range_result):
+            return Err(range_result.error())
+        return _extract_member(
+            range_result.unwrap(),
+            info,
+            extraction.path(info),
+            url,
+            start,
+            end,
+            chunk_size,
+            progress,
+            share,
+        )
+
+    if not ranges:
+        return Ok([])
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_connections, len(ranges))),
+        thread_name_prefix="satvu-extract",
+    ) as executor:
+        futures = [executor.submit(fetch, *member) for member in ranges]
+        paths = []
+        for future in futures:
+            extracted = future.result()
+            if is_err(extracted):
+                executor.shutdown(wait=True, cancel_futures=True)
+                return Err(extracted.error())
+            paths.append(extracted.unwrap())
+    return Ok(paths)
+
+
+async def extract_url_members_async(
+    client: AsyncHttpClient,
+    url: str,
+    output_dir: Path | str,
+    members: MemberSelector,
+    *,
+    chunk_size: int = 8192,
+    progress_callback: ProgressCallback | None = None,
+    timeout: float = 30.0,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+) -> Result[list[Path], HttpError]:
+    """
+    Extract selected members of a remote zip archive on the event loop.
+
+    Async counterpart of extract_url_members(); see it for details.
+    """
+    extraction = _Extraction(url, output_dir, members)
+    result = await client.request(
+        "GET", url, headers=_tail_headers(), follow_redirects=True, timeout=timeout
+    )
+    if is_err(result):
+        return Err(result.error())
+    response = result.unwrap()
+
+    if not extraction.ranged_tail(response):
+        logger.debug("Range requests not supported, spooling %s", url)
+        file = await RemoteFile.from_response_async(
+            response, url, chunk_size=chunk_size
+        )
+        with file:
+            return extract_file_members(file, output_dir, members, url)
+
+    try:
+        missing = extraction.missing_range()
+        if missing is not None:
+            result = await client.request(
+                "GET",
+                url,
+                headers=_range_headers(*missing),
+                follow_redirects=True,
+                timeout=timeout,
+            )
+            if is_err(result):
+                return Err(result.error())
+            extraction.prepend(result.unwrap())
+        ranges = extraction.plan()
+    except HttpError as error:
+        return Err(error)
+
+    progress = _Progress(
+        sum(end - start + 1 for _, start, end in ranges), progress_callback
+    )
+    share = bandwidth_limiter.share() if bandwidth_limiter is not None else None
+    semaphore = asyncio.Semaphore(max(1, max_connections))
+
+    async def fetch(
+        info: zipfile.ZipInfo, start: int, end: int
+    ) -> Result[Path, HttpError]:
+        async with semaphore:
+            range_result = await client.request(
+                "GET",
+                url,
+                headers=_range_headers(start, end),
+                follow_redirects=True,
+                timeout=timeout,
+            )
+            if is_err(range_result):
+                return Err(range_result.error())
+            return await _extract_member_async(
+                range_result.unwrap(),
+                info,
+                extraction.path(info),
+                url,
+                start,
+                end,
+                chunk_size,
+                progress,
+                share,
+            )
+
+    tasks = [asyncio.ensure_future(fetch(*member)) for member in ranges]
+    try:
+        paths = []
+        for task in tasks:
+            extracted = await task
+            if is_err(extracted):
+                return Err(extracted.error())
+            paths.append(extracted.unwrap())
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return Ok(paths)
+
+
+__all__ = [
+    "MemberSelector",
+    "SeekableFile",
+    "TAIL_SIZE",
+    "extract_file_members",
+    "extract_url_members",
+    "extract_url_members_async",
+    "member_path",
+    "select_members",
+]
@@ -0,0 +1,290 @@
+"""Tests for extracting zip members with range requests."""
+
+import asyncio
+import io
+import os
+import re
+import zipfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+from satvu.archive import (
+    TAIL_SIZE,
+    extract_file_members,
+    extract_url_members,
+    extract_url_members_async,
+    member_path,
+    select_members,
+)
+from satvu.http.errors import (
+    ArchiveError,
+    ChecksumMismatchError,
+    ClientError,
+    IncompleteDownloadError,
+)
+from satvu.http.httpx_adapter import AsyncHttpxAdapter, HttpxAdapter
+from satvu.result import is_err, is_ok
+
+URL = "https://files.example.com/order.zip"
+IMAGE = os.urandom(200_000)
+METADATA = b'{"id": "order-1"}' * 100
+
+
+def make_zip(
+    members: dict[str, bytes],
+    compression: int = zipfile.ZIP_DEFLATED,
+    comment: bytes = b"",
+) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=compression) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+        archive.comment = comment
+    return buffer.getvalue()
+
+
+ORDER = make_zip(
+    {
+        "order/image.tif": IMAGE,
+        "order/metadata.json": METADATA,
+        "order/thumbnail.png": os.urandom(10_000),
+    }
+)
+
+
+def range_handler(content: bytes, requests: list, truncate: int | None = None):
+    """Serve ``content`` honouring single and suffix byte-range requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", request.headers.get("Range", ""))
+        if not match:
+            return httpx.Response(200, content=content)
+        if match[1]:
+            start, end = int(match[1]), min(int(match[2]), len(content) - 1)
+        else:
+            start, end = max(len(content) - int(match[2]), 0), len(content) - 1
+        body = content[start : end + 1]
+        if truncate is not None and match[1]:
+            body = body[:truncate]
+        return httpx.Response(
+            206,
+            content=body,
+            headers={"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+        )
+
+    return handler
+
+
+def sync_client(handler) -> HttpxAdapter:
+    return HttpxAdapter(client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def requested_bytes(requests: list) -> int:
+    total = 0
+    for request in requests:
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", request.headers["Range"])
+        assert match is not None
+        total += int(match[2]) if not match[1] else int(match[2]) - int(match[1]) + 1
+    return total
+
+
+class TestSelection:
+    INFOS = [
+        zipfile.ZipInfo("order/"),
+        zipfile.ZipInfo("order/image.tif"),
+        zipfile.ZipInfo("order/metadata.json"),
+    ]
+
+    @pytest.mark.parametrize(
+        "members, expected",
+        [
+            ("*.tif", ["order/image.tif"]),
+            (["*.tif", "*.json"], ["order/image.tif", "order/metadata.json"]),
+            ("*", ["order/image.tif", "order/metadata.json"]),
+            (lambda info: info.filename.endswith(".json"), ["order/metadata.json"]),
+        ],
+    )
+    def test_select_members(self, members, expected):
+        selected = select_members(self.INFOS, members)
+        assert [info.filename for info in selected] == expected
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("order/image.tif", "out/order/image.tif"),
+            ("/etc/passwd", "out/etc/passwd"),
+            ("../../escape.txt", "out/escape.txt"),
+            ("a\\..\\b.txt", "out/a/b.txt"),
+        ],
+    )
+    def test_member_path_stays_inside_output_dir(self, filename, expected):
+        assert member_path(Path("out"), filename) == Path(expected)
+
+
+class TestExtractUrlMembers:
+    """Tests for extract_url_members()."""
+
+    def test_fetches_only_selected_members(self, tmp_path):
+        requests = []
+
+        result = extract_url_members(
+            sync_client(range_handler(ORDER, requests)), URL, tmp_path, "*.json"
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert result.unwrap() == [tmp_path / "order" / "metadata.json"]
+        assert (tmp_path / "order" / "metadata.json").read_bytes() == METADATA
+        assert not (tmp_path / "order" / "image.tif").exists()
+        assert requests[0].headers["Range"] == f"bytes=-{TAIL_SIZE}"
+        assert len(requests) == 2
+        assert requested_bytes(requests[1:]) < len(METADATA) + 100
+
+    @pytest.mark.parametrize(
+        "compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2]
+    )
+    def test_compression_methods(self, tmp_path, compression):
+        archive = make_zip({"image.tif": IMAGE, "b.json": METADATA}, compression)
+
+        result = extract_url_members(
+            sync_client(range_handler(archive, [])), URL, tmp_path, ["*.tif", "*.json"]
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert (tmp_path / "image.tif").read_bytes() == IMAGE
+        assert (tmp_path / "b.json").read_bytes() == METADATA
+
+    def test_central_directory_larger_than_tail(self, tmp_path):
+        """A central directory that starts before the tail is fetched separately."""
+        names = [f"order/{'x' * 100}/{i}.json" for i in range(1000)]
+        archive = make_zip({name: b"{}" for name in names}, comment=b"c" * 100)
+        requests = []
+
+        result = extract_url_members(
+            sync_client(range_handler(archive, requests)), URL, tmp_path, names[-1]
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert member_path(tmp_path, names[-1]).read_bytes() == b"{}"
+        assert len(requests) == 3
+
+    def test_zip64(self, tmp_path):
+        """Archives with more than 65535 members have a zip64 end record."""
+        archive = make_zip(
+            {f"{i}.txt": b"" for i in range(0x10000)} | {"last.txt": b"data"},
+            zipfile.ZIP_STORED,
+        )
+
+        result = extract_url_members(
+            sync_client(range_handler(archive, [])), URL, tmp_path, "last.txt"
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert (tmp_path / "last.txt").read_bytes() == b"data"
+
+    @pytest.mark.parametrize(
+        "compression, error_type",
+        [
+            (zipfile.ZIP_STORED, ChecksumMismatchError),
+            (zipfile.ZIP_BZIP2, ArchiveError),
+        ],
+    )
+    def test_corrupt_member_is_removed(self, tmp_path, compression, error_type):
+        """A member that fails to decompress or verify is an error and is deleted."""
+        archive = bytearray(make_zip({"image.tif": IMAGE}, compression))
+        archive[1000] ^= 0xFF
+
+        result = extract_url_members(
+            sync_client(range_handler(bytes(archive), [])), URL, tmp_path, "*.tif"
+        )
+
+        assert is_err(result)
+        assert isinstance(result.error(), error_type)
+        assert not (tmp_path / "image.tif").exists()
+
+    def test_truncated_member(self, tmp_path):
+        handler = range_handler(ORDER, [], truncate=100)
+
+        result = extract_url_members(sync_client(handler), URL, tmp_path, "*.tif")
+
+        assert is_err(result)
+        assert isinstance(result.error(), IncompleteDownloadError)
+
+    def test_not_a_zip(self, tmp_path):
+        result = extract_url_members(
+            sync_client(range_handler(b"not a zip" * 100, [])), URL, tmp_path, "*"
+        )
+
+        assert is_err(result)
+        assert isinstance(result.error(), ArchiveError)
+
+    def test_http_error_is_returned(self, tmp_path):
+        result = extract_url_members(
+            sync_client(lambda request: httpx.Response(403)), URL, tmp_path, "*"
+        )
+
+        assert is_err(result)
+        assert isinstance(result.error(), ClientError)
+
+    def test_falls_back_without_range_support(self, tmp_path):
+        """Servers ignoring Range send the whole archive, which is still extracted."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=ORDER)
+
+        result = extract_url_members(sync_client(handler), URL, tmp_path, "*.json")
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert (tmp_path / "order" / "metadata.json").read_bytes() == METADATA
+        assert len(requests) == 1
+
+    def test_progress_counts_fetched_members(self, tmp_path):
+        progress = []
+
+        extract_url_members(
+            sync_client(range_handler(ORDER, [])),
+            URL,
+            tmp_path,
+            "*",
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        done, total = progress[-1]
+        assert done == total
+        assert len(ORDER) - TAIL_SIZE < total < len(ORDER)
+
+
+def test_extract_file_members_verifies_crc(tmp_path):
+    archive = bytearray(make_zip({"a.txt": b"hello world"}, zipfile.ZIP_STORED))
+    archive[archive.index(b"hello")] = ord("j")
+
+    result = extract_file_members(io.BytesIO(archive), tmp_path, "*")
+
+    assert is_err(result)
+    assert isinstance(result.error(), ChecksumMismatchError)
+    assert not (tmp_path / "a.txt").exists()
+
+
+def test_extract_url_members_async(tmp_path):
+    requests = []
+    client = AsyncHttpxAdapter(
+        client=httpx.AsyncClient(
+            transport=httpx.MockTransport(range_handler(ORDER, requests))
+        )
+    )
+
+    result = asyncio.run(
+        extract_url_members_async(client, URL, tmp_path, ["*.tif", "*.json"])
+    )
+
+    assert is_ok(result), f"Expected Ok but got: {result}"
+    assert result.unwrap() == [
+        tmp_path / "order" / "image.tif",
+        tmp_path / "order" / "metadata.json",
+    ]
+    assert (tmp_path / "order" / "image.tif").read_bytes() == IMAGE
+    assert len(requests) == 3
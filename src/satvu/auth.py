@@ -1,14 +1,19 @@
+import asyncio
 import os
+import threading
+import time
 from base64 import b64decode
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterator
 from configparser import ConfigParser, DuplicateSectionError
-from datetime import datetime
+from contextvars import ContextVar
 from hashlib import sha1
 from json import loads
 from logging import getLogger
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Protocol
+from typing import IO, NamedTuple, Protocol, TypeVar
 from urllib.parse import urljoin
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ValidationError
 
@@ -19,13 +24,28 @@ except ImportError:
 
 import contextlib
 
-from satvu.core import SDKClient
-from satvu.http import HttpClient
-from satvu.http.errors import ClientError, ServerError
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+from satvu.core import AsyncSDKClient, SDKClient
+from satvu.http import AsyncHttpClient, HttpClient
+from satvu.http.errors import ClientError, HttpError, ServerError
+from satvu.http.pool import AsyncConnectionPool, ConnectionPool
+from satvu.http.protocol import HttpResponse
 from satvu.result import Err, Ok, Result, is_err
 
 logger = getLogger(__name__)
 
+# Seconds before a token's expiry at which it is refreshed
+DEFAULT_REFRESH_SKEW = 60.0
+
+ResponseT = TypeVar("ResponseT", bound=HttpResponse)
+
+# Seconds between attempts to take a file lock without blocking the event loop
+LOCK_POLL_INTERVAL = 0.05
+
 
 class AuthError(RuntimeError):
     pass
@@ -54,44 +74,118 @@ class MemoryCache:
         return self._items.get(client_id)
 
 
+_async_lock_holder: ContextVar["AppDirCache | None"] = ContextVar(
+    "_async_lock_holder", default=None
+)
+"""The AppDirCache whose alock() the current task holds."""
+
+
 class AppDirCache:
     """
     File based token cache using an INI file in the user's cache dir or given dir.
+
+    The cache is safe to share between processes: writes and token refreshes
+    hold an advisory lock on ``tokencache.lock``, and ``load`` only re-parses
+    the file when its inode, size or modification time has changed.
     """
 
     cache_dir: Path
     cache_file: Path
+    lock_file: Path
 
     def __init__(self, cache_dir: str | None = None):
         if user_cache_dir is None:
             raise RuntimeError(
                 'To use the AppDirCache, please install "satvu[standard]": pip install "satvu[standard]"'
             )
-        self.cache_dir = Path(cache_dir if cache_dir else user_cache_dir("SatelliteVu"))
+        self.cache_dir = Path(cache_dir or user_cache_dir("SatelliteVu"))
         self.cache_file = self.cache_dir / "tokencache"
+        self.lock_file = self.cache_dir / "tokencache.lock"
 
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
 
-    def save(self, client_id: str, value: OAuthTokenResponse):
-        parser = ConfigParser()
-        parser.read(self.cache_file)
+        self._parsed: tuple[tuple[int, int, int], ConfigParser] | None = None
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_handle: IO[bytes] | None = None
 
-        with contextlib.suppress(DuplicateSectionError):
-            parser.add_section(client_id)
-        parser[client_id]["access_token"] = value.access_token
-        parser[client_id]["refresh_token"] = value.refresh_token or ""
+    @contextlib.contextmanager
+    def lock(self, client_id: str) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the cache across threads and processes.
 
-        with NamedTemporaryFile("w", dir=str(self.cache_dir), delete=False) as handle:
-            parser.write(handle)
-        os.replace(handle.name, self.cache_file)
+        The whole file is locked, whatever the client ID. The lock is
+        re-entrant within a thread, so ``save`` can be called while holding it.
+        """
+        if _async_lock_holder.get() is self:
+            # The current task holds alock(), e.g. while saving a new token
+            yield
+            return
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                handle = open(self.lock_file, "a+b")  # noqa: SIM115
+                try:
+                    _lock_file(handle)
+                except BaseException:
+                    handle.close()
+                    raise
+                self._lock_handle = handle
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and self._lock_handle is not None:
+                    _unlock_file(self._lock_handle)
+                    self._lock_handle.close()
+                    self._lock_handle = None
+
+    @contextlib.asynccontextmanager
+    async def alock(self, client_id: str) -> AsyncIterator[None]:
+        """
+        Async counterpart of lock(), for use on an event loop.
 
-    def load(self, client_id: str) -> OAuthTokenResponse | None:
+        The file lock is polled for without blocking, and no thread lock is
+        held while the caller awaits. ``save`` can be called while holding it.
+        """
+        handle = open(self.lock_file, "a+b")  # noqa: SIM115
         try:
+            while not _try_lock_file(handle):
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+            holder = _async_lock_holder.set(self)
+            try:
+                yield
+            finally:
+                _async_lock_holder.reset(holder)
+                _unlock_file(handle)
+        finally:
+            handle.close()
+
+    def save(self, client_id: str, value: OAuthTokenResponse):
+        with self.lock(client_id):
+            # Re-read under the lock so entries saved by other processes are kept
             parser = ConfigParser()
             parser.read(self.cache_file)
 
-            cached = parser[client_id]
+            with contextlib.suppress(DuplicateSectionError):
+                parser.add_section(client_id)
+            parser[client_id]["access_token"] = value.access_token
+            parser[client_id]["refresh_token"] = value.refresh_token or ""
+
+            with NamedTemporaryFile(
+                "w", dir=str(self.cache_dir), delete=False
+            ) as handle:
+                parser.write(handle)
+            os.replace(handle.name, self.cache_file)
+
+            signature = self._signature()
+            if signature is not None:
+                self._parsed = (signature, parser)
+
+    def load(self, client_id: str) -> OAuthTokenResponse | None:
+        try:
+            cached = self._read()[client_id]
             return OAuthTokenResponse(
                 access_token=cached["access_token"],
                 refresh_token=cached["refresh_token"],
@@ -99,6 +193,195 @@ class AppDirCache:
         except (FileNotFoundError, KeyError):
             return None
 
+    def _signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.cache_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _read(self) -> ConfigParser:
+        """Return the parsed cache file, re-parsing only if it has changed."""
+        signature = self._signature()
+        if signature is None:
+            return ConfigParser()
+        parsed = self._parsed
+        if parsed is None or parsed[0] != signature:
+            parser = ConfigParser()
+            parser.read(self.cache_file)
+            parsed = self._parsed = (signature, parser)
+        return parsed[1]
+
+
+if os.name == "nt":
+
+    def _lock_file(handle: IO[bytes]) -> None:
+        handle.seek(0)
+        while True:
+            # LK_LOCK gives up after 10 attempts, so keep retrying
+            with contextlib.suppress(OSError):
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                return
+
+    def _try_lock_file(handle: IO[bytes]) -> bool:
+        handle.seek(0)
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock_file(handle: IO[bytes]) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+
+    def _lock_file(handle: IO[bytes]) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _try_lock_file(handle: IO[bytes]) -> bool:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock_file(handle: IO[bytes]) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _cache_lock(
+    cache: TokenCache, client_id: str
+) -> contextlib.AbstractContextManager[None]:
+    """
+    Lock a token cache around a refresh.
+
+    Caches shared between processes, such as AppDirCache, provide a
+    ``lock(client_id)`` context manager so that only one process refreshes a
+    token while the others wait and then load it. Other caches need no lock.
+    """
+    lock = getattr(cache, "lock", None)
+    return lock(client_id) if lock is not None else contextlib.nullcontext()
+
+
+def _async_cache_lock(
+    cache: TokenCache, client_id: str
+) -> contextlib.AbstractAsyncContextManager[None]:
+    """
+    Async counterpart of _cache_lock(), using the cache's ``alock(client_id)``.
+
+    A cache's blocking ``lock`` is never held across an await: caches without
+    ``alock`` are not locked, and refreshes are only single-flight within the
+    process.
+    """
+    alock = getattr(cache, "alock", None)
+    return alock(client_id) if alock is not None else contextlib.nullcontext()
+
+
+class _ManagedToken(NamedTuple):
+    access_token: str
+    expires_at: float
+    refresh_at: float
+
+
+class TokenManager:
+    """
+    In-memory access tokens with proactive, single-flight refresh.
+
+    Tokens are held together with their decoded ``exp`` claim, so while a
+    token is fresh it is returned from a dict lookup without taking a lock or
+    decoding the JWT. Once a token is within ``refresh_skew`` seconds of
+    expiry the next caller refreshes it; concurrent callers wait for that one
+    refresh instead of starting their own. Callers that arrive while a token
+    that has not yet expired is being refreshed keep using it.
+    """
+
+    def __init__(self, refresh_skew: float = DEFAULT_REFRESH_SKEW):
+        self.refresh_skew = refresh_skew
+        self._tokens: dict[Hashable, _ManagedToken] = {}
+        self._lock = threading.Lock()
+        # asyncio locks belong to one event loop, so each loop gets its own
+        self._async_locks: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[Hashable, asyncio.Lock]
+        ] = WeakKeyDictionary()
+
+    def needs_refresh(self, access_token: str) -> bool:
+        """Whether a token has expired or is within the refresh skew of expiry."""
+        return _token_expiry(access_token) - self.refresh_skew <= time.time()
+
+    def get(
+        self, key: Hashable, refresh: Callable[[], Result[str, AuthError]]
+    ) -> Result[str, AuthError]:
+        """
+        Return the token for ``key``, calling ``refresh`` when it is due.
+
+        Args:
+            key: Identifies the token, e.g. the client ID and scopes
+            refresh: Fetches a new access token
+
+        Returns:
+            Result containing either:
+            - Ok(str) with the access token
+            - Err(AuthError) if the refresh fails and no unexpired token is held
+        """
+        token = self._tokens.get(key)
+        if token is not None and time.time() < token.refresh_at:
+            return Ok(token.access_token)
+
+        usable = token is not None and time.time() < token.expires_at
+        if not self._lock.acquire(blocking=not usable):
+            # Another thread is refreshing; the current token is still valid
+            return Ok(token.access_token)  # type: ignore[union-attr]
+        try:
+            # The refresh may have completed while this thread was waiting
+            token = self._tokens.get(key)
+            if token is not None and time.time() < token.refresh_at:
+                return Ok(token.access_token)
+            return self._store(key, refresh())
+        finally:
+            self._lock.release()
+
+    async def aget(
+        self, key: Hashable, refresh: Callable[[], Awaitable[Result[str, AuthError]]]
+    ) -> Result[str, AuthError]:
+        """Async counterpart of get()."""
+        token = self._tokens.get(key)
+        if token is not None and time.time() < token.refresh_at:
+            return Ok(token.access_token)
+
+        locks = self._async_locks.setdefault(asyncio.get_running_loop(), {})
+        lock = locks.setdefault(key, asyncio.Lock())
+        usable = token is not None and time.time() < token.expires_at
+        if usable and lock.locked():
+            # Another task is refreshing; the current token is still valid
+            return Ok(token.access_token)  # type: ignore[union-attr]
+
+        async with lock:
+            token = self._tokens.get(key)
+            if token is not None and time.time() < token.refresh_at:
+                return Ok(token.access_token)
+            return self._store(key, await refresh())
+
+    def _store(
+        self, key: Hashable, result: Result[str, AuthError]
+    ) -> Result[str, AuthError]:
+        if is_err(result):
+            token = self._tokens.get(key)
+            if token is not None and time.time() < token.expires_at:
+                logger.warning(
+                    "token refresh failed, using current token: %s", result.error()
+                )
+                return Ok(token.access_token)
+            return result
+
+        access_token = result.unwrap()
+        expires_at = _token_expiry(access_token)
+        self._tokens[key] = _ManagedToken(
+            access_token, expires_at, expires_at - self.refresh_skew
+        )
+        return result
+
 
 class AuthService(SDKClient):
     base_path = "/oauth"
@@ -109,6 +392,8 @@ class AuthService(SDKClient):
         token_cache: TokenCache | None = None,
         http_client: HttpClient | None = None,
         timeout: int = 30,
+        refresh_skew: float = DEFAULT_REFRESH_SKEW,
+        connection_pool: ConnectionPool | None = None,
     ):
         super().__init__(
             subdomain="auth",
@@ -116,9 +401,11 @@ class AuthService(SDKClient):
             get_token=None,
             http_client=http_client,
             timeout=timeout,
+            connection_pool=connection_pool,
         )
         self.audience = self.build_url("api")
         self.cache = token_cache or MemoryCache()
+        self.tokens = TokenManager(refresh_skew)
 
     @staticmethod
     def is_expired_token(token: str) -> bool:
@@ -127,18 +414,7 @@ class AuthService(SDKClient):
 
         Returns True if the token is expired or malformed (fail-safe).
         """
-        try:
-            parts = token.split(".")
-            if len(parts) != 3:
-                return True  # Invalid JWT format
-            json_data = b64decode(parts[1] + "==")
-            claims = loads(json_data)
-            if not claims or "exp" not in claims:
-                return True  # No exp claim, treat as expired
-            exp = float(claims["exp"])
-            return datetime.fromtimestamp(exp) <= datetime.now()
-        except (ValueError, IndexError, KeyError, TypeError):
-            return True  # Any parsing error = treat as expired
+        return _token_expiry(token) <= time.time()
 
     def token(
         self, client_id: str, client_secret: str, scopes: list[str] | None = None
@@ -157,20 +433,35 @@ class AuthService(SDKClient):
             - Err(AuthError) if authentication fails
         """
         scopes = scopes or []
-        cache_key = sha1(client_id.encode("utf-8"), usedforsecurity=False)
-        cache_key.update("".join(scopes).encode("utf-8"))
+        return self.tokens.get(
+            (client_id, *scopes),
+            lambda: self._refresh(client_id, client_secret, scopes),
+        )
+
+    def _refresh(
+        self, client_id: str, client_secret: str, scopes: list[str]
+    ) -> Result[str, AuthError]:
+        """Load a token from the cache, authenticating if it is due for refresh."""
+        cache_key = _token_cache_key(client_id, scopes)
 
-        cached_token = self.cache.load(cache_key.hexdigest())
+        cached_token = self.cache.load(cache_key)
+        if cached_token and not self.tokens.needs_refresh(cached_token.access_token):
+            return Ok(cached_token.access_token)
+
+        with _cache_lock(self.cache, cache_key):
+            # Another process may have refreshed the token while we waited
+            cached_token = self.cache.load(cache_key)
+            if cached_token and not self.tokens.needs_refresh(
+                cached_token.access_token
+            ):
+                return Ok(cached_token.access_token)
 
-        if not cached_token or self.is_expired_token(cached_token.access_token):
             auth_result = self._auth(client_id, client_secret, scopes)
             if is_err(auth_result):
                 return auth_result  # Propagate error
 
             token = auth_result.unwrap()
-            self.cache.save(cache_key.hexdigest(), token)
-        else:
-            token = cached_token
+            self.cache.save(cache_key, token)
 
         return Ok(token.access_token)
 
@@ -200,60 +491,216 @@ class AuthService(SDKClient):
             "POST",
             token_url,
             headers={"content-type": "application/x-www-form-urlencoded"},
-            data={
-                "grant_type": "client_credentials",
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "audience": self.audience,
-                "scope": " ".join(scopes),
-            },
+            data=_token_request_data(client_id, client_secret, self.audience, scopes),
             timeout=float(self.timeout),
         )
 
-        # Handle Result type
-        if is_err(result):
-            error = result.error()
-            # Distinguish between HTTP status errors and transport errors
-            if isinstance(error, ClientError | ServerError):
-                # HTTP error response (4xx/5xx) - server responded with error status
-                body_text = (
-                    error.response_body.decode("utf-8") if error.response_body else ""
-                )
-                return Err(
-                    AuthError(
-                        f"Auth request failed with status {error.status_code}: {body_text}"
-                    )
-                )
-            # Transport error (network, timeout, SSL, etc.)
-            return Err(AuthError(f"HTTP request failed: {error}"))
+        return _parse_token_result(result)
+
+
+class AsyncAuthService(AsyncSDKClient):
+    """Asynchronous counterpart of AuthService."""
+
+    base_path = "/oauth"
+
+    def __init__(
+        self,
+        env: str | None,
+        token_cache: TokenCache | None = None,
+        http_client: AsyncHttpClient | None = None,
+        timeout: int = 30,
+        refresh_skew: float = DEFAULT_REFRESH_SKEW,
+        connection_pool: AsyncConnectionPool | None = None,
+    ):
+        super().__init__(
+            subdomain="auth",
+            env=env,
+            get_token=None,
+            http_client=http_client,
+            timeout=timeout,
+            connection_pool=connection_pool,
+        )
+        self.audience = self.build_url("api")
+        self.cache = token_cache or MemoryCache()
+        self.tokens = TokenManager(refresh_skew)
+
+    async def token(
+        self, client_id: str, client_secret: str, scopes: list[str] | None = None
+    ) -> Result[str, AuthError]:
+        """
+        Get an OAuth access token, using cache if available.
+
+        Args:
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            scopes: Optional list of OAuth scopes
+
+        Returns:
+            Result containing either:
+            - Ok(str) with the access token
+            - Err(AuthError) if authentication fails
+        """
+        scopes = scopes or []
+        return await self.tokens.aget(
+            (client_id, *scopes),
+            lambda: self._refresh(client_id, client_secret, scopes),
+        )
+
+    async def _refresh(
+        self, client_id: str, client_secret: str, scopes: list[str]
+    ) -> Result[str, AuthError]:
+        """Load a token from the cache, authenticating if it is due for refresh."""
+        cache_key = _token_cache_key(client_id, scopes)
+
+        cached_token = self.cache.load(cache_key)
+        if cached_token and not self.tokens.needs_refresh(cached_token.access_token):
+            return Ok(cached_token.access_token)
+
+        async with _async_cache_lock(self.cache, cache_key):
+            # Another process may have refreshed the token while we waited
+            cached_token = self.cache.load(cache_key)
+            if cached_token and not self.tokens.needs_refresh(
+                cached_token.access_token
+            ):
+                return Ok(cached_token.access_token)
+
+            auth_result = await self._auth(client_id, client_secret, scopes)
+            if is_err(auth_result):
+                return auth_result  # Propagate error
+
+            token = auth_result.unwrap()
+            self.cache.save(cache_key, token)
+
+        return Ok(token.access_token)
+
+    async def _auth(
+        self,
+        client_id: str,
+        client_secret: str,
+        scopes: list[str],
+    ) -> Result[OAuthTokenResponse, AuthError]:
+        """
+        Perform OAuth client credentials authentication.
+
+        Args:
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            scopes: List of OAuth scopes to request
+
+        Returns:
+            Result containing either:
+            - Ok(OAuthTokenResponse) with access and refresh tokens
+            - Err(AuthError) if authentication fails
+        """
+        logger.info("performing client_credential authentication")
+        token_url = urljoin(self.base_path, "token")
+
+        result = await self.client.request(
+            "POST",
+            token_url,
+            headers={"content-type": "application/x-www-form-urlencoded"},
+            data=_token_request_data(client_id, client_secret, self.audience, scopes),
+            timeout=float(self.timeout),
+        )
+
+        return _parse_token_result(result)
+
+
+def _token_expiry(token: str) -> float:
+    """
+    Return the ``exp`` claim of a JWT as a Unix timestamp.
+
+    Malformed tokens and tokens without an ``exp`` claim are treated as
+    already expired (fail-safe) and return 0.
+    """
+    try:
+        parts = token.split(".")
+        if len(parts) != 3:
+            return 0.0  # Invalid JWT format
+        claims = loads(b64decode(parts[1] + "=="))
+        if not claims or "exp" not in claims:
+            return 0.0  # No exp claim, treat as expired
+        return float(claims["exp"])
+    except (ValueError, IndexError, KeyError, TypeError):
+        return 0.0  # Any parsing error = treat as expired
+
+
+def _token_cache_key(client_id: str, scopes: list[str]) -> str:
+    """Build the token cache key for a client ID and set of scopes."""
+    cache_key = sha1(client_id.encode("utf-8"), usedforsecurity=False)
+    cache_key.update("".join(scopes).encode("utf-8"))
+    return cache_key.hexdigest()
+
+
+def _token_request_data(
+    client_id: str, client_secret: str, audience: str, scopes: list[str]
+) -> dict[str, str]:
+    """Build the form body for a client_credentials token request."""
+    return {
+        "grant_type": "client_credentials",
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "audience": audience,
+        "scope": " ".join(scopes),
+    }
+
+
+def _parse_token_result(
+    result: Result[ResponseT, HttpError],
+) -> Result[OAuthTokenResponse, AuthError]:
+    """
+    Convert the token endpoint's HTTP result into a token response.
 
-        response = result.unwrap()
+    Args:
+        result: Result of the POST to the token endpoint
 
-        if response.status_code != 200:
-            text = response.text.unwrap_or("")
+    Returns:
+        Result containing either:
+        - Ok(OAuthTokenResponse) with access and refresh tokens
+        - Err(AuthError) if authentication fails
+    """
+    # Handle Result type
+    if is_err(result):
+        error = result.error()
+        # Distinguish between HTTP status errors and transport errors
+        if isinstance(error, ClientError | ServerError):
+            # HTTP error response (4xx/5xx) - server responded with error status
+            body_text = (
+                error.response_body.decode("utf-8") if error.response_body else ""
+            )
             return Err(
                 AuthError(
-                    "Unexpected error code for client_credential flow: "
-                    f"{response.status_code} - {text}"
+                    f"Auth request failed with status {error.status_code}: {body_text}"
                 )
             )
+        # Transport error (network, timeout, SSL, etc.)
+        return Err(AuthError(f"HTTP request failed: {error}"))
 
-        # Parse JSON response
-        json_result = response.json()
-        if is_err(json_result):
-            error = json_result.error()
-            return Err(
-                AuthError(
-                    f"Unexpected response body for client_credential flow: {error}"
-                )
+    response = result.unwrap()
+
+    if response.status_code != 200:
+        text = response.text.unwrap_or("")
+        return Err(
+            AuthError(
+                "Unexpected error code for client_credential flow: "
+                f"{response.status_code} - {text}"
             )
+        )
 
-        payload = json_result.unwrap()
+    # Parse JSON response
+    json_result = response.json()
+    if is_err(json_result):
+        error = json_result.error()
+        return Err(
+            AuthError(f"Unexpected response body for client_credential flow: {error}")
+        )
 
-        # Parse into Pydantic model for validation
-        try:
-            token_response = OAuthTokenResponse(**payload)
-        except ValidationError as e:
-            return Err(AuthError(f"Invalid token response structure: {e}"))
+    payload = json_result.unwrap()
+
+    # Parse into Pydantic model for validation
+    try:
+        token_response = OAuthTokenResponse(**payload)
+    except ValidationError as e:
+        return Err(AuthError(f"Invalid token response structure: {e}"))
 
-        return Ok(token_response)
+    return Ok(token_response)
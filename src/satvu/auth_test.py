@@ -1,19 +1,38 @@
 """Tests for AuthService."""
 # pragma: allowlist secret
 
+import asyncio
+import multiprocessing
+import threading
+import time
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from configparser import ConfigParser
+from datetime import datetime, timezone
 from json import dumps
+from pathlib import Path
 
+import httpx
 import pook
 import pytest
 from freezegun import freeze_time
 
-from satvu.auth import AuthError, AuthService, MemoryCache
+from satvu.auth import (
+    AppDirCache,
+    AsyncAuthService,
+    AuthError,
+    AuthService,
+    MemoryCache,
+    OAuthTokenResponse,
+    TokenManager,
+)
 from satvu.http import create_http_client
-from satvu.result import is_err, is_ok
+from satvu.http.httpx_adapter import AsyncHttpxAdapter
+from satvu.result import Err, Ok, is_err, is_ok
 
 # Fixed timestamp for consistent testing
 FIXED_TIMESTAMP = 1640000000  # 2021-12-20 12:13:20 UTC
+FIXED_NOW = datetime.fromtimestamp(FIXED_TIMESTAMP, timezone.utc)
 
 
 def create_mock_jwt_token(
@@ -416,3 +435,380 @@ def test_oauth_token_response_model_validation():
     token_dict = token_response.model_dump()
     assert token_dict["access_token"] == "test_access_token"
     assert token_dict["refresh_token"] == "test_refresh_token"
+
+
+@freeze_time("2021-12-20 12:13:20")
+def test_async_token_acquisition_and_caching():
+    """Test AsyncAuthService fetches a token once and then serves it from cache."""
+    access_token = create_mock_jwt_token()
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={"access_token": access_token, "refresh_token": "refresh"},
+        )
+
+    http_client = AsyncHttpxAdapter(
+        client=httpx.AsyncClient(
+            base_url="https://auth.satellitevu.com/oauth",
+            transport=httpx.MockTransport(handler),
+        )
+    )
+    auth_service = AsyncAuthService(
+        env=None, token_cache=MemoryCache(), http_client=http_client
+    )
+
+    async def fetch_twice():
+        first = await auth_service.token(
+            client_id="test_client_id",
+            client_secret="test_client_secret",  # pragma: allowlist secret
+        )
+        second = await auth_service.token(
+            client_id="test_client_id",
+            client_secret="test_client_secret",  # pragma: allowlist secret
+        )
+        return first, second
+
+    result1, result2 = asyncio.run(fetch_twice())
+
+    assert result1.unwrap() == access_token
+    assert result2.unwrap() == access_token
+    assert len(requests) == 1
+    assert requests[0].url.path.endswith("/token")
+    assert b"grant_type=client_credentials" in requests[0].content
+
+
+def test_async_auth_error_non_200_response():
+    """Test AsyncAuthService maps error responses to AuthError."""
+    http_client = AsyncHttpxAdapter(
+        client=httpx.AsyncClient(
+            base_url="https://auth.satellitevu.com/oauth",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(401, json={"error": "invalid_client"})
+            ),
+        )
+    )
+    auth_service = AsyncAuthService(
+        env=None, token_cache=MemoryCache(), http_client=http_client
+    )
+
+    result = asyncio.run(
+        auth_service.token(
+            client_id="bad_client",
+            client_secret="bad_secret",  # pragma: allowlist secret
+        )
+    )
+
+    assert is_err(result)
+    assert isinstance(result.error(), AuthError)
+
+
+class TestTokenManager:
+    """Tests for TokenManager."""
+
+    @staticmethod
+    def refresher(tokens: list[str]):
+        calls = []
+
+        def refresh():
+            calls.append(True)
+            return Ok(tokens[min(len(calls), len(tokens)) - 1])
+
+        return refresh, calls
+
+    @freeze_time("2021-12-20 12:13:20")
+    def test_fresh_token_is_reused(self):
+        """A fresh token is served from memory without refreshing."""
+        manager = TokenManager()
+        refresh, calls = self.refresher([create_mock_jwt_token()])
+
+        first = manager.get("key", refresh)
+        second = manager.get("key", refresh)
+
+        assert first.unwrap() == second.unwrap()
+        assert len(calls) == 1
+
+    def test_refreshes_within_skew(self):
+        """A token is refreshed once it is within the skew of expiry."""
+        first = create_mock_jwt_token(exp_seconds_from_now=3600)
+        second = create_mock_jwt_token(exp_seconds_from_now=7200)
+        manager = TokenManager(refresh_skew=120)
+        refresh, calls = self.refresher([first, second])
+
+        with freeze_time(FIXED_NOW) as frozen:
+            assert manager.get("key", refresh).unwrap() == first
+            frozen.tick(3600 - 121)
+            assert manager.get("key", refresh).unwrap() == first
+            frozen.tick(2)
+            assert manager.get("key", refresh).unwrap() == second
+
+        assert len(calls) == 2
+
+    def test_failed_refresh_keeps_unexpired_token(self):
+        """A failed proactive refresh falls back to the still-valid token."""
+        token = create_mock_jwt_token(exp_seconds_from_now=30)
+        manager = TokenManager(refresh_skew=60)
+
+        with freeze_time(FIXED_NOW):
+            manager.get("key", lambda: Ok(token))
+            result = manager.get("key", lambda: Err(AuthError("down")))
+
+        assert result.unwrap() == token
+
+    def test_failed_refresh_of_expired_token(self):
+        """Without a valid token, the refresh error is returned."""
+        manager = TokenManager()
+
+        result = manager.get("key", lambda: Err(AuthError("down")))
+
+        assert is_err(result)
+        assert isinstance(result.error(), AuthError)
+
+    def test_concurrent_refresh_is_single_flight(self):
+        """Threads needing a token at the same time share one refresh."""
+        manager = TokenManager()
+        token = create_mock_jwt_token(base_time=int(time.time()))
+        calls = []
+        barrier = threading.Barrier(16)
+
+        def refresh():
+            calls.append(True)
+            time.sleep(0.05)
+            return Ok(token)
+
+        def worker():
+            barrier.wait()
+            return manager.get("key", refresh).unwrap()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda _: worker(), range(16)))
+
+        assert results == [token] * 16
+        assert len(calls) == 1
+
+    def test_async_concurrent_refresh_is_single_flight(self):
+        """Concurrent tasks share one refresh."""
+        manager = TokenManager()
+        token = create_mock_jwt_token(base_time=int(time.time()))
+        calls = []
+
+        async def refresh():
+            calls.append(True)
+            await asyncio.sleep(0.01)
+            return Ok(token)
+
+        async def run():
+            return await asyncio.gather(
+                *(manager.aget("key", refresh) for _ in range(10))
+            )
+
+        results = asyncio.run(run())
+
+        assert [result.unwrap() for result in results] == [token] * 10
+        assert len(calls) == 1
+
+    def test_async_refresh_of_other_keys_is_not_blocked(self):
+        """A slow refresh of one token doesn't hold up the refresh of another."""
+        manager = TokenManager()
+        token = create_mock_jwt_token(base_time=int(time.time()))
+
+        async def run():
+            released = asyncio.Event()
+
+            async def slow_refresh():
+                await released.wait()
+                return Ok(token)
+
+            slow = asyncio.ensure_future(manager.aget("slow", slow_refresh))
+            await asyncio.sleep(0)
+            fast = await asyncio.wait_for(
+                manager.aget("fast", lambda: asyncio.sleep(0, Ok(token))), 1
+            )
+            released.set()
+            return fast, await slow
+
+        fast, slow = asyncio.run(run())
+
+        assert fast.unwrap() == slow.unwrap() == token
+
+    def test_async_refresh_on_successive_event_loops(self):
+        """Locks from a finished event loop aren't reused by the next one."""
+        manager = TokenManager()
+        # Already expired, so every call refreshes
+        token = create_mock_jwt_token(exp_seconds_from_now=-10)
+        calls = []
+
+        async def refresh():
+            calls.append(True)
+            await asyncio.sleep(0.01)
+            return Ok(token)
+
+        async def run():
+            return await asyncio.gather(
+                *(manager.aget("key", refresh) for _ in range(3))
+            )
+
+        for _ in range(2):
+            results = asyncio.run(run())
+            assert [result.unwrap() for result in results] == [token] * 3
+
+        assert len(calls) == 6
+
+
+def access_token(cache: AppDirCache, key: str) -> str | None:
+    token = cache.load(key)
+    return token.access_token if token else None
+
+
+class TestAppDirCache:
+    """Tests for AppDirCache."""
+
+    def test_save_and_load(self, tmp_path):
+        """Saved tokens are loaded back, including by other instances."""
+        cache = AppDirCache(str(tmp_path))
+        cache.save("client", OAuthTokenResponse(access_token="a", refresh_token="r"))
+
+        assert cache.load("client") == OAuthTokenResponse(
+            access_token="a", refresh_token="r"
+        )
+        assert AppDirCache(str(tmp_path)).load("client") == cache.load("client")
+        assert cache.load("other") is None
+
+    def test_load_skips_parsing_unchanged_file(self, tmp_path, monkeypatch):
+        """The file is only re-parsed after it has been replaced."""
+        writer = AppDirCache(str(tmp_path))
+        reader = AppDirCache(str(tmp_path))
+        writer.save("client", OAuthTokenResponse(access_token="a"))
+        reads = []
+        original_read = ConfigParser.read
+        monkeypatch.setattr(
+            ConfigParser,
+            "read",
+            lambda self, *args, **kwargs: (
+                reads.append(True) or original_read(self, *args, **kwargs)
+            ),
+        )
+
+        reader.load("client")
+        reader.load("client")
+        assert len(reads) == 1
+
+        writer.save("client", OAuthTokenResponse(access_token="b"))
+        reads.clear()
+
+        assert access_token(reader, "client") == "b"
+        assert len(reads) == 1
+
+    def test_save_keeps_entries_from_other_instances(self, tmp_path):
+        """Saving re-reads the file, so concurrent writers don't lose entries."""
+        first = AppDirCache(str(tmp_path))
+        second = AppDirCache(str(tmp_path))
+        first.load("a")
+        second.load("b")
+
+        first.save("a", OAuthTokenResponse(access_token="token-a"))
+        second.save("b", OAuthTokenResponse(access_token="token-b"))
+
+        assert access_token(first, "a") == "token-a"
+        assert access_token(first, "b") == "token-b"
+
+    def test_lock_is_reentrant(self, tmp_path):
+        """save() can be called while holding the lock."""
+        cache = AppDirCache(str(tmp_path))
+
+        with cache.lock("client"):
+            cache.save("client", OAuthTokenResponse(access_token="a"))
+
+        assert access_token(cache, "client") == "a"
+
+    def test_alock_waits_without_blocking_the_loop(self, tmp_path):
+        """alock() polls for a lock held elsewhere while other tasks run."""
+        cache = AppDirCache(str(tmp_path))
+        holding = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with AppDirCache(str(tmp_path)).lock("client"):
+                holding.set()
+                release.wait(5)
+
+        async def run():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.ensure_future(tick())
+            asyncio.get_running_loop().call_later(0.2, release.set)
+            async with cache.alock("client"):
+                cache.save("client", OAuthTokenResponse(access_token="a"))
+            ticker.cancel()
+            return ticks
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        holding.wait(5)
+        ticks = asyncio.run(run())
+        holder.join()
+
+        assert ticks >= 5
+        assert access_token(cache, "client") == "a"
+
+    def test_async_tasks_share_one_refresh(self, tmp_path):
+        """Tasks refreshing through a shared cache authenticate only once."""
+        token = create_mock_jwt_token(base_time=int(time.time()))
+        calls = []
+
+        async def fake_auth(client_id, client_secret, scopes):
+            calls.append(True)
+            await asyncio.sleep(0.05)
+            return Ok(OAuthTokenResponse(access_token=token))
+
+        async def run():
+            services = [
+                AsyncAuthService(env=None, token_cache=AppDirCache(str(tmp_path)))
+                for _ in range(4)
+            ]
+            for service in services:
+                service._auth = fake_auth  # type: ignore[method-assign]
+            return await asyncio.gather(
+                *(
+                    service.token("client_id", "secret")  # pragma: allowlist secret
+                    for service in services
+                )
+            )
+
+        results = asyncio.run(run())
+
+        assert [result.unwrap() for result in results] == [token] * 4
+        assert len(calls) == 1
+
+    def test_processes_share_one_refresh(self, tmp_path):
+        """Processes refreshing together authenticate only once."""
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(4) as pool:
+            tokens = pool.map(_refresh_in_process, [str(tmp_path)] * 4)
+
+        auth_calls = (tmp_path / "auth_calls").read_text()
+        assert len(auth_calls) == 1
+        assert len(set(tokens)) == 1
+
+
+def _refresh_in_process(cache_dir: str) -> str:
+    """Fetch a token through a shared AppDirCache, recording each auth request."""
+    token = create_mock_jwt_token(base_time=int(time.time()))
+
+    def fake_auth(client_id, client_secret, scopes):
+        with open(Path(cache_dir) / "auth_calls", "a") as handle:
+            handle.write("x")
+        time.sleep(0.2)
+        return Ok(OAuthTokenResponse(access_token=token))
+
+    service = AuthService(env=None, token_cache=AppDirCache(cache_dir))
+    service._auth = fake_auth  # type: ignore[method-assign]
+    return service.token("client_id", "secret").unwrap()  # pragma: allowlist secret
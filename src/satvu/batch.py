@@ -0,0 +1,231 @@
+"""
+Concurrent batches of API calls.
+
+map_concurrent() calls an endpoint method once per argument dict on a
+bounded thread pool, and amap_concurrent() does the same with tasks on the
+running event loop. Results are yielded in input order as soon as they are
+available, each as a Result, so one failed call never aborts the batch:
+besides HttpError, calls raising ValueError or a pydantic ValidationError
+(e.g. for a response that does not match its model) get Err(UnexpectedError).
+
+A per-call ``timeout`` is passed to the endpoint method as its request
+timeout (and, for coroutines, also enforced around the whole call). A
+``deadline`` bounds the batch as a whole: calls that have not finished when it
+passes get Err(DeadlineExceededError) and calls not started yet are skipped.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import inspect
+import time
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Mapping,
+)
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from pydantic import ValidationError
+
+from satvu.http.errors import DeadlineExceededError, HttpError, UnexpectedError
+from satvu.result import Err, Ok, Result
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+
+Calls = Iterable[Mapping[str, Any]]
+
+
+def _accepts_timeout(func: Callable[..., Any]) -> bool:
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return "timeout" in parameters or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+
+
+class _Deadline:
+    """Time left of a batch's deadline, and of the calls started within it."""
+
+    def __init__(self, timeout: float | None, deadline: float | None):
+        self.timeout = timeout
+        self.deadline = deadline
+        self.ends = time.monotonic() + deadline if deadline is not None else None
+
+    def remaining(self) -> float | None:
+        if self.ends is None:
+            return None
+        return max(self.ends - time.monotonic(), 0.0)
+
+    def call_timeout(self) -> float | None:
+        """Time limit for a call starting now."""
+        remaining = self.remaining()
+        if remaining is None or self.timeout is None:
+            return remaining if remaining is not None else self.timeout
+        return min(self.timeout, remaining)
+
+    def expired(self) -> bool:
+        return self.ends is not None and time.monotonic() >= self.ends
+
+    def error(self) -> DeadlineExceededError:
+        return DeadlineExceededError(
+            f"Batch deadline of {self.deadline}s exceeded", timeout=self.deadline
+        )
+
+
+def _with_timeout(
+    kwargs: Mapping[str, Any], timeout: float | None, accepts_timeout: bool
+) -> dict[str, Any]:
+    call = dict(kwargs)
+    if accepts_timeout and timeout is not None:
+        call.setdefault("timeout", timeout)
+    return call
+
+
+def _unexpected(error: Exception) -> UnexpectedError:
+    return UnexpectedError(
+        f"Call raised {type(error).__name__}: {error}", original_error=error
+    )
+
+
+def _call(func: Callable[..., T], kwargs: dict[str, Any]) -> Result[T, HttpError]:
+    try:
+        return Ok(func(**kwargs))
+    except HttpError as error:
+        return Err(error)
+    except (ValueError, ValidationError) as error:
+        return Err(_unexpected(error))
+
+
+def map_concurrent(
+    func: Callable[..., T],
+    calls: Calls,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float | None = None,
+    deadline: float | None = None,
+) -> Generator[Result[T, HttpError], None, None]:
+    """
+    Call ``func(**kwargs)`` for every kwargs in ``calls`` on a thread pool.
+
+    Args:
+        func: Endpoint method (or any function raising HttpError on failure)
+        calls: Keyword arguments of each call. Read lazily, so it may be a
+            generator of any length.
+        max_workers: Most calls in flight at once
+        timeout: Request timeout in seconds passed to each call that does not
+            set its own
+        deadline: Seconds for the whole batch, after which unfinished calls
+            fail with DeadlineExceededError
+
+    Yields:
+        Ok(return value) or Err(HttpError) per call, in the order of ``calls``
+
+    Example:
+        >>> calls = ({"contract_id": cid, "order_id": oid} for oid in order_ids)
+        >>> for order_id, result in zip(order_ids, map_concurrent(sdk.cos.get_order, calls)):
+        ...     ...
+    """
+    limits = _Deadline(timeout, deadline)
+    accepts_timeout = _accepts_timeout(func)
+    workers = max(1, max_workers)
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="satvu-batch")
+    pending: collections.deque[concurrent.futures.Future | None] = collections.deque()
+    inputs = iter(calls)
+    try:
+        exhausted = False
+        while True:
+            # Keep a queue of twice the pool size, so a slow call at the head
+            # does not leave workers idle
+            while not exhausted and len(pending) < 2 * workers:
+                kwargs = next(inputs, None)
+                if kwargs is None:
+                    exhausted = True
+                elif limits.expired():
+                    pending.append(None)
+                else:
+                    call = _with_timeout(kwargs, limits.call_timeout(), accepts_timeout)
+                    pending.append(executor.submit(_call, func, call))
+            if not pending:
+                return
+            future = pending.popleft()
+            if future is None:
+                yield Err(limits.error())
+                continue
+            try:
+                yield future.result(timeout=limits.remaining())
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                yield Err(limits.error())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def amap_concurrent(
+    func: Callable[..., Awaitable[T]],
+    calls: Calls,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float | None = None,
+    deadline: float | None = None,
+) -> AsyncIterator[Result[T, HttpError]]:
+    """
+    Async counterpart of map_concurrent(), running calls as tasks.
+
+    A call that runs longer than ``timeout`` is cancelled and fails with
+    DeadlineExceededError, as do calls still running at the deadline.
+    """
+    limits = _Deadline(timeout, deadline)
+    accepts_timeout = _accepts_timeout(func)
+    workers = max(1, max_workers)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def run(kwargs: Mapping[str, Any]) -> Result[T, HttpError]:
+        async with semaphore:
+            call_timeout = limits.call_timeout()
+            if limits.expired():
+                return Err(limits.error())
+            call = _with_timeout(kwargs, call_timeout, accepts_timeout)
+            try:
+                return Ok(await asyncio.wait_for(func(**call), call_timeout))
+            except HttpError as error:
+                return Err(error)
+            except (ValueError, ValidationError) as error:
+                return Err(_unexpected(error))
+            except asyncio.TimeoutError:
+                if limits.expired():
+                    return Err(limits.error())
+                return Err(
+                    DeadlineExceededError(
+                        f"Call exceeded its timeout of {timeout}s", timeout=timeout
+                    )
+                )
+
+    pending: collections.deque[asyncio.Task] = collections.deque()
+    inputs = iter(calls)
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < 2 * workers:
+                kwargs = next(inputs, None)
+                if kwargs is None:
+                    exhausted = True
+                else:
+                    pending.append(asyncio.ensure_future(run(kwargs)))
+            if not pending:
+                return
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+__all__ = ["DEFAULT_MAX_WORKERS", "amap_concurrent", "map_concurrent"]
@@ -0,0 +1,204 @@
+"""Tests for concurrent batches of API calls."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from satvu.batch import amap_concurrent, map_concurrent
+from satvu.core import AsyncSDKClient, SDKClient
+from satvu.http.errors import ClientError, DeadlineExceededError, UnexpectedError
+from satvu.result import is_err
+
+
+class Item(BaseModel):
+    id: str
+
+
+def parse(body: dict) -> Item:
+    if not body:
+        raise ValueError("Empty response")
+    return Item.model_validate(body)
+
+
+PARSE_CALLS = [{"body": {"id": "a"}}, {"body": {}}, {"body": {"id": 1}}]
+
+
+def check_parse_results(results: list) -> None:
+    """Raised ValueError and ValidationError are returned as UnexpectedError."""
+    ok, empty, invalid = results
+    assert ok.unwrap() == Item(id="a")
+    for result, raised in ((empty, ValueError), (invalid, ValidationError)):
+        assert is_err(result)
+        error = result.error()
+        assert isinstance(error, UnexpectedError)
+        assert type(error.original_error) is raised
+
+
+def lookup(id: str, timeout: int | None = None) -> str:
+    if id == "missing":
+        raise ClientError("Not found", status_code=404)
+    time.sleep(0.01 * (id == "slow"))
+    return id.upper()
+
+
+class ConcreteSDKClient(SDKClient):
+    base_path = "/otm/v2"
+
+    def get_item(self, id: str, timeout: int | None = None) -> str:
+        return lookup(id, timeout)
+
+
+class ConcreteAsyncSDKClient(AsyncSDKClient):
+    base_path = "/otm/v2"
+
+    async def get_item(self, id: str, timeout: int | None = None) -> str:
+        if id == "slow":
+            await asyncio.sleep(1)
+        return lookup(id, timeout)
+
+
+class TestMapConcurrent:
+    def test_results_in_input_order(self):
+        ids = ["slow", "a", "missing", "b"]
+
+        results = list(map_concurrent(lookup, ({"id": id} for id in ids)))
+
+        assert [r.unwrap() for r in results if r.is_ok()] == ["SLOW", "A", "B"]
+        assert is_err(results[2])
+        assert isinstance(results[2].error(), ClientError)
+
+    def test_bounded_concurrency(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def call(n: int) -> int:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return n
+
+        results = list(
+            map_concurrent(call, ({"n": n} for n in range(20)), max_workers=3)
+        )
+
+        assert [r.unwrap() for r in results] == list(range(20))
+        assert peak <= 3
+
+    def test_timeout_is_passed_to_calls(self):
+        seen = []
+
+        def call(timeout: float | None = None) -> None:
+            seen.append(timeout)
+
+        list(map_concurrent(call, [{}, {"timeout": 1}], timeout=5))
+
+        assert sorted(seen) == [1, 5]
+
+    def test_timeout_not_passed_to_functions_without_it(self):
+        results = list(map_concurrent(lambda id: id, [{"id": "a"}], timeout=5))
+
+        assert results[0].unwrap() == "a"
+
+    def test_value_and_validation_errors(self):
+        check_parse_results(list(map_concurrent(parse, PARSE_CALLS)))
+
+    def test_deadline(self):
+        release = threading.Event()
+
+        def call(n: int) -> int:
+            if n == 1:
+                release.wait(5)
+            return n
+
+        started = time.monotonic()
+        results = list(map_concurrent(call, ({"n": n} for n in range(4)), deadline=0.1))
+        release.set()
+
+        assert time.monotonic() - started < 1
+        assert results[0].unwrap() == 0
+        assert is_err(results[1])
+        assert isinstance(results[1].error(), DeadlineExceededError)
+        assert len(results) == 4
+
+    def test_stops_reading_calls_when_closed(self):
+        read = []
+
+        def calls():
+            for n in range(100):
+                read.append(n)
+                yield {"n": n}
+
+        batch = map_concurrent(lambda n: n, calls(), max_workers=2)
+        next(batch)
+        batch.close()
+
+        assert len(read) <= 5
+
+
+def test_service_methods():
+    client = ConcreteSDKClient(env=None)
+
+    results = client.batch_call("get_item", [{"id": "a"}, {"id": "missing"}])
+
+    assert results[0].unwrap() == "A"
+    assert is_err(results[1])
+    assert isinstance(results[1].error(), ClientError)
+
+
+def test_async_service_methods():
+    async def run():
+        client = ConcreteAsyncSDKClient(env=None)
+        calls = [{"id": "slow"}, {"id": "a"}, {"id": "missing"}]
+        return await client.batch_call("get_item", calls, timeout=0.05)
+
+    slow, a, missing = asyncio.run(run())
+
+    assert is_err(slow)
+    deadline = slow.error()
+    assert isinstance(deadline, DeadlineExceededError)
+    assert deadline.timeout == 0.05
+    assert a.unwrap() == "A"
+    assert is_err(missing)
+    assert isinstance(missing.error(), ClientError)
+
+
+def test_async_value_and_validation_errors():
+    async def aparse(body: dict) -> Item:
+        return parse(body)
+
+    async def run():
+        return [r async for r in amap_concurrent(aparse, PARSE_CALLS)]
+
+    check_parse_results(asyncio.run(run()))
+
+
+def test_async_deadline():
+    async def call(n: int) -> int:
+        await asyncio.sleep(n)
+        return n
+
+    async def run():
+        calls = [{"n": 0}, {"n": 5}, {"n": 0}]
+        return [r async for r in amap_concurrent(call, calls, deadline=0.05)]
+
+    results = asyncio.run(run())
+
+    assert results[0].unwrap() == 0
+    assert is_err(results[1])
+    assert isinstance(results[1].error(), DeadlineExceededError)
+    assert results[2].unwrap() == 0
+
+
+@pytest.mark.parametrize("max_workers", [0, 1])
+def test_single_worker(max_workers):
+    results = map_concurrent(lambda n: n, [{"n": 1}, {"n": 2}], max_workers=max_workers)
+
+    assert [r.unwrap() for r in results] == [1, 2]
@@ -0,0 +1,635 @@
+"""Concurrent bulk downloads of COS and OTM orders."""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import urlparse
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from satvu.download import DEFAULT_MAX_CONNECTIONS
+from satvu.http import AsyncHttpClient, HttpClient
+from satvu.http.buffers import iter_response
+from satvu.http.errors import (
+    ClientError,
+    ConnectionTimeoutError,
+    HttpError,
+    IncompleteDownloadError,
+    NetworkError,
+    ReadTimeoutError,
+    ServerError,
+    UnexpectedError,
+)
+from satvu.http.protocol import HttpMethod
+from satvu.result import Err, Ok, Result, is_err, is_ok
+
+if TYPE_CHECKING:
+    from satvu.sdk import AsyncSatVuSDK, SatVuSDK
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({401, 403, 408, 425, 429})
+"""Client error statuses worth retrying; 401/403 usually mean an expired URL."""
+
+
+class DownloadTarget(BaseModel):
+    """
+    One order, or one item of an order, to download.
+
+    ``service`` selects the ordering API: ``"cos"`` for catalog orders or
+    ``"otm"`` for tasking orders. Items can only be downloaded individually
+    from COS. Without ``output_path`` the file is named after the order (and
+    item) inside the manager's output directory.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    contract_id: UUID
+    order_id: UUID
+    item_id: str | None = None
+    service: Literal["cos", "otm"] = "cos"
+    output_path: Path | None = None
+
+    @model_validator(mode="after")
+    def _check_item(self) -> "DownloadTarget":
+        if self.item_id is not None and self.service != "cos":
+            raise ValueError("item downloads are only supported for COS orders")
+        return self
+
+    @classmethod
+    def coerce(
+        cls,
+        target: "DownloadTarget | tuple[Any, ...]",
+        service: Literal["cos", "otm"] = "cos",
+    ) -> "DownloadTarget":
+        """Accept a target or a ``(contract_id, order_id[, item_id])`` tuple."""
+        if isinstance(target, DownloadTarget):
+            return target
+        keys = ("contract_id", "order_id", "item_id")
+        if not 2 <= len(target) <= len(keys):
+            raise ValueError(
+                f"Expected (contract_id, order_id[, item_id]), got {target!r}"
+            )
+        return cls(service=service, **dict(zip(keys, target, strict=False)))
+
+    def default_filename(self) -> str:
+        if self.item_id is None:
+            return f"{self.order_id}.zip"
+        return f"{self.order_id}_{self.item_id}.zip"
+
+
+class BulkProgress(BaseModel):
+    """Snapshot of aggregate progress across all targets of a bulk download."""
+
+    total_targets: int
+    completed: int = 0
+    failed: int = 0
+    bytes_downloaded: int = 0
+    total_bytes: int | None = None
+    elapsed: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average throughput since the download started."""
+        return self.bytes_downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+BulkProgressCallback = Callable[[BulkProgress], None]
+
+
+class BulkDownloadResult:
+    """Per-target results of a bulk download."""
+
+    def __init__(
+        self,
+        results: dict[DownloadTarget, Result[Path, HttpError]],
+        progress: BulkProgress,
+    ):
+        self.results = results
+        self.progress = progress
+
+    def __iter__(self) -> Iterator[tuple[DownloadTarget, Result[Path, HttpError]]]:
+        return iter(self.results.items())
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> dict[DownloadTarget, Path]:
+        return {
+            target: result.unwrap()
+            for target, result in self.results.items()
+            if is_ok(result)
+        }
+
+    @property
+    def failed(self) -> dict[DownloadTarget, HttpError]:
+        return {
+            target: result.error()
+            for target, result in self.results.items()
+            if is_err(result)
+        }
+
+
+def is_retryable(error: HttpError) -> bool:
+    """Whether a failed download is worth retrying (and resuming)."""
+    if isinstance(error, ClientError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(
+        error,
+        ServerError
+        | NetworkError
+        | ConnectionTimeoutError
+        | ReadTimeoutError
+        | IncompleteDownloadError,
+    )
+
+
+class _Tracker:
+    """Aggregates per-target byte counts into a BulkProgress."""
+
+    def __init__(self, total_targets: int, callback: BulkProgressCallback | None):
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._done: dict[DownloadTarget, int] = {}
+        self._totals: dict[DownloadTarget, int | None] = {}
+        self._transferred = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_targets = total_targets
+
+    def target_callback(
+        self, target: DownloadTarget
+    ) -> Callable[[int, int | None], None]:
+        def update(downloaded: int, total: int | None) -> None:
+            with self._lock:
+                # Resumed attempts start from the bytes already on disk, so
+                # only growth beyond the last report is new data
+                previous = self._done.get(target, 0)
+                self._transferred += max(0, downloaded - previous)
+                self._done[target] = downloaded
+                self._totals[target] = total
+            self._report()
+
+        return update
+
+    def finish(self, target: DownloadTarget, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._completed += 1
+            else:
+                self._failed += 1
+        self._report()
+
+    def snapshot(self) -> BulkProgress:
+        with self._lock:
+            totals = list(self._totals.values())
+            # The overall size is only known once every target has reported one
+            known = len(totals) == self._total_targets and None not in totals
+            return BulkProgress(
+                total_targets=self._total_targets,
+                completed=self._completed,
+                failed=self._failed,
+                bytes_downloaded=self._transferred,
+                total_bytes=sum(t for t in totals if t is not None) if known else None,
+                elapsed=time.monotonic() - self._started,
+            )
+
+    def _report(self) -> None:
+        if self.callback:
+            self.callback(self.snapshot())
+
+
+class _Slot:
+    """A slot of a host limiter, released exactly once."""
+
+    def __init__(self, release: Callable[[], None]):
+        self._release: Callable[[], None] | None = release
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        with self._lock:
+            release, self._release = self._release, None
+        if release is not None:
+            release()
+
+
+class _SlotResponse:
+    """
+    Response holding its host's slot until the body has been read.
+
+    The slot is released once the body is read to the end, its stream is
+    closed, or the response is garbage collected unread.
+    """
+
+    def __init__(self, response: Any, slot: _Slot):
+        self._response = response
+        self._slot = slot
+        weakref.finalize(self, slot.release)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def body(self) -> bytes:
+        try:
+            return self._response.body
+        finally:
+            self._slot.release()
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        try:
+            n = self._response.readinto(buffer)
+        except BaseException:
+            self._slot.release()
+            raise
+        if not n:
+            self._slot.release()
+        return n
+
+    def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes]:
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        finally:
+            self._slot.release()
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[Any]:
+        try:
+            yield from iter_response(self._response, buffer)
+        finally:
+            self._slot.release()
+
+    async def aiter_bytes(self, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            self._slot.release()
+
+
+class _HostLimiter:
+    """At most ``limit`` concurrent transfers per host, across all targets."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    def semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[host]
+
+
+class _AsyncHostLimiter:
+    """Async counterpart of _HostLimiter."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.limit)
+        return self._semaphores[host]
+
+
+class _HostLimitedClient:
+    """HttpClient whose requests each hold a slot of a _HostLimiter."""
+
+    def __init__(self, client: HttpClient, limiter: _HostLimiter):
+        self.client = client
+        self.limiter = limiter
+
+    def request(self, method: HttpMethod, url: str, **kwargs: Any) -> Any:
+        semaphore = self.limiter.semaphore(url)
+        semaphore.acquire()
+        slot = _Slot(semaphore.release)
+        try:
+            result = self.client.request(method, url, **kwargs)
+        except BaseException:
+            slot.release()
+            raise
+        if is_err(result):
+            slot.release()
+            return result
+        return Ok(_SlotResponse(result.unwrap(), slot))
+
+
+class _AsyncHostLimitedClient:
+    """AsyncHttpClient whose requests each hold a slot of an _AsyncHostLimiter."""
+
+    def __init__(self, client: AsyncHttpClient, limiter: _AsyncHostLimiter):
+        self.client = client
+        self.limiter = limiter
+
+    async def request(self, method: HttpMethod, url: str, **kwargs: Any) -> Any:
+        semaphore = self.limiter.semaphore(url)
+        await semaphore.acquire()
+        slot = _Slot(semaphore.release)
+        try:
+            result = await self.client.request(method, url, **kwargs)
+        except BaseException:
+            slot.release()
+            raise
+        if is_err(result):
+            slot.release()
+            return result
+        return Ok(_SlotResponse(result.unwrap(), slot))
+
+
+class _BulkDownloaderBase(ABC):
+    """Configuration shared by DownloadManager and AsyncDownloadManager."""
+
+    def __init__(
+        self,
+        output_dir: Path | str = ".",
+        *,
+        max_workers: int = 8,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int | None = 32,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        chunk_size: int = 65536,
+        progress_callback: BulkProgressCallback | None = None,
+    ):
+        """
+        Args:
+            output_dir: Directory for targets without an explicit output_path
+            max_workers: Number of targets downloaded concurrently
+            max_connections: Range requests per target, see download_to_file()
+            max_connections_per_host: Cap on concurrent requests to any one
+                storage host across all targets and downloads of this manager.
+                A request holds its slot until its body has been read. None
+                for no cap.
+            max_attempts: Attempts per target; retries resume partial files
+            retry_delay: Delay before the first retry in seconds, doubled for
+                each further retry
+            max_retry_delay: Upper bound for the retry delay in seconds
+            chunk_size: Bytes per chunk read from each response
+            progress_callback: Called with a BulkProgress snapshot whenever any
+                target makes progress. May be called from worker threads.
+        """
+        self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self._host_limiter: Any = None
+
+    def _targets(
+        self,
+        targets: Iterable[DownloadTarget | tuple[Any, ...]],
+        service: Literal["cos", "otm"],
+    ) -> list[DownloadTarget]:
+        return list(
+            dict.fromkeys(DownloadTarget.coerce(t, service=service) for t in targets)
+        )
+
+    def _output_path(self, target: DownloadTarget) -> Path:
+        return target.output_path or self.output_dir / target.default_filename()
+
+    def _should_retry(self, error: HttpError, attempt: int) -> bool:
+        return attempt < self.max_attempts and is_retryable(error)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.retry_delay * 2 ** (attempt - 1), self.max_retry_delay)
+
+    @abstractmethod
+    def _limited(self, client: Any) -> Any:
+        """Wrap a service's transfer client in the manager's host limiter."""
+
+    @staticmethod
+    def _unexpected(target: DownloadTarget, error: Exception) -> UnexpectedError:
+        logger.exception("Download of %s raised", target.order_id)
+        return UnexpectedError(
+            f"Download of {target.order_id} raised {type(error).__name__}",
+            original_error=error,
+        )
+
+    def _method_and_kwargs(
+        self, sdk: Any, target: DownloadTarget, tracker: _Tracker
+    ) -> tuple[Callable[..., Any], dict[str, Any]]:
+        kwargs: dict[str, Any] = {
+            "contract_id": target.contract_id,
+            "order_id": target.order_id,
+            "output_path": self._output_path(target),
+            "chunk_size": self.chunk_size,
+            "progress_callback": tracker.target_callback(target),
+            "max_connections": self.max_connections,
+            "resume": True,
+        }
+        if self._host_limiter is not None:
+            service = getattr(sdk, target.service)
+            kwargs["transfer_client"] = self._limited(service.transfer_client)
+        if target.service == "otm":
+            return sdk.otm.download_tasking_order_to_file, kwargs
+        if target.item_id is not None:
+            kwargs["item_id"] = target.item_id
+            return sdk.cos.download_order_item_to_file, kwargs
+        return sdk.cos.download_order_to_file, kwargs
+
+
+class DownloadManager(_BulkDownloaderBase):
+    """
+    Download many orders concurrently with retries and resumable transfers.
+
+    Targets run on a bounded thread pool; each target's file is itself fetched
+    as parallel byte ranges. Failed targets are retried with exponential
+    backoff and resume from their ``.part`` file, and every target gets its
+    own Result, so one failure never aborts the batch.
+
+    Example:
+        >>> manager = DownloadManager(sdk, output_dir="./orders", max_workers=16)
+        >>> summary = manager.download(
+        ...     [(contract_id, order_id), (contract_id, order_id, item_id)]
+        ... )
+        >>> for target, error in summary.failed.items():
+        ...     print(target.order_id, error)
+    """
+
+    def __init__(self, sdk: "SatVuSDK", output_dir: Path | str = ".", **kwargs: Any):
+        """
+        Args:
+            sdk: SDK whose ``cos`` and ``otm`` services perform the downloads
+            output_dir: Directory for targets without an explicit output_path
+            **kwargs: Options described in _BulkDownloaderBase.__init__
+        """
+        super().__init__(output_dir, **kwargs)
+        self.sdk = sdk
+        self._host_limiter = (
+            _HostLimiter(self.max_connections_per_host)
+            if self.max_connections_per_host is not None
+            else None
+        )
+
+    def download(
+        self,
+        targets: Iterable[DownloadTarget | tuple[Any, ...]],
+        service: Literal["cos", "otm"] = "cos",
+    ) -> BulkDownloadResult:
+        """
+        Download all targets and return a per-target summary.
+
+        Args:
+            targets: DownloadTarget instances or ``(contract_id, order_id[,
+                item_id])`` tuples; duplicates are downloaded once
+            service: Service used for tuple targets
+
+        Returns:
+            BulkDownloadResult mapping each target to Ok(Path) or Err(HttpError)
+        """
+        items = self._targets(targets, service)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tracker = _Tracker(len(items), self.progress_callback)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.max_workers),
+            thread_name_prefix="satvu-bulk",
+        ) as executor:
+            futures = {
+                target: executor.submit(self._download_one, target, tracker)
+                for target in items
+            }
+            results = {target: future.result() for target, future in futures.items()}
+
+        return BulkDownloadResult(results, tracker.snapshot())
+
+    def _download_one(
+        self, target: DownloadTarget, tracker: _Tracker
+    ) -> Result[Path, HttpError]:
+        method, kwargs = self._method_and_kwargs(self.sdk, target, tracker)
+        result = self._attempt(target, method, kwargs)
+        attempt = 1
+        while is_err(result) and self._should_retry(result.error(), attempt):
+            delay = self._backoff(attempt)
+            logger.info(
+                "Download of %s failed (%s), retrying in %.1fs",
+                target.order_id,
+                result.error(),
+                delay,
+            )
+            time.sleep(delay)
+            attempt += 1
+            result = self._attempt(target, method, kwargs)
+        tracker.finish(target, is_ok(result))
+        return result
+
+    def _attempt(
+        self,
+        target: DownloadTarget,
+        method: Callable[..., Result[Path, HttpError]],
+        kwargs: dict[str, Any],
+    ) -> Result[Path, HttpError]:
+        try:
+            return method(**kwargs)
+        except HttpError as error:
+            return Err(error)
+        except Exception as error:
+            return Err(self._unexpected(target, error))
+
+    def _limited(self, client: HttpClient) -> _HostLimitedClient:
+        return _HostLimitedClient(client, self._host_limiter)
+
+
+class AsyncDownloadManager(_BulkDownloaderBase):
+    """
+    Asynchronous counterpart of DownloadManager for AsyncSatVuSDK.
+
+    Targets run as tasks on the event loop, at most ``max_workers`` at a time.
+    """
+
+    def __init__(
+        self, sdk: "AsyncSatVuSDK", output_dir: Path | str = ".", **kwargs: Any
+    ):
+        super().__init__(output_dir, **kwargs)
+        self.sdk = sdk
+        self._host_limiter = (
+            _AsyncHostLimiter(self.max_connections_per_host)
+            if self.max_connections_per_host is not None
+            else None
+        )
+
+    async def download(
+        self,
+        targets: Iterable[DownloadTarget | tuple[Any, ...]],
+        service: Literal["cos", "otm"] = "cos",
+    ) -> BulkDownloadResult:
+        """Download all targets and return a per-target summary."""
+        items = self._targets(targets, service)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tracker = _Tracker(len(items), self.progress_callback)
+        semaphore = asyncio.Semaphore(max(1, self.max_workers))
+
+        async def run(target: DownloadTarget) -> Result[Path, HttpError]:
+            async with semaphore:
+                return await self._download_one(target, tracker)
+
+        outcomes = await asyncio.gather(*(run(target) for target in items))
+
+        return BulkDownloadResult(
+            dict(zip(items, outcomes, strict=True)), tracker.snapshot()
+        )
+
+    async def _download_one(
+        self, target: DownloadTarget, tracker: _Tracker
+    ) -> Result[Path, HttpError]:
+        method, kwargs = self._method_and_kwargs(self.sdk, target, tracker)
+        result = await self._attempt(target, method, kwargs)
+        attempt = 1
+        while is_err(result) and self._should_retry(result.error(), attempt):
+            delay = self._backoff(attempt)
+            logger.info(
+                "Download of %s failed (%s), retrying in %.1fs",
+                target.order_id,
+                result.error(),
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+            result = await self._attempt(target, method, kwargs)
+        tracker.finish(target, is_ok(result))
+        return result
+
+    async def _attempt(
+        self,
+        target: DownloadTarget,
+        method: Callable[..., Awaitable[Result[Path, HttpError]]],
+        kwargs: dict[str, Any],
+    ) -> Result[Path, HttpError]:
+        try:
+            return await method(**kwargs)
+        except HttpError as error:
+            return Err(error)
+        except Exception as error:
+            return Err(self._unexpected(target, error))
+
+    def _limited(self, client: AsyncHttpClient) -> _AsyncHostLimitedClient:
+        return _AsyncHostLimitedClient(client, self._host_limiter)
+
+
+__all__ = [
+    "AsyncDownloadManager",
+    "BulkDownloadResult",
+    "BulkProgress",
+    "DownloadManager",
+    "DownloadTarget",
+    "is_retryable",
+]
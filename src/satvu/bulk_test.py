@@ -0,0 +1,393 @@
+"""Tests for bulk order downloads."""
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from satvu.bulk import (
+    AsyncDownloadManager,
+    DownloadManager,
+    DownloadTarget,
+    _AsyncHostLimitedClient,
+    _AsyncHostLimiter,
+    _HostLimitedClient,
+    _HostLimiter,
+    is_retryable,
+)
+from satvu.http.errors import (
+    ClientError,
+    IncompleteDownloadError,
+    ServerError,
+    UnexpectedError,
+)
+from satvu.http.httpx_adapter import AsyncHttpxAdapter, HttpxAdapter
+from satvu.result import Err, Ok, is_err, is_ok
+
+CONTRACT_ID = uuid4()
+
+
+def server_error() -> ServerError:
+    return ServerError(message="Server error: 503", status_code=503, url="u")
+
+
+def fake_download(fail_times: dict | None = None):
+    """Build a *_to_file stand-in that writes a file and reports progress."""
+    fail_times = dict(fail_times or {})
+    calls = []
+
+    def download(**kwargs):
+        calls.append(kwargs)
+        key = kwargs.get("item_id") or kwargs["order_id"]
+        if fail_times.get(key, 0) > 0:
+            fail_times[key] -= 1
+            return Err(server_error())
+        kwargs["progress_callback"](100, 100)
+        Path(kwargs["output_path"]).write_bytes(b"x" * 100)
+        return Ok(Path(kwargs["output_path"]))
+
+    download.calls = calls
+    return download
+
+
+def make_sdk(**methods) -> MagicMock:
+    sdk = MagicMock()
+    for name, method in methods.items():
+        service, attr = name.split("__")
+        setattr(getattr(sdk, service), attr, method)
+    return sdk
+
+
+class TestDownloadTarget:
+    """Tests for DownloadTarget."""
+
+    def test_coerce_tuples(self):
+        """Two- and three-tuples become order and item targets."""
+        order_id = uuid4()
+
+        order = DownloadTarget.coerce((CONTRACT_ID, order_id))
+        item = DownloadTarget.coerce((CONTRACT_ID, order_id, "item-1"), service="cos")
+
+        assert order.item_id is None
+        assert item.item_id == "item-1"
+        assert item.default_filename() == f"{order_id}_item-1.zip"
+
+    def test_coerce_rejects_bad_tuples(self):
+        """Tuples of the wrong length are rejected."""
+        with pytest.raises(ValueError):
+            DownloadTarget.coerce((CONTRACT_ID,))
+
+    def test_otm_items_are_rejected(self):
+        """Tasking orders cannot be downloaded item by item."""
+        with pytest.raises(ValidationError):
+            DownloadTarget(
+                contract_id=CONTRACT_ID, order_id=uuid4(), item_id="x", service="otm"
+            )
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (server_error(), True),
+        (IncompleteDownloadError(message="short", url="u"), True),
+        (ClientError(message="", status_code=403, url="u"), True),
+        (ClientError(message="", status_code=404, url="u"), False),
+    ],
+)
+def test_is_retryable(error, expected):
+    """Transient and expired-URL errors are retried, missing orders are not."""
+    assert is_retryable(error) is expected
+
+
+class TestDownloadManager:
+    """Tests for DownloadManager."""
+
+    def test_dispatches_to_services(self, tmp_path):
+        """Orders, items and tasking orders use their generated methods."""
+        order, item, tasking = fake_download(), fake_download(), fake_download()
+        sdk = make_sdk(
+            cos__download_order_to_file=order,
+            cos__download_order_item_to_file=item,
+            otm__download_tasking_order_to_file=tasking,
+        )
+        order_id = uuid4()
+
+        summary = DownloadManager(
+            sdk, tmp_path, max_connections_per_host=None
+        ).download(
+            [
+                (CONTRACT_ID, order_id),
+                (CONTRACT_ID, order_id, "item-1"),
+                DownloadTarget(
+                    contract_id=CONTRACT_ID, order_id=uuid4(), service="otm"
+                ),
+            ]
+        )
+
+        assert len(summary.succeeded) == 3
+        assert order.calls[0]["output_path"] == tmp_path / f"{order_id}.zip"
+        assert order.calls[0]["resume"] is True
+        assert item.calls[0]["item_id"] == "item-1"
+        assert len(tasking.calls) == 1
+
+    def test_retries_transient_failures(self, tmp_path):
+        """Failed targets are retried with backoff and resumed."""
+        order_id = uuid4()
+        download = fake_download(fail_times={order_id: 2})
+        manager = DownloadManager(
+            make_sdk(cos__download_order_to_file=download),
+            tmp_path,
+            max_connections_per_host=None,
+            retry_delay=0.5,
+        )
+
+        with patch("satvu.bulk.time.sleep") as mock_sleep:
+            summary = manager.download([(CONTRACT_ID, order_id)])
+
+        assert len(summary.succeeded) == 1
+        assert len(download.calls) == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_failures_are_reported_per_target(self, tmp_path):
+        """One failing target does not affect the others."""
+        bad, good = uuid4(), uuid4()
+        manager = DownloadManager(
+            make_sdk(cos__download_order_to_file=fake_download(fail_times={bad: 9})),
+            tmp_path,
+            max_connections_per_host=None,
+            max_attempts=2,
+        )
+
+        with patch("satvu.bulk.time.sleep"):
+            summary = manager.download([(CONTRACT_ID, bad), (CONTRACT_ID, good)])
+
+        assert [t.order_id for t in summary.succeeded] == [good]
+        assert isinstance(
+            summary.failed[DownloadTarget.coerce((CONTRACT_ID, bad))], ServerError
+        )
+        assert summary.progress.completed == 1
+        assert summary.progress.failed == 1
+
+    def test_exceptions_are_reported_per_target(self, tmp_path):
+        """A target whose download raises fails alone, without a retry."""
+        bad, good = uuid4(), uuid4()
+        succeed = fake_download()
+        calls = []
+
+        def download(**kwargs):
+            calls.append(kwargs["order_id"])
+            if kwargs["order_id"] == bad:
+                raise OSError("disk full")
+            return succeed(**kwargs)
+
+        manager = DownloadManager(
+            make_sdk(cos__download_order_to_file=download),
+            tmp_path,
+            max_connections_per_host=None,
+        )
+
+        summary = manager.download([(CONTRACT_ID, bad), (CONTRACT_ID, good)])
+
+        assert [t.order_id for t in summary.succeeded] == [good]
+        error = summary.failed[DownloadTarget.coerce((CONTRACT_ID, bad))]
+        assert isinstance(error, UnexpectedError)
+        assert isinstance(error.original_error, OSError)
+        assert calls.count(bad) == 1
+
+    def test_aggregate_progress(self, tmp_path):
+        """Progress snapshots combine bytes across targets."""
+        snapshots = []
+        manager = DownloadManager(
+            make_sdk(cos__download_order_to_file=fake_download()),
+            tmp_path,
+            max_connections_per_host=None,
+            progress_callback=snapshots.append,
+        )
+
+        summary = manager.download([(CONTRACT_ID, uuid4()) for _ in range(5)])
+
+        assert summary.progress.bytes_downloaded == 500
+        assert summary.progress.total_bytes == 500
+        assert snapshots[-1].completed == 5
+
+    def test_services_share_one_host_limiter(self, tmp_path):
+        """COS and OTM transfers are limited together, without touching the SDK."""
+        order, tasking = fake_download(), fake_download()
+        sdk = make_sdk(
+            cos__download_order_to_file=order,
+            otm__download_tasking_order_to_file=tasking,
+        )
+        cos_client, otm_client = sdk.cos.transfer_client, sdk.otm.transfer_client
+
+        DownloadManager(sdk, tmp_path, max_connections_per_host=2).download(
+            [
+                (CONTRACT_ID, uuid4()),
+                DownloadTarget(
+                    contract_id=CONTRACT_ID, order_id=uuid4(), service="otm"
+                ),
+            ]
+        )
+
+        cos, otm = (
+            order.calls[0]["transfer_client"],
+            tasking.calls[0]["transfer_client"],
+        )
+        assert isinstance(cos, _HostLimitedClient)
+        assert cos.client is cos_client
+        assert otm.client is otm_client
+        assert cos.limiter is otm.limiter
+        assert sdk.cos.transfer_client is cos_client
+
+    def test_no_host_limit(self, tmp_path):
+        """Without a cap the services' own transfer clients are used."""
+        order = fake_download()
+        sdk = make_sdk(cos__download_order_to_file=order)
+
+        DownloadManager(sdk, tmp_path, max_connections_per_host=None).download(
+            [(CONTRACT_ID, uuid4())]
+        )
+
+        assert "transfer_client" not in order.calls[0]
+
+
+def limited_client(handler, limit: int) -> _HostLimitedClient:
+    return _HostLimitedClient(
+        HttpxAdapter(client=httpx.Client(transport=httpx.MockTransport(handler))),
+        _HostLimiter(limit),
+    )
+
+
+def test_host_limited_client_caps_concurrency():
+    """No more than ``limit`` requests to one host run at once."""
+    active, peak = [0], [0]
+    lock = threading.Lock()
+    gate = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        gate.wait(0.05)
+        with lock:
+            active[0] -= 1
+        return httpx.Response(200)
+
+    client = limited_client(handler, 2)
+    threads = [
+        threading.Thread(target=client.request, args=("GET", "https://a.example/f"))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+
+
+def test_host_limited_client_holds_slot_until_body_is_read():
+    """A response keeps its host's slot until its body has been streamed."""
+    requests = []
+    client = limited_client(
+        lambda request: requests.append(request) or httpx.Response(200, content=b"x"),
+        1,
+    )
+    first = client.request("GET", "https://a.example/f").unwrap()
+    second = threading.Thread(
+        target=client.request, args=("GET", "https://a.example/g")
+    )
+    second.start()
+    second.join(0.1)
+
+    assert second.is_alive()
+    assert len(requests) == 1
+
+    assert b"".join(first.iter_bytes()) == b"x"
+    second.join(1)
+
+    assert not second.is_alive()
+    assert len(requests) == 2
+
+
+def test_async_host_limited_client_holds_slot_until_body_is_read():
+    """An async response keeps its host's slot until its body has been streamed."""
+
+    async def run():
+        client = _AsyncHostLimitedClient(
+            AsyncHttpxAdapter(
+                client=httpx.AsyncClient(
+                    transport=httpx.MockTransport(
+                        lambda request: httpx.Response(200, content=b"x")
+                    )
+                )
+            ),
+            _AsyncHostLimiter(1),
+        )
+        first = (await client.request("GET", "https://a.example/f")).unwrap()
+        second = asyncio.ensure_future(client.request("GET", "https://a.example/g"))
+        await asyncio.sleep(0.05)
+        waiting = not second.done()
+        body = b"".join([chunk async for chunk in first.aiter_bytes()])
+        await asyncio.wait_for(second, 1)
+        return waiting, body
+
+    waiting, body = asyncio.run(run())
+
+    assert waiting
+    assert body == b"x"
+
+
+class TestAsyncDownloadManager:
+    """Tests for AsyncDownloadManager."""
+
+    def test_downloads_and_retries(self, tmp_path):
+        """Targets run concurrently and transient failures are retried."""
+        order_id = uuid4()
+        sync_download = fake_download(fail_times={order_id: 1})
+        method = AsyncMock(side_effect=lambda **kwargs: sync_download(**kwargs))
+        sdk = make_sdk(cos__download_order_to_file=method)
+        manager = AsyncDownloadManager(sdk, tmp_path, max_connections_per_host=None)
+
+        with patch("satvu.bulk.asyncio.sleep", new_callable=AsyncMock):
+            summary = asyncio.run(
+                manager.download([(CONTRACT_ID, order_id), (CONTRACT_ID, uuid4())])
+            )
+
+        assert all(is_ok(result) for _, result in summary)
+        assert method.await_count == 3
+
+    def test_non_retryable_error(self, tmp_path):
+        """Errors that cannot succeed on retry are returned immediately."""
+        method = AsyncMock(
+            return_value=Err(ClientError(message="", status_code=404, url="u"))
+        )
+        manager = AsyncDownloadManager(
+            make_sdk(cos__download_order_to_file=method),
+            tmp_path,
+            max_connections_per_host=None,
+        )
+
+        summary = asyncio.run(manager.download([(CONTRACT_ID, uuid4())]))
+
+        assert all(is_err(result) for _, result in summary)
+        assert method.await_count == 1
+
+    def test_exceptions_are_reported_per_target(self, tmp_path):
+        """A raising download is returned as Err(UnexpectedError)."""
+        method = AsyncMock(side_effect=ValueError("bad response"))
+        manager = AsyncDownloadManager(
+            make_sdk(cos__download_order_to_file=method),
+            tmp_path,
+            max_connections_per_host=None,
+        )
+
+        summary = asyncio.run(manager.download([(CONTRACT_ID, uuid4())]))
+
+        [error] = summary.failed.values()
+        assert isinstance(error, UnexpectedError)
+        assert summary.progress.failed == 1
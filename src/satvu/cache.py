@@ -0,0 +1,575 @@
+"""
+Caching of API responses.
+
+A ResponseCache keeps successful JSON responses to GET requests in memory,
+evicting the least recently used once ``max_entries`` or ``max_bytes`` is
+reached, and optionally in a directory so they outlive the process and are
+shared with other processes. An entry is fresh for its endpoint's TTL. After
+that it is revalidated with ``If-None-Match``/``If-Modified-Since`` if the
+response had an ETag or Last-Modified header: a 304 Not Modified refreshes
+the entry without transferring or parsing the body again.
+
+Each entry's body is parsed into models once, and every hit returns the same
+objects, so treat them as read-only. A successful POST, PUT, PATCH or DELETE
+drops the cached responses of its API that share its first path segment, so
+``PUT /user/settings`` drops ``GET /user/details``.
+"""
+
+import contextlib
+import hashlib
+import json as json_lib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Hashable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from satvu.download import header_value
+from satvu.http.buffers import BytesReader
+from satvu.http.errors import HttpError, JsonDecodeError, TextDecodeError
+from satvu.http.protocol import HttpResponse
+from satvu.result import Err, Ok, Result, is_err
+from satvu.shared.parsing import annotation_key, parse_response
+
+DEFAULT_TTL = 60.0
+"""Seconds a cached response is used without revalidating it."""
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+"""Combined size of the bodies kept in memory (32 MiB)."""
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# Response headers sent back as conditional request headers
+_VALIDATORS = {"etag": "If-None-Match", "last-modified": "If-Modified-Since"}
+
+
+def _hash(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _is_hash(name: str) -> bool:
+    """Whether a file name is one _hash() produced."""
+    return len(name) == 64 and all(c in "0123456789abcdef" for c in name)
+
+
+def _remove_entries(directory: Path) -> None:
+    """Delete the entry files in a scope's directory, and it if left empty."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        if _is_hash(name) or name.startswith(".tmp-"):
+            with contextlib.suppress(OSError):
+                (directory / name).unlink()
+    with contextlib.suppress(OSError):
+        directory.rmdir()
+
+
+class _Entry:
+    """A cached response body with its headers and parsed forms."""
+
+    def __init__(
+        self,
+        scope: str,
+        status_code: int,
+        headers: dict[str, str],
+        body: bytes,
+        expires: float,
+    ):
+        self.scope = scope
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.expires = expires
+        # Parsed body by annotation_key() of the annotation it was parsed as
+        self.parsed: dict[Hashable, Any] = {}
+
+    def copy(self) -> "_Entry":
+        """The same response without its parsed forms, sharing the body."""
+        return _Entry(
+            self.scope, self.status_code, self.headers, self.body, self.expires
+        )
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers to revalidate the entry with."""
+        return {
+            request_header: value
+            for name, request_header in _VALIDATORS.items()
+            if (value := header_value(self.headers, name)) is not None
+        }
+
+    def dump(self) -> bytes:
+        meta = {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "expires": self.expires,
+        }
+        return json_lib.dumps(meta).encode() + b"\n" + self.body
+
+    @classmethod
+    def load(cls, scope: str, data: bytes) -> "_Entry":
+        meta, _, body = data.partition(b"\n")
+        fields = json_lib.loads(meta)
+        return cls(
+            scope, fields["status_code"], fields["headers"], body, fields["expires"]
+        )
+
+
+class CachedResponse:
+    """
+    A response held in memory, served from a ResponseCache or shared by
+    coalesced requests instead of read from the network.
+
+    Conforms to the HttpResponse and AsyncHttpResponse protocols. Each caller
+    gets its own CachedResponse, so streaming one does not affect the others.
+    """
+
+    def __init__(self, entry: _Entry):
+        self._entry = entry
+        self._reader = BytesReader(entry.body)
+
+    @classmethod
+    def from_response(cls, response: HttpResponse) -> "CachedResponse":
+        """
+        Read a response into memory, so it can be handed to several callers.
+
+        The result is not stored in any cache. Calling copy() on it gives each
+        caller its own stream over the body and its own parsed models.
+        """
+        if isinstance(response, CachedResponse):
+            return response.copy()
+        entry = _Entry(
+            "", response.status_code, dict(response.headers), response.body, 0.0
+        )
+        return cls(entry)
+
+    def copy(self) -> "CachedResponse":
+        """
+        Another response over the same body, parsing its own models.
+
+        The body is immutable and shared; models parsed from the copy are not
+        shared with any other response, so callers may change them.
+        """
+        return CachedResponse(self._entry.copy())
+
+    @property
+    def status_code(self) -> int:
+        return self._entry.status_code
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return dict(self._entry.headers)
+
+    @property
+    def body(self) -> bytes:
+        return self._entry.body
+
+    def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes]:
+        for chunk in self._reader.iter_bytes(chunk_size):
+            yield bytes(chunk)
+
+    async def aiter_bytes(self, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+        for chunk in self._reader.iter_bytes(chunk_size):
+            yield bytes(chunk)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        return self._reader.readinto(buffer)
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[memoryview]:
+        return self._reader.iter_into(buffer)
+
+    @property
+    def text(self) -> Result[str, TextDecodeError]:
+        try:
+            return Ok(self.body.decode("utf-8"))
+        except UnicodeDecodeError as e:
+            return Err(
+                TextDecodeError(
+                    message=f"Failed to decode response body as UTF-8: {e}",
+                    encoding="utf-8",
+                    original_error=e,
+                )
+            )
+
+    def json(self) -> Result[Any, JsonDecodeError | TextDecodeError]:
+        text_result = self.text
+        if is_err(text_result):
+            return Err(text_result.error())
+        try:
+            return Ok(json_lib.loads(text_result.unwrap()))
+        except json_lib.JSONDecodeError as e:
+            return Err(
+                JsonDecodeError(
+                    message=f"Failed to parse JSON: {e}",
+                    body=text_result.unwrap(),
+                    original_error=e,
+                )
+            )
+
+    def parsed(self, annotation: Any) -> Any:
+        """
+        The body parsed as ``annotation``, validated only on the first call.
+
+        Later calls, and other responses over the same cache entry, return the
+        same objects, which must therefore not be changed.
+
+        Raises:
+            ValueError: When the body cannot be parsed into ``annotation``
+        """
+        key = annotation_key(annotation)
+        if key is None:
+            return parse_response(self.json().unwrap(), annotation)
+        if key not in self._entry.parsed:
+            self._entry.parsed[key] = parse_response(self.json().unwrap(), annotation)
+        return self._entry.parsed[key]
+
+
+class CacheStats(BaseModel):
+    """Snapshot of a response cache, for metrics."""
+
+    hits: int
+    misses: int
+    revalidated: int
+    entries: int
+    bytes: int
+
+
+class _Store:
+    """Entries shared by a ResponseCache and its scoped() views."""
+
+    def __init__(self, directory: Path | None):
+        self.directory = directory
+        self.entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.lock = threading.Lock()
+
+
+class CacheLookup:
+    """A request's place in a ResponseCache, and the entry found there if any."""
+
+    def __init__(
+        self,
+        cache: "ResponseCache",
+        method: str,
+        scope: str,
+        key: str | None,
+        ttl: float | None,
+        entry: _Entry | None,
+    ):
+        self.cache = cache
+        self.method = method
+        self.scope = scope
+        self.key = key
+        self.ttl = ttl
+        self.entry = entry
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be used without asking the server."""
+        return self.entry is not None and self.entry.expires > time.time()
+
+    @property
+    def headers(self) -> dict[str, str] | None:
+        """Conditional request headers revalidating a stale entry."""
+        if self.entry is None:
+            return None
+        return self.entry.validators() or None
+
+    def response(self) -> CachedResponse:
+        """The cached response. Only valid if an entry was found."""
+        assert self.entry is not None
+        return CachedResponse(self.entry)
+
+    def update(self, result: Result[Any, HttpError]) -> Result[Any, HttpError]:
+        """
+        Update the cache from the server's reply to the request.
+
+        Returns:
+            The result to hand to the caller: the cached response if the
+            server answered 304 Not Modified, otherwise ``result``, with a
+            successful response replaced by its new cache entry
+        """
+        if is_err(result):
+            return result
+        response = result.unwrap()
+        if self.method in WRITE_METHODS:
+            if 200 <= response.status_code < 300:
+                self.cache._drop(self.scope)
+            return result
+        if self.key is None or self.ttl is None:
+            return result
+        if response.status_code == 304 and self.entry is not None:
+            self.cache.refresh(self.scope, self.key, self.entry, self.ttl, response)
+            return Ok(self.response())
+        if response.status_code == 200:
+            entry = self.cache.store(self.scope, self.key, response, self.ttl)
+            if entry is not None:
+                return Ok(CachedResponse(entry))
+        return result
+
+
+class ResponseCache:
+    """
+    Cache of JSON responses to GET requests, opted into per SDK.
+
+    ``ttls`` overrides the TTL for individual APIs (base paths such as
+    ``/id/v3``) or endpoints (method, base path and route template). A TTL of
+    0 revalidates on every request; None disables caching.
+
+    Example:
+        >>> cache = ResponseCache(
+        ...     ttl=60,
+        ...     ttls={"GET /wallet/v1/{contract_id}/credit": 10, "/otm/v2": None},
+        ...     directory="~/.cache/satvu/responses",
+        ... )
+        >>> sdk = SatVuSDK(client_id, client_secret, response_cache=cache)
+
+    Responses served from the cache are parsed once and every hit returns the
+    same models, so do not change them: copy them with
+    ``model_copy(deep=True)`` first.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = DEFAULT_TTL,
+        *,
+        ttls: Mapping[str, float | None] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: str | Path | None = None,
+    ):
+        """
+        Args:
+            ttl: Default seconds a response is fresh for, or None to only
+                cache the endpoints listed in ``ttls``
+            ttls: TTL by base path or endpoint
+            max_entries: Most responses kept in memory
+            max_bytes: Most response body bytes kept in memory; larger
+                responses are not cached
+            directory: Directory to also keep responses in, not limited in
+                size. Memory only if None.
+        """
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.identity = ""
+        self._store = _Store(
+            Path(directory).expanduser() if directory is not None else None
+        )
+
+    def scoped(self, identity: str) -> "ResponseCache":
+        """
+        A view of the cache whose entries are private to ``identity``.
+
+        SatVuSDK scopes the cache to its client ID, so that one cache can be
+        shared by SDKs authenticated as different clients.
+        """
+        view = ResponseCache.__new__(ResponseCache)
+        view.__dict__.update(self.__dict__)
+        view.identity = _hash(self.identity, identity)
+        return view
+
+    def lookup(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        *,
+        base_url: str,
+        base_path: str,
+        route: str,
+    ) -> CacheLookup:
+        """
+        Find a request's cache entry.
+
+        Args:
+            method: HTTP method
+            url: Request URL, relative to base_url
+            params: Query parameters
+            base_url: URL of the service's API
+            base_path: Base path of the API, e.g. "/id/v3"
+            route: Route template of url, e.g. "/user/details"
+        """
+        method = method.upper()
+        route = "/" + route.lstrip("/")
+        scope = _hash(self.identity, base_url, route.split("/")[1])
+        if method != "GET":
+            return CacheLookup(self, method, scope, None, None, None)
+        endpoint = f"GET /{base_path.strip('/')}{route}"
+        ttl = self.ttls.get(endpoint, self.ttls.get(base_path, self.ttl))
+        if ttl is None:
+            return CacheLookup(self, method, scope, None, None, None)
+
+        query = json_lib.dumps(params or {}, sort_keys=True, default=str)
+        key = _hash(self.identity, method, base_url + url, query)
+        entry = self._get(scope, key)
+        store = self._store
+        with store.lock:
+            if entry is not None and entry.expires > time.time():
+                store.hits += 1
+            else:
+                store.misses += 1
+        return CacheLookup(self, method, scope, key, ttl, entry)
+
+    def store(self, scope: str, key: str, response: Any, ttl: float) -> _Entry | None:
+        """Cache a 200 response if it is JSON and may be stored."""
+        headers = dict(response.headers)
+        content_type = header_value(headers, "content-type") or ""
+        cache_control = (header_value(headers, "cache-control") or "").lower()
+        if "json" not in content_type or "no-store" in cache_control:
+            return None
+        length = header_value(headers, "content-length")
+        if length is not None and length.isdigit() and int(length) > self.max_bytes:
+            return None
+        body = response.body
+        if len(body) > self.max_bytes:
+            return None
+        if "no-cache" in cache_control:
+            ttl = 0
+        entry = _Entry(scope, response.status_code, headers, body, time.time() + ttl)
+        if ttl <= 0 and not entry.validators():
+            return None
+        self._put(key, entry)
+        self._write(key, entry)
+        return entry
+
+    def refresh(
+        self, scope: str, key: str, entry: _Entry, ttl: float, response: Any
+    ) -> None:
+        """Extend an entry that the server confirmed with 304 Not Modified."""
+        updated = {
+            name: value
+            for name in ("etag", "last-modified", "cache-control", "date", "expires")
+            if (value := header_value(dict(response.headers), name)) is not None
+        }
+        entry.headers = {
+            **{k: v for k, v in entry.headers.items() if k.lower() not in updated},
+            **updated,
+        }
+        entry.expires = time.time() + ttl
+        with self._store.lock:
+            self._store.revalidated += 1
+        self._put(key, entry)
+        self._write(key, entry)
+
+    def invalidate(self, base_url: str, route: str) -> None:
+        """
+        Drop the cached responses of an API's endpoints under one path.
+
+        Args:
+            base_url: URL of the service's API
+            route: Path whose first segment selects the responses to drop,
+                e.g. "/user" for all of ``/user/...``
+        """
+        self._drop(_hash(self.identity, base_url, route.strip("/").split("/")[0]))
+
+    def _drop(self, scope: str) -> None:
+        store = self._store
+        with store.lock:
+            for key in [k for k, e in store.entries.items() if e.scope == scope]:
+                store.size -= len(store.entries.pop(key).body)
+        if store.directory is not None:
+            _remove_entries(store.directory / scope)
+
+    def clear(self) -> None:
+        """
+        Drop every cached response, in memory and on disk.
+
+        Only the files the cache wrote are deleted; the directory itself and
+        anything else in it are left alone.
+        """
+        store = self._store
+        with store.lock:
+            store.entries.clear()
+            store.size = 0
+        if store.directory is None:
+            return
+        try:
+            scopes = [path for path in store.directory.iterdir() if _is_hash(path.name)]
+        except OSError:
+            return
+        for scope in scopes:
+            _remove_entries(scope)
+
+    def stats(self) -> CacheStats:
+        """Hit and miss counts and the memory tier's size."""
+        store = self._store
+        with store.lock:
+            return CacheStats(
+                hits=store.hits,
+                misses=store.misses,
+                revalidated=store.revalidated,
+                entries=len(store.entries),
+                bytes=store.size,
+            )
+
+    def _get(self, scope: str, key: str) -> _Entry | None:
+        store = self._store
+        with store.lock:
+            entry = store.entries.get(key)
+            if entry is not None:
+                store.entries.move_to_end(key)
+                return entry
+        if store.directory is None:
+            return None
+        try:
+            data = (store.directory / scope / key).read_bytes()
+            entry = _Entry.load(scope, data)
+        except (OSError, ValueError, KeyError):
+            return None
+        self._put(key, entry)
+        return entry
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        store = self._store
+        with store.lock:
+            previous = store.entries.pop(key, None)
+            if previous is not None:
+                store.size -= len(previous.body)
+            store.entries[key] = entry
+            store.size += len(entry.body)
+            while store.entries and (
+                len(store.entries) > self.max_entries or store.size > self.max_bytes
+            ):
+                _, evicted = store.entries.popitem(last=False)
+                store.size -= len(evicted.body)
+
+    def _write(self, key: str, entry: _Entry) -> None:
+        """Save an entry to the disk tier, replacing the file atomically."""
+        if self._store.directory is None:
+            return
+        directory = self._store.directory / entry.scope
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        except OSError:
+            # The disk tier is best effort; the entry is still cached in memory
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(entry.dump())
+            os.replace(tmp, directory / key)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_ENTRIES",
+    "DEFAULT_TTL",
+    "CacheLookup",
+    "CacheStats",
+    "CachedResponse",
+    "ResponseCache",
+]
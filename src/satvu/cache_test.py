@@ -0,0 +1,269 @@
+"""Tests for the response cache."""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from satvu.cache import CachedResponse, ResponseCache
+from satvu.http.protocol import HttpResponse
+from satvu.result import Ok
+
+
+class User(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def make_client(make_client):
+    """Clients caching in ``cache``, receiving ``responses`` in turn."""
+
+    def make(cache: ResponseCache, *responses: HttpResponse):
+        return make_client(*map(Ok, responses), response_cache=cache)
+
+    return make
+
+
+class FakeClock:
+    """Stands in for time.time() in the cache module."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("satvu.cache.time.time", new=fake):
+        yield fake
+
+
+class TestMakeRequest:
+    """Tests for caching in SDKClient.make_request()."""
+
+    def test_fresh_response_is_reused(self, clock, make_client, make_response):
+        client = make_client(ResponseCache(ttl=60), make_response({"name": "a"}))
+
+        first = client.make_request("GET", "/user/details").unwrap()
+        clock.now += 59
+        second = client.make_request("GET", "/user/details").unwrap()
+
+        assert client.client.request.call_count == 1
+        assert isinstance(second, CachedResponse)
+        assert second.json().unwrap() == first.json().unwrap() == {"name": "a"}
+
+    def test_streamed_responses_bypass_the_cache(
+        self, clock, make_client, make_response
+    ):
+        """stream=True neither reads from nor fills the cache."""
+        first, second = make_response({"name": "a"}), make_response({"name": "b"})
+        client = make_client(ResponseCache(ttl=60), first, second)
+
+        streamed = client.make_request("GET", "/user/details", stream=True).unwrap()
+        cached = client.make_request("GET", "/user/details").unwrap()
+
+        assert streamed is first
+        assert cached.json().unwrap() == {"name": "b"}
+        assert client.client.request.call_count == 2
+
+    def test_parsed_models_are_reused(self, clock, make_client, make_response):
+        """A cache hit skips validation and returns the same model."""
+        client = make_client(ResponseCache(), make_response({"name": "a"}))
+
+        first = client.parse_json(client.make_request("GET", "/user").unwrap(), User)
+        with patch("satvu.cache.parse_response") as parse:
+            second = client.parse_json(
+                client.make_request("GET", "/user").unwrap(), User
+            )
+
+        assert second is first
+        parse.assert_not_called()
+
+    def test_stale_response_is_revalidated(self, clock, make_client, make_response):
+        client = make_client(
+            ResponseCache(ttl=60),
+            make_response({"name": "a"}, ETag='"v1"'),
+            make_response(status_code=304, ETag='"v1"'),
+        )
+        first = client.make_request("GET", "/user/details").unwrap()
+
+        clock.now += 61
+        second = client.make_request("GET", "/user/details").unwrap()
+
+        assert client.client.request.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"'
+        }
+        assert second.status_code == 200
+        assert second.body == first.body
+        assert client.response_cache.stats().revalidated == 1
+
+        # Revalidation extends the entry
+        client.make_request("GET", "/user/details")
+        assert client.client.request.call_count == 2
+
+    def test_changed_response_replaces_entry(self, clock, make_client, make_response):
+        client = make_client(
+            ResponseCache(ttl=0),
+            make_response({"name": "a"}, **{"Last-Modified": "Mon"}),
+            make_response({"name": "b"}, **{"Last-Modified": "Tue"}),
+        )
+        client.make_request("GET", "/user/details")
+
+        second = client.make_request("GET", "/user/details").unwrap()
+
+        assert client.client.request.call_args.kwargs["headers"] == {
+            "If-Modified-Since": "Mon"
+        }
+        assert second.json().unwrap() == {"name": "b"}
+
+    def test_params_are_part_of_key(self, clock, make_client, make_response):
+        client = make_client(ResponseCache(), make_response(), make_response())
+
+        client.make_request("GET", "/webhooks", params={"page": 1})
+        client.make_request("GET", "/webhooks", params={"page": 2})
+        client.make_request("GET", "/webhooks", params={"page": 1})
+
+        assert client.client.request.call_count == 2
+
+    def test_identities_do_not_share_entries(self, clock, make_client, make_response):
+        cache = ResponseCache()
+        alice = make_client(cache.scoped("alice"), make_response({"name": "a"}))
+        bob = make_client(cache.scoped("bob"), make_response({"name": "b"}))
+
+        alice.make_request("GET", "/user/details")
+        result = bob.make_request("GET", "/user/details")
+
+        assert result.unwrap().json().unwrap() == {"name": "b"}
+
+    def test_write_invalidates_related_endpoints(
+        self, clock, make_client, make_response
+    ):
+        client = make_client(
+            ResponseCache(),
+            make_response({"name": "a"}),
+            make_response({"balance": 1}),
+            make_response(),
+            make_response({"name": "b"}),
+        )
+        client.make_request("GET", "/user/details")
+        client.make_request("GET", "/wallet/credit")
+
+        client.make_request("PUT", "/user/settings", json={})
+        user = client.make_request("GET", "/user/details").unwrap()
+        client.make_request("GET", "/wallet/credit")
+
+        assert user.json().unwrap() == {"name": "b"}
+        assert client.client.request.call_count == 4
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"Content-Type": "application/zip"},
+            {"Cache-Control": "no-store"},
+            {"status_code": 201},
+        ],
+    )
+    def test_not_cached(self, clock, make_client, make_response, options):
+        response = make_response(**options)
+        client = make_client(ResponseCache(), response, response)
+
+        client.make_request("GET", "/download")
+        client.make_request("GET", "/download")
+
+        assert client.client.request.call_count == 2
+
+    def test_ttls_per_endpoint(self, clock, make_client, make_response):
+        cache = ResponseCache(ttl=None, ttls={"GET /otm/v2/user/{id}": 60})
+        client = make_client(cache, *[make_response() for _ in range(3)])
+
+        for _ in range(2):
+            client.make_request("GET", "/user/42", route="/user/{id}")
+            client.make_request("GET", "/webhooks")
+
+        assert client.client.request.call_count == 3
+
+
+class TestResponseCache:
+    """Tests for storage and eviction."""
+
+    def lookup(self, cache: ResponseCache, url: str):
+        return cache.lookup(
+            "GET", url, None, base_url="https://api", base_path="/otm/v2", route=url
+        )
+
+    @pytest.fixture
+    def fill(self, make_response):
+        def fill(cache: ResponseCache, url: str, body: dict) -> None:
+            self.lookup(cache, url).update(Ok(make_response(body)))
+
+        return fill
+
+    def test_evicts_least_recently_used(self, clock, fill):
+        cache = ResponseCache(max_entries=2)
+        fill(cache, "/a", {})
+        fill(cache, "/b", {})
+        self.lookup(cache, "/a")
+
+        fill(cache, "/c", {})
+
+        assert self.lookup(cache, "/a").fresh
+        assert self.lookup(cache, "/b").entry is None
+        assert cache.stats().entries == 2
+
+    def test_max_bytes(self, clock, fill):
+        cache = ResponseCache(max_bytes=100)
+        fill(cache, "/big", {"data": "x" * 200})
+        fill(cache, "/a", {"data": "x" * 60})
+        fill(cache, "/b", {"data": "x" * 60})
+
+        assert self.lookup(cache, "/big").entry is None
+        assert self.lookup(cache, "/a").entry is None
+        assert cache.stats().bytes <= 100
+
+    def test_disk_tier(self, clock, tmp_path, fill):
+        fill(ResponseCache(directory=tmp_path), "/a", {"name": "a"})
+
+        lookup = self.lookup(ResponseCache(directory=tmp_path), "/a")
+
+        assert lookup.fresh
+        assert lookup.response().json().unwrap() == {"name": "a"}
+
+    def test_clear(self, clock, tmp_path, fill):
+        cache = ResponseCache(directory=tmp_path)
+        (tmp_path / "notes.txt").write_text("mine")
+        (tmp_path / "data").mkdir()
+        fill(cache, "/a", {})
+
+        cache.clear()
+
+        assert self.lookup(cache, "/a").entry is None
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["data", "notes.txt"]
+
+    def test_stats(self, clock, fill):
+        cache = ResponseCache()
+        fill(cache, "/a", {})
+        self.lookup(cache, "/a")
+
+        stats = cache.stats()
+
+        assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_cached_response_streams_independently(clock, make_response):
+    cache = ResponseCache()
+    lookup = cache.lookup(
+        "GET", "/a", None, base_url="https://api", base_path="/otm/v2", route="/a"
+    )
+    lookup.update(Ok(make_response({"name": "abc"})))
+    lookup = cache.lookup(
+        "GET", "/a", None, base_url="https://api", base_path="/otm/v2", route="/a"
+    )
+
+    first, second = lookup.response(), lookup.response()
+    buffer = bytearray(4)
+
+    assert first.readinto(buffer) == 4
+    assert b"".join(second.iter_bytes(4)) == b'{"name": "abc"}'
@@ -0,0 +1,301 @@
+"""
+Client-side circuit breakers for API endpoints.
+
+A breaker watches the error rate and latency of one endpoint over a rolling
+window. When too many requests fail or are slow it opens, and further
+requests to that endpoint fail immediately with CircuitOpenError instead of
+each waiting for the full timeout. After ``open_duration`` seconds it lets a
+few probe requests through (half-open): if they succeed the breaker closes,
+otherwise it opens again.
+
+Endpoints are identified by method, service base path and route template,
+e.g. ``"GET /otm/v2/{contract_id}/tasking/orders/{order_id}"``, so failures of
+one order do not trip the breaker of another service.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Literal
+
+from pydantic import BaseModel
+
+from satvu.http.errors import (
+    CircuitOpenError,
+    ClientError,
+    ConnectionTimeoutError,
+    HttpError,
+    NetworkError,
+    ReadTimeoutError,
+    ServerError,
+)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+_BUCKETS = 10
+
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+def route_template(path: str) -> str:
+    """
+    Approximate the route template of a request path.
+
+    Used when the caller does not know the template: the query string is
+    dropped and UUID or numeric path segments are replaced with ``{id}``.
+    """
+    path = path.split("?", 1)[0]
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+def is_failure(error: BaseException | None) -> bool:
+    """
+    Whether a request outcome counts against the endpoint's health.
+
+    Server errors, rate limiting, timeouts and network errors do, as do
+    exceptions raised instead of returned. Other client errors, such as a
+    404, mean the service answered normally.
+    """
+    if isinstance(error, ClientError):
+        return error.status_code in (408, 429)
+    if error is not None and not isinstance(error, HttpError):
+        return True
+    return isinstance(
+        error, ServerError | NetworkError | ConnectionTimeoutError | ReadTimeoutError
+    )
+
+
+class CircuitStats(BaseModel):
+    """Snapshot of one circuit breaker, for metrics."""
+
+    endpoint: str
+    state: CircuitState
+    requests: int
+    failures: int
+    slow_calls: int
+    average_latency: float | None
+    times_opened: int
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of requests in the window that failed."""
+        return self.failures / self.requests if self.requests else 0.0
+
+    @property
+    def slow_call_rate(self) -> float:
+        """Fraction of requests in the window that were slow."""
+        return self.slow_calls / self.requests if self.requests else 0.0
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single endpoint."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float | None = None,
+        slow_call_rate_threshold: float = 0.8,
+        minimum_requests: int = 10,
+        window: float = 60.0,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Args:
+            endpoint: Name of the endpoint, used in errors and stats
+            failure_rate_threshold: Fraction of failed requests in the window
+                that opens the breaker
+            slow_call_duration: Requests taking at least this many seconds
+                count as slow. None disables latency tracking.
+            slow_call_rate_threshold: Fraction of slow requests in the window
+                that opens the breaker
+            minimum_requests: Requests needed in the window before the
+                breaker can open
+            window: Length of the rolling window in seconds
+            open_duration: Seconds the breaker stays open before probing
+            half_open_max_calls: Probe requests allowed while half-open
+        """
+        self.endpoint = endpoint
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state: CircuitState = "closed"
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        # [bucket start, requests, failures, slow calls, total latency]
+        self._buckets: deque[list[float]] = deque()
+        self._lock = threading.Lock()
+
+    def before_request(self) -> CircuitOpenError | None:
+        """
+        Check whether a request may be sent.
+
+        Returns:
+            None if the request may go ahead, or the error to fail it with.
+        """
+        if self.state == "closed":
+            return None
+        with self._lock:
+            now = time.monotonic()
+            if self.state == "open":
+                reopen_at = self._opened_at + self.open_duration
+                if now < reopen_at:
+                    return self._open_error(reopen_at - now)
+                self.state = "half_open"
+                self._probes = 0
+            if self.state == "half_open":
+                if self._probes >= self.half_open_max_calls:
+                    return self._open_error(None)
+                self._probes += 1
+            return None
+
+    def record(self, error: BaseException | None, duration: float) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            error: The request's error or raised exception, or None if it
+                succeeded
+            duration: Seconds the request took
+        """
+        failed = is_failure(error)
+        slow = (
+            self.slow_call_duration is not None and duration >= self.slow_call_duration
+        )
+        with self._lock:
+            now = time.monotonic()
+            if self.state == "half_open":
+                if failed or slow:
+                    self._trip(now)
+                else:
+                    self.state = "closed"
+                    self._buckets.clear()
+                return
+
+            self._add(now, failed, slow, duration)
+            if self.state == "closed" and self._should_trip():
+                self._trip(now)
+
+    def stats(self) -> CircuitStats:
+        """Snapshot of the breaker's state and rolling window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            requests, failures, slow, latency = self._totals()
+        return CircuitStats(
+            endpoint=self.endpoint,
+            state=self.state,
+            requests=int(requests),
+            failures=int(failures),
+            slow_calls=int(slow),
+            average_latency=latency / requests if requests else None,
+            times_opened=self.times_opened,
+        )
+
+    def _open_error(self, retry_after: float | None) -> CircuitOpenError:
+        return CircuitOpenError(
+            f"Circuit breaker for {self.endpoint} is open",
+            endpoint=self.endpoint,
+            retry_after=retry_after,
+        )
+
+    def _trip(self, now: float) -> None:
+        self.state = "open"
+        self.times_opened += 1
+        self._opened_at = now
+
+    def _add(self, now: float, failed: bool, slow: bool, duration: float) -> None:
+        self._expire(now)
+        width = self.window / _BUCKETS
+        if not self._buckets or now - self._buckets[-1][0] >= width:
+            self._buckets.append([now, 0, 0, 0, 0.0])
+        bucket = self._buckets[-1]
+        bucket[1] += 1
+        bucket[2] += failed
+        bucket[3] += slow
+        bucket[4] += duration
+
+    def _expire(self, now: float) -> None:
+        while self._buckets and now - self._buckets[0][0] >= self.window:
+            self._buckets.popleft()
+
+    def _totals(self) -> tuple[float, float, float, float]:
+        requests = failures = slow = latency = 0.0
+        for (
+            _,
+            bucket_requests,
+            bucket_failures,
+            bucket_slow,
+            bucket_latency,
+        ) in self._buckets:
+            requests += bucket_requests
+            failures += bucket_failures
+            slow += bucket_slow
+            latency += bucket_latency
+        return requests, failures, slow, latency
+
+    def _should_trip(self) -> bool:
+        requests, failures, slow, _ = self._totals()
+        if requests < self.minimum_requests:
+            return False
+        return failures / requests >= self.failure_rate_threshold or (
+            self.slow_call_duration is not None
+            and slow / requests >= self.slow_call_rate_threshold
+        )
+
+
+class CircuitBreakers:
+    """
+    Circuit breakers for every endpoint, created on first use.
+
+    Pass one instance to SatVuSDK to protect all its services. The options
+    are applied to every breaker; see CircuitBreaker for their meaning.
+
+    Example:
+        >>> breakers = CircuitBreakers(slow_call_duration=10.0)
+        >>> sdk = SatVuSDK(client_id, client_secret, circuit_breakers=breakers)
+        >>> for stats in breakers.stats():
+        ...     print(stats.endpoint, stats.state, stats.failure_rate)
+    """
+
+    def __init__(self, **options: float | None):
+        self.options = options
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Return the breaker for an endpoint, creating it if needed."""
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(endpoint)
+                if breaker is None:
+                    breaker = CircuitBreaker(endpoint, **self.options)  # type: ignore[arg-type]
+                    self._breakers[endpoint] = breaker
+        return breaker
+
+    def stats(self) -> list[CircuitStats]:
+        """Snapshots of all breakers, for exporting as metrics."""
+        return [breaker.stats() for breaker in list(self._breakers.values())]
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "CircuitState",
+    "CircuitStats",
+    "is_failure",
+    "route_template",
+]
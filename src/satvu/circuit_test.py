@@ -0,0 +1,207 @@
+"""Tests for circuit breakers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from satvu.circuit import CircuitBreaker, CircuitBreakers, route_template
+from satvu.http.errors import (
+    CircuitOpenError,
+    ClientError,
+    ReadTimeoutError,
+    ServerError,
+)
+from satvu.result import Err, Ok, is_err
+from satvu.retry import RetryPolicy
+
+SERVER_ERROR = ServerError("Server error", status_code=503)
+
+
+class FakeClock:
+    """Stands in for time.monotonic() in the circuit module."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("satvu.circuit.time.monotonic", new=fake):
+        yield fake
+
+
+def make_breaker(**options) -> CircuitBreaker:
+    return CircuitBreaker(
+        "GET /otm/{id}", minimum_requests=4, open_duration=30, **options
+    )
+
+
+class TestRouteTemplate:
+    """Tests for route_template()."""
+
+    def test_replaces_ids(self):
+        """UUID and numeric segments become placeholders."""
+        path = "/3fa85f64-5717-4562-b3fc-2c963f66afa6/orders/42/download?redirect=false"
+
+        assert route_template(path) == "/{id}/orders/{id}/download"
+
+    def test_keeps_other_segments(self):
+        """Named segments are kept."""
+        assert route_template("/collections/visual") == "/collections/visual"
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_at_failure_rate(self, clock):
+        """The breaker opens once enough requests in the window failed."""
+        breaker = make_breaker(failure_rate_threshold=0.5)
+
+        breaker.record(None, 0.1)
+        breaker.record(SERVER_ERROR, 0.1)
+        breaker.record(None, 0.1)
+        assert breaker.state == "closed"
+
+        breaker.record(SERVER_ERROR, 0.1)
+        assert breaker.state == "open"
+
+        error = breaker.before_request()
+        assert isinstance(error, CircuitOpenError)
+        assert error.retry_after == 30
+
+    def test_client_errors_are_not_failures(self, clock):
+        """A 404 means the service is healthy."""
+        breaker = make_breaker()
+        for _ in range(10):
+            breaker.record(ClientError("Not found", status_code=404), 0.1)
+
+        assert breaker.state == "closed"
+
+    def test_slow_calls_open_breaker(self, clock):
+        """Slow responses open the breaker when latency is tracked."""
+        breaker = make_breaker(slow_call_duration=5.0, slow_call_rate_threshold=0.75)
+
+        for duration in (6.0, 7.0, 1.0, 8.0):
+            breaker.record(None, duration)
+
+        assert breaker.state == "open"
+        assert breaker.stats().average_latency == 5.5
+
+    def test_old_outcomes_leave_window(self, clock):
+        """Only requests in the rolling window count."""
+        breaker = make_breaker(window=60)
+        for _ in range(3):
+            breaker.record(SERVER_ERROR, 0.1)
+
+        clock.now += 61
+        breaker.record(SERVER_ERROR, 0.1)
+
+        assert breaker.state == "closed"
+        assert breaker.stats().requests == 1
+
+    def test_half_open_probe_closes(self, clock):
+        """After open_duration one probe is let through; success closes."""
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(SERVER_ERROR, 0.1)
+
+        clock.now += 30
+        assert breaker.before_request() is None
+        assert breaker.state == "half_open"
+        assert isinstance(breaker.before_request(), CircuitOpenError)
+
+        breaker.record(None, 0.1)
+        assert breaker.state == "closed"
+        assert breaker.before_request() is None
+
+    def test_half_open_probe_failure_reopens(self, clock):
+        """A failed probe opens the breaker again."""
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(ReadTimeoutError("slow"), 0.1)
+
+        clock.now += 30
+        breaker.before_request()
+        breaker.record(SERVER_ERROR, 0.1)
+
+        assert breaker.state == "open"
+        assert breaker.stats().times_opened == 2
+
+    def test_raised_exceptions_are_failures(self, clock):
+        """Exceptions raised instead of returned count as failures."""
+        breaker = make_breaker()
+        for _ in range(4):
+            breaker.record(RuntimeError("bug"), 0.1)
+
+        assert breaker.state == "open"
+
+
+def test_client_fails_fast_when_open(clock, make_client):
+    """Requests to an open endpoint are failed without being sent."""
+    http_client = MagicMock()
+    http_client.request.return_value = Err(SERVER_ERROR)
+    breakers = CircuitBreakers(minimum_requests=3)
+    client = make_client(
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breakers=breakers,
+    )
+
+    for order in range(3):
+        client.make_request("GET", f"/c/{order}", route="/c/{order_id}")
+    result = client.make_request("GET", "/c/9", route="/c/{order_id}")
+
+    assert is_err(result)
+    assert isinstance(result.error(), CircuitOpenError)
+    assert http_client.request.call_count == 3
+    [stats] = breakers.stats()
+    assert stats.endpoint == "GET /otm/v2/c/{order_id}"
+    assert stats.state == "open"
+    assert stats.failure_rate == 1.0
+
+
+def test_other_endpoints_unaffected(clock, make_client, make_response):
+    """Breakers are kept per method and route."""
+    response = make_response()
+    http_client = MagicMock()
+    http_client.request.side_effect = lambda method, **kwargs: (
+        Err(SERVER_ERROR) if method == "POST" else Ok(response)
+    )
+    client = make_client(
+        http_client=http_client,
+        circuit_breakers=CircuitBreakers(minimum_requests=2),
+    )
+
+    for _ in range(2):
+        client.make_request("POST", "/search", json={})
+
+    result = client.make_request("POST", "/search", json={})
+    assert is_err(result)
+    assert isinstance(result.error(), CircuitOpenError)
+    assert client.make_request("GET", "/search").is_ok()
+
+
+def test_client_records_raised_probe(clock, make_client):
+    """A probe whose request raises reopens the breaker instead of wedging it."""
+    http_client = MagicMock()
+    http_client.request.side_effect = [Err(SERVER_ERROR)] * 3 + [RuntimeError("bug")]
+    breakers = CircuitBreakers(minimum_requests=3, open_duration=30)
+    client = make_client(
+        http_client=http_client,
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breakers=breakers,
+    )
+    for _ in range(3):
+        client.make_request("GET", "/orders")
+
+    clock.now += 30
+    with pytest.raises(RuntimeError):
+        client.make_request("GET", "/orders")
+
+    [stats] = breakers.stats()
+    assert stats.state == "open"
+    assert stats.times_opened == 2
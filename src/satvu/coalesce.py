@@ -0,0 +1,239 @@
+"""
+Coalescing of identical concurrent GET requests.
+
+While a GET request is in flight, identical requests (same URL, query
+parameters and client) from other threads or tasks wait for it instead of
+being sent as well ("single flight"). Every caller then gets the same
+result: its own copy of the response, sharing the body but parsing its own
+models from it, or the same error.
+
+Responses that are neither JSON nor small, such as file downloads, are not
+read into memory to be shared; callers waiting on one send their own request.
+"""
+
+import asyncio
+import json as json_lib
+import threading
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+from satvu.cache import CachedResponse
+from satvu.download import header_value
+from satvu.http.errors import HttpError
+from satvu.result import Ok, Result, is_err, is_ok
+
+SHARED_BODY_LIMIT = 1024 * 1024
+"""Largest non-JSON body read into memory to share it (1 MiB)."""
+
+_Key = tuple[str, ...]
+
+
+def _shared(result: Result[Any, HttpError]) -> Result[Any, HttpError] | None:
+    """The result in a form every waiter can use, or None if it cannot be shared."""
+    if is_err(result):
+        return result
+    response = result.unwrap()
+    if not isinstance(response, CachedResponse):
+        content_type = header_value(response.headers, "content-type") or ""
+        length = header_value(response.headers, "content-length") or ""
+        small = length.isdigit() and int(length) <= SHARED_BODY_LIMIT
+        if "json" not in content_type and not small:
+            return None
+    return Ok(CachedResponse.from_response(response))
+
+
+def _copy(result: Result[Any, HttpError]) -> Result[Any, HttpError]:
+    """A waiter's own copy of a shared result."""
+    if is_ok(result):
+        return Ok(result.unwrap().copy())
+    return result
+
+
+class _Flight:
+    """A request in flight and the callers waiting for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Result[Any, HttpError] | None = None
+        self.exception: BaseException | None = None
+
+
+class CoalescingStats(BaseModel):
+    """Counts of coalesced requests, for metrics."""
+
+    requests: int
+    sent: int
+    coalesced: int
+    ratio: float
+    """Share of requests answered by another caller's request."""
+
+
+class _Counters:
+    """Flights and counts shared by a RequestCoalescer and its scoped() views."""
+
+    def __init__(self):
+        self.flights: dict[_Key, _Flight] = {}
+        self.async_flights: dict[_Key, asyncio.Future[_Flight]] = {}
+        self.requests = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.lock = threading.Lock()
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight GET request between identical concurrent callers.
+
+    Pass one instance to SatVuSDK to coalesce the requests of all its
+    services, across threads (SatVuSDK) or tasks (AsyncSatVuSDK).
+
+    Example:
+        >>> coalescer = RequestCoalescer()
+        >>> sdk = SatVuSDK(client_id, client_secret, request_coalescer=coalescer)
+        >>> ...
+        >>> coalescer.stats().ratio
+        0.42
+    """
+
+    def __init__(self):
+        self.identity = ""
+        self._state = _Counters()
+
+    def scoped(self, identity: str) -> "RequestCoalescer":
+        """
+        A view that only coalesces requests made as ``identity``.
+
+        SatVuSDK scopes the coalescer to its client ID, so that clients never
+        receive responses to each other's requests.
+        """
+        view = RequestCoalescer.__new__(RequestCoalescer)
+        view.__dict__.update(self.__dict__)
+        view.identity = f"{self.identity}\0{identity}"
+        return view
+
+    def key(self, url: str, params: Mapping[str, Any] | None) -> _Key:
+        """Key of a GET request to ``url``, an absolute URL."""
+        query = json_lib.dumps(params or {}, sort_keys=True, default=str)
+        return (self.identity, url, query)
+
+    def run(
+        self, key: _Key, send: Callable[[], Result[Any, HttpError]]
+    ) -> Result[Any, HttpError]:
+        """
+        Send a request with ``send()``, unless an identical one is in flight.
+
+        Args:
+            key: The request's key()
+            send: Sends the request
+
+        Returns:
+            The caller's copy of the request's result
+        """
+        state = self._state
+        with state.lock:
+            state.requests += 1
+            flight = state.flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = state.flights[key] = _Flight()
+                state.sent += 1
+            else:
+                state.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.exception is not None:
+                raise flight.exception
+            if flight.result is None:
+                return self._send_alone(send)
+            return _copy(flight.result)
+
+        try:
+            result = send()
+            flight.result = _shared(result)
+        except BaseException as e:
+            flight.exception = e
+            raise
+        finally:
+            with state.lock:
+                del state.flights[key]
+            flight.done.set()
+        return _copy(flight.result) if flight.result is not None else result
+
+    async def run_async(
+        self, key: _Key, send: Callable[[], Awaitable[Result[Any, HttpError]]]
+    ) -> Result[Any, HttpError]:
+        """
+        Async counterpart of run(), coalescing tasks on the same event loop.
+
+        If the task sending the request is cancelled, the tasks waiting for it
+        send their own requests instead.
+        """
+        state = self._state
+        loop = asyncio.get_running_loop()
+        key = (*key, str(id(loop)))
+        with state.lock:
+            state.requests += 1
+            future = state.async_flights.get(key)
+            leader = future is None
+            if future is None:
+                future = state.async_flights[key] = loop.create_future()
+                state.sent += 1
+            else:
+                state.coalesced += 1
+
+        if not leader:
+            flight: _Flight = await asyncio.shield(future)
+            if flight.exception is not None:
+                raise flight.exception
+            if flight.result is None:
+                return await self._send_alone_async(send)
+            return _copy(flight.result)
+
+        flight = _Flight()
+        try:
+            result = await send()
+            flight.result = _shared(result)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            flight.exception = e
+            raise
+        finally:
+            with state.lock:
+                del state.async_flights[key]
+            future.set_result(flight)
+        return _copy(flight.result) if flight.result is not None else result
+
+    def stats(self) -> CoalescingStats:
+        """Counts of requests sent and coalesced so far."""
+        state = self._state
+        with state.lock:
+            return CoalescingStats(
+                requests=state.requests,
+                sent=state.sent,
+                coalesced=state.coalesced,
+                ratio=state.coalesced / state.requests if state.requests else 0.0,
+            )
+
+    def _send_alone(
+        self, send: Callable[[], Result[Any, HttpError]]
+    ) -> Result[Any, HttpError]:
+        """Send a request whose flight's response could not be shared."""
+        with self._state.lock:
+            self._state.sent += 1
+            self._state.coalesced -= 1
+        return send()
+
+    async def _send_alone_async(
+        self, send: Callable[[], Awaitable[Result[Any, HttpError]]]
+    ) -> Result[Any, HttpError]:
+        with self._state.lock:
+            self._state.sent += 1
+            self._state.coalesced -= 1
+        return await send()
+
+
+__all__ = ["SHARED_BODY_LIMIT", "CoalescingStats", "RequestCoalescer"]
@@ -0,0 +1,207 @@
+"""Tests for coalescing identical concurrent GET requests."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from satvu.cache import CachedResponse
+from satvu.coalesce import RequestCoalescer
+from satvu.core import SDKClient
+from satvu.http.errors import ServerError
+from satvu.result import Err, Ok, is_err
+from satvu.retry import RetryPolicy
+
+
+class Item(BaseModel):
+    id: str
+
+
+class BlockingClient:
+    """HTTP client whose requests wait until released."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.calls += 1
+        self.release.wait(5)
+        return self.result
+
+
+def run_concurrently(client: SDKClient, http: BlockingClient, n: int, url="/a"):
+    coalescer = client.request_coalescer
+    assert coalescer is not None
+    with ThreadPoolExecutor(n) as pool:
+        futures = [pool.submit(client.make_request, "GET", url) for _ in range(n)]
+        while coalescer.stats().requests < n:
+            threading.Event().wait(0.01)
+        http.release.set()
+        return [future.result() for future in futures]
+
+
+@pytest.fixture
+def make_client(make_client):
+    """Clients sending their requests through ``http``."""
+
+    def make(http, coalescer=None, **options):
+        return make_client(
+            http_client=http,
+            request_coalescer=coalescer or RequestCoalescer(),
+            **options,
+        )
+
+    return make
+
+
+class TestRun:
+    """Tests for coalescing in SDKClient.make_request()."""
+
+    def test_concurrent_requests_share_one(self, make_client, make_response):
+        http = BlockingClient(Ok(make_response()))
+        client = make_client(http)
+
+        results = run_concurrently(client, http, 8)
+
+        assert http.calls == 1
+        responses = [result.unwrap() for result in results]
+        assert all(isinstance(r, CachedResponse) for r in responses)
+        assert len({id(r) for r in responses}) == 8
+        stats = client.request_coalescer.stats()
+        assert (stats.requests, stats.sent, stats.coalesced) == (8, 1, 7)
+        assert stats.ratio == pytest.approx(7 / 8)
+
+    def test_body_is_shared_but_models_are_not(self, make_client, make_response):
+        http = BlockingClient(Ok(make_response({"id": "a"})))
+        client = make_client(http)
+
+        results = run_concurrently(client, http, 4)
+
+        responses = [result.unwrap() for result in results]
+        assert all(r.body is responses[0].body for r in responses)
+        items = [client.parse_json(response, Item) for response in responses]
+        assert all(item == items[0] for item in items)
+        assert len({id(item) for item in items}) == 4
+
+    def test_errors_reach_every_waiter(self, make_client):
+        error = ServerError("Unavailable", status_code=503)
+        http = BlockingClient(Err(error))
+        client = make_client(http, retry_policy=RetryPolicy(max_attempts=1))
+
+        results = run_concurrently(client, http, 4)
+
+        assert http.calls == 1
+        assert all(is_err(result) and result.error() is error for result in results)
+
+    def test_downloads_are_not_shared(self, make_client, make_response):
+        """Waiters on a streamed, non-JSON response send their own request."""
+        response = make_response(**{"Content-Type": "application/zip"})
+        http = BlockingClient(Ok(response))
+        client = make_client(http)
+
+        results = run_concurrently(client, http, 3)
+
+        assert http.calls == 3
+        assert all(result.unwrap() is response for result in results)
+        assert client.request_coalescer.stats().coalesced == 0
+
+    def test_sequential_requests_are_not_coalesced(self, make_client, make_response):
+        http = BlockingClient(Ok(make_response()))
+        http.release.set()
+        client = make_client(http)
+
+        client.make_request("GET", "/a")
+        client.make_request("GET", "/a")
+
+        assert http.calls == 2
+
+    def test_streamed_requests_are_not_coalesced(self, make_client, make_response):
+        """stream=True responses are returned as they are, not buffered."""
+        response = make_response()
+        http = BlockingClient(Ok(response))
+        http.release.set()
+        client = make_client(http)
+
+        result = client.make_request("GET", "/a", stream=True)
+
+        assert result.unwrap() is response
+        assert client.request_coalescer.stats().requests == 0
+
+    def test_only_get_is_coalesced(self, make_client, make_response):
+        http = BlockingClient(Ok(make_response()))
+        client = make_client(http)
+        with ThreadPoolExecutor(2) as pool:
+            futures = [
+                pool.submit(client.make_request, "POST", "/search", json={})
+                for _ in range(2)
+            ]
+            while http.calls < 2:
+                threading.Event().wait(0.01)
+            http.release.set()
+            [future.result() for future in futures]
+
+        assert client.request_coalescer.stats().requests == 0
+
+    def test_clients_are_not_coalesced(self):
+        coalescer = RequestCoalescer()
+
+        alice = coalescer.scoped("alice").key("https://api/a", None)
+        bob = coalescer.scoped("bob").key("https://api/a", None)
+
+        assert alice != bob
+
+
+def test_async_tasks_share_one_request(make_async_client, make_response):
+    calls = 0
+
+    async def request(method, url, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return Ok(make_response({"id": "a"}))
+
+    async def run():
+        http = MagicMock()
+        http.request = request
+        client = make_async_client(http, request_coalescer=RequestCoalescer())
+        return await asyncio.gather(
+            *(client.make_request("GET", "/a") for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(result.unwrap().body == b'{"id": "a"}' for result in results)
+
+
+def test_async_waiters_resend_when_sender_is_cancelled(
+    make_async_client, make_response
+):
+    calls = 0
+
+    async def request(method, url, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return Ok(make_response())
+
+    async def run():
+        http = MagicMock()
+        http.request = request
+        client = make_async_client(http, request_coalescer=RequestCoalescer())
+        sender = asyncio.create_task(client.make_request("GET", "/a"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(client.make_request("GET", "/a"))
+        await asyncio.sleep(0.01)
+        sender.cancel()
+        return await waiter
+
+    assert asyncio.run(run()).is_ok()
+    assert calls == 2
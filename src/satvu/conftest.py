@@ -0,0 +1,78 @@
+"""Fixtures shared by the SDK client tests."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from satvu.core import AsyncSDKClient, SDKClient
+from satvu.http.protocol import HttpResponse
+from satvu.result import Ok
+
+
+class ConcreteSDKClient(SDKClient):
+    base_path = "/otm/v2"
+
+
+class ConcreteAsyncSDKClient(AsyncSDKClient):
+    base_path = "/otm/v2"
+
+
+@pytest.fixture
+def make_response() -> Callable[..., HttpResponse]:
+    """
+    Factory for mocked JSON responses.
+
+    The factory takes the JSON body (default ``{}``), the status code and
+    any headers, which are added to ``Content-Type: application/json``.
+    """
+
+    def make(body: Any = None, status_code: int = 200, **headers: str) -> Any:
+        body = {} if body is None else body
+        content = json.dumps(body).encode()
+        response = MagicMock(spec=HttpResponse)
+        response.status_code = status_code
+        response.headers = {"Content-Type": "application/json", **headers}
+        response.body = content
+        response.json.return_value = Ok(body)
+        response.iter_bytes.side_effect = lambda chunk_size=8192: iter(
+            [content[:4], content[4:]]
+        )
+        return response
+
+    return make
+
+
+@pytest.fixture
+def make_client() -> Callable[..., ConcreteSDKClient]:
+    """
+    Factory for clients of the ``/otm/v2`` base path.
+
+    The factory's positional arguments are the results the mocked HTTP
+    client returns in turn, unless ``http_client`` is given. Other keyword
+    arguments are passed to the client.
+    """
+
+    def make(
+        *results: Any, http_client: Any = None, **options: Any
+    ) -> ConcreteSDKClient:
+        if http_client is None:
+            http_client = MagicMock()
+            http_client.request.side_effect = results
+        options.setdefault("env", None)
+        return ConcreteSDKClient(http_client=http_client, **options)
+
+    return make
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., ConcreteAsyncSDKClient]:
+    """Async counterpart of make_client, taking the async HTTP client to use."""
+
+    def make(http_client: Any = None, **options: Any) -> ConcreteAsyncSDKClient:
+        options.setdefault("env", None)
+        return ConcreteAsyncSDKClient(http_client=http_client, **options)
+
+    return make
@@ -1,77 +1,1274 @@
+import asyncio
 import logging
+import os
+import sys
 import time
-from collections.abc import Callable
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Sequence,
+)
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from urllib.parse import parse_qs, urlparse
 
 from pydantic import BaseModel
 
-from satvu.http import HttpClient, create_http_client
-from satvu.http.errors import HttpError
-from satvu.http.protocol import HttpResponse
-from satvu.result import Result
+from satvu.archive import (
+    MemberSelector,
+    extract_file_members,
+    extract_url_members,
+    extract_url_members_async,
+)
+from satvu.batch import DEFAULT_MAX_WORKERS, Calls, amap_concurrent, map_concurrent
+from satvu.cache import CachedResponse, CacheLookup, ResponseCache
+from satvu.circuit import CircuitBreaker, CircuitBreakers, route_template
+from satvu.coalesce import RequestCoalescer
+from satvu.digest import DigestAlgorithm, DownloadedFile, StreamingDigest, verify_digest
+from satvu.download import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_SPOOL_THRESHOLD,
+    DownloadState,
+    RemoteFile,
+    download_url,
+    download_url_async,
+    header_value,
+    partial_paths,
+    temp_path,
+)
+from satvu.http import (
+    AsyncHttpClient,
+    HttpClient,
+    create_async_http_client,
+    create_http_client,
+)
+from satvu.http.buffers import aclose_response, close_response, iter_response
+from satvu.http.errors import (
+    ChecksumMismatchError,
+    ClientError,
+    HttpError,
+    HttpStatusError,
+)
+from satvu.http.pool import AsyncConnectionPool, ConnectionPool
+from satvu.http.protocol import AsyncHttpResponse, HttpResponse
+from satvu.ratelimit import RateLimiter, RateLimits
+from satvu.result import Err, Ok, Result, is_err
+from satvu.retry import RetryPolicy, parse_retry_after, retry_after_header
+from satvu.shared.parsing import ResponseAdapter, parse_response
+from satvu.shared.streaming_json import AsyncJsonArrayStream, JsonArrayStream
+from satvu.telemetry.hooks import (
+    ObservedResponse,
+    RequestHooks,
+    RequestInfo,
+    RequestObservation,
+)
+from satvu.throttle import BandwidthLimiter
 
 logger = logging.getLogger(__name__)
 
 
-class SDKClient:
+class _SDKClientBase:
+    """
+    Configuration and helpers shared by the sync and async SDK clients.
+    """
+
+    base_path: str
+
+    def __init__(
+        self,
+        env: str | None,
+        subdomain: str = "api",
+        timeout: int = 30,
+        max_retry_attempts: int = 5,
+        max_retry_after_seconds: float = 300.0,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        rate_limits: RateLimits | None = None,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        hooks: Sequence[RequestHooks] | None = None,
+    ):
+        """
+        Initialize shared client configuration.
+
+        :param env: the environment to use
+        :param subdomain: the subdomain to use
+        :param timeout: request timeout in seconds, default 30s
+        :param max_retry_attempts: maximum number of retry attempts, default 5
+        :param max_retry_after_seconds: maximum seconds to wait for Retry-After, default 300s
+        :param retry_policy: policy for retrying failed requests, defaults to one
+            built from max_retry_attempts and max_retry_after_seconds
+        :param circuit_breakers: circuit breakers to fail fast on unhealthy
+            endpoints, disabled by default
+        :param bandwidth_limiter: limiter that downloads to disk read through,
+            unlimited by default
+        :param rate_limits: client-side request rate limits per API or
+            endpoint, disabled by default
+        :param response_cache: cache of responses to GET requests, disabled
+            by default
+        :param request_coalescer: shares in-flight GET requests between
+            identical concurrent calls, disabled by default
+        :param hooks: observers of requests and their phase timings
+        """
+        self.timeout = timeout
+        self.max_retry_attempts = max_retry_attempts
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=max_retry_attempts,
+            max_retry_after=max_retry_after_seconds,
+        )
+        self.circuit_breakers = circuit_breakers
+        self.bandwidth_limiter = bandwidth_limiter
+        self.rate_limits = rate_limits
+        self.response_cache = response_cache
+        self.request_coalescer = request_coalescer
+        self.hooks = list(hooks or ())
+        # Bytes of a downloaded file kept in memory before spooling to disk
+        self.spool_threshold = DEFAULT_SPOOL_THRESHOLD
+        self.env = env
+        self.base_url = (
+            f"{self.build_url(subdomain).rstrip('/')}/{self.base_path.lstrip('/')}"
+        )
+
+    def build_url(self, subdomain: str) -> str:
+        """
+        Build base URL for given subdomain and environment.
+
+        :param subdomain: the subdomain to use
+        :return: the constructed base URL
+        """
+        env = "" if not self.env else f"{self.env}."
+        return f"https://{subdomain}.{env}satellitevu.com/"
+
+    @staticmethod
+    def _prepare_params(params: dict[str, Any] | None) -> dict[str, Any] | None:
+        """
+        Prepare query parameters for sending.
+
+        Converts pydantic models to json-serializable dicts and drops empty values.
+        """
+        if params:
+            # Convert any pydantic model objects in params to json-serializable dicts
+            for key, val in params.items():
+                if isinstance(val, BaseModel):
+                    params[key] = val.model_dump()
+
+            # Drop any params that are None or empty, keeping explicit False flags
+            params = {k: v for k, v in params.items() if v or v is False}
+
+        return params
+
+    def _endpoint(self, method: str, url: str, route: str | None) -> str:
+        """Name of a request's endpoint, e.g. "GET /otm/v2/{contract_id}/"."""
+        template = route if route is not None else route_template(url)
+        base_path = self.base_path.strip("/")
+        return f"{method.upper()} /{base_path}/{template.lstrip('/')}"
+
+    def _circuit_breaker(
+        self, method: str, url: str, route: str | None
+    ) -> CircuitBreaker | None:
+        """Circuit breaker for a request's endpoint, if breakers are enabled."""
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.get(self._endpoint(method, url, route))
+
+    def _rate_limiter(
+        self, method: str, url: str, route: str | None
+    ) -> RateLimiter | None:
+        """Rate limiter for a request's API or endpoint, if limits are enabled."""
+        if self.rate_limits is None:
+            return None
+        return self.rate_limits.get(
+            "/" + self.base_path.strip("/"), self._endpoint(method, url, route)
+        )
+
+    def _cache_lookup(
+        self, method: str, url: str, params: dict[str, Any] | None, route: str | None
+    ) -> CacheLookup | None:
+        """A request's entry in the response cache, if caching is enabled."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.lookup(
+            method,
+            url,
+            self._prepare_params(params),
+            base_url=self.base_url,
+            base_path="/" + self.base_path.strip("/"),
+            route=route if route is not None else route_template(url),
+        )
+
+    def _coalescing_key(
+        self, method: str, url: str, params: dict[str, Any] | None
+    ) -> tuple[str, ...] | None:
+        """Key of a request to coalesce with identical ones, if enabled."""
+        if self.request_coalescer is None or method.upper() != "GET":
+            return None
+        return self.request_coalescer.key(
+            self.base_url + url, self._prepare_params(params)
+        )
+
+    def _observation(
+        self, method: str, url: str, route: str | None
+    ) -> RequestObservation | None:
+        """Reports a request to the hooks, if there are any."""
+        if not self.hooks:
+            return None
+        request = RequestInfo(
+            service=self.base_path.strip("/").split("/")[0],
+            endpoint=self._endpoint(method, url, route),
+            method=method.upper(),
+            url=url,
+        )
+        return RequestObservation(self.hooks, request)
+
+    @staticmethod
+    def _finish(
+        observation: RequestObservation | None, result: Result[Any, HttpError]
+    ) -> Result[Any, HttpError]:
+        return observation.finish(result) if observation is not None else result
+
+    def warmup(self) -> None:
+        """
+        Build the TypeAdapters of the ResponseAdapters defined in this
+        service's module, instead of on each endpoint's first response.
+        """
+        module = sys.modules[type(self).__module__]
+        for value in vars(module).values():
+            if isinstance(value, ResponseAdapter):
+                value.warmup()
+
+    @staticmethod
+    def parse_json(response: HttpResponse, annotation: Any) -> Any:
+        """
+        Parse a JSON response body into ``annotation``.
+
+        Cached responses are validated once and the parsed objects reused.
+        """
+        if isinstance(response, ObservedResponse):
+            return response.parse(annotation)
+        if isinstance(response, CachedResponse):
+            return response.parsed(annotation)
+        return parse_response(response.json().unwrap(), annotation)
+
+    @staticmethod
+    def _observe_rate_limit(
+        limiter: RateLimiter, result: Result[Any, HttpError]
+    ) -> None:
+        """Let a rate limiter tune itself from a response's headers."""
+        if is_err(result):
+            error = result.error()
+            if isinstance(error, HttpStatusError):
+                limiter.observe(error.status_code, error.response_headers)
+        else:
+            response = result.unwrap()
+            limiter.observe(response.status_code, response.headers)
+
+    @staticmethod
+    def _parse_retry_after_from_headers(
+        headers: dict[str, str] | None, max_seconds: float
+    ) -> float | None:
+        """
+        Parse Retry-After header from response headers.
+
+        Accepts both a number of seconds and an HTTP-date.
+
+        Args:
+            headers: Response headers dict (can be None)
+            max_seconds: Maximum delay to cap at
+
+        Returns:
+            Delay in seconds (capped at max_seconds), or None if no valid header
+            is present.
+        """
+        delay = parse_retry_after(retry_after_header(headers))
+        if delay is None:
+            return None
+        return min(delay, max_seconds)
+
+    @staticmethod
+    def _content_length(headers: dict[str, str]) -> int | None:
+        """
+        Read the Content-Length header, if present and valid.
+
+        Args:
+            headers: Response headers dict
+
+        Returns:
+            Body size in bytes, or None if the header is missing or invalid.
+        """
+        content_length = headers.get("Content-Length") or headers.get("content-length")
+        if not content_length:
+            return None
+        try:
+            return int(content_length)
+        except (ValueError, TypeError):
+            # Content-Length header exists but isn't a valid integer
+            return None
+
+    @staticmethod
+    def _verify_download(
+        digest: StreamingDigest,
+        output_path: Path,
+        response: HttpResponse | AsyncHttpResponse,
+    ) -> DownloadedFile:
+        """Check a streamed file's digest against the response's checksum headers."""
+        return verify_digest(
+            digest, output_path, response.headers, response.status_code == 206
+        )
+
+    @staticmethod
+    def _download_location(
+        response: HttpResponse | AsyncHttpResponse,
+    ) -> tuple[str, float | None] | None:
+        """
+        Find the signed file URL in a download endpoint response.
+
+        Download endpoints called with ``redirect=False`` return ``{"url", "ttl"}``
+        as JSON; a redirect response carries the URL in its Location header.
+
+        Args:
+            response: Response from a download endpoint
+
+        Returns:
+            The signed URL and the Unix time it expires at (None if unknown),
+            or None if the response is the file itself.
+        """
+        if 300 <= response.status_code < 400:
+            location = header_value(response.headers, "Location")
+            return (location, None) if location else None
+
+        content_type = header_value(response.headers, "Content-Type") or ""
+        if response.status_code != 200 or "json" not in content_type:
+            return None
+
+        body = response.json()
+        if is_err(body):
+            return None
+        payload = body.unwrap()
+        if not isinstance(payload, dict) or not isinstance(payload.get("url"), str):
+            return None
+        ttl = payload.get("ttl")
+        expires_at = time.time() + ttl if isinstance(ttl, int | float) else None
+        return payload["url"], expires_at
+
+    @staticmethod
+    def _resumable_url(output_path: Path | str) -> tuple[str, float | None] | None:
+        """
+        Signed URL saved by an interrupted resumable download, if still valid.
+
+        Reusing it skips the call to the download endpoint when resuming.
+        """
+        part_path, state_path = partial_paths(output_path)
+        if not part_path.exists():
+            return None
+        state = DownloadState.load(state_path)
+        if state is None or not state.url_is_fresh():
+            return None
+        return state.url, state.expires_at
+
+    @staticmethod
+    def _url_rejected(result: Result[Path | DownloadedFile, HttpError]) -> bool:
+        """Whether a download failed because its signed URL was refused."""
+        if not is_err(result):
+            return False
+        error = result.error()
+        return isinstance(error, ClientError) and error.status_code in (401, 403)
+
+    @staticmethod
+    def extract_next_token(response: BaseModel) -> str | None:
+        """
+        Extract pagination token from STAC links array.
+
+        Handles both GET (token in URL) and POST (token in body) patterns
+        used across all SatVu APIs for pagination.
+
+        Args:
+            response: API response with links array
+
+        Returns:
+            Next pagination token or None if no more pages
+        """
+        links = getattr(response, "links", None)
+        if not links:
+            return None
+
+        # Find link with rel="next"
+        next_link = next(
+            (link for link in links if link.rel == "next"),
+            None,
+        )
+
+        if not next_link:
+            return None
+
+        # Method 1: GET request - token in URL query parameter
+        if next_link.method == "GET":
+            parsed = urlparse(next_link.href)
+            params = parse_qs(parsed.query)
+            return params.get("token", [None])[0]
+
+        # Method 2: POST request - token in body
+        if next_link.method == "POST" and next_link.body:
+            if isinstance(next_link.body, dict):
+                return next_link.body.get("token")
+            if hasattr(next_link.body, "token"):
+                return next_link.body.token
+
+        return None
+
+
+class SDKClient(_SDKClientBase):
     """
     Base SDK client with HTTP request handling, retry logic, and utilities.
     """
 
-    base_path: str
+    def __init__(
+        self,
+        env: str | None,
+        get_token: Callable[[], str] | None = None,
+        subdomain: str = "api",
+        http_client: HttpClient | None = None,
+        timeout: int = 30,
+        max_retry_attempts: int = 5,
+        max_retry_after_seconds: float = 300.0,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        connection_pool: ConnectionPool | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        rate_limits: RateLimits | None = None,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        hooks: Sequence[RequestHooks] | None = None,
+    ):
+        """
+        Initialize SDK client.
+
+        :param env: the environment to use
+        :param get_token: callable that returns the auth token
+        :param subdomain: the subdomain to use
+        :param http_client: optional custom HTTP client, defaults to auto-created client
+        :param timeout: request timeout in seconds, default 30s
+        :param max_retry_attempts: maximum number of retry attempts, default 5
+        :param max_retry_after_seconds: maximum seconds to wait for Retry-After, default 300s
+        :param retry_policy: policy for retrying failed requests, defaults to one
+            built from max_retry_attempts and max_retry_after_seconds
+        :param circuit_breakers: circuit breakers to fail fast on unhealthy
+            endpoints, disabled by default
+        :param connection_pool: pool to send requests through instead of
+            creating a client, ignored if http_client is given
+        :param bandwidth_limiter: limiter that downloads to disk read through,
+            unlimited by default
+        :param rate_limits: client-side request rate limits per API or
+            endpoint, disabled by default
+        :param response_cache: cache of responses to GET requests, disabled
+            by default
+        :param request_coalescer: shares in-flight GET requests between
+            identical concurrent calls, disabled by default
+        :param hooks: observers of requests and their phase timings
+        """
+        super().__init__(
+            env=env,
+            subdomain=subdomain,
+            timeout=timeout,
+            max_retry_attempts=max_retry_attempts,
+            max_retry_after_seconds=max_retry_after_seconds,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            bandwidth_limiter=bandwidth_limiter,
+            rate_limits=rate_limits,
+            response_cache=response_cache,
+            request_coalescer=request_coalescer,
+            hooks=hooks,
+        )
+
+        self._transfer_client: HttpClient | None = None
+        if http_client is not None:
+            self.client = http_client
+            self._owns_client = False
+        elif connection_pool is not None:
+            self.client = connection_pool.client(self.base_url, get_token=get_token)
+            self._transfer_client = connection_pool.client()
+            self._owns_client = False
+        else:
+            self.client = create_http_client(
+                "auto",
+                base_url=self.base_url,
+                get_token=get_token,
+            )
+            self._owns_client = True
+
+    @property
+    def transfer_client(self) -> HttpClient:
+        """
+        HTTP client used to fetch files from signed download URLs.
+
+        Signed URLs carry their own authorisation and reject bearer tokens, so
+        unless a custom http_client was provided, a separate client without
+        credentials is created on first use.
+        """
+        if self._transfer_client is None:
+            self._transfer_client = (
+                create_http_client("auto") if self._owns_client else self.client
+            )
+        return self._transfer_client
+
+    @transfer_client.setter
+    def transfer_client(self, client: HttpClient) -> None:
+        self._transfer_client = client
+
+    def make_request(
+        self,
+        method: str,
+        url: str,
+        json: list | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        follow_redirects: bool = False,
+        timeout: int | None = None,
+        route: str | None = None,
+        stream: bool = False,
+    ) -> Result[HttpResponse, HttpError]:
+        """
+        Make an HTTP request with automatic retries.
+
+        Automatically retries requests when the server provides a Retry-After header
+        for a 202 Accepted response, respecting the server's requested delay.
+        The delay is capped at max_retry_after_seconds (default 5 minutes) and
+        will retry up to max_retry_attempts times (default 5).
+
+        Transient failures (5xx and 429 responses, timeouts and network
+        errors) are retried as decided by retry_policy: with exponential
+        backoff and jitter, only for idempotent methods by default, and only
+        while the policy's retry budget allows.
+
+        With a response_cache, fresh cached responses to GET requests are
+        returned without contacting the server, and stale ones are
+        revalidated with a conditional request. With a request_coalescer,
+        identical GET requests made while one is in flight share its result.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE, etc.)
+            url: URL to request
+            json: Optional JSON body
+            params: Optional query parameters
+            follow_redirects: Whether to follow redirects
+            timeout: Request timeout in seconds (uses instance timeout if None)
+            route: Route template of url, e.g. "/{contract_id}/search", naming
+                the endpoint for circuit breaking, rate limiting and caching.
+                Guessed from url if None.
+            stream: The body will be read incrementally. Skips the response
+                cache and request coalescer, which read whole bodies into
+                memory.
+
+        Returns:
+            Result containing either:
+            - Ok(HttpResponse) on success
+            - Err(HttpError) on failure
+        """
+        observation = self._observation(method, url, route)
+        lookup = None if stream else self._cache_lookup(method, url, params, route)
+        if lookup is not None and lookup.fresh:
+            return self._finish(observation, Ok(lookup.response()))
+
+        def send() -> Result[HttpResponse, HttpError]:
+            result = self._send_request(
+                method,
+                url,
+                json,
+                params,
+                follow_redirects,
+                timeout,
+                route,
+                lookup.headers if lookup is not None else None,
+                observation,
+                stream,
+            )
+            return lookup.update(result) if lookup is not None else result
+
+        key = None if stream else self._coalescing_key(method, url, params)
+        coalescer = self.request_coalescer
+        if key is not None and coalescer is not None:
+            return self._finish(observation, coalescer.run(key, send))
+        return self._finish(observation, send())
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        json: list | dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        follow_redirects: bool,
+        timeout: int | None,
+        route: str | None,
+        headers: dict[str, str] | None,
+        observation: RequestObservation | None = None,
+        stream: bool = False,
+    ) -> Result[HttpResponse, HttpError]:
+        """Send a request, retrying and rate limiting it as configured."""
+        breaker = self._circuit_breaker(method, url, route)
+        limiter = self._rate_limiter(method, url, route)
+        self.retry_policy.budget.record_request()
+        max_attempts = max(self.max_retry_attempts, self.retry_policy.max_attempts)
+        for attempt in range(1, max_attempts + 1):
+            if limiter is not None:
+                wait = limiter.reserve()
+                if isinstance(wait, HttpError):
+                    return Err(wait)
+                if wait > 0:
+                    time.sleep(wait)
+
+            if breaker is not None:
+                rejected = breaker.before_request()
+                if rejected is not None:
+                    return Err(rejected)
+                started = time.monotonic()
+
+            # Record raised exceptions too, or a half-open breaker would keep
+            # waiting for its probe's outcome
+            outcome: BaseException | None = None
+            try:
+                with observation.attempt() if observation else nullcontext():
+                    result = self._execute_request(
+                        method,
+                        url,
+                        json,
+                        params,
+                        follow_redirects,
+                        timeout,
+                        headers,
+                        stream,
+                    )
+                if is_err(result):
+                    outcome = result.error()
+            except BaseException as error:
+                outcome = error
+                raise
+            finally:
+                if breaker is not None:
+                    breaker.record(outcome, time.monotonic() - started)
+
+            if limiter is not None:
+                self._observe_rate_limit(limiter, result)
+
+            if is_err(result):
+                error = result.error()
+                if not self.retry_policy.should_retry(method, error, attempt):
+                    return result
+                delay = self.retry_policy.delay(attempt, error)
+                logger.info(
+                    f"{error.error_type()} for {method} {url} - retrying in "
+                    f"{delay:.1f}s (attempt {attempt}/{self.retry_policy.max_attempts})"
+                )
+                if observation is not None:
+                    observation.retried(attempt, delay, error)
+                time.sleep(delay)
+                continue
+
+            response = result.unwrap()
+
+            if response.status_code != 202:
+                return result
+
+            # Handle 202 with Retry-After
+            retry_after = self._parse_retry_after_from_headers(
+                response.headers, self.max_retry_after_seconds
+            )
+            if retry_after is None or attempt >= self.max_retry_attempts:
+                return result
+
+            # Log retry attempt
+            logger.info(
+                f"Received 202 Accepted - retrying in {retry_after:.0f}s "
+                f"(attempt {attempt}/{self.max_retry_attempts})"
+            )
+            if observation is not None:
+                observation.retried(attempt, retry_after, None)
+
+            time.sleep(retry_after)
+
+        return result
+
+    def _execute_request(
+        self,
+        method: str,
+        url: str,
+        json: list | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        follow_redirects: bool = False,
+        timeout: int | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> Result[HttpResponse, HttpError]:
+        """
+        Execute HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE, etc.)
+            url: URL to request
+            json: Optional JSON body
+            params: Optional query parameters
+            follow_redirects: Whether to follow redirects
+            timeout: Request timeout in seconds (uses instance timeout if None)
+            headers: Optional extra request headers
+            stream: Read the body from the connection as it is iterated
+
+        Returns:
+            Result containing either:
+            - Ok(HttpResponse) on success
+            - Err(HttpError) on failure
+
+        """
+        params = self._prepare_params(params)
+
+        # Use instance timeout if not specified
+        timeout_val = timeout if timeout is not None else self.timeout
+        # stream is only passed when set, so custom clients without it keep working
+        options: dict[str, Any] = {"stream": True} if stream else {}
+
+        return self.client.request(
+            method=method,  # type: ignore
+            url=url,
+            headers=headers,
+            json=json,
+            params=params,
+            follow_redirects=follow_redirects,
+            timeout=float(timeout_val),
+            **options,
+        )
+
+    def download_to_file(
+        self,
+        url: str,
+        output_path: Path | str,
+        params: dict[str, Any] | None = None,
+        *,
+        chunk_size: int = 8192,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        timeout: int | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        resume: bool = False,
+        digest: DigestAlgorithm | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        transfer_client: HttpClient | None = None,
+    ) -> Result[Path | DownloadedFile, HttpError]:
+        """
+        Download the file behind a redirecting download endpoint to disk.
+
+        Asks the endpoint for its signed URL instead of following the redirect,
+        then fetches the file with satvu.download.download_url(), using parallel
+        byte-range requests when the storage server supports them. If the
+        endpoint serves the file directly, the response is streamed to disk.
+
+        With ``resume=True`` an interrupted download continues from the
+        ``<output_path>.part`` file. The signed URL saved alongside it is reused
+        while it is valid; otherwise a fresh one is requested from the endpoint.
+
+        Args:
+            url: Download endpoint URL, relative to the service base URL
+            output_path: Where to save the file (Path or string)
+            params: Optional query parameters for the endpoint
+            chunk_size: Bytes per chunk (default: 8KB)
+            progress_callback: Optional callback called after each chunk is written.
+                             Signature: callback(bytes_downloaded: int, total_bytes: int | None)
+            timeout: Request timeout in seconds (uses instance timeout if None)
+            max_connections: Maximum number of concurrent range requests. Use 1 to
+                             download over a single connection.
+            resume: Resume a previously interrupted download of ``output_path``
+            digest: Compute a "sha256", "md5" or "crc32c" digest while writing
+                    the file and check it against the server's checksum headers
+            bandwidth_limiter: Limiter to read the file through, overriding the
+                    client's ``bandwidth_limiter``
+            transfer_client: Client to fetch the signed URL with, overriding
+                    ``transfer_client``
+
+        Returns:
+            Result containing either:
+            - Ok(Path) pointing to the downloaded file, or Ok(DownloadedFile)
+              with its path and digest when ``digest`` is given
+            - Err(HttpError) on failure, including ChecksumMismatchError
+        """
+        transfer_timeout = float(timeout if timeout is not None else self.timeout)
+        limiter = bandwidth_limiter or self.bandwidth_limiter
+        transfer_client = transfer_client or self.transfer_client
+
+        saved = self._resumable_url(output_path) if resume else None
+        if saved is not None:
+            resumed = download_url(
+                transfer_client,
+                saved[0],
+                output_path,
+                chunk_size=chunk_size,
+                progress_callback=progress_callback,
+                timeout=transfer_timeout,
+                max_connections=max_connections,
+                resume=True,
+                url_expires_at=saved[1],
+                digest=digest,
+                bandwidth_limiter=limiter,
+            )
+            if not self._url_rejected(resumed):
+                return resumed
+            logger.debug("Saved download URL was rejected, requesting a new one")
+
+        result = self.make_request(
+            method="get",
+            url=url,
+            params={**(params or {}), "redirect": False},
+            timeout=timeout,
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+
+        location = self._download_location(response)
+        if location is None:
+            try:
+                return Ok(
+                    self.stream_to_file(
+                        response=response,
+                        output_path=output_path,
+                        chunk_size=chunk_size,
+                        progress_callback=progress_callback,
+                        digest=digest,
+                        bandwidth_limiter=limiter,
+                    )
+                )
+            except ChecksumMismatchError as error:
+                return Err(error)
+
+        return download_url(
+            transfer_client,
+            location[0],
+            output_path,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            timeout=transfer_timeout,
+            max_connections=max_connections,
+            resume=resume,
+            url_expires_at=location[1],
+            digest=digest,
+            bandwidth_limiter=limiter,
+        )
+
+    def open_download(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: int | None = None,
+    ) -> Result[RemoteFile, HttpError]:
+        """
+        Open the file behind a download endpoint without loading it into memory.
+
+        Asks the endpoint for its signed URL instead of following the redirect.
+        The returned RemoteFile fetches byte ranges of the signed URL as they
+        are read, so ``zipfile.ZipFile`` only downloads the parts of an archive
+        it needs. If the endpoint serves the file directly, it is spooled.
+        Either way, at most ``spool_threshold`` bytes are held in memory and the
+        rest is spooled to a temporary file.
+
+        Args:
+            url: Download endpoint URL, relative to the service base URL
+            params: Optional query parameters for the endpoint
+            timeout: Request timeout in seconds (uses instance timeout if None)
+
+        Returns:
+            Result containing either:
+            - Ok(RemoteFile) positioned at the start of the file
+            - Err(HttpError) if fetching the file fails
+        """
+        result = self.make_request(
+            method="get",
+            url=url,
+            params={**(params or {}), "redirect": False},
+            timeout=timeout,
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+
+        location = self._download_location(response)
+        if location is None:
+            return Ok(
+                RemoteFile.from_response(response, spool_threshold=self.spool_threshold)
+            )
+        return RemoteFile.open(
+            self.transfer_client,
+            location[0],
+            timeout=float(timeout if timeout is not None else self.timeout),
+            spool_threshold=self.spool_threshold,
+        )
+
+    def extract_members(
+        self,
+        url: str,
+        output_dir: Path | str,
+        members: MemberSelector,
+        params: dict[str, Any] | None = None,
+        *,
+        chunk_size: int = 8192,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        timeout: int | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> Result[list[Path], HttpError]:
+        """
+        Extract selected members of the zip archive behind a download endpoint.
+
+        Asks the endpoint for its signed URL, reads the archive's central
+        directory with a range request and then fetches only the selected
+        members, see satvu.archive.extract_url_members(). Each member is
+        written straight to ``output_dir`` and its CRC-32 is verified.
+
+        Args:
+            url: Download endpoint URL, relative to the service base URL
+            output_dir: Directory to extract the members into
+            members: Glob pattern(s) matched against member names, e.g. "*.tif",
+                or a predicate called with each member's ZipInfo
+            params: Optional query parameters for the endpoint
+            chunk_size: Bytes per chunk (default: 8KB)
+            progress_callback: Optional callback called after each chunk, with
+                the compressed bytes received across all members.
+                Signature: callback(bytes_downloaded: int, total_bytes: int | None)
+            timeout: Request timeout in seconds (uses instance timeout if None)
+            max_connections: Maximum number of members fetched concurrently
+            bandwidth_limiter: Limiter to read the members through, overriding
+                the client's ``bandwidth_limiter``
+
+        Returns:
+            Result containing either:
+            - Ok(list[Path]) of the extracted files
+            - Err(HttpError) on failure
+        """
+        result = self.make_request(
+            method="get",
+            url=url,
+            params={**(params or {}), "redirect": False},
+            timeout=timeout,
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+
+        location = self._download_location(response)
+        if location is None:
+            with RemoteFile.from_response(
+                response, spool_threshold=self.spool_threshold
+            ) as file:
+                return extract_file_members(file, output_dir, members)
+
+        return extract_url_members(
+            self.transfer_client,
+            location[0],
+            output_dir,
+            members,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            timeout=float(timeout if timeout is not None else self.timeout),
+            max_connections=max_connections,
+            bandwidth_limiter=bandwidth_limiter or self.bandwidth_limiter,
+        )
+
+    @staticmethod
+    def stream_to_file(
+        response: HttpResponse,
+        output_path: Path | str,
+        chunk_size: int = 8192,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        digest: DigestAlgorithm | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> Path | DownloadedFile:
+        """
+        Stream HTTP response to disk with optional progress tracking.
+
+        Memory-efficient: streams response in chunks without loading entire file into memory.
+        Ideal for large file downloads (satellite imagery, archives, etc.).
+
+        Args:
+            response: HTTP response to stream
+            output_path: Where to save the file (Path or string)
+            chunk_size: Bytes per chunk (default: 8KB). Increase for better throughput
+                       on fast connections (e.g., 64KB), decrease for progress granularity.
+            progress_callback: Optional callback called after each chunk is written.
+                             Signature: callback(bytes_downloaded: int, total_bytes: int | None)
+                             total_bytes is None if Content-Length header is not present.
+            digest: Optional digest algorithm ("sha256", "md5" or "crc32c") computed
+                    over the chunks as they are written. If the response carries a
+                    checksum for it (ETag, Content-MD5, Digest, Repr-Digest,
+                    Content-Digest or x-goog-hash), the digest is checked against it.
+            bandwidth_limiter: Optional limiter the body is read through, capping
+                    the rate shared with other downloads using it.
+
+        Returns:
+            Path object pointing to the downloaded file, or a DownloadedFile holding
+            the path and its digest when ``digest`` is given
+
+        Raises:
+            ChecksumMismatchError: If the digest differs from the server's checksum.
+                Nothing is written to output_path.
+
+        Note:
+            The body is written to a hidden file next to output_path and renamed
+            into place once complete, so a failed download never leaves a
+            partial file at output_path.
+
+            This method uses response.iter_into() (or iter_bytes() for responses
+            without it), which can only be called once per response. The response
+            stream is consumed during this operation.
+        """
+        output_path = Path(output_path)
+
+        # Get total file size from Content-Length header (if available)
+        total_bytes = SDKClient._content_length(response.headers)
+
+        # Stream response to disk in chunks, reusing one buffer
+        bytes_downloaded = 0
+        buffer = bytearray(chunk_size)
+        digester = StreamingDigest(digest) if digest is not None else None
+        share = bandwidth_limiter.share() if bandwidth_limiter is not None else None
+        target = temp_path(output_path)
+        try:
+            with target.open("wb") as f:
+                for chunk in iter_response(response, buffer):
+                    if share is not None:
+                        share.acquire(len(chunk))
+                    f.write(chunk)
+                    if digester is not None:
+                        digester.update(chunk)
+                    bytes_downloaded += len(chunk)
+
+                    # Call progress callback if provided
+                    if progress_callback:
+                        progress_callback(bytes_downloaded, total_bytes)
+
+            downloaded = (
+                SDKClient._verify_download(digester, output_path, response)
+                if digester is not None
+                else output_path
+            )
+            os.replace(target, output_path)
+        finally:
+            target.unlink(missing_ok=True)
+        return downloaded
+
+    def stream_items(
+        self,
+        fetch_response: Callable[[str | None], HttpResponse],
+        items_field: str,
+        item_type: Any,
+        page_type: Any,
+        *,
+        max_items: int | None = None,
+        chunk_size: int = 65536,
+    ) -> Generator[Any, None, None]:
+        """
+        Yield the items of paginated responses, parsing each page incrementally.
+
+        Each item of ``items_field`` is decoded and validated as soon as its
+        bytes arrive instead of decoding the whole page, so memory is bounded by
+        a single item rather than a page. The page's remaining fields are
+        validated as ``page_type`` (with no items) to find the next page.
+
+        Args:
+            fetch_response: Returns the raw response for a page token (None for
+                the first page)
+            items_field: Name of the array field holding the items
+            item_type: Type each item is parsed into
+            page_type: Type of a full page, used to read its links
+            max_items: Stop after this many items (default: unlimited)
+            chunk_size: Bytes read from the response at a time
+
+        Yields:
+            Parsed items from all pages, in order
+        """
+        token = None
+        count = 0
+        while True:
+            response = fetch_response(token)
+            try:
+                stream = JsonArrayStream(response.iter_bytes(chunk_size), items_field)
+                for raw in stream:
+                    yield parse_response(raw, item_type)
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+            finally:
+                # Release the connection of a page that was not read to the end
+                close_response(response)
+            page = parse_response({**stream.fields, items_field: []}, page_type)
+            token = self.extract_next_token(page)
+            if not token:
+                return
+
+    def map_concurrent(
+        self,
+        method: str | Callable[..., Any],
+        calls: Calls,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> Generator[Result[Any, HttpError], None, None]:
+        """
+        Call an endpoint method once per argument dict on a bounded thread pool.
+
+        Results are yielded in the order of ``calls`` as they complete, each as
+        Ok(return value) or Err(HttpError), so failed calls do not stop the
+        batch.
+
+        Args:
+            method: Endpoint method, or its name on this service
+            calls: Keyword arguments of each call
+            max_workers: Most calls in flight at once
+            timeout: Request timeout in seconds for calls that do not set one
+            deadline: Seconds for the whole batch, after which unfinished calls
+                fail with DeadlineExceededError
+
+        Example:
+            >>> calls = ({"contract_id": cid, "order_id": o} for o in order_ids)
+            >>> for result in sdk.otm.map_concurrent("get_tasking_order", calls):
+            ...     ...
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        return map_concurrent(
+            func, calls, max_workers=max_workers, timeout=timeout, deadline=deadline
+        )
+
+    def batch_call(
+        self,
+        method: str | Callable[..., Any],
+        calls: Calls,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> list[Result[Any, HttpError]]:
+        """
+        Like map_concurrent(), but wait for the whole batch and return a list.
+        """
+        return list(
+            self.map_concurrent(
+                method,
+                calls,
+                max_workers=max_workers,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        )
+
+
+class AsyncSDKClient(_SDKClientBase):
+    """
+    Asynchronous SDK client with HTTP request handling, retry logic, and utilities.
+
+    Mirrors SDKClient, but every request is awaited on an AsyncHttpClient so a
+    single event loop can keep many requests in flight.
+    """
 
     def __init__(
         self,
         env: str | None,
-        get_token: Callable[[], str] | None = None,
+        get_token: Callable[[], Awaitable[str]] | None = None,
         subdomain: str = "api",
-        http_client: HttpClient | None = None,
+        http_client: AsyncHttpClient | None = None,
         timeout: int = 30,
         max_retry_attempts: int = 5,
         max_retry_after_seconds: float = 300.0,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        connection_pool: AsyncConnectionPool | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        rate_limits: RateLimits | None = None,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        hooks: Sequence[RequestHooks] | None = None,
     ):
         """
-        Initialize SDK client.
+        Initialize async SDK client.
 
         :param env: the environment to use
-        :param get_token: callable that returns the auth token
+        :param get_token: coroutine function that returns the auth token
         :param subdomain: the subdomain to use
-        :param http_client: optional custom HTTP client, defaults to auto-created client
+        :param http_client: optional custom async HTTP client, defaults to auto-created client
         :param timeout: request timeout in seconds, default 30s
         :param max_retry_attempts: maximum number of retry attempts, default 5
         :param max_retry_after_seconds: maximum seconds to wait for Retry-After, default 300s
+        :param retry_policy: policy for retrying failed requests, defaults to one
+            built from max_retry_attempts and max_retry_after_seconds
+        :param circuit_breakers: circuit breakers to fail fast on unhealthy
+            endpoints, disabled by default
+        :param connection_pool: pool to send requests through instead of
+            creating a client, ignored if http_client is given
+        :param bandwidth_limiter: limiter that downloads to disk read through,
+            unlimited by default
+        :param rate_limits: client-side request rate limits per API or
+            endpoint, disabled by default
+        :param response_cache: cache of responses to GET requests, disabled
+            by default
+        :param request_coalescer: shares in-flight GET requests between
+            identical concurrent calls, disabled by default
+        :param hooks: observers of requests and their phase timings
         """
-        self.timeout = timeout
-        self.max_retry_attempts = max_retry_attempts
-        self.max_retry_after_seconds = max_retry_after_seconds
-        self.env = env
-
-        base_url = (
-            f"{self.build_url(subdomain).rstrip('/')}/{self.base_path.lstrip('/')}"
+        super().__init__(
+            env=env,
+            subdomain=subdomain,
+            timeout=timeout,
+            max_retry_attempts=max_retry_attempts,
+            max_retry_after_seconds=max_retry_after_seconds,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            bandwidth_limiter=bandwidth_limiter,
+            rate_limits=rate_limits,
+            response_cache=response_cache,
+            request_coalescer=request_coalescer,
+            hooks=hooks,
         )
 
+        self._transfer_client: AsyncHttpClient | None = None
         if http_client is not None:
             self.client = http_client
+            self._owns_client = False
+        elif connection_pool is not None:
+            self.client = connection_pool.client(self.base_url, get_token=get_token)
+            self._transfer_client = connection_pool.client()
+            self._owns_client = False
         else:
-            self.client = create_http_client(
+            self.client = create_async_http_client(
                 "auto",
-                base_url=base_url,
+                base_url=self.base_url,
                 get_token=get_token,
             )
+            self._owns_client = True
 
-    def build_url(self, subdomain: str) -> str:
+    @property
+    def transfer_client(self) -> AsyncHttpClient:
         """
-        Build base URL for given subdomain and environment.
+        HTTP client used to fetch files from signed download URLs.
 
-        :param subdomain: the subdomain to use
-        :return: the constructed base URL
+        See SDKClient.transfer_client.
         """
-        env = "" if not self.env else f"{self.env}."
-        return f"https://{subdomain}.{env}satellitevu.com/"
+        if self._transfer_client is None:
+            self._transfer_client = (
+                create_async_http_client("auto") if self._owns_client else self.client
+            )
+        return self._transfer_client
 
-    def make_request(
+    @transfer_client.setter
+    def transfer_client(self, client: AsyncHttpClient) -> None:
+        self._transfer_client = client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP clients if they were created by this client."""
+        if self._owns_client:
+            await self.client.aclose()
+            if self._transfer_client is not None:
+                await self._transfer_client.aclose()
+
+    async def make_request(
         self,
         method: str,
         url: str,
@@ -79,14 +1276,14 @@ class SDKClient:
         params: dict[str, Any] | None = None,
         follow_redirects: bool = False,
         timeout: int | None = None,
-    ) -> Result[HttpResponse, HttpError]:
+        route: str | None = None,
+        stream: bool = False,
+    ) -> Result[AsyncHttpResponse, HttpError]:
         """
-        Make an HTTP request with automatic Retry-After handling.
+        Make an HTTP request with automatic retries.
 
-        Automatically retries requests when the server provides a Retry-After header
-        for a 202 Accepted response, respecting the server's requested delay.
-        The delay is capped at max_retry_after_seconds (default 5 minutes) and
-        will retry up to max_retry_attempts times (default 5).
+        Behaves like SDKClient.make_request(), but waits between retries with
+        asyncio.sleep() so other requests keep running on the event loop.
 
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE, etc.)
@@ -95,19 +1292,118 @@ class SDKClient:
             params: Optional query parameters
             follow_redirects: Whether to follow redirects
             timeout: Request timeout in seconds (uses instance timeout if None)
+            route: Route template of url, e.g. "/{contract_id}/search", naming
+                the endpoint for circuit breaking, rate limiting and caching.
+                Guessed from url if None.
+            stream: The body will be read incrementally. Skips the response
+                cache and request coalescer, which read whole bodies into
+                memory.
 
         Returns:
             Result containing either:
-            - Ok(HttpResponse) on success
+            - Ok(AsyncHttpResponse) on success
             - Err(HttpError) on failure
         """
-        for attempt in range(1, self.max_retry_attempts + 1):
-            result = self._execute_request(
-                method, url, json, params, follow_redirects, timeout
+        observation = self._observation(method, url, route)
+        lookup = None if stream else self._cache_lookup(method, url, params, route)
+        if lookup is not None and lookup.fresh:
+            return self._finish(observation, Ok(lookup.response()))
+
+        async def send() -> Result[AsyncHttpResponse, HttpError]:
+            result = await self._send_request(
+                method,
+                url,
+                json,
+                params,
+                follow_redirects,
+                timeout,
+                route,
+                lookup.headers if lookup is not None else None,
+                observation,
+                stream,
             )
+            return lookup.update(result) if lookup is not None else result
 
-            if result.is_err():
-                return result
+        key = None if stream else self._coalescing_key(method, url, params)
+        coalescer = self.request_coalescer
+        if key is not None and coalescer is not None:
+            result = await coalescer.run_async(key, send)
+        else:
+            result = await send()
+        return self._finish(observation, result)
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        json: list | dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        follow_redirects: bool,
+        timeout: int | None,
+        route: str | None,
+        headers: dict[str, str] | None,
+        observation: RequestObservation | None = None,
+        stream: bool = False,
+    ) -> Result[AsyncHttpResponse, HttpError]:
+        """Send a request, retrying and rate limiting it as configured."""
+        breaker = self._circuit_breaker(method, url, route)
+        limiter = self._rate_limiter(method, url, route)
+        self.retry_policy.budget.record_request()
+        max_attempts = max(self.max_retry_attempts, self.retry_policy.max_attempts)
+        for attempt in range(1, max_attempts + 1):
+            if limiter is not None:
+                wait = limiter.reserve()
+                if isinstance(wait, HttpError):
+                    return Err(wait)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            if breaker is not None:
+                rejected = breaker.before_request()
+                if rejected is not None:
+                    return Err(rejected)
+                started = time.monotonic()
+
+            # Record raised exceptions too, or a half-open breaker would keep
+            # waiting for its probe's outcome
+            outcome: BaseException | None = None
+            try:
+                with observation.attempt() if observation else nullcontext():
+                    result = await self._execute_request(
+                        method,
+                        url,
+                        json,
+                        params,
+                        follow_redirects,
+                        timeout,
+                        headers,
+                        stream,
+                    )
+                if is_err(result):
+                    outcome = result.error()
+            except BaseException as error:
+                outcome = error
+                raise
+            finally:
+                if breaker is not None:
+                    breaker.record(outcome, time.monotonic() - started)
+
+            if limiter is not None:
+                self._observe_rate_limit(limiter, result)
+
+            if is_err(result):
+                error = result.error()
+                if not self.retry_policy.should_retry(method, error, attempt):
+                    return result
+                delay = self.retry_policy.delay(attempt, error)
+                logger.info(
+                    f"{error.error_type()} for {method} {url} - retrying in "
+                    f"{delay:.1f}s (attempt {attempt}/{self.retry_policy.max_attempts})"
+                )
+                if observation is not None:
+                    observation.retried(attempt, delay, error)
+                await asyncio.sleep(delay)
+                continue
 
             response = result.unwrap()
 
@@ -121,17 +1417,18 @@ class SDKClient:
             if retry_after is None or attempt >= self.max_retry_attempts:
                 return result
 
-            # Log retry attempt
             logger.info(
                 f"Received 202 Accepted - retrying in {retry_after:.0f}s "
                 f"(attempt {attempt}/{self.max_retry_attempts})"
             )
+            if observation is not None:
+                observation.retried(attempt, retry_after, None)
 
-            time.sleep(retry_after)
+            await asyncio.sleep(retry_after)
 
         return result
 
-    def _execute_request(
+    async def _execute_request(
         self,
         method: str,
         url: str,
@@ -139,7 +1436,9 @@ class SDKClient:
         params: dict[str, Any] | None = None,
         follow_redirects: bool = False,
         timeout: int | None = None,
-    ) -> Result[HttpResponse, HttpError]:
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> Result[AsyncHttpResponse, HttpError]:
         """
         Execute HTTP request.
 
@@ -150,157 +1449,355 @@ class SDKClient:
             params: Optional query parameters
             follow_redirects: Whether to follow redirects
             timeout: Request timeout in seconds (uses instance timeout if None)
+            headers: Optional extra request headers
+            stream: Read the body from the connection as it is iterated
 
         Returns:
             Result containing either:
-            - Ok(HttpResponse) on success
+            - Ok(AsyncHttpResponse) on success
             - Err(HttpError) on failure
-
         """
-        if params:
-            # Convert any pydantic model objects in params to json-serializable dicts
-            for key, val in params.items():
-                if isinstance(val, BaseModel):
-                    params[key] = val.model_dump()
-
-            # Drop any params that are None
-            params = {k: v for k, v in params.items() if v}
+        params = self._prepare_params(params)
 
         # Use instance timeout if not specified
         timeout_val = timeout if timeout is not None else self.timeout
+        # stream is only passed when set, so custom clients without it keep working
+        options: dict[str, Any] = {"stream": True} if stream else {}
 
-        return self.client.request(
+        return await self.client.request(
             method=method,  # type: ignore
             url=url,
+            headers=headers,
             json=json,
             params=params,
             follow_redirects=follow_redirects,
             timeout=float(timeout_val),
+            **options,
         )
 
-    @staticmethod
-    def _parse_retry_after_from_headers(
-        headers: dict[str, str] | None, max_seconds: float
-    ) -> float | None:
+    async def download_to_file(
+        self,
+        url: str,
+        output_path: Path | str,
+        params: dict[str, Any] | None = None,
+        *,
+        chunk_size: int = 8192,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        timeout: int | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        resume: bool = False,
+        digest: DigestAlgorithm | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        transfer_client: AsyncHttpClient | None = None,
+    ) -> Result[Path | DownloadedFile, HttpError]:
         """
-        Parse Retry-After header from response headers.
+        Download the file behind a redirecting download endpoint to disk.
+
+        Async counterpart of SDKClient.download_to_file(); byte ranges are
+        fetched concurrently on the event loop.
+        """
+        transfer_timeout = float(timeout if timeout is not None else self.timeout)
+        limiter = bandwidth_limiter or self.bandwidth_limiter
+        transfer_client = transfer_client or self.transfer_client
+
+        saved = self._resumable_url(output_path) if resume else None
+        if saved is not None:
+            resumed = await download_url_async(
+                transfer_client,
+                saved[0],
+                output_path,
+                chunk_size=chunk_size,
+                progress_callback=progress_callback,
+                timeout=transfer_timeout,
+                max_connections=max_connections,
+                resume=True,
+                url_expires_at=saved[1],
+                digest=digest,
+                bandwidth_limiter=limiter,
+            )
+            if not self._url_rejected(resumed):
+                return resumed
+            logger.debug("Saved download URL was rejected, requesting a new one")
+
+        result = await self.make_request(
+            method="get",
+            url=url,
+            params={**(params or {}), "redirect": False},
+            timeout=timeout,
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+
+        location = self._download_location(response)
+        if location is None:
+            try:
+                return Ok(
+                    await self.stream_to_file(
+                        response=response,
+                        output_path=output_path,
+                        chunk_size=chunk_size,
+                        progress_callback=progress_callback,
+                        digest=digest,
+                        bandwidth_limiter=limiter,
+                    )
+                )
+            except ChecksumMismatchError as error:
+                return Err(error)
+
+        return await download_url_async(
+            transfer_client,
+            location[0],
+            output_path,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            timeout=transfer_timeout,
+            max_connections=max_connections,
+            resume=resume,
+            url_expires_at=location[1],
+            digest=digest,
+            bandwidth_limiter=limiter,
+        )
+
+    async def open_download(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: int | None = None,
+    ) -> Result[RemoteFile, HttpError]:
+        """
+        Open the file behind a download endpoint without loading it into memory.
+
+        Unlike SDKClient.open_download(), the file is downloaded in full before
+        it is returned, as reads cannot await range requests. At most
+        ``spool_threshold`` bytes are held in memory and the rest is spooled to
+        a temporary file.
 
         Args:
-            headers: Response headers dict (can be None)
-            max_seconds: Maximum delay to cap at
+            url: Download endpoint URL, relative to the service base URL
+            params: Optional query parameters for the endpoint
+            timeout: Request timeout in seconds (uses instance timeout if None)
 
         Returns:
-            Delay in seconds (capped at max_seconds), or None if no header present.
+            Result containing either:
+            - Ok(RemoteFile) positioned at the start of the file
+            - Err(HttpError) if fetching the file fails
         """
-        if not headers:
-            return None
+        result = await self.make_request(
+            method="get",
+            url=url,
+            params={**(params or {}), "redirect": False},
+            timeout=timeout,
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
 
-        # Case-insensitive header lookup
-        retry_after = next(
-            (val for key, val in headers.items() if key.lower() == "retry-after"), None
+        location = self._download_location(response)
+        if location is None:
+            return Ok(
+                await RemoteFile.from_response_async(
+                    response, spool_threshold=self.spool_threshold
+                )
+            )
+        return await RemoteFile.open_async(
+            self.transfer_client,
+            location[0],
+            timeout=float(timeout if timeout is not None else self.timeout),
+            spool_threshold=self.spool_threshold,
         )
 
-        if not retry_after:
-            return None
+    async def extract_members(
+        self,
+        url: str,
+        output_dir: Path | str,
+        members: MemberSelector,
+        params: dict[str, Any] | None = None,
+        *,
+        chunk_size: int = 8192,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        timeout: int | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> Result[list[Path], HttpError]:
+        """
+        Extract selected members of the zip archive behind a download endpoint.
 
-        # Parse as integer seconds
-        delay = float(retry_after)
-        return min(delay, max_seconds)
+        Async counterpart of SDKClient.extract_members(); see it for details.
+        """
+        result = await self.make_request(
+            method="get",
+            url=url,
+            params={**(params or {}), "redirect": False},
+            timeout=timeout,
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+
+        location = self._download_location(response)
+        if location is None:
+            file = await RemoteFile.from_response_async(
+                response, spool_threshold=self.spool_threshold
+            )
+            with file:
+                return extract_file_members(file, output_dir, members)
+
+        return await extract_url_members_async(
+            self.transfer_client,
+            location[0],
+            output_dir,
+            members,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            timeout=float(timeout if timeout is not None else self.timeout),
+            max_connections=max_connections,
+            bandwidth_limiter=bandwidth_limiter or self.bandwidth_limiter,
+        )
 
     @staticmethod
-    def stream_to_file(
-        response: HttpResponse,
+    async def stream_to_file(
+        response: AsyncHttpResponse,
         output_path: Path | str,
         chunk_size: int = 8192,
         progress_callback: Callable[[int, int | None], None] | None = None,
-    ) -> Path:
+        digest: DigestAlgorithm | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+    ) -> Path | DownloadedFile:
         """
         Stream HTTP response to disk with optional progress tracking.
 
-        Memory-efficient: streams response in chunks without loading entire file into memory.
-        Ideal for large file downloads (satellite imagery, archives, etc.).
+        Async counterpart of SDKClient.stream_to_file(), reading the body with
+        response.aiter_bytes().
 
         Args:
             response: HTTP response to stream
             output_path: Where to save the file (Path or string)
-            chunk_size: Bytes per chunk (default: 8KB). Increase for better throughput
-                       on fast connections (e.g., 64KB), decrease for progress granularity.
+            chunk_size: Bytes per chunk (default: 8KB)
             progress_callback: Optional callback called after each chunk is written.
                              Signature: callback(bytes_downloaded: int, total_bytes: int | None)
-                             total_bytes is None if Content-Length header is not present.
+            digest: Optional digest algorithm computed over the chunks and checked
+                    against the server's checksum headers
+            bandwidth_limiter: Optional limiter the body is read through
 
         Returns:
-            Path object pointing to the downloaded file
+            Path object pointing to the downloaded file, or a DownloadedFile holding
+            the path and its digest when ``digest`` is given
+
+        Raises:
+            ChecksumMismatchError: If the digest differs from the server's checksum.
+                Nothing is written to output_path.
 
         Note:
-            This method uses response.iter_bytes() which can only be called once per response.
-            The response stream is consumed during this operation.
+            File writes and hashing run in a worker thread so they don't block
+            the event loop.
         """
         output_path = Path(output_path)
+        total_bytes = AsyncSDKClient._content_length(response.headers)
 
-        # Get total file size from Content-Length header (if available)
-        total_bytes: int | None = None
-        content_length = response.headers.get("Content-Length") or response.headers.get(
-            "content-length"
-        )
-        if content_length:
-            try:
-                total_bytes = int(content_length)
-            except (ValueError, TypeError):
-                # Content-Length header exists but isn't a valid integer
-                total_bytes = None
-
-        # Stream response to disk in chunks
         bytes_downloaded = 0
-        with output_path.open("wb") as f:
-            for chunk in response.iter_bytes(chunk_size=chunk_size):
-                f.write(chunk)
-                bytes_downloaded += len(chunk)
-
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(bytes_downloaded, total_bytes)
+        digester = StreamingDigest(digest) if digest is not None else None
+        share = bandwidth_limiter.share() if bandwidth_limiter is not None else None
+        target = temp_path(output_path)
 
-        return output_path
+        def write(f: BinaryIO, chunk: bytes) -> None:
+            f.write(chunk)
+            if digester is not None:
+                digester.update(chunk)
 
-    @staticmethod
-    def extract_next_token(response: BaseModel) -> str | None:
-        """
-        Extract pagination token from STAC links array.
+        try:
+            f = await asyncio.to_thread(target.open, "wb")
+            try:
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    if share is not None:
+                        await share.acquire_async(len(chunk))
+                    await asyncio.to_thread(write, f, chunk)
+                    bytes_downloaded += len(chunk)
 
-        Handles both GET (token in URL) and POST (token in body) patterns
-        used across all SatVu APIs for pagination.
+                    if progress_callback:
+                        progress_callback(bytes_downloaded, total_bytes)
+            finally:
+                await asyncio.to_thread(f.close)
 
-        Args:
-            response: API response with links array
+            downloaded = (
+                AsyncSDKClient._verify_download(digester, output_path, response)
+                if digester is not None
+                else output_path
+            )
+            await asyncio.to_thread(os.replace, target, output_path)
+        finally:
+            await asyncio.to_thread(target.unlink, missing_ok=True)
+        return downloaded
 
-        Returns:
-            Next pagination token or None if no more pages
+    async def stream_items(
+        self,
+        fetch_response: Callable[[str | None], Awaitable[AsyncHttpResponse]],
+        items_field: str,
+        item_type: Any,
+        page_type: Any,
+        *,
+        max_items: int | None = None,
+        chunk_size: int = 65536,
+    ) -> AsyncGenerator[Any, None]:
         """
-        links = getattr(response, "links", None)
-        if not links:
-            return None
-
-        # Find link with rel="next"
-        next_link = next(
-            (link for link in links if link.rel == "next"),
-            None,
-        )
+        Yield the items of paginated responses, parsing each page incrementally.
 
-        if not next_link:
-            return None
+        Async counterpart of SDKClient.stream_items().
+        """
+        token = None
+        count = 0
+        while True:
+            response = await fetch_response(token)
+            try:
+                stream = AsyncJsonArrayStream(
+                    response.aiter_bytes(chunk_size), items_field
+                )
+                async for raw in stream:
+                    yield parse_response(raw, item_type)
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+            finally:
+                await aclose_response(response)
+            page = parse_response({**stream.fields, items_field: []}, page_type)
+            token = self.extract_next_token(page)
+            if not token:
+                return
 
-        # Method 1: GET request - token in URL query parameter
-        if next_link.method == "GET":
-            parsed = urlparse(next_link.href)
-            params = parse_qs(parsed.query)
-            return params.get("token", [None])[0]
+    def map_concurrent(
+        self,
+        method: str | Callable[..., Awaitable[Any]],
+        calls: Calls,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[Result[Any, HttpError]]:
+        """
+        Run an endpoint method once per argument dict, at most ``max_workers``
+        at a time.
 
-        # Method 2: POST request - token in body
-        if next_link.method == "POST" and next_link.body:
-            if isinstance(next_link.body, dict):
-                return next_link.body.get("token")
-            if hasattr(next_link.body, "token"):
-                return next_link.body.token
+        Async counterpart of SDKClient.map_concurrent(); use with ``async for``.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        return amap_concurrent(
+            func, calls, max_workers=max_workers, timeout=timeout, deadline=deadline
+        )
 
-        return None
+    async def batch_call(
+        self,
+        method: str | Callable[..., Awaitable[Any]],
+        calls: Calls,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> list[Result[Any, HttpError]]:
+        """
+        Like map_concurrent(), but wait for the whole batch and return a list.
+        """
+        batch = self.map_concurrent(
+            method, calls, max_workers=max_workers, timeout=timeout, deadline=deadline
+        )
+        return [result async for result in batch]
@@ -0,0 +1,281 @@
+"""Tests for AsyncSDKClient."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from satvu.core import AsyncSDKClient
+from satvu.http.errors import ClientError
+from satvu.http.httpx_adapter import AsyncHttpxAdapter
+from satvu.result import Ok, is_err, is_ok
+
+
+@pytest.fixture
+def client_for(make_async_client):
+    """Factory for clients whose requests are answered by a handler."""
+
+    def make(handler) -> AsyncSDKClient:
+        return make_async_client(
+            AsyncHttpxAdapter(
+                client=httpx.AsyncClient(
+                    base_url="https://api.satellitevu.com/otm/v2",
+                    transport=httpx.MockTransport(handler),
+                )
+            )
+        )
+
+    return make
+
+
+def test_make_request_success(client_for):
+    """Successful requests return Ok with the response."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/otm/v2/items"
+        assert request.url.params["limit"] == "10"
+        return httpx.Response(200, json={"items": [1, 2]})
+
+    client = client_for(handler)
+    result = asyncio.run(client.make_request("GET", "/items", params={"limit": 10}))
+
+    assert is_ok(result)
+    assert result.unwrap().json().unwrap() == {"items": [1, 2]}
+
+
+def test_make_request_client_error(client_for):
+    """4xx responses are returned as Err(ClientError)."""
+    client = client_for(lambda request: httpx.Response(404, json={"error": "nope"}))
+    result = asyncio.run(client.make_request("GET", "/missing"))
+
+    assert is_err(result)
+    assert isinstance(result.error(), ClientError)
+    assert result.error().status_code == 404
+
+
+def test_make_request_drops_empty_params(client_for):
+    """Falsy query parameters are not sent."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(request.url.params)
+        return httpx.Response(200, json={})
+
+    client = client_for(handler)
+    asyncio.run(
+        client.make_request("GET", "/items", params={"a": "x", "b": None, "c": ""})
+    )
+
+    assert seen == {"a": "x"}
+
+
+def test_make_request_retries_202_with_retry_after(client_for):
+    """A 202 with Retry-After is retried using asyncio.sleep."""
+    responses = iter(
+        [
+            httpx.Response(202, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"done": True}),
+        ]
+    )
+    client = client_for(lambda request: next(responses))
+
+    with patch("satvu.core.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = asyncio.run(client.make_request("GET", "/order"))
+
+    assert is_ok(result)
+    assert result.unwrap().status_code == 200
+    mock_sleep.assert_awaited_once_with(2.0)
+
+
+def test_make_request_stops_after_max_attempts(client_for):
+    """Retries stop once max_retry_attempts is reached."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(202, headers={"Retry-After": "1"})
+
+    client = client_for(handler)
+    client.max_retry_attempts = 3
+
+    with patch("satvu.core.asyncio.sleep", new_callable=AsyncMock):
+        result = asyncio.run(client.make_request("GET", "/order"))
+
+    assert result.unwrap().status_code == 202
+    assert len(calls) == 3
+
+
+def test_make_request_uses_instance_timeout(make_async_client):
+    """The instance timeout is passed to the client when none is given."""
+    http_client = MagicMock()
+    http_client.request = AsyncMock(return_value=Ok(MagicMock(status_code=200)))
+    client = make_async_client(http_client, timeout=12)
+
+    asyncio.run(client.make_request("GET", "/items"))
+
+    assert http_client.request.await_args.kwargs["timeout"] == 12.0
+
+
+def test_stream_to_file(tmp_path, client_for):
+    """stream_to_file writes the body and reports progress."""
+    content = b"x" * 20000
+    client = client_for(
+        lambda request: httpx.Response(
+            200, content=content, headers={"Content-Length": str(len(content))}
+        )
+    )
+    progress = []
+
+    async def download():
+        result = await client.make_request("GET", "/file")
+        return await client.stream_to_file(
+            result.unwrap(),
+            tmp_path / "out.bin",
+            chunk_size=8192,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+    path = asyncio.run(download())
+
+    assert path.read_bytes() == content
+    assert progress[-1] == (20000, 20000)
+
+
+def test_stream_to_file_failure_keeps_existing_file(tmp_path):
+    """A failed stream leaves the previous file untouched and no temp file."""
+    output = tmp_path / "out.bin"
+    output.write_bytes(b"previous")
+
+    async def failing_body(chunk_size):
+        yield b"start"
+        raise RuntimeError("connection reset")
+
+    response = MagicMock(status_code=200, headers={})
+    response.aiter_bytes = failing_body
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(AsyncSDKClient.stream_to_file(response, output))
+
+    assert output.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_aclose_does_not_close_user_client(make_async_client):
+    """A user-provided client is left open by aclose()."""
+    http_client = MagicMock()
+    http_client.aclose = AsyncMock()
+    client = make_async_client(http_client)
+
+    asyncio.run(client.aclose())
+
+    http_client.aclose.assert_not_awaited()
+
+
+@pytest.mark.parametrize("env", [None, "dev"])
+def test_build_url_matches_sync_client(env, make_async_client, make_client):
+    """Async and sync clients build the same base URL."""
+    client = make_async_client(env=env)
+    assert client.base_url == make_client(env=env).base_url
+
+
+def test_download_to_file_from_signed_url(tmp_path, client_for):
+    """download_to_file resolves the signed URL and downloads it."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.satellitevu.com":
+            assert request.url.params["redirect"] == "false"
+            return httpx.Response(200, json={"url": "https://files.example.com/o.zip"})
+        return httpx.Response(
+            206, content=b"zipdata", headers={"Content-Range": "bytes 0-6/7"}
+        )
+
+    output = tmp_path / "order.zip"
+    result = asyncio.run(client_for(handler).download_to_file("/download", output))
+
+    assert is_ok(result)
+    assert output.read_bytes() == b"zipdata"
+
+
+def test_open_download_follows_redirect(client_for):
+    """The redirect target is downloaded into a spooled file."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.satellitevu.com":
+            return httpx.Response(
+                302, headers={"Location": "https://files.example.com/o.zip"}
+            )
+        assert "Authorization" not in request.headers
+        return httpx.Response(200, content=b"zipdata")
+
+    result = asyncio.run(client_for(handler).open_download("/download"))
+
+    assert is_ok(result)
+    with result.unwrap() as file:
+        assert file.read() == b"zipdata"
+
+
+class Link(BaseModel):
+    href: str
+    rel: str
+    method: str = "GET"
+
+
+class Page(BaseModel):
+    links: list[Link]
+    items: list[dict]
+
+
+def test_stream_items(client_for):
+    """Items are parsed incrementally across pages until max_items."""
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params.get("token") or 0)
+        requested.append(page)
+        links = [{"href": f"https://x/?token={page + 1}", "rel": "next"}]
+        items = [{"id": page * 10 + i} for i in range(3)]
+        return httpx.Response(200, json={"links": links, "items": items})
+
+    client = client_for(handler)
+
+    async def fetch_response(token):
+        params = {"token": token} if token else None
+        result = await client.make_request("GET", "/search", params=params)
+        return result.unwrap()
+
+    async def run():
+        return [
+            item
+            async for item in client.stream_items(
+                fetch_response, "items", dict, Page, max_items=5, chunk_size=4
+            )
+        ]
+
+    items = asyncio.run(run())
+
+    assert [item["id"] for item in items] == [0, 1, 2, 10, 11]
+    assert requested == [0, 1]
+
+
+def test_stream_items_closes_abandoned_page(make_async_client):
+    """A page abandoned at max_items is closed with aclose()."""
+
+    async def body(chunk_size):
+        yield b'{"items": [{"id": 1}, {"id": 2}]}'
+
+    response = MagicMock()
+    response.aiter_bytes = body
+    response.aclose = AsyncMock()
+
+    async def fetch_response(token):
+        return response
+
+    async def run():
+        client = make_async_client()
+        stream = client.stream_items(fetch_response, "items", dict, Page, max_items=1)
+        return [item async for item in stream]
+
+    assert asyncio.run(run()) == [{"id": 1}]
+    response.aclose.assert_awaited_once()
@@ -1,12 +1,15 @@
 """Tests for automatic Retry-After retry logic in SDKClient."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from satvu.core import SDKClient
+from satvu.core import AsyncSDKClient, SDKClient
+from satvu.http.errors import ClientError, ReadTimeoutError, ServerError
 from satvu.http.protocol import HttpResponse
-from satvu.result import Ok
+from satvu.result import Err, Ok
+from satvu.retry import RetryBudget, RetryPolicy
 
 
 class MockCatalogClient(SDKClient):
@@ -15,6 +18,12 @@ class MockCatalogClient(SDKClient):
     base_path = "catalog"
 
 
+class MockAsyncCatalogClient(AsyncSDKClient):
+    """Mock async catalog client for testing."""
+
+    base_path = "catalog"
+
+
 @pytest.fixture
 def mock_http_client():
     """Create a mock HTTP client."""
@@ -240,3 +249,103 @@ class TestHeaderParsing:
             {"Content-Type": "application/json"}, max_seconds=300.0
         )
         assert result is None
+
+    def test_parse_retry_after_http_date(self, sdk_client):
+        """Test parsing an HTTP-date Retry-After value."""
+        result = sdk_client._parse_retry_after_from_headers(
+            {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, max_seconds=300.0
+        )
+        assert result == 0.0
+
+
+def server_error(status_code: int = 503, headers: dict[str, str] | None = None):
+    """Helper to create a failed request result."""
+    return Err(
+        ServerError("Server error", status_code=status_code, response_headers=headers)
+    )
+
+
+class TestTransientFailureRetry:
+    """Tests for retrying transient failures with the retry policy."""
+
+    @patch("satvu.core.time.sleep")
+    def test_server_error_is_retried(self, mock_sleep, sdk_client, mock_http_client):
+        """A GET failing with 503 is retried until it succeeds."""
+        mock_http_client.request.side_effect = [
+            server_error(),
+            Err(ReadTimeoutError("slow")),
+            Ok(create_mock_response(200)),
+        ]
+
+        result = sdk_client.make_request("GET", "/test")
+
+        assert result.unwrap().status_code == 200
+        assert mock_http_client.request.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("satvu.core.time.sleep")
+    def test_retry_after_on_429(self, mock_sleep, sdk_client, mock_http_client):
+        """The Retry-After of a 429 response sets the delay."""
+        mock_http_client.request.side_effect = [
+            Err(
+                ClientError(
+                    "Too many", status_code=429, response_headers={"Retry-After": "4"}
+                )
+            ),
+            Ok(create_mock_response(200)),
+        ]
+
+        sdk_client.make_request("GET", "/test")
+
+        mock_sleep.assert_called_once_with(4.0)
+
+    def test_post_not_retried_by_default(self, sdk_client, mock_http_client):
+        """Non-idempotent requests are returned straight away."""
+        mock_http_client.request.return_value = server_error()
+
+        result = sdk_client.make_request("POST", "/test", json={})
+
+        assert result.is_err()
+        assert mock_http_client.request.call_count == 1
+
+    def test_client_error_not_retried(self, sdk_client, mock_http_client):
+        """Permanent failures are returned straight away."""
+        mock_http_client.request.return_value = Err(
+            ClientError("Not found", status_code=404)
+        )
+
+        sdk_client.make_request("GET", "/test")
+
+        assert mock_http_client.request.call_count == 1
+
+    @patch("satvu.core.time.sleep")
+    def test_shared_budget_limits_retries(self, mock_sleep, mock_http_client):
+        """Clients sharing a policy stop retrying once its budget is spent."""
+        policy = RetryPolicy(budget=RetryBudget(capacity=3, ratio=0))
+        clients = [
+            MockCatalogClient(
+                env=None, http_client=mock_http_client, retry_policy=policy
+            )
+            for _ in range(2)
+        ]
+        mock_http_client.request.return_value = server_error()
+
+        for client in clients:
+            client.make_request("GET", "/test")
+
+        # 2 requests plus the 3 retries the budget allows
+        assert mock_http_client.request.call_count == 5
+
+    def test_async_server_error_is_retried(self):
+        """AsyncSDKClient retries with asyncio.sleep."""
+        client = MagicMock()
+        client.request = AsyncMock(
+            side_effect=[server_error(), Ok(create_mock_response(200))]
+        )
+        sdk = MockAsyncCatalogClient(env=None, http_client=client)
+
+        with patch("satvu.core.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(sdk.make_request("GET", "/test"))
+
+        assert result.unwrap().status_code == 200
+        assert mock_sleep.await_count == 1
@@ -1,12 +1,24 @@
 """Tests for SDKClient streaming download functionality."""
 
+import base64
+import hashlib
+import io
+import time
+import zipfile
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from satvu.core import SDKClient
+from satvu.digest import DownloadedFile
+from satvu.download import DownloadState, partial_paths
+from satvu.http.errors import ChecksumMismatchError, ClientError
+from satvu.http.httpx_adapter import HttpxAdapter
+from satvu.result import is_err
+from satvu.throttle import BandwidthLimiter
 
 
 class ConcreteSDKClient(SDKClient):
@@ -23,8 +35,8 @@ def sdk_client():
 
 @pytest.fixture
 def mock_response():
-    """Create a mock HTTP response with iter_bytes support."""
-    response = MagicMock()
+    """Create a mock HTTP response with iter_bytes support only, like a custom client."""
+    response = MagicMock(spec=["status_code", "headers", "iter_bytes"])
     response.status_code = 200
     response.headers = {"Content-Length": "1024"}
     return response
@@ -224,6 +236,96 @@ class TestStreamToFile:
         )
 
 
+class TestStreamToFileIntoBuffer:
+    """Tests for stream_to_file() with responses implementing iter_into()."""
+
+    def test_reuses_one_buffer(self, sdk_client, temp_file):
+        """The body is streamed through a single buffer of chunk_size bytes."""
+        buffers = []
+
+        class BufferedResponse:
+            headers = {"Content-Length": "10"}
+
+            def iter_into(self, buffer):
+                buffers.append(buffer)
+                for part in (b"01234", b"56789"):
+                    buffer[: len(part)] = part
+                    yield memoryview(buffer)[: len(part)]
+
+        sdk_client.stream_to_file(BufferedResponse(), temp_file, chunk_size=5)
+
+        assert temp_file.read_bytes() == b"0123456789"
+        assert len(buffers) == 1
+        assert len(buffers[0]) == 5
+
+    def test_adapter_response(self, sdk_client, temp_file):
+        """Responses of the built-in adapters stream through iter_into()."""
+        body = bytes(range(256)) * 100
+        client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=body)
+            )
+        )
+        response = HttpxAdapter(client=client).request("GET", "https://x/file").unwrap()
+        progress = []
+
+        sdk_client.stream_to_file(
+            response,
+            temp_file,
+            chunk_size=10_000,
+            progress_callback=lambda done, total: progress.append(done),
+        )
+
+        assert temp_file.read_bytes() == body
+        assert progress == [10_000, 20_000, 25_600]
+
+
+class TestStreamToFileDigest:
+    """Tests for digests computed by stream_to_file()."""
+
+    BODY = bytes(range(256)) * 100
+
+    def response(self, headers: dict[str, str] | None = None):
+        client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=self.BODY, headers=headers)
+            )
+        )
+        return HttpxAdapter(client=client).request("GET", "https://x/file").unwrap()
+
+    def test_digest_is_returned_with_path(self, sdk_client, temp_file):
+        result = sdk_client.stream_to_file(
+            self.response(), temp_file, chunk_size=1000, digest="sha256"
+        )
+
+        assert result == DownloadedFile(
+            path=temp_file,
+            algorithm="sha256",
+            digest=hashlib.sha256(self.BODY).hexdigest(),
+        )
+        assert temp_file.read_bytes() == self.BODY
+
+    def test_verified_against_content_md5(self, sdk_client, temp_file):
+        content_md5 = base64.b64encode(hashlib.md5(self.BODY).digest()).decode()
+
+        result = sdk_client.stream_to_file(
+            self.response({"Content-MD5": content_md5}), temp_file, digest="md5"
+        )
+
+        assert result.verified_by == "Content-MD5"
+
+    def test_mismatch_raises_and_writes_nothing(self, sdk_client, tmp_path):
+        etag = f'"{hashlib.md5(b"other").hexdigest()}"'
+        output = tmp_path / "order.zip"
+
+        with pytest.raises(ChecksumMismatchError):
+            sdk_client.stream_to_file(
+                self.response({"ETag": etag}), output, digest="md5"
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+
 class TestStreamToFileErrorHandling:
     """Tests for error handling in stream_to_file()."""
 
@@ -251,6 +353,23 @@ class TestStreamToFileErrorHandling:
                 output_path=temp_file,
             )
 
+    def test_failure_keeps_existing_file(self, sdk_client, mock_response, tmp_path):
+        """A failed stream leaves the previous file untouched and no temp file."""
+        output = tmp_path / "order.zip"
+        output.write_bytes(b"previous")
+
+        def failing_iter():
+            yield b"start"
+            raise RuntimeError("connection reset")
+
+        mock_response.iter_bytes.return_value = failing_iter()
+
+        with pytest.raises(RuntimeError):
+            sdk_client.stream_to_file(mock_response, output)
+
+        assert output.read_bytes() == b"previous"
+        assert list(tmp_path.iterdir()) == [output]
+
     def test_stream_to_file_with_progress_callback_exception(
         self, sdk_client, mock_response, temp_file
     ):
@@ -266,3 +385,375 @@ class TestStreamToFileErrorHandling:
                 output_path=temp_file,
                 progress_callback=failing_callback,
             )
+
+
+class TestDownloadToFile:
+    """Tests for SDKClient.download_to_file()."""
+
+    @staticmethod
+    def make_client(handler) -> ConcreteSDKClient:
+        http_client = HttpxAdapter(
+            client=httpx.Client(
+                base_url="https://api.satellitevu.com/test",
+                transport=httpx.MockTransport(handler),
+            )
+        )
+        return ConcreteSDKClient(env=None, http_client=http_client)
+
+    def test_downloads_from_signed_url(self, tmp_path):
+        """The signed URL from the endpoint is fetched in byte ranges."""
+        content = b"0123456789" * 1000
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    200, json={"url": "https://files.example.com/o.zip", "ttl": 3600}
+                )
+            start, end = map(int, request.headers["Range"][6:].split("-"))
+            end = min(end, len(content) - 1)
+            return httpx.Response(
+                206,
+                content=content[start : end + 1],
+                headers={"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+            )
+
+        output = tmp_path / "order.zip"
+        result = self.make_client(handler).download_to_file(
+            "/orders/1/download", output, params={"collections": None}
+        )
+
+        assert result.is_ok()
+        assert output.read_bytes() == content
+        assert requests[0].url.params["redirect"] == "false"
+        assert requests[1].url.host == "files.example.com"
+        assert "Authorization" not in requests[1].headers
+
+    def test_endpoint_serving_file_directly(self, tmp_path):
+        """A file returned by the endpoint itself is streamed to disk."""
+        client = self.make_client(
+            lambda request: httpx.Response(
+                200, content=b"zipdata", headers={"Content-Type": "application/zip"}
+            )
+        )
+        output = tmp_path / "order.zip"
+
+        result = client.download_to_file("/orders/1/download", output)
+
+        assert result.is_ok()
+        assert output.read_bytes() == b"zipdata"
+
+    def test_follows_location_header(self, tmp_path):
+        """A redirect response's Location is used as the signed URL."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    302, headers={"Location": "https://files.example.com/o.zip"}
+                )
+            return httpx.Response(200, content=b"zipdata")
+
+        output = tmp_path / "order.zip"
+        result = self.make_client(handler).download_to_file("/download", output)
+
+        assert result.is_ok()
+        assert output.read_bytes() == b"zipdata"
+
+    def test_uses_client_bandwidth_limiter(self, tmp_path):
+        client = self.make_client(
+            lambda request: httpx.Response(
+                200, content=b"zipdata", headers={"Content-Type": "application/zip"}
+            )
+        )
+        client.bandwidth_limiter = BandwidthLimiter(None)
+
+        with patch.object(
+            client.bandwidth_limiter,
+            "acquire",
+            wraps=client.bandwidth_limiter.acquire,
+        ) as acquire:
+            result = client.download_to_file("/orders/1/download", tmp_path / "o.zip")
+
+        assert result.is_ok()
+        assert acquire.call_args.args[0] == len(b"zipdata")
+
+    def test_digest_of_signed_url(self, tmp_path):
+        content = b"0123456789" * 1000
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    302, headers={"Location": "https://files.example.com/o.zip"}
+                )
+            return httpx.Response(200, content=content, headers={"ETag": etag})
+
+        output = tmp_path / "order.zip"
+        result = self.make_client(handler).download_to_file(
+            "/download", output, digest="md5"
+        )
+
+        assert result.is_ok()
+        assert result.unwrap() == DownloadedFile(
+            path=output,
+            algorithm="md5",
+            digest=hashlib.md5(content).hexdigest(),
+            verified_by="ETag",
+        )
+
+    def test_digest_mismatch_of_file_served_directly(self, tmp_path):
+        client = self.make_client(
+            lambda request: httpx.Response(
+                200,
+                content=b"zipdata",
+                headers={
+                    "Content-Type": "application/zip",
+                    "ETag": '"' + "0" * 32 + '"',
+                },
+            )
+        )
+        output = tmp_path / "order.zip"
+
+        result = client.download_to_file("/orders/1/download", output, digest="md5")
+
+        assert is_err(result)
+        assert isinstance(result.error(), ChecksumMismatchError)
+        assert not output.exists()
+
+    def test_endpoint_error(self, tmp_path):
+        """Errors from the download endpoint are returned as Err."""
+        client = self.make_client(lambda request: httpx.Response(404))
+
+        result = client.download_to_file("/orders/1/download", tmp_path / "x.zip")
+
+        assert is_err(result)
+        error = result.error()
+        assert isinstance(error, ClientError)
+        assert error.status_code == 404
+
+    def test_transfer_client_has_no_credentials(self):
+        """The SDK-owned transfer client does not send the bearer token."""
+        client = ConcreteSDKClient(env=None, get_token=lambda: "secret-token")
+
+        assert client.transfer_client is not client.client
+        assert getattr(client.transfer_client, "get_token", None) is None
+
+    def test_transfer_client_reuses_custom_client(self):
+        """A custom http_client is also used for signed URLs."""
+        http_client = MagicMock()
+        client = ConcreteSDKClient(env=None, http_client=http_client)
+
+        assert client.transfer_client is http_client
+
+    @staticmethod
+    def save_partial(output, expires_at: float) -> None:
+        """Leave a half-finished resumable download of ten bytes behind."""
+        part_path, state_path = partial_paths(output)
+        part_path.write_bytes(b"01234\0\0\0\0\0")
+        DownloadState(
+            url="https://files.example.com/old.zip",
+            expires_at=expires_at,
+            total_bytes=10,
+            completed=[(0, 4)],
+        ).save(state_path)
+
+    @staticmethod
+    def ranged(request: httpx.Request, content: bytes) -> httpx.Response:
+        start, end = map(int, request.headers["Range"][6:].split("-"))
+        end = min(end, len(content) - 1)
+        return httpx.Response(
+            206,
+            content=content[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+        )
+
+    def test_resume_reuses_saved_url(self, tmp_path):
+        """A still-valid saved URL is resumed without calling the endpoint."""
+        output = tmp_path / "order.zip"
+        self.save_partial(output, expires_at=time.time() + 3600)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return self.ranged(request, b"0123456789")
+
+        result = self.make_client(handler).download_to_file(
+            "/download", output, resume=True
+        )
+
+        assert result.is_ok()
+        assert output.read_bytes() == b"0123456789"
+        assert [r.url.host for r in requests] == ["files.example.com"]
+        assert requests[0].url.path == "/old.zip"
+        assert requests[0].headers["Range"].startswith("bytes=5-")
+
+    def test_resume_refreshes_expired_url(self, tmp_path):
+        """An expired saved URL is replaced by one from the endpoint."""
+        output = tmp_path / "order.zip"
+        self.save_partial(output, expires_at=time.time() - 1)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    200, json={"url": "https://files.example.com/new.zip", "ttl": 60}
+                )
+            return self.ranged(request, b"0123456789")
+
+        result = self.make_client(handler).download_to_file(
+            "/download", output, resume=True
+        )
+
+        assert result.is_ok()
+        assert output.read_bytes() == b"0123456789"
+        assert requests[1].url.path == "/new.zip"
+        assert requests[1].headers["Range"].startswith("bytes=5-")
+
+    def test_resume_refreshes_rejected_url(self, tmp_path):
+        """A saved URL refused by storage is replaced by one from the endpoint."""
+        output = tmp_path / "order.zip"
+        self.save_partial(output, expires_at=time.time() + 3600)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    200, json={"url": "https://files.example.com/new.zip"}
+                )
+            if request.url.path == "/old.zip":
+                return httpx.Response(403)
+            return self.ranged(request, b"0123456789")
+
+        result = self.make_client(handler).download_to_file(
+            "/download", output, resume=True
+        )
+
+        assert result.is_ok()
+        assert output.read_bytes() == b"0123456789"
+
+
+class TestOpenDownload:
+    """Tests for SDKClient.open_download()."""
+
+    make_client = staticmethod(TestDownloadToFile.make_client)
+    ranged = staticmethod(TestDownloadToFile.ranged)
+
+    def test_redirect_is_read_lazily(self, tmp_path):
+        """Only the byte ranges that are read are fetched from the signed URL."""
+        content = b"0123456789" * 1000
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    302, headers={"Location": "https://files.example.com/o.zip"}
+                )
+            return self.ranged(request, content)
+
+        result = self.make_client(handler).open_download("/download")
+
+        assert result.is_ok()
+        with result.unwrap() as file:
+            assert file.size == len(content)
+            assert file.read(10) == b"0123456789"
+        assert len(requests) == 2
+        assert requests[0].url.params["redirect"] == "false"
+        assert requests[1].headers["Range"].startswith("bytes=0-")
+        assert "Authorization" not in requests[1].headers
+
+    def test_endpoint_serving_file_directly(self, tmp_path):
+        """A zip returned by the endpoint itself is spooled and opens as an archive."""
+        archive = tmp_path / "order.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("metadata.json", "{}")
+
+        client = self.make_client(
+            lambda request: httpx.Response(
+                200,
+                content=archive.read_bytes(),
+                headers={"Content-Type": "application/zip"},
+            )
+        )
+        client.spool_threshold = 16
+
+        with client.open_download("/download").unwrap() as file:
+            assert zipfile.ZipFile(file).namelist() == ["metadata.json"]
+            assert not isinstance(file._spool._file, io.BytesIO)
+
+    def test_signed_url_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    302, headers={"Location": "https://files.example.com/o.zip"}
+                )
+            return httpx.Response(403)
+
+        result = self.make_client(handler).open_download("/d")
+
+        assert is_err(result)
+        assert isinstance(result.error(), ClientError)
+
+
+class TestExtractMembers:
+    """Tests for SDKClient.extract_members()."""
+
+    make_client = staticmethod(TestDownloadToFile.make_client)
+
+    @staticmethod
+    def archive(tmp_path) -> bytes:
+        path = tmp_path / "order.zip"
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("order/image.tif", b"\0" * 100_000)
+            zf.writestr("order/metadata.json", '{"id": 1}')
+        return path.read_bytes()
+
+    def test_extracts_from_signed_url(self, tmp_path):
+        """Only the tail and the selected member are fetched from storage."""
+        content = self.archive(tmp_path)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.host == "api.satellitevu.com":
+                return httpx.Response(
+                    200, json={"url": "https://files.example.com/o.zip", "ttl": 60}
+                )
+            first, last = request.headers["Range"][6:].split("-")
+            start = int(first) if first else max(len(content) - int(last), 0)
+            end = min(int(last), len(content) - 1) if first else len(content) - 1
+            return httpx.Response(
+                206,
+                content=content[start : end + 1],
+                headers={"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+            )
+
+        output_dir = tmp_path / "out"
+        result = self.make_client(handler).extract_members(
+            "/orders/1/download", output_dir, "*.json"
+        )
+
+        assert result.is_ok()
+        assert result.unwrap() == [output_dir / "order" / "metadata.json"]
+        assert (output_dir / "order" / "metadata.json").read_text() == '{"id": 1}'
+        assert requests[0].url.params["redirect"] == "false"
+        assert len(requests) == 3
+        assert all("Authorization" not in r.headers for r in requests[1:])
+
+    def test_endpoint_serving_file_directly(self, tmp_path):
+        content = self.archive(tmp_path)
+        client = self.make_client(
+            lambda request: httpx.Response(
+                200, content=content, headers={"Content-Type": "application/zip"}
+            )
+        )
+
+        result = client.extract_members(
+            "/orders/1/download",
+            tmp_path / "out",
+            lambda info: "image" in info.filename,
+        )
+
+        assert result.is_ok()
+        assert result.unwrap() == [tmp_path / "out" / "order" / "image.tif"]
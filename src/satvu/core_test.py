@@ -1,7 +1,8 @@
 """Tests for SDKClient core functionality."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pook
 import pytest
 from pydantic import BaseModel
@@ -9,7 +10,9 @@ from pydantic import BaseModel
 from satvu.core import SDKClient
 from satvu.http import create_http_client
 from satvu.http.errors import ClientError, ServerError
+from satvu.http.httpx_adapter import HttpxAdapter
 from satvu.result import Ok, is_err, is_ok
+from satvu.shared.parsing import ResponseAdapter
 
 
 class ParameterTestModel(BaseModel):
@@ -19,6 +22,9 @@ class ParameterTestModel(BaseModel):
     field2: int
 
 
+_PARAMETER_TEST_MODEL = ResponseAdapter(ParameterTestModel)
+
+
 class ConcreteSDKClient(SDKClient):
     """Concrete implementation for testing abstract SDKClient."""
 
@@ -208,9 +214,10 @@ def test_make_request_client_error(sdk_client):
 
 
 @pook.on
-def test_make_request_server_error(sdk_client):
-    """Test handling of 5xx server errors."""
-    pook.get("https://api.satellitevu.com/test/error").reply(500).json(
+@patch("satvu.core.time.sleep")
+def test_make_request_server_error(mock_sleep, sdk_client):
+    """Test handling of 5xx server errors once retries are exhausted."""
+    pook.get("https://api.satellitevu.com/test/error").times(5).reply(500).json(
         {"error": "Internal server error"}
     )
 
@@ -220,6 +227,7 @@ def test_make_request_server_error(sdk_client):
     error = result.error()
     assert isinstance(error, ServerError)
     assert error.status_code == 500
+    assert mock_sleep.call_count == 4
 
 
 @pook.on
@@ -586,3 +594,102 @@ class TestTokenExtraction:
 
         token = SDKClient.extract_next_token(response)
         assert token is None
+
+
+class TestStreamItems:
+    """Tests for SDKClient.stream_items()."""
+
+    @staticmethod
+    def make_client(pages: int):
+        requested = []
+
+        def handler(request):
+            page = int(request.url.params.get("token") or 0)
+            requested.append(page)
+            links = (
+                [{"href": f"https://x/?token={page + 1}", "rel": "next"}]
+                if page + 1 < pages
+                else []
+            )
+            items = [{"id": page * 10 + i} for i in range(3)]
+            return httpx.Response(200, json={"links": links, "items": items})
+
+        http_client = HttpxAdapter(
+            client=httpx.Client(
+                base_url="https://api.satellitevu.com/test",
+                transport=httpx.MockTransport(handler),
+            )
+        )
+        client = ConcreteSDKClient(env=None, http_client=http_client)
+
+        def fetch_response(token):
+            params = {"token": token} if token else None
+            return client.make_request("GET", "/search", params=params).unwrap()
+
+        return client, fetch_response, requested
+
+    def test_yields_items_of_all_pages(self):
+        """Items are parsed one at a time across pages."""
+        client, fetch_response, requested = self.make_client(pages=3)
+
+        items = list(
+            client.stream_items(
+                fetch_response, "items", dict, PaginatedResponseModel, chunk_size=7
+            )
+        )
+
+        assert [item["id"] for item in items] == [0, 1, 2, 10, 11, 12, 20, 21, 22]
+        assert requested == [0, 1, 2]
+
+    def test_max_items(self):
+        """No further pages are requested once max_items is reached."""
+        client, fetch_response, requested = self.make_client(pages=10)
+
+        items = list(
+            client.stream_items(
+                fetch_response,
+                "items",
+                dict,
+                PaginatedResponseModel,
+                max_items=4,
+            )
+        )
+
+        assert len(items) == 4
+        assert requested == [0, 1]
+
+    def test_pages_are_requested_streaming(self):
+        """Pages are requested with stream=True, bypassing the response cache."""
+        http_client = MagicMock()
+        client = ConcreteSDKClient(env=None, http_client=http_client)
+
+        client.make_request("GET", "/search", stream=True)
+
+        assert http_client.request.call_args.kwargs["stream"] is True
+
+    def test_page_closed_when_stopping_early(self):
+        """A page abandoned at max_items is closed to release its connection."""
+        response = MagicMock()
+        response.iter_bytes.return_value = iter([b'{"items": [{"id": 1}, {"id": 2}]}'])
+
+        items = list(
+            ConcreteSDKClient(env=None).stream_items(
+                lambda token: response,
+                "items",
+                dict,
+                PaginatedResponseModel,
+                max_items=1,
+            )
+        )
+
+        assert items == [{"id": 1}]
+        response.close.assert_called_once()
+
+
+def test_warmup_builds_response_adapters_of_module(sdk_client):
+    """warmup() builds the ResponseAdapters defined next to the client."""
+    _PARAMETER_TEST_MODEL._adapter = None
+
+    sdk_client.warmup()
+
+    assert _PARAMETER_TEST_MODEL._adapter is not None
@@ -0,0 +1,203 @@
+"""
+Checksums computed while downloading, verified against the server's.
+
+Storage servers describe a file's checksum in several headers: ``Content-MD5``,
+``Digest`` (RFC 3230), ``Repr-Digest`` and ``Content-Digest`` (RFC 9530),
+Google Cloud Storage's ``x-goog-hash`` and, for files uploaded in one part to
+S3-compatible storage, the ``ETag``. A StreamingDigest is updated with every
+chunk as it is written, so no file has to be read again to be hashed.
+"""
+
+import base64
+import binascii
+import hashlib
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+from satvu.http.errors import ChecksumMismatchError
+
+DigestAlgorithm = Literal["sha256", "md5", "crc32c"]
+
+# Digest algorithm names used in headers, lower-cased
+_HEADER_ALGORITHMS: dict[str, DigestAlgorithm] = {
+    "sha-256": "sha256",
+    "md5": "md5",
+    "crc32c": "crc32c",
+}
+_MD5_ETAG = re.compile(r'"?([0-9a-fA-F]{32})"?')
+
+
+def _crc32c_extend() -> Callable[[int, bytes], int]:
+    """CRC-32C function of an installed crc32c package."""
+    try:
+        import google_crc32c  # pyright: ignore[reportMissingImports]
+
+        return google_crc32c.extend
+    except ImportError:
+        pass
+    try:
+        import crc32c  # pyright: ignore[reportMissingImports]
+
+        return lambda crc, data: crc32c.crc32c(data, crc)
+    except ImportError:
+        raise ImportError(
+            "crc32c digests require the google-crc32c package. "
+            "Install it with: pip install google-crc32c"
+        ) from None
+
+
+class StreamingDigest:
+    """A digest updated incrementally with the chunks of a download."""
+
+    def __init__(self, algorithm: DigestAlgorithm):
+        """
+        Args:
+            algorithm: "sha256", "md5", or "crc32c" (requires google-crc32c)
+
+        Raises:
+            ValueError: If the algorithm is not supported
+            ImportError: If algorithm is "crc32c" and no crc32c package is installed
+        """
+        self.algorithm: DigestAlgorithm = algorithm
+        self._crc = 0
+        if algorithm == "crc32c":
+            self._extend = _crc32c_extend()
+        elif algorithm in ("sha256", "md5"):
+            self._hash = hashlib.new(algorithm, usedforsecurity=False)
+        else:
+            raise ValueError(f"Unsupported digest algorithm: {algorithm}")
+
+    def update(self, data: bytes | memoryview) -> None:
+        if self.algorithm == "crc32c":
+            self._crc = self._extend(self._crc, bytes(data))
+        else:
+            self._hash.update(data)
+
+    def digest(self) -> bytes:
+        if self.algorithm == "crc32c":
+            return self._crc.to_bytes(4, "big")
+        return self._hash.digest()
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+
+class DownloadedFile(BaseModel):
+    """
+    A downloaded file and the digest computed while it was written.
+
+    ``verified_by`` names the response header the digest was checked against,
+    or is None if the server did not send a checksum for ``algorithm``. It can
+    be used in place of a path, e.g. ``open(downloaded)``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    path: Path
+    algorithm: DigestAlgorithm
+    digest: str
+    verified_by: str | None = None
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+
+def _decode(value: str) -> bytes | None:
+    try:
+        return base64.b64decode(value.strip().strip(":"), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _parse_digest_list(value: str) -> dict[DigestAlgorithm, bytes]:
+    """Parse ``alg=<base64>`` pairs as in Digest, Repr-Digest and x-goog-hash."""
+    digests: dict[DigestAlgorithm, bytes] = {}
+    for part in value.split(","):
+        name, _, encoded = part.partition("=")
+        algorithm = _HEADER_ALGORITHMS.get(name.strip().lower())
+        decoded = _decode(encoded) if algorithm else None
+        if algorithm and decoded:
+            digests[algorithm] = decoded
+    return digests
+
+
+def server_digests(
+    headers: dict[str, str], partial: bool = False
+) -> dict[DigestAlgorithm, tuple[bytes, str]]:
+    """
+    Checksums of the whole file announced in response headers.
+
+    Args:
+        headers: Response headers
+        partial: Whether the response is a 206 carrying part of the file.
+            Content-MD5 and Content-Digest then describe the part and are ignored.
+
+    Returns:
+        Digest and the name of the header it came from, by algorithm. Explicit
+        digest headers take precedence over an MD5 ETag.
+    """
+    found: dict[DigestAlgorithm, tuple[bytes, str]] = {}
+    lowered = {key.lower(): value for key, value in headers.items()}
+
+    etag = lowered.get("etag")
+    match = _MD5_ETAG.fullmatch(etag.strip()) if etag else None
+    if match:
+        found["md5"] = (bytes.fromhex(match[1]), "ETag")
+
+    names = ["x-goog-hash", "Digest", "Repr-Digest"]
+    if not partial:
+        names += ["Content-Digest"]
+    for name in names:
+        value = lowered.get(name.lower(), "")
+        for algorithm, digest in _parse_digest_list(value).items():
+            found[algorithm] = (digest, name)
+
+    content_md5 = None if partial else lowered.get("content-md5")
+    decoded = _decode(content_md5) if content_md5 else None
+    if decoded:
+        found["md5"] = (decoded, "Content-MD5")
+    return found
+
+
+def verify_digest(
+    digest: StreamingDigest,
+    path: Path,
+    headers: dict[str, str],
+    partial: bool = False,
+    url: str | None = None,
+) -> DownloadedFile:
+    """
+    Compare a computed digest with the server's checksum, if it sent one.
+
+    Raises:
+        ChecksumMismatchError: If the server's checksum differs
+    """
+    actual = digest.digest()
+    expected = server_digests(headers, partial).get(digest.algorithm)
+    if expected is not None and expected[0] != actual:
+        raise ChecksumMismatchError(
+            message=f"{digest.algorithm} of {path.name} does not match {expected[1]}",
+            url=url,
+            algorithm=digest.algorithm,
+            expected=expected[0].hex(),
+            actual=actual.hex(),
+        )
+    return DownloadedFile(
+        path=path,
+        algorithm=digest.algorithm,
+        digest=actual.hex(),
+        verified_by=expected[1] if expected is not None else None,
+    )
+
+
+__all__ = [
+    "DigestAlgorithm",
+    "DownloadedFile",
+    "StreamingDigest",
+    "server_digests",
+    "verify_digest",
+]
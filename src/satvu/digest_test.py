@@ -0,0 +1,168 @@
+"""Tests for streaming digests and server checksum headers."""
+
+import base64
+import hashlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from satvu.digest import (
+    DigestAlgorithm,
+    DownloadedFile,
+    StreamingDigest,
+    server_digests,
+    verify_digest,
+)
+from satvu.http.errors import ChecksumMismatchError
+
+DATA = b"satellite imagery" * 1000
+MD5 = hashlib.md5(DATA).digest()
+SHA256 = hashlib.sha256(DATA).digest()
+
+
+def b64(digest: bytes) -> str:
+    return base64.b64encode(digest).decode()
+
+
+def crc32c(data: bytes, crc: int = 0) -> int:
+    """Bitwise reference CRC-32C (Castagnoli)."""
+    crc ^= 0xFFFFFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ (0x82F63B78 if crc & 1 else 0)
+    return crc ^ 0xFFFFFFFF
+
+
+class TestStreamingDigest:
+    @pytest.mark.parametrize("algorithm", ["sha256", "md5"])
+    def test_matches_hashlib(self, algorithm):
+        digest = StreamingDigest(algorithm)
+        for start in range(0, len(DATA), 1000):
+            digest.update(memoryview(DATA)[start : start + 1000])
+
+        assert digest.hexdigest() == hashlib.new(algorithm, DATA).hexdigest()
+
+    def test_crc32c_uses_google_crc32c(self, monkeypatch):
+        module = types.ModuleType("google_crc32c")
+        module.extend = lambda crc, data: crc32c(data, crc)  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "google_crc32c", module)
+
+        digest = StreamingDigest("crc32c")
+        digest.update(b"1234")
+        digest.update(b"56789")
+
+        # CRC-32C check value
+        assert digest.hexdigest() == "e3069283"
+
+    def test_crc32c_requires_package(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "google_crc32c", None)
+        monkeypatch.setitem(sys.modules, "crc32c", None)
+
+        with pytest.raises(ImportError, match="pip install google-crc32c"):
+            StreamingDigest("crc32c")
+
+    def test_unsupported_algorithm(self):
+        with pytest.raises(ValueError):
+            StreamingDigest("sha1")  # type: ignore[arg-type]
+
+
+class TestServerDigests:
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({"ETag": f'"{MD5.hex()}"'}, {"md5": (MD5, "ETag")}),
+            ({"Content-MD5": b64(MD5)}, {"md5": (MD5, "Content-MD5")}),
+            ({"Digest": f"SHA-256={b64(SHA256)}"}, {"sha256": (SHA256, "Digest")}),
+            (
+                {"Repr-Digest": f"sha-256=:{b64(SHA256)}:"},
+                {"sha256": (SHA256, "Repr-Digest")},
+            ),
+            (
+                {"x-goog-hash": f"crc32c=AAAAAA==,md5={b64(MD5)}"},
+                {
+                    "crc32c": (b"\0\0\0\0", "x-goog-hash"),
+                    "md5": (MD5, "x-goog-hash"),
+                },
+            ),
+        ],
+    )
+    def test_headers(self, headers, expected):
+        assert server_digests(headers) == expected
+
+    @pytest.mark.parametrize(
+        "etag",
+        [
+            f'"{MD5.hex()}-3"',  # multipart upload
+            f'W/"{MD5.hex()}"',  # weak
+            '"v1"',
+        ],
+    )
+    def test_etags_that_are_not_md5(self, etag):
+        assert server_digests({"ETag": etag}) == {}
+
+    def test_digest_headers_take_precedence_over_etag(self):
+        headers = {"ETag": f'"{"0" * 32}"', "Content-MD5": b64(MD5)}
+
+        assert server_digests(headers)["md5"] == (MD5, "Content-MD5")
+
+    def test_partial_response_ignores_content_checksums(self):
+        """Content-MD5 and Content-Digest of a 206 describe the range only."""
+        headers = {
+            "Content-MD5": b64(MD5),
+            "Content-Digest": f"sha-256=:{b64(SHA256)}:",
+        }
+
+        assert server_digests(headers, partial=True) == {}
+        assert set(server_digests(headers)) == {"md5", "sha256"}
+
+    def test_invalid_base64_is_ignored(self):
+        assert server_digests({"Content-MD5": "not base64!"}) == {}
+
+
+class TestVerifyDigest:
+    def digest(self, algorithm: DigestAlgorithm = "md5") -> StreamingDigest:
+        digest = StreamingDigest(algorithm)
+        digest.update(DATA)
+        return digest
+
+    def test_verified(self):
+        downloaded = verify_digest(
+            self.digest(), Path("out.tif"), {"Content-MD5": b64(MD5)}
+        )
+
+        assert downloaded == DownloadedFile(
+            path=Path("out.tif"),
+            algorithm="md5",
+            digest=MD5.hex(),
+            verified_by="Content-MD5",
+        )
+
+    def test_no_server_checksum(self):
+        downloaded = verify_digest(
+            self.digest("sha256"), Path("out.tif"), {"Content-MD5": b64(MD5)}
+        )
+
+        assert downloaded.digest == SHA256.hex()
+        assert downloaded.verified_by is None
+
+    def test_mismatch(self):
+        with pytest.raises(ChecksumMismatchError) as excinfo:
+            verify_digest(
+                self.digest(), Path("out.tif"), {"ETag": '"' + "0" * 32 + '"'}, url="u"
+            )
+
+        assert excinfo.value.expected == "0" * 32
+        assert excinfo.value.actual == MD5.hex()
+        assert excinfo.value.url == "u"
+
+
+def test_downloaded_file_is_path_like(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_bytes(DATA)
+    downloaded = DownloadedFile(path=path, algorithm="md5", digest=MD5.hex())
+
+    with open(downloaded, "rb") as f:
+        assert f.read() == DATA
@@ -0,0 +1,1152 @@
+"""Ranged downloads from signed URLs, to disk or into lazily filled files."""
+
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+
+from pydantic import BaseModel, ValidationError
+
+from satvu.digest import DigestAlgorithm, DownloadedFile, StreamingDigest, verify_digest
+from satvu.http.buffers import iter_response
+from satvu.http.errors import ChecksumMismatchError, HttpError, IncompleteDownloadError
+from satvu.http.protocol import (
+    AsyncHttpClient,
+    AsyncHttpResponse,
+    HttpClient,
+    HttpResponse,
+)
+from satvu.result import Err, Ok, Result, is_err
+from satvu.throttle import BandwidthLimiter, BandwidthShare
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 4
+"""Default number of byte ranges fetched concurrently."""
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+"""Default size of each byte range (16 MiB)."""
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+"""Default size of the byte ranges a RemoteFile fetches on demand (1 MiB)."""
+
+DEFAULT_SPOOL_THRESHOLD = 32 * 1024 * 1024
+"""Default bytes a RemoteFile keeps in memory before spooling to disk (32 MiB)."""
+
+URL_EXPIRY_MARGIN = 60.0
+"""Seconds before a signed URL's expiry at which it is no longer reused."""
+
+ProgressCallback = Callable[[int, int | None], None]
+
+
+def header_value(headers: dict[str, str], name: str) -> str | None:
+    """Look up a response header case-insensitively."""
+    name = name.lower()
+    return next((val for key, val in headers.items() if key.lower() == name), None)
+
+
+def content_range_total(headers: dict[str, str]) -> int | None:
+    """
+    Read the complete resource size from a ``Content-Range`` header.
+
+    Args:
+        headers: Response headers of a 206 Partial Content response
+
+    Returns:
+        Total size in bytes, or None if the header is missing or the size is unknown.
+    """
+    content_range = header_value(headers, "Content-Range")
+    if not content_range or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+def plan_ranges(start: int, total: int, part_size: int) -> list[tuple[int, int]]:
+    """
+    Split ``[start, total)`` into inclusive byte ranges of at most ``part_size``.
+
+    Example:
+        >>> plan_ranges(0, 10, 4)
+        [(0, 3), (4, 7), (8, 9)]
+    """
+    return [
+        (offset, min(offset + part_size, total) - 1)
+        for offset in range(start, total, part_size)
+    ]
+
+
+def partial_paths(output_path: Path | str) -> tuple[Path, Path]:
+    """
+    Paths of the partial file and its state sidecar for a resumable download.
+
+    Example:
+        >>> partial_paths("order.zip")
+        (PosixPath('order.zip.part'), PosixPath('order.zip.part.json'))
+    """
+    output_path = Path(output_path)
+    part_path = output_path.with_name(f"{output_path.name}.part")
+    return part_path, part_path.with_name(f"{part_path.name}.json")
+
+
+def temp_path(output_path: Path | str) -> Path:
+    """
+    A unique hidden path next to ``output_path`` to write a download to.
+
+    Renaming it over ``output_path`` once complete means a failed download
+    never leaves a partial file where the finished one is expected.
+    """
+    output_path = Path(output_path)
+    return output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex[:12]}.part")
+
+
+class DownloadState(BaseModel):
+    """
+    Progress of a resumable download, stored next to the ``.part`` file.
+
+    ``completed`` holds merged, sorted inclusive byte ranges already on disk.
+    ``etag`` and ``last_modified`` identify the remote file so a changed file
+    is downloaded from scratch instead of being resumed.
+    """
+
+    url: str
+    expires_at: float | None = None
+    total_bytes: int | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    completed: list[tuple[int, int]] = []
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes already on disk."""
+        return sum(end - start + 1 for start, end in self.completed)
+
+    def url_is_fresh(self, margin: float = URL_EXPIRY_MARGIN) -> bool:
+        """Whether the stored signed URL can still be used."""
+        return self.expires_at is None or self.expires_at - margin > time.time()
+
+    def matches(self, total: int, etag: str | None, last_modified: str | None) -> bool:
+        """Whether a response describes the same remote file as this state."""
+        if self.total_bytes != total:
+            return False
+        if self.etag and etag and self.etag != etag:
+            return False
+        return not (
+            self.last_modified and last_modified and self.last_modified != last_modified
+        )
+
+    def add_range(self, start: int, end: int) -> None:
+        """Record ``start-end`` as written, merging adjacent ranges."""
+        merged: list[tuple[int, int]] = []
+        for cur_start, cur_end in sorted([*self.completed, (start, end)]):
+            if merged and cur_start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], cur_end))
+            else:
+                merged.append((cur_start, cur_end))
+        self.completed = merged
+
+    def missing_ranges(self, part_size: int) -> list[tuple[int, int]]:
+        """Byte ranges still to download, split into parts of ``part_size``."""
+        if self.total_bytes is None:
+            return []
+        ranges: list[tuple[int, int]] = []
+        offset = 0
+        for start, end in [*self.completed, (self.total_bytes, self.total_bytes)]:
+            ranges.extend(plan_ranges(offset, start, part_size))
+            offset = end + 1
+        return ranges
+
+    @classmethod
+    def load(cls, path: Path) -> "DownloadState | None":
+        """Load saved state, or None if missing or unreadable."""
+        try:
+            return cls.model_validate_json(path.read_text())
+        except (FileNotFoundError, ValueError, ValidationError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Atomically write the state to ``path``."""
+        with NamedTemporaryFile(
+            "w", dir=str(path.parent), prefix=f".{path.name}", delete=False
+        ) as handle:
+            handle.write(self.model_dump_json())
+        os.replace(handle.name, path)
+
+
+class _Progress:
+    """Aggregate progress across concurrent range workers."""
+
+    def __init__(
+        self, total: int | None, callback: ProgressCallback | None, downloaded: int = 0
+    ):
+        self.total = total
+        self.callback = callback
+        self.downloaded = downloaded
+        self._lock = threading.Lock()
+
+    def advance(self, nbytes: int) -> None:
+        with self._lock:
+            self.downloaded += nbytes
+            if self.callback:
+                self.callback(self.downloaded, self.total)
+
+
+class _RangedFile:
+    """
+    A preallocated file written at absolute offsets by concurrent workers.
+
+    When given a state path, every written range is recorded in the sidecar
+    so an interrupted download can be resumed. When given a digest, ranges are
+    hashed in file order: a range finishing ahead of its predecessors waits
+    until they are written and is then read back, usually from the page cache.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        total: int,
+        progress: _Progress,
+        state: DownloadState | None = None,
+        state_path: Path | None = None,
+        digest: StreamingDigest | None = None,
+    ):
+        self.progress = progress
+        self.state = state
+        self.state_path = state_path
+        self.digest = digest
+        self.hashed = 0
+        self._unhashed: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._digest_lock = threading.Lock()
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0))
+        os.ftruncate(self.fd, total)
+        for start, end in state.completed if state is not None else []:
+            self._hash_written(start, end)
+
+    def write(self, data: bytes | memoryview, offset: int) -> None:
+        if hasattr(os, "pwrite"):
+            os.pwrite(self.fd, data, offset)
+        else:
+            # No pwrite (Windows): serialise seek + write
+            with self._lock:
+                os.lseek(self.fd, offset, os.SEEK_SET)
+                os.write(self.fd, data)
+        self.progress.advance(len(data))
+
+    def read(self, size: int, offset: int) -> bytes:
+        if hasattr(os, "pread"):
+            return os.pread(self.fd, size, offset)
+        with self._lock:
+            os.lseek(self.fd, offset, os.SEEK_SET)
+            return os.read(self.fd, size)
+
+    def record(self, start: int, end: int) -> None:
+        """Record ``start-end`` as written and persist the resume state."""
+        if self.state is None or end < start:
+            return
+        with self._lock:
+            self.state.add_range(start, end)
+            if self.state_path is not None:
+                self.state.save(self.state_path)
+        self._hash_written(start, end)
+
+    def _hash_written(self, start: int, end: int) -> None:
+        """Hash every written range that now directly follows the hashed ones."""
+        if self.digest is None:
+            return
+        with self._digest_lock:
+            self._unhashed[start] = end
+            while self.hashed in self._unhashed:
+                end = self._unhashed.pop(self.hashed)
+                while self.hashed <= end:
+                    data = self.read(
+                        min(DEFAULT_BLOCK_SIZE, end + 1 - self.hashed), self.hashed
+                    )
+                    if not data:
+                        raise OSError(f"Unexpected end of file at byte {self.hashed}")
+                    self.digest.update(data)
+                    self.hashed += len(data)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _range_headers(start: int, end: int) -> dict[str, str]:
+    return {"Range": f"bytes={start}-{end}"}
+
+
+def _check_partial(
+    response: HttpResponse | AsyncHttpResponse, url: str, start: int, end: int
+) -> IncompleteDownloadError | None:
+    """Ensure a response is a 206 for exactly the requested range."""
+    if response.status_code != 206:
+        return IncompleteDownloadError(
+            message=f"Expected 206 Partial Content, got {response.status_code}",
+            url=url,
+            expected_bytes=end - start + 1,
+        )
+    content_range = header_value(response.headers, "Content-Range") or ""
+    if not content_range.startswith(f"bytes {start}-{end}/"):
+        return IncompleteDownloadError(
+            message=f"Server returned range {content_range!r} for bytes {start}-{end}",
+            url=url,
+            expected_bytes=end - start + 1,
+        )
+    return None
+
+
+def _size_error(
+    url: str, start: int, end: int, offset: int
+) -> IncompleteDownloadError | None:
+    if offset == end + 1:
+        return None
+    return IncompleteDownloadError(
+        message=f"Range {start}-{end} ended after {offset - start} bytes",
+        url=url,
+        expected_bytes=end - start + 1,
+        received_bytes=offset - start,
+    )
+
+
+def _content_length(headers: dict[str, str]) -> int | None:
+    value = header_value(headers, "Content-Length")
+    return int(value) if value and value.isdigit() else None
+
+
+class _Transfer:
+    """
+    Bookkeeping for one download, shared by the sync and async functions.
+
+    Decides what to request first, reconciles saved resume state with the
+    server's response, and finishes by verifying the size (and digest) and
+    moving the partial file into place.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        output_path: Path,
+        part_size: int,
+        progress_callback: ProgressCallback | None,
+        resume: bool,
+        url_expires_at: float | None,
+        digest: DigestAlgorithm | None = None,
+    ):
+        self.digest = StreamingDigest(digest) if digest is not None else None
+        self.headers: dict[str, str] = {}
+        self.partial = False
+        self.url = url
+        self.output_path = output_path
+        self.part_size = part_size
+        self.progress_callback = progress_callback
+        self.resume = resume
+        self.url_expires_at = url_expires_at
+        self.part_path, self.state_path = partial_paths(output_path)
+        # Without resume, write to a hidden file that nothing else will pick up
+        self.temp_path = temp_path(output_path)
+        self.state = (
+            DownloadState.load(self.state_path)
+            if resume and self.part_path.exists()
+            else None
+        )
+
+    @property
+    def target(self) -> Path:
+        """File written during the transfer, renamed to output_path by finish()."""
+        return self.part_path if self.resume else self.temp_path
+
+    def probe_range(self) -> tuple[int, int]:
+        """Range to request first: the first part still missing."""
+        if self.state is not None:
+            missing = self.state.missing_ranges(self.part_size)
+            if missing:
+                return missing[0]
+        return 0, self.part_size - 1
+
+    @staticmethod
+    def ranged_total(response: HttpResponse | AsyncHttpResponse) -> int | None:
+        """Total size if the response honoured the range, else None."""
+        if response.status_code != 206:
+            return None
+        return content_range_total(response.headers)
+
+    def open(
+        self, response: HttpResponse | AsyncHttpResponse, total: int
+    ) -> _RangedFile:
+        """Open the target file, reusing saved state when it still matches."""
+        self.headers, self.partial = response.headers, True
+        etag = header_value(response.headers, "ETag")
+        last_modified = header_value(response.headers, "Last-Modified")
+
+        if self.state is not None and not self.state.matches(
+            total, etag, last_modified
+        ):
+            logger.info("Remote file changed, restarting download of %s", self.url)
+            self.state = None
+
+        if self.state is None:
+            self.state = DownloadState(
+                url=self.url,
+                total_bytes=total,
+                etag=etag,
+                last_modified=last_modified,
+            )
+        self.state.url = self.url
+        self.state.expires_at = self.url_expires_at
+        if self.resume:
+            self.state.save(self.state_path)
+
+        return _RangedFile(
+            self.target,
+            total,
+            _Progress(total, self.progress_callback, self.state.bytes_written),
+            self.state,
+            self.state_path if self.resume else None,
+            self.digest,
+        )
+
+    def remaining_ranges(self) -> list[tuple[int, int]]:
+        """Ranges still missing after the probe range has been written."""
+        if self.state is None:
+            return []
+        return self.state.missing_ranges(self.part_size)
+
+    def stream_progress(self, response: HttpResponse | AsyncHttpResponse) -> _Progress:
+        """Progress for a full (non-ranged) response, discarding resume state."""
+        self.headers, self.partial = response.headers, False
+        self.state = None
+        if self.resume:
+            with contextlib.suppress(FileNotFoundError):
+                self.state_path.unlink()
+        return _Progress(_content_length(response.headers), self.progress_callback)
+
+    def finish(self, total: int | None) -> Result[Path | DownloadedFile, HttpError]:
+        """Verify the downloaded size and move the partial file into place."""
+        size = self.target.stat().st_size
+        written = self.state.bytes_written if self.state is not None else size
+        if (total is not None and size != total) or written != size:
+            return Err(
+                IncompleteDownloadError(
+                    message=f"Downloaded {written} of {total or size} bytes",
+                    url=self.url,
+                    expected_bytes=total or size,
+                    received_bytes=written,
+                )
+            )
+        downloaded = None
+        if self.digest is not None:
+            try:
+                downloaded = verify_digest(
+                    self.digest, self.output_path, self.headers, self.partial, self.url
+                )
+            except ChecksumMismatchError as error:
+                self.target.unlink(missing_ok=True)
+                if self.resume:
+                    self.state_path.unlink(missing_ok=True)
+                return Err(error)
+        os.replace(self.target, self.output_path)
+        if self.resume:
+            with contextlib.suppress(FileNotFoundError):
+                self.state_path.unlink()
+        return Ok(downloaded or self.output_path)
+
+    def discard(self) -> None:
+        """Delete the partial file of a failed download that won't be resumed."""
+        if not self.resume:
+            self.temp_path.unlink(missing_ok=True)
+
+
+def _write_range(
+    response: HttpResponse,
+    file: _RangedFile,
+    url: str,
+    start: int,
+    end: int,
+    chunk_size: int,
+    share: BandwidthShare | None = None,
+) -> Result[int, HttpError]:
+    """Write the body of a 206 response for ``start-end`` at its offset."""
+    range_error = _check_partial(response, url, start, end)
+    if range_error is not None:
+        return Err(range_error)
+
+    offset = start
+    try:
+        for chunk in iter_response(response, bytearray(chunk_size)):
+            if share is not None:
+                share.acquire(len(chunk))
+            file.write(chunk, offset)
+            offset += len(chunk)
+    finally:
+        file.record(start, offset - 1)
+
+    size_error = _size_error(url, start, end, offset)
+    if size_error is not None:
+        return Err(size_error)
+    return Ok(offset - start)
+
+
+def _write_stream(
+    response: HttpResponse,
+    path: Path,
+    chunk_size: int,
+    progress: _Progress,
+    digest: StreamingDigest | None = None,
+    share: BandwidthShare | None = None,
+) -> None:
+    """Write a full (non-ranged) response body sequentially."""
+    with path.open("wb") as f:
+        for chunk in iter_response(response, bytearray(chunk_size)):
+            if share is not None:
+                share.acquire(len(chunk))
+            f.write(chunk)
+            if digest is not None:
+                digest.update(chunk)
+            progress.advance(len(chunk))
+
+
+def download_url(
+    client: HttpClient,
+    url: str,
+    output_path: Path | str,
+    *,
+    chunk_size: int = 8192,
+    progress_callback: ProgressCallback | None = None,
+    timeout: float = 30.0,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    part_size: int = DEFAULT_PART_SIZE,
+    resume: bool = False,
+    url_expires_at: float | None = None,
+    digest: DigestAlgorithm | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+) -> Result[Path | DownloadedFile, HttpError]:
+    """
+    Download a URL to disk, fetching byte ranges over parallel connections.
+
+    The first range doubles as a probe: a server that supports range requests
+    (``Accept-Ranges: bytes``) answers with 206 and a ``Content-Range`` carrying
+    the total size, after which the remaining ranges are fetched concurrently and
+    written in place into a preallocated file. A server that ignores the
+    ``Range`` header answers with 200 and the whole body, which is streamed to
+    disk sequentially.
+
+    With ``resume=True`` the file is written to ``<output_path>.part`` and every
+    written byte range is recorded in ``<output_path>.part.json`` together with
+    the URL, its expiry and the file's ETag/Last-Modified. Calling again after a
+    failure only fetches the missing ranges, unless the remote file has changed.
+    Without it the file is written to a hidden temporary file next to
+    ``output_path``, which is deleted if the download fails. Once complete, the
+    size is verified against ``Content-Range`` and the file is atomically
+    renamed to ``output_path``, so a failed download never leaves a partial
+    file there.
+
+    Args:
+        client: HTTP client used for the transfer. It should not attach SDK
+            credentials, as signed URLs carry their own authorisation.
+        url: Absolute URL to download
+        output_path: Where to save the file (Path or string)
+        chunk_size: Bytes per chunk read from each response
+        progress_callback: Optional callback called after each chunk is written,
+            with the total across all connections. Signature:
+            callback(bytes_downloaded: int, total_bytes: int | None). Calls are
+            serialised but may come from worker threads.
+        timeout: Request timeout in seconds
+        max_connections: Maximum number of ranges fetched concurrently. Use 1 to
+            download over a single connection.
+        part_size: Size of each byte range in bytes
+        resume: Keep partial state on disk and resume from it
+        url_expires_at: Unix time at which ``url`` expires, saved with the resume
+            state so a later call knows whether the URL can be reused
+        digest: Compute a "sha256", "md5" or "crc32c" digest of the file while
+            it is written, and check it against a checksum the server sends in
+            its headers (ETag, Content-MD5, Digest, Repr-Digest, x-goog-hash)
+        bandwidth_limiter: Limiter the response bodies are read through. All
+            ranges of the download draw on one fair share of it.
+
+    Returns:
+        Result containing either:
+        - Ok(Path) pointing to the downloaded file, or Ok(DownloadedFile) with
+          its path and digest when ``digest`` is given
+        - Err(HttpError) if any request fails or the file is incomplete, or
+          ChecksumMismatchError if the digest differs from the server's (the
+          file is then deleted)
+    """
+    transfer = _Transfer(
+        url,
+        Path(output_path),
+        part_size,
+        progress_callback,
+        resume,
+        url_expires_at,
+        digest,
+    )
+    share = bandwidth_limiter.share() if bandwidth_limiter is not None else None
+    try:
+        result = _download(
+            client, transfer, share, chunk_size, timeout, max_connections
+        )
+    except BaseException:
+        transfer.discard()
+        raise
+    if is_err(result):
+        transfer.discard()
+    return result
+
+
+def _download(
+    client: HttpClient,
+    transfer: _Transfer,
+    share: BandwidthShare | None,
+    chunk_size: int,
+    timeout: float,
+    max_connections: int,
+) -> Result[Path | DownloadedFile, HttpError]:
+    """Fetch a download into its target file and verify it."""
+    url = transfer.url
+    if max_connections <= 1 and not transfer.resume:
+        result = client.request("GET", url, follow_redirects=True, timeout=timeout)
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+        progress = transfer.stream_progress(response)
+        _write_stream(
+            response, transfer.target, chunk_size, progress, transfer.digest, share
+        )
+        return transfer.finish(progress.total)
+
+    probe = transfer.probe_range()
+    result = client.request(
+        "GET",
+        url,
+        headers=_range_headers(*probe),
+        follow_redirects=True,
+        timeout=timeout,
+    )
+    if is_err(result):
+        return Err(result.error())
+    response = result.unwrap()
+
+    total = transfer.ranged_total(response)
+    if total is None:
+        logger.debug("Range requests not supported, downloading %s sequentially", url)
+        progress = transfer.stream_progress(response)
+        _write_stream(
+            response, transfer.target, chunk_size, progress, transfer.digest, share
+        )
+        return transfer.finish(progress.total)
+
+    file = transfer.open(response, total)
+    try:
+        first = _write_range(
+            response, file, url, probe[0], min(probe[1], total - 1), chunk_size, share
+        )
+        if is_err(first):
+            return Err(first.error())
+
+        def fetch(start: int, end: int) -> Result[int, HttpError]:
+            range_result = client.request(
+                "GET",
+                url,
+                headers=_range_headers(start, end),
+                follow_redirects=True,
+                timeout=timeout,
+            )
+            if is_err(range_result):
+                return Err(range_result.error())
+            return _write_range(
+                range_result.unwrap(), file, url, start, end, chunk_size, share
+            )
+
+        ranges = transfer.remaining_ranges()
+        if ranges:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_connections, len(ranges))),
+                thread_name_prefix="satvu-download",
+            ) as executor:
+                futures = [executor.submit(fetch, start, end) for start, end in ranges]
+                for future in futures:
+                    part = future.result()
+                    if is_err(part):
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        return Err(part.error())
+    finally:
+        file.close()
+
+    return transfer.finish(total)
+
+
+async def _write_range_async(
+    response: AsyncHttpResponse,
+    file: _RangedFile,
+    url: str,
+    start: int,
+    end: int,
+    chunk_size: int,
+    share: BandwidthShare | None = None,
+) -> Result[int, HttpError]:
+    """Async counterpart of _write_range()."""
+    range_error = _check_partial(response, url, start, end)
+    if range_error is not None:
+        return Err(range_error)
+
+    offset = start
+    try:
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            if share is not None:
+                await share.acquire_async(len(chunk))
+            file.write(chunk, offset)
+            offset += len(chunk)
+    finally:
+        file.record(start, offset - 1)
+
+    size_error = _size_error(url, start, end, offset)
+    if size_error is not None:
+        return Err(size_error)
+    return Ok(offset - start)
+
+
+async def _write_stream_async(
+    response: AsyncHttpResponse,
+    path: Path,
+    chunk_size: int,
+    progress: _Progress,
+    digest: StreamingDigest | None = None,
+    share: BandwidthShare | None = None,
+) -> None:
+    """Write a full (non-ranged) async response body sequentially."""
+    with path.open("wb") as f:
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            if share is not None:
+                await share.acquire_async(len(chunk))
+            f.write(chunk)
+            if digest is not None:
+                digest.update(chunk)
+            progress.advance(len(chunk))
+
+
+async def download_url_async(
+    client: AsyncHttpClient,
+    url: str,
+    output_path: Path | str,
+    *,
+    chunk_size: int = 8192,
+    progress_callback: ProgressCallback | None = None,
+    timeout: float = 30.0,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    part_size: int = DEFAULT_PART_SIZE,
+    resume: bool = False,
+    url_expires_at: float | None = None,
+    digest: DigestAlgorithm | None = None,
+    bandwidth_limiter: BandwidthLimiter | None = None,
+) -> Result[Path | DownloadedFile, HttpError]:
+    """
+    Download a URL to disk, fetching byte ranges concurrently on the event loop.
+
+    Async counterpart of download_url(); see it for details.
+    """
+    transfer = _Transfer(
+        url,
+        Path(output_path),
+        part_size,
+        progress_callback,
+        resume,
+        url_expires_at,
+        digest,
+    )
+    share = bandwidth_limiter.share() if bandwidth_limiter is not None else None
+    try:
+        result = await _download_async(
+            client, transfer, share, chunk_size, timeout, max_connections
+        )
+    except BaseException:
+        transfer.discard()
+        raise
+    if is_err(result):
+        transfer.discard()
+    return result
+
+
+async def _download_async(
+    client: AsyncHttpClient,
+    transfer: _Transfer,
+    share: BandwidthShare | None,
+    chunk_size: int,
+    timeout: float,
+    max_connections: int,
+) -> Result[Path | DownloadedFile, HttpError]:
+    """Async counterpart of _download()."""
+    url = transfer.url
+    if max_connections <= 1 and not transfer.resume:
+        result = await client.request(
+            "GET", url, follow_redirects=True, timeout=timeout
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+        progress = transfer.stream_progress(response)
+        await _write_stream_async(
+            response, transfer.target, chunk_size, progress, transfer.digest, share
+        )
+        return transfer.finish(progress.total)
+
+    probe = transfer.probe_range()
+    result = await client.request(
+        "GET",
+        url,
+        headers=_range_headers(*probe),
+        follow_redirects=True,
+        timeout=timeout,
+    )
+    if is_err(result):
+        return Err(result.error())
+    response = result.unwrap()
+
+    total = transfer.ranged_total(response)
+    if total is None:
+        logger.debug("Range requests not supported, downloading %s sequentially", url)
+        progress = transfer.stream_progress(response)
+        await _write_stream_async(
+            response, transfer.target, chunk_size, progress, transfer.digest, share
+        )
+        return transfer.finish(progress.total)
+
+    file = transfer.open(response, total)
+    semaphore = asyncio.Semaphore(max(1, max_connections))
+
+    async def fetch(start: int, end: int) -> Result[int, HttpError]:
+        async with semaphore:
+            range_result = await client.request(
+                "GET",
+                url,
+                headers=_range_headers(start, end),
+                follow_redirects=True,
+                timeout=timeout,
+            )
+            if is_err(range_result):
+                return Err(range_result.error())
+            return await _write_range_async(
+                range_result.unwrap(), file, url, start, end, chunk_size, share
+            )
+
+    try:
+        first = await _write_range_async(
+            response, file, url, probe[0], min(probe[1], total - 1), chunk_size, share
+        )
+        if is_err(first):
+            return Err(first.error())
+
+        tasks = [
+            asyncio.ensure_future(fetch(start, end))
+            for start, end in transfer.remaining_ranges()
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                part = await task
+                if is_err(part):
+                    return Err(part.error())
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        file.close()
+
+    return transfer.finish(total)
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    A read-only, seekable file behind a URL, fetched as it is read.
+
+    Reads request the byte ranges they touch, in blocks of ``block_size``, and
+    cache them in a SpooledTemporaryFile: the first ``spool_threshold`` bytes
+    of the file are kept in memory and anything beyond is written to a
+    temporary file on disk. Reading a zip archive with ``zipfile.ZipFile``
+    therefore only downloads its central directory and the members that are
+    opened, and memory use does not grow with the archive size.
+
+    When the server does not support range requests, or the file was served
+    directly, the whole body is spooled up front by open() or from_response().
+    Range requests are made synchronously, so async clients always spool the
+    whole file.
+
+    Reads raise the HttpError of a failed range request.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int,
+        client: HttpClient | None = None,
+        *,
+        timeout: float = 30.0,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        chunk_size: int = 8192,
+    ):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.client = client
+        self.timeout = timeout
+        self.block_size = block_size
+        self.spool_threshold = spool_threshold
+        self._buffer = bytearray(chunk_size)
+        self._spool = SpooledTemporaryFile(max_size=spool_threshold)  # noqa: SIM115
+        self._fetched = bytearray(-(-size // block_size))
+        self._pos = 0
+
+    @classmethod
+    def open(
+        cls,
+        client: HttpClient,
+        url: str,
+        *,
+        timeout: float = 30.0,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        chunk_size: int = 8192,
+    ) -> Result["RemoteFile", HttpError]:
+        """
+        Open a URL, fetching only its first block.
+
+        The first block doubles as a probe for range support and the file size.
+
+        Args:
+            client: HTTP client for the range requests. It should not attach SDK
+                credentials, as signed URLs carry their own authorisation.
+            url: Absolute URL of the file
+            timeout: Request timeout in seconds
+            block_size: Size of the byte ranges fetched on demand
+            spool_threshold: Bytes kept in memory before spooling to disk
+            chunk_size: Bytes per chunk read from each response
+
+        Returns:
+            Result containing either:
+            - Ok(RemoteFile) positioned at the start of the file
+            - Err(HttpError) if the first request fails
+        """
+        result = client.request(
+            "GET",
+            url,
+            headers=_range_headers(0, block_size - 1),
+            follow_redirects=True,
+            timeout=timeout,
+        )
+        if is_err(result):
+            return Err(result.error())
+        response = result.unwrap()
+
+        total = _Transfer.ranged_total(response)
+        if total is None:
+            logger.debug("Range requests not supported, spooling %s", url)
+            return Ok(
+                cls.from_response(
+                    response,
+                    url,
+                    spool_threshold=spool_threshold,
+                    chunk_size=chunk_size,
+                )
+            )
+
+        file = cls(
+            url,
+            total,
+            client,
+            timeout=timeout,
+            block_size=block_size,
+            spool_threshold=spool_threshold,
+            chunk_size=chunk_size,
+        )
+        try:
+            file._write_blocks(response, 0, 0)
+        except HttpError as error:
+            file.close()
+            return Err(error)
+        return Ok(file)
+
+    @classmethod
+    def from_response(
+        cls,
+        response: HttpResponse,
+        url: str = "",
+        *,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        chunk_size: int = 8192,
+    ) -> "RemoteFile":
+        """Spool the whole body of a response that is the file itself."""
+        file = cls(url, 0, spool_threshold=spool_threshold, chunk_size=chunk_size)
+        for chunk in iter_response(response, file._buffer):
+            file._spool.write(chunk)
+        file._loaded()
+        return file
+
+    @classmethod
+    async def open_async(
+        cls,
+        client: AsyncHttpClient,
+        url: str,
+        *,
+        timeout: float = 30.0,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        chunk_size: int = 8192,
+    ) -> Result["RemoteFile", HttpError]:
+        """Download a URL with an async client and spool its whole body."""
+        result = await client.request(
+            "GET", url, follow_redirects=True, timeout=timeout
+        )
+        if is_err(result):
+            return Err(result.error())
+        return Ok(
+            await cls.from_response_async(
+                result.unwrap(),
+                url,
+                spool_threshold=spool_threshold,
+                chunk_size=chunk_size,
+            )
+        )
+
+    @classmethod
+    async def from_response_async(
+        cls,
+        response: AsyncHttpResponse,
+        url: str = "",
+        *,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        chunk_size: int = 8192,
+    ) -> "RemoteFile":
+        """Async counterpart of from_response()."""
+        file = cls(url, 0, spool_threshold=spool_threshold, chunk_size=chunk_size)
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            file._spool.write(chunk)
+        file._loaded()
+        return file
+
+    def _loaded(self) -> None:
+        """Mark a fully spooled body as fetched."""
+        self.size = self._spool.tell()
+        self._fetched = bytearray(b"\x01") * -(-self.size // self.block_size)
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_open()
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        self._check_open()
+        view = memoryview(buffer).cast("B")
+        n = min(len(view), self.size - self._pos)
+        if n <= 0:
+            return 0
+        self._fetch(
+            self._pos // self.block_size, (self._pos + n - 1) // self.block_size
+        )
+        self._spool.seek(self._pos)
+        data = self._spool.read(n)
+        view[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        """Read the rest of the file, fetching its missing blocks in one request."""
+        buffer = bytearray(max(self.size - self._pos, 0))
+        return bytes(buffer[: self.readinto(buffer)])
+
+    def close(self) -> None:
+        if not self.closed:
+            self._spool.close()
+        super().close()
+
+    def _fetch(self, first: int, last: int) -> None:
+        """Fetch the missing blocks from ``first`` to ``last``, one request per run."""
+        block = first
+        while block <= last:
+            if self._fetched[block]:
+                block += 1
+                continue
+            end = block
+            while end < last and not self._fetched[end + 1]:
+                end += 1
+            assert self.client is not None, "Spooled files are fully fetched"
+            result = self.client.request(
+                "GET",
+                self.url,
+                headers=_range_headers(*self._byte_range(block, end)),
+                follow_redirects=True,
+                timeout=self.timeout,
+            )
+            if is_err(result):
+                raise result.error()
+            self._write_blocks(result.unwrap(), block, end)
+            block = end + 1
+
+    def _byte_range(self, first: int, last: int) -> tuple[int, int]:
+        return first * self.block_size, min((last + 1) * self.block_size, self.size) - 1
+
+    def _write_blocks(self, response: HttpResponse, first: int, last: int) -> None:
+        """Spool the 206 response for blocks ``first`` to ``last``."""
+        start, end = self._byte_range(first, last)
+        range_error = _check_partial(response, self.url, start, end)
+        if range_error is not None:
+            raise range_error
+
+        if end >= self.spool_threshold:
+            # Writing past the end of an in-memory spool would zero-fill the gap
+            self._spool.rollover()
+        self._spool.seek(start)
+        offset = start
+        for chunk in iter_response(response, self._buffer):
+            self._spool.write(chunk)
+            offset += len(chunk)
+
+        size_error = _size_error(self.url, start, end, offset)
+        if size_error is not None:
+            raise size_error
+        self._fetched[first : last + 1] = b"\x01" * (last - first + 1)
+
+
+__all__ = [
+    "DEFAULT_BLOCK_SIZE",
+    "DEFAULT_MAX_CONNECTIONS",
+    "DEFAULT_PART_SIZE",
+    "DEFAULT_SPOOL_THRESHOLD",
+    "DownloadState",
+    "RemoteFile",
+    "content_range_total",
+    "download_url",
+    "download_url_async",
+    "header_value",
+    "partial_paths",
+    "plan_ranges",
+    "temp_path",
+]
@@ -0,0 +1,727 @@
+"""Tests for parallel ranged downloads."""
+
+import asyncio
+import base64
+import hashlib
+import io
+import os
+import re
+import time
+import zipfile
+
+import httpx
+import pytest
+
+from satvu.digest import DownloadedFile
+from satvu.download import (
+    DownloadState,
+    RemoteFile,
+    content_range_total,
+    download_url,
+    download_url_async,
+    partial_paths,
+    plan_ranges,
+)
+from satvu.http.errors import (
+    ChecksumMismatchError,
+    ClientError,
+    IncompleteDownloadError,
+)
+from satvu.http.httpx_adapter import AsyncHttpxAdapter, HttpxAdapter
+from satvu.result import is_err, is_ok
+from satvu.throttle import BandwidthLimiter
+
+URL = "https://files.example.com/order.zip"
+CONTENT = bytes(range(256)) * 40  # 10240 bytes
+CONTENT_MD5 = hashlib.md5(CONTENT).hexdigest()
+
+
+def range_handler(
+    content: bytes,
+    requests: list,
+    truncate: int | None = None,
+    etag: str = '"v1"',
+):
+    """Serve ``content`` honouring single byte-range requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if not match:
+            return httpx.Response(200, content=content)
+        start, end = int(match[1]), min(int(match[2]), len(content) - 1)
+        body = content[start : end + 1]
+        if truncate is not None and start > 0:
+            body = body[:truncate]
+        return httpx.Response(
+            206,
+            content=body,
+            headers={
+                "Accept-Ranges": "bytes",
+                "Content-Range": f"bytes {start}-{end}/{len(content)}",
+                "ETag": etag,
+            },
+        )
+
+    return handler
+
+
+def sync_client(handler) -> HttpxAdapter:
+    return HttpxAdapter(client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def async_client(handler) -> AsyncHttpxAdapter:
+    return AsyncHttpxAdapter(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+class TestHelpers:
+    """Tests for range planning and header parsing."""
+
+    @pytest.mark.parametrize(
+        "start,total,part_size,expected",
+        [
+            (0, 10, 4, [(0, 3), (4, 7), (8, 9)]),
+            (0, 8, 4, [(0, 3), (4, 7)]),
+            (4, 10, 4, [(4, 7), (8, 9)]),
+            (10, 10, 4, []),
+        ],
+    )
+    def test_plan_ranges(self, start, total, part_size, expected):
+        """Ranges cover the requested span without gaps or overlap."""
+        assert plan_ranges(start, total, part_size) == expected
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({"Content-Range": "bytes 0-99/1000"}, 1000),
+            ({"content-range": "bytes 0-99/1000"}, 1000),
+            ({"Content-Range": "bytes 0-99/*"}, None),
+            ({}, None),
+        ],
+    )
+    def test_content_range_total(self, headers, expected):
+        """Total size is read from Content-Range when known."""
+        assert content_range_total(headers) == expected
+
+
+class TestDownloadState:
+    """Tests for the resume state sidecar."""
+
+    def test_add_range_merges_adjacent(self):
+        """Adjacent and overlapping ranges are merged."""
+        state = DownloadState(url=URL, total_bytes=100)
+        for start, end in [(20, 29), (0, 9), (10, 19), (50, 59), (55, 64)]:
+            state.add_range(start, end)
+
+        assert state.completed == [(0, 29), (50, 64)]
+        assert state.bytes_written == 45
+
+    def test_missing_ranges(self):
+        """Gaps between completed ranges are split into parts."""
+        state = DownloadState(url=URL, total_bytes=100, completed=[(10, 29)])
+
+        assert state.missing_ranges(part_size=40) == [(0, 9), (30, 69), (70, 99)]
+
+    @pytest.mark.parametrize(
+        "expires_in,fresh", [(None, True), (3600, True), (10, False), (-1, False)]
+    )
+    def test_url_is_fresh(self, expires_in, fresh):
+        """URLs close to expiry are not reused."""
+        expires_at = None if expires_in is None else time.time() + expires_in
+        assert DownloadState(url=URL, expires_at=expires_at).url_is_fresh() is fresh
+
+    def test_save_and_load(self, tmp_path):
+        """State round-trips through the sidecar file."""
+        path = tmp_path / "order.zip.part.json"
+        state = DownloadState(url=URL, total_bytes=10, etag='"v1"', completed=[(0, 4)])
+
+        state.save(path)
+
+        assert DownloadState.load(path) == state
+
+    def test_load_corrupt_state(self, tmp_path):
+        """Unreadable state is treated as missing."""
+        path = tmp_path / "order.zip.part.json"
+        path.write_text("{not json")
+
+        assert DownloadState.load(path) is None
+        assert DownloadState.load(tmp_path / "missing.json") is None
+
+
+class TestDownloadUrl:
+    """Tests for download_url()."""
+
+    def test_parallel_ranges(self, tmp_path):
+        """Files are assembled from concurrent byte ranges."""
+        requests = []
+        output = tmp_path / "order.zip"
+
+        result = download_url(
+            sync_client(range_handler(CONTENT, requests)),
+            URL,
+            output,
+            part_size=1024,
+            max_connections=4,
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert len(requests) == 10
+        assert all("Range" in r.headers for r in requests)
+
+    def test_progress_is_aggregated(self, tmp_path):
+        """Progress reports the running total across all ranges."""
+        progress = []
+
+        download_url(
+            sync_client(range_handler(CONTENT, [])),
+            URL,
+            tmp_path / "order.zip",
+            part_size=1024,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+
+        assert progress[-1] == (len(CONTENT), len(CONTENT))
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    def test_small_file_single_range(self, tmp_path):
+        """A file smaller than one part needs a single request."""
+        requests = []
+        output = tmp_path / "small.bin"
+
+        result = download_url(
+            sync_client(range_handler(b"tiny", requests)), URL, output
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == b"tiny"
+        assert len(requests) == 1
+
+    def test_falls_back_without_range_support(self, tmp_path):
+        """Servers ignoring Range are downloaded from the single full response."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=CONTENT)
+
+        output = tmp_path / "order.zip"
+        result = download_url(sync_client(handler), URL, output, part_size=1024)
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert len(requests) == 1
+
+    def test_single_connection(self, tmp_path):
+        """max_connections=1 downloads without range requests."""
+        requests = []
+        output = tmp_path / "order.zip"
+
+        result = download_url(
+            sync_client(range_handler(CONTENT, requests)),
+            URL,
+            output,
+            max_connections=1,
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert "Range" not in requests[0].headers
+
+    def test_truncated_range_is_an_error(self, tmp_path):
+        """A short range body results in IncompleteDownloadError."""
+        result = download_url(
+            sync_client(range_handler(CONTENT, [], truncate=10)),
+            URL,
+            tmp_path / "order.zip",
+            part_size=1024,
+        )
+
+        assert is_err(result)
+        error = result.error()
+        assert isinstance(error, IncompleteDownloadError)
+        assert error.expected_bytes == 1024
+        assert error.received_bytes == 10
+
+    def test_failed_range_leaves_no_file(self, tmp_path):
+        """A failed range deletes the partially written file."""
+        serve = range_handler(CONTENT, [])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("Range") == "bytes=4096-5119":
+                return httpx.Response(503)
+            return serve(request)
+
+        output = tmp_path / "order.zip"
+        result = download_url(sync_client(handler), URL, output, part_size=1024)
+
+        assert is_err(result)
+        assert not output.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_http_error_is_returned(self, tmp_path):
+        """Errors from the storage server are returned as Err."""
+        result = download_url(
+            sync_client(lambda request: httpx.Response(403)),
+            URL,
+            tmp_path / "order.zip",
+        )
+
+        assert is_err(result)
+        assert isinstance(result.error(), ClientError)
+
+    def test_resume_fetches_missing_ranges(self, tmp_path):
+        """An interrupted download resumes from the ranges saved in the sidecar."""
+        output = tmp_path / "order.zip"
+        part_path, state_path = partial_paths(output)
+
+        failed = download_url(
+            sync_client(range_handler(CONTENT, [], truncate=10)),
+            URL,
+            output,
+            part_size=1024,
+            resume=True,
+        )
+        assert is_err(failed)
+        assert not output.exists()
+        saved = DownloadState.load(state_path)
+        assert saved is not None
+        assert saved.etag == '"v1"'
+        assert saved.completed[0] == (0, 1033)
+        missing = saved.missing_ranges(1024)
+
+        requests = []
+        result = download_url(
+            sync_client(range_handler(CONTENT, requests)),
+            URL,
+            output,
+            part_size=1024,
+            resume=True,
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert not part_path.exists()
+        assert not state_path.exists()
+        assert sorted(r.headers["Range"] for r in requests) == sorted(
+            f"bytes={start}-{end}" for start, end in missing
+        )
+
+    def test_resume_restarts_when_file_changed(self, tmp_path):
+        """A different ETag discards saved progress."""
+        output = tmp_path / "order.zip"
+        download_url(
+            sync_client(range_handler(CONTENT, [], truncate=10)),
+            URL,
+            output,
+            part_size=1024,
+            resume=True,
+        )
+
+        changed = bytes(reversed(CONTENT))
+        requests = []
+        result = download_url(
+            sync_client(range_handler(changed, requests, etag='"v2"')),
+            URL,
+            output,
+            part_size=1024,
+            resume=True,
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == changed
+        fetched = [tuple(map(int, r.headers["Range"][6:].split("-"))) for r in requests]
+        assert sum(end - start + 1 for start, end in fetched) == len(changed)
+
+    def test_resume_without_range_support(self, tmp_path):
+        """Servers ignoring Range still complete into the final path."""
+        output = tmp_path / "order.zip"
+
+        result = download_url(
+            sync_client(lambda request: httpx.Response(200, content=CONTENT)),
+            URL,
+            output,
+            resume=True,
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert not partial_paths(output)[0].exists()
+
+    def test_bandwidth_limiter(self, tmp_path):
+        """All ranges of a download draw on the limiter through one share."""
+        limiter = BandwidthLimiter(50_000, burst=1024)
+        output = tmp_path / "order.zip"
+
+        started = time.monotonic()
+        result = download_url(
+            sync_client(range_handler(CONTENT, [])),
+            URL,
+            output,
+            chunk_size=512,
+            part_size=1024,
+            bandwidth_limiter=limiter,
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert time.monotonic() - started >= (len(CONTENT) - 1024) / 50_000 * 0.9
+        assert limiter.share().received >= len(CONTENT) - 512
+
+    def test_digest_of_parallel_ranges(self, tmp_path):
+        """Ranges are hashed in file order and checked against an MD5 ETag."""
+        output = tmp_path / "order.zip"
+
+        result = download_url(
+            sync_client(range_handler(CONTENT, [], etag=f'"{CONTENT_MD5}"')),
+            URL,
+            output,
+            part_size=1024,
+            max_connections=4,
+            digest="md5",
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert result.unwrap() == DownloadedFile(
+            path=output, algorithm="md5", digest=CONTENT_MD5, verified_by="ETag"
+        )
+
+    def test_digest_without_server_checksum(self, tmp_path):
+        output = tmp_path / "order.zip"
+
+        result = download_url(
+            sync_client(range_handler(CONTENT, [])),
+            URL,
+            output,
+            part_size=1024,
+            digest="sha256",
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        downloaded = result.unwrap()
+        assert isinstance(downloaded, DownloadedFile)
+        assert downloaded.digest == hashlib.sha256(CONTENT).hexdigest()
+        assert downloaded.verified_by is None
+
+    def test_digest_mismatch_deletes_file(self, tmp_path):
+        output = tmp_path / "order.zip"
+        wrong = hashlib.md5(b"other").hexdigest()
+
+        result = download_url(
+            sync_client(range_handler(CONTENT, [], etag=f'"{wrong}"')),
+            URL,
+            output,
+            part_size=1024,
+            resume=True,
+            digest="md5",
+        )
+
+        assert is_err(result)
+        error = result.error()
+        assert isinstance(error, ChecksumMismatchError)
+        assert error.expected == wrong
+        assert error.actual == CONTENT_MD5
+        assert not output.exists()
+        assert not any(path.exists() for path in partial_paths(output))
+
+    def test_digest_after_resume(self, tmp_path):
+        """Ranges saved by an interrupted download are hashed from disk."""
+        output = tmp_path / "order.zip"
+        download_url(
+            sync_client(range_handler(CONTENT, [], truncate=10)),
+            URL,
+            output,
+            part_size=1024,
+            resume=True,
+        )
+
+        result = download_url(
+            sync_client(range_handler(CONTENT, [])),
+            URL,
+            output,
+            part_size=1024,
+            resume=True,
+            digest="sha256",
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        downloaded = result.unwrap()
+        assert isinstance(downloaded, DownloadedFile)
+        assert downloaded.digest == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_digest_without_range_support(self, tmp_path):
+        """Full responses are hashed as they stream and checked against Content-MD5."""
+        output = tmp_path / "order.zip"
+        content_md5 = base64.b64encode(hashlib.md5(CONTENT).digest()).decode()
+
+        result = download_url(
+            sync_client(
+                lambda request: httpx.Response(
+                    200, content=CONTENT, headers={"Content-MD5": content_md5}
+                )
+            ),
+            URL,
+            output,
+            digest="md5",
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        downloaded = result.unwrap()
+        assert isinstance(downloaded, DownloadedFile)
+        assert downloaded.verified_by == "Content-MD5"
+
+
+class TestDownloadUrlAsync:
+    """Tests for download_url_async()."""
+
+    def test_parallel_ranges(self, tmp_path):
+        """Files are assembled from concurrent byte ranges."""
+        requests = []
+        output = tmp_path / "order.zip"
+
+        result = asyncio.run(
+            download_url_async(
+                async_client(range_handler(CONTENT, requests)),
+                URL,
+                output,
+                part_size=1024,
+            )
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert len(requests) == 10
+
+    def test_falls_back_without_range_support(self, tmp_path):
+        """Servers ignoring Range are downloaded from the single full response."""
+        output = tmp_path / "order.zip"
+
+        result = asyncio.run(
+            download_url_async(
+                async_client(lambda request: httpx.Response(200, content=CONTENT)),
+                URL,
+                output,
+                part_size=1024,
+            )
+        )
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+
+    def test_truncated_range_is_an_error(self, tmp_path):
+        """A short range body results in IncompleteDownloadError."""
+        result = asyncio.run(
+            download_url_async(
+                async_client(range_handler(CONTENT, [], truncate=10)),
+                URL,
+                tmp_path / "order.zip",
+                part_size=1024,
+            )
+        )
+
+        assert is_err(result)
+        assert isinstance(result.error(), IncompleteDownloadError)
+
+    def test_failed_range_leaves_no_file(self, tmp_path):
+        """A failed range deletes the partially written file."""
+        serve = range_handler(CONTENT, [])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("Range") == "bytes=4096-5119":
+                return httpx.Response(503)
+            return serve(request)
+
+        output = tmp_path / "order.zip"
+        result = asyncio.run(
+            download_url_async(async_client(handler), URL, output, part_size=1024)
+        )
+
+        assert is_err(result)
+        assert not output.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_resume_fetches_missing_ranges(self, tmp_path):
+        """An interrupted download resumes from the ranges saved in the sidecar."""
+        output = tmp_path / "order.zip"
+
+        async def download(handler):
+            return await download_url_async(
+                async_client(handler), URL, output, part_size=1024, resume=True
+            )
+
+        assert is_err(asyncio.run(download(range_handler(CONTENT, [], truncate=10))))
+
+        requests = []
+        result = asyncio.run(download(range_handler(CONTENT, requests)))
+
+        assert is_ok(result)
+        assert output.read_bytes() == CONTENT
+        assert all(r.headers["Range"] != "bytes=0-1023" for r in requests)
+
+    def test_bandwidth_limiter(self, tmp_path):
+        limiter = BandwidthLimiter(50_000, burst=1024)
+
+        started = time.monotonic()
+        result = asyncio.run(
+            download_url_async(
+                async_client(range_handler(CONTENT, [])),
+                URL,
+                tmp_path / "order.zip",
+                chunk_size=512,
+                part_size=1024,
+                bandwidth_limiter=limiter,
+            )
+        )
+
+        assert is_ok(result)
+        assert time.monotonic() - started >= (len(CONTENT) - 1024) / 50_000 * 0.9
+
+    def test_digest_of_parallel_ranges(self, tmp_path):
+        result = asyncio.run(
+            download_url_async(
+                async_client(range_handler(CONTENT, [], etag=f'"{CONTENT_MD5}"')),
+                URL,
+                tmp_path / "order.zip",
+                part_size=1024,
+                digest="md5",
+            )
+        )
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        downloaded = result.unwrap()
+        assert isinstance(downloaded, DownloadedFile)
+        assert downloaded.verified_by == "ETag"
+
+
+def make_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def requested_bytes(requests: list) -> int:
+    total = 0
+    for request in requests:
+        start, end = map(int, request.headers["Range"][6:].split("-"))
+        total += end - start + 1
+    return total
+
+
+def spooled_to_disk(file: RemoteFile) -> bool:
+    """Whether the file's spool has rolled over from memory to disk."""
+    return not isinstance(file._spool._file, io.BytesIO)
+
+
+class TestRemoteFile:
+    """Tests for RemoteFile."""
+
+    def open(self, content: bytes, requests: list, **kwargs) -> RemoteFile:
+        result = RemoteFile.open(
+            sync_client(range_handler(content, requests)), URL, **kwargs
+        )
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        return result.unwrap()
+
+    def test_zipfile_fetches_only_what_it_reads(self):
+        """Opening one member skips the byte ranges of the others."""
+        archive = make_zip(
+            {"image.tif": os.urandom(64 * 1024), "metadata.json": b'{"id": 1}'}
+        )
+        requests = []
+
+        with (
+            self.open(archive, requests, block_size=4096) as file,
+            zipfile.ZipFile(file) as zf,
+        ):
+            assert zf.read("metadata.json") == b'{"id": 1}'
+
+        assert requested_bytes(requests) < len(archive) // 4
+
+    def test_reads_whole_file(self):
+        requests = []
+        with self.open(CONTENT, requests, block_size=1024) as file:
+            assert file.size == len(CONTENT)
+            assert file.read() == CONTENT
+        assert len(requests) == 2  # The probe, then all remaining blocks at once
+
+    def test_seek_and_reread(self):
+        """Blocks are fetched once, however often they are read."""
+        requests = []
+        with self.open(CONTENT, requests, block_size=1024) as file:
+            assert file.seek(-10, io.SEEK_END) == len(CONTENT) - 10
+            assert file.read() == CONTENT[-10:]
+            assert file.read() == b""
+            file.seek(5000)
+            assert file.read(100) == CONTENT[5000:5100]
+            file.seek(-100, io.SEEK_CUR)
+            assert file.read(100) == CONTENT[5000:5100]
+            assert file.tell() == 5100
+        assert len(requests) == 3
+
+    def test_spools_to_disk_past_threshold(self):
+        with self.open(CONTENT, [], block_size=1024, spool_threshold=2048) as file:
+            file.read(1024)
+            assert not spooled_to_disk(file)
+            file.seek(-1, io.SEEK_END)
+            file.read()
+            assert spooled_to_disk(file)
+
+    def test_falls_back_without_range_support(self):
+        """Servers ignoring Range are spooled from the single full response."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=CONTENT)
+
+        result = RemoteFile.open(sync_client(handler), URL, spool_threshold=1024)
+
+        assert is_ok(result)
+        with result.unwrap() as file:
+            assert file.size == len(CONTENT)
+            assert spooled_to_disk(file)
+            file.seek(100)
+            assert file.read() == CONTENT[100:]
+        assert len(requests) == 1
+
+    def test_truncated_range_raises(self):
+        file = RemoteFile.open(
+            sync_client(range_handler(CONTENT, [], truncate=10)),
+            URL,
+            block_size=1024,
+        ).unwrap()
+
+        with file, pytest.raises(IncompleteDownloadError):
+            file.read()
+
+    def test_http_error_is_returned(self):
+        result = RemoteFile.open(sync_client(lambda request: httpx.Response(403)), URL)
+
+        assert is_err(result)
+        assert isinstance(result.error(), ClientError)
+
+    def test_closed_file(self):
+        file = self.open(CONTENT, [])
+        file.close()
+
+        with pytest.raises(ValueError, match="closed file"):
+            file.read()
+
+    def test_open_async_spools_whole_file(self):
+        requests = []
+
+        async def open_file():
+            return await RemoteFile.open_async(
+                async_client(range_handler(CONTENT, requests)), URL
+            )
+
+        result = asyncio.run(open_file())
+
+        assert is_ok(result)
+        with result.unwrap() as file:
+            assert file.read() == CONTENT
+        assert len(requests) == 1
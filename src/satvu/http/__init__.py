@@ -3,20 +3,33 @@
 from typing import Any, Literal, cast
 
 from satvu.http.errors import (
+    ArchiveError,
+    ChecksumMismatchError,
+    CircuitOpenError,
     ClientError,
     ConnectionTimeoutError,
+    DeadlineExceededError,
     HttpError,
     HttpStatusError,
+    IncompleteDownloadError,
     JsonDecodeError,
     NetworkError,
     ProxyError,
+    RateLimitExceededError,
     ReadTimeoutError,
     RequestValidationError,
     ServerError,
     SSLError,
     TextDecodeError,
+    UnexpectedError,
+)
+from satvu.http.pool import AsyncConnectionPool, ConnectionPool
+from satvu.http.protocol import (
+    AsyncHttpClient,
+    AsyncHttpResponse,
+    HttpClient,
+    HttpResponse,
 )
-from satvu.http.protocol import HttpClient, HttpResponse
 from satvu.result import Err, Ok, Result, is_err, is_ok
 
 
@@ -34,7 +47,7 @@ def create_http_client(
             - "httpx": Use httpx library (requires httpx)
             - "requests": Use requests library (requires requests)
             - "urllib3": Use urllib3 library (requires urllib3)
-            - "stdlib": Use standard library urllib (no dependencies)
+            - "stdlib": Use standard library http.client (no dependencies)
         base_url: Optional base URL for all requests
         **options: Additional backend-specific options (e.g., timeout, headers)
 
@@ -102,12 +115,55 @@ def _create_backend(
     raise ValueError(f"Unknown backend: {backend}")
 
 
+def create_async_http_client(
+    backend: Literal["auto", "httpx"] = "auto",
+    base_url: str | None = None,
+    **options: Any,
+) -> AsyncHttpClient:
+    """
+    Create an asynchronous HTTP client with the specified backend.
+
+    Args:
+        backend: HTTP library to use. Options:
+            - "auto": Use the best available async backend (currently httpx)
+            - "httpx": Use httpx.AsyncClient (requires httpx)
+        base_url: Optional base URL for all requests
+        **options: Additional backend-specific options (e.g., get_token, client)
+
+    Returns:
+        AsyncHttpClient: An HTTP client implementing the AsyncHttpClient protocol
+
+    Raises:
+        ValueError: If an invalid backend is specified
+        ImportError: If no async-capable backend is installed
+
+    Examples:
+        >>> client = create_async_http_client(base_url="https://api.example.com")
+        >>> result = await client.request("GET", "/data")
+    """
+    valid_backends = ["httpx"]
+    if backend != "auto" and backend not in valid_backends:
+        raise ValueError(
+            f"Invalid async backend '{backend}'. Must be one of: {', '.join(valid_backends + ['auto'])}"
+        )
+
+    from satvu.http.httpx_adapter import AsyncHttpxAdapter
+
+    return cast(AsyncHttpClient, AsyncHttpxAdapter(base_url=base_url, **options))
+
+
 __all__ = [
     # Factory
     "create_http_client",
+    "create_async_http_client",
+    # Connection pools
+    "ConnectionPool",
+    "AsyncConnectionPool",
     # Protocol
     "HttpClient",
     "HttpResponse",
+    "AsyncHttpClient",
+    "AsyncHttpResponse",
     # Result types
     "Result",
     "Ok",
@@ -121,10 +177,17 @@ __all__ = [
     "ReadTimeoutError",
     "SSLError",
     "ProxyError",
+    "IncompleteDownloadError",
+    "ChecksumMismatchError",
+    "ArchiveError",
+    "CircuitOpenError",
+    "RateLimitExceededError",
+    "DeadlineExceededError",
     "HttpStatusError",
     "ClientError",
     "ServerError",
     "JsonDecodeError",
     "TextDecodeError",
     "RequestValidationError",
+    "UnexpectedError",
 ]
@@ -0,0 +1,152 @@
+"""
+Reading response bodies into preallocated buffers.
+
+HttpResponse.iter_bytes() allocates a new bytes object for every chunk. For
+multi-gigabyte downloads, HttpResponse.readinto() and iter_into() instead
+fill one buffer owned by the caller, which is reused for the whole body.
+Adapters read into it natively where the library supports it, and serve
+bodies that are already in memory as memoryview slices without copying.
+Streamed bodies abandoned part way are released with close_response().
+"""
+
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from satvu.http.protocol import HttpResponse
+
+Buffer = bytearray | memoryview
+
+
+def byte_view(buffer: Buffer) -> memoryview:
+    """A flat, byte-addressed view of a writable buffer."""
+    return memoryview(buffer).cast("B")
+
+
+def iter_into(
+    readinto: Callable[[memoryview], int], buffer: Buffer
+) -> Iterator[memoryview]:
+    """
+    Repeatedly fill ``buffer`` with ``readinto`` until it returns 0.
+
+    Yields:
+        The filled part of the buffer, valid until the next iteration
+    """
+    view = byte_view(buffer)
+    while n := readinto(view):
+        yield view[:n]
+
+
+def iter_response(
+    response: "HttpResponse", buffer: Buffer
+) -> Iterator[bytes | memoryview]:
+    """
+    Stream a response body through ``buffer``.
+
+    Falls back to iter_bytes() for responses of custom HTTP clients that do
+    not implement iter_into().
+    """
+    stream_into = getattr(response, "iter_into", None)
+    if stream_into is None:
+        return response.iter_bytes(chunk_size=len(byte_view(buffer)))
+    return stream_into(buffer)
+
+
+def close_response(response: "HttpResponse") -> None:
+    """
+    Release the connection of a response that may not have been read to the end.
+
+    Responses of custom HTTP clients without a close() method are left as is.
+    """
+    close = getattr(response, "close", None)
+    if close is not None:
+        close()
+
+
+async def aclose_response(response: "HttpResponse") -> None:
+    """Async counterpart of close_response(), preferring aclose() over close()."""
+    aclose = getattr(response, "aclose", None)
+    if aclose is not None:
+        await aclose()
+    else:
+        close_response(response)
+
+
+class BytesReader:
+    """readinto() and iter_into() over a body that is already in memory."""
+
+    def __init__(self, body: bytes):
+        self._view = memoryview(body)
+        self._pos = 0
+
+    def readinto(self, buffer: Buffer) -> int:
+        """Copy the next ``len(buffer)`` bytes of the body into ``buffer``."""
+        view = byte_view(buffer)
+        n = min(len(view), len(self._view) - self._pos)
+        view[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def iter_into(self, buffer: Buffer) -> Iterator[memoryview]:
+        """
+        Yield the rest of the body as slices of ``len(buffer)`` bytes.
+
+        The slices refer to the body itself, so nothing is copied and
+        ``buffer`` is left untouched.
+        """
+        return self.iter_bytes(len(byte_view(buffer)))
+
+    def iter_bytes(self, chunk_size: int) -> Iterator[memoryview]:
+        """Yield the rest of the body as memoryview slices, without copying."""
+        while self._pos < len(self._view):
+            chunk = self._view[self._pos : self._pos + chunk_size]
+            self._pos += len(chunk)
+            yield chunk
+
+
+class ChunkReader:
+    """
+    readinto() and iter_into() over a body arriving as an iterator of chunks.
+
+    For libraries that stream the body but cannot read it into a buffer.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readinto(self, buffer: Buffer) -> int:
+        """Copy the next part of the current chunk into ``buffer``."""
+        if not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        view = byte_view(buffer)
+        n = min(len(view), len(self._pending))
+        view[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def iter_into(self, buffer: Buffer) -> Iterator[memoryview]:
+        """
+        Yield the rest of the body as views of the chunks themselves.
+
+        The chunks were allocated by the library anyway, so nothing is copied
+        and ``buffer`` is left untouched.
+        """
+        if self._pending:
+            pending, self._pending = self._pending, memoryview(b"")
+            yield pending
+        for chunk in self._chunks:
+            yield memoryview(chunk)
+
+
+__all__ = [
+    "Buffer",
+    "BytesReader",
+    "ChunkReader",
+    "byte_view",
+    "iter_into",
+    "iter_response",
+]
@@ -0,0 +1,94 @@
+"""Tests for reading response bodies into preallocated buffers."""
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from satvu.http.buffers import BytesReader, ChunkReader, iter_into, iter_response
+
+
+class TestBytesReader:
+    def test_readinto(self):
+        reader = BytesReader(b"0123456789")
+        buffer = bytearray(4)
+
+        reads = []
+        while n := reader.readinto(buffer):
+            reads.append(bytes(buffer[:n]))
+
+        assert reads == [b"0123", b"4567", b"89"]
+
+    def test_iter_into_slices_body(self):
+        """Slices refer to the body itself and leave the buffer untouched."""
+        body = b"0123456789"
+        buffer = bytearray(4)
+
+        chunks = list(BytesReader(body).iter_into(buffer))
+
+        assert [bytes(chunk) for chunk in chunks] == [b"0123", b"4567", b"89"]
+        assert all(chunk.obj is body for chunk in chunks)
+        assert buffer == bytearray(4)
+
+    def test_continues_after_readinto(self):
+        reader = BytesReader(b"0123456789")
+        reader.readinto(bytearray(3))
+
+        assert b"".join(reader.iter_bytes(4)) == b"3456789"
+
+    def test_memoryview_buffer(self):
+        storage = bytearray(8)
+        reader = BytesReader(b"abc")
+
+        assert reader.readinto(memoryview(storage)[2:6]) == 3
+        assert storage == bytearray(b"\0\0abc\0\0\0")
+
+
+class TestChunkReader:
+    def test_readinto_spans_chunks(self):
+        reader = ChunkReader(iter([b"012345", b"6789"]))
+        buffer = bytearray(4)
+
+        reads = []
+        while n := reader.readinto(buffer):
+            reads.append(bytes(buffer[:n]))
+
+        assert reads == [b"0123", b"45", b"6789"]
+
+    def test_iter_into_yields_chunks_without_copying(self):
+        chunks = [b"0123", b"4567"]
+        buffer = bytearray(4)
+
+        views = list(ChunkReader(iter(chunks)).iter_into(buffer))
+
+        assert [view.obj for view in views] == chunks
+        assert buffer == bytearray(4)
+
+    def test_iter_into_continues_after_readinto(self):
+        reader = ChunkReader(iter([b"012345", b"6789"]))
+        reader.readinto(bytearray(4))
+
+        assert b"".join(reader.iter_into(bytearray(4))) == b"456789"
+
+
+@pytest.mark.parametrize("size", [1, 3, 10, 64])
+def test_iter_into_reuses_buffer(size):
+    source = io.BytesIO(b"0123456789")
+    buffer = bytearray(size)
+
+    chunks = []
+    for chunk in iter_into(source.readinto, buffer):
+        assert chunk.obj is buffer
+        chunks.append(bytes(chunk))
+
+    assert b"".join(chunks) == b"0123456789"
+    assert max(len(chunk) for chunk in chunks) <= size
+
+
+def test_iter_response_falls_back_to_iter_bytes():
+    """Responses of custom clients without iter_into() still stream."""
+    response = MagicMock(spec=["iter_bytes"])
+    response.iter_bytes.return_value = iter([b"ab", b"c"])
+
+    assert list(iter_response(response, bytearray(16))) == [b"ab", b"c"]
+    response.iter_bytes.assert_called_once_with(chunk_size=16)
@@ -244,6 +244,229 @@ class ProxyError(HttpError):
         return "ProxyError"
 
 
+class IncompleteDownloadError(HttpError):
+    """
+    Downloaded body did not match the expected size.
+
+    This occurs when a transfer ends before all expected bytes arrive, or when
+    a server answers a ranged request without honouring the requested range.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        url: str | None = None,
+        expected_bytes: int | None = None,
+        received_bytes: int | None = None,
+    ) -> None:
+        """
+        Initialize an incomplete download error.
+
+        Args:
+            message: Error description
+            url: URL being downloaded
+            expected_bytes: Number of bytes that should have been received
+            received_bytes: Number of bytes actually received
+        """
+        context: dict[str, Any] = {}
+        if url:
+            context["url"] = url
+        if expected_bytes is not None:
+            context["expected_bytes"] = expected_bytes
+        if received_bytes is not None:
+            context["received_bytes"] = received_bytes
+
+        super().__init__(message, context)
+        self.url = url
+        self.expected_bytes = expected_bytes
+        self.received_bytes = received_bytes
+
+    def error_type(self) -> str:
+        return "IncompleteDownloadError"
+
+
+class ChecksumMismatchError(HttpError):
+    """
+    Downloaded data did not match its checksum.
+
+    This occurs when the checksum computed while downloading differs from the
+    one recorded for the data, such as the CRC-32 of a zip archive member.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        url: str | None = None,
+        algorithm: str | None = None,
+        expected: str | None = None,
+        actual: str | None = None,
+    ) -> None:
+        """
+        Initialize a checksum mismatch error.
+
+        Args:
+            message: Error description
+            url: URL being downloaded
+            algorithm: Checksum algorithm, e.g. "crc32"
+            expected: Checksum the data should have had
+            actual: Checksum of the data actually received
+        """
+        context: dict[str, Any] = {}
+        if url:
+            context["url"] = url
+        if algorithm:
+            context["algorithm"] = algorithm
+        if expected is not None:
+            context["expected"] = expected
+        if actual is not None:
+            context["actual"] = actual
+
+        super().__init__(message, context)
+        self.url = url
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+
+    def error_type(self) -> str:
+        return "ChecksumMismatchError"
+
+
+class ArchiveError(HttpError):
+    """
+    Downloaded archive could not be read.
+
+    This occurs when a file is not a valid zip archive, or when a member uses
+    encryption or a compression method that cannot be extracted.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        url: str | None = None,
+        member: str | None = None,
+    ) -> None:
+        """
+        Initialize an archive error.
+
+        Args:
+            message: Error description
+            url: URL of the archive
+            member: Name of the archive member that could not be extracted
+        """
+        context: dict[str, Any] = {}
+        if url:
+            context["url"] = url
+        if member:
+            context["member"] = member
+
+        super().__init__(message, context)
+        self.url = url
+        self.member = member
+
+    def error_type(self) -> str:
+        return "ArchiveError"
+
+
+class CircuitOpenError(HttpError):
+    """
+    Request was not sent because the endpoint's circuit breaker is open.
+
+    The breaker opens after an endpoint has been failing or responding slowly,
+    so requests fail immediately instead of waiting for a timeout. It lets a
+    probe request through once ``retry_after`` seconds have passed.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        endpoint: str | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Initialize a circuit open error.
+
+        Args:
+            message: Error description
+            endpoint: The endpoint whose breaker is open, e.g. "GET /cos/{contract_id}/"
+            retry_after: Seconds until the breaker lets a probe request through
+        """
+        context: dict[str, Any] = {}
+        if endpoint:
+            context["endpoint"] = endpoint
+        if retry_after is not None:
+            context["retry_after"] = round(retry_after, 1)
+
+        super().__init__(message, context)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+    def error_type(self) -> str:
+        return "CircuitOpenError"
+
+
+class RateLimitExceededError(HttpError):
+    """
+    Request was not sent because it would exceed the client-side rate limit.
+
+    Raised instead of waiting when the rate limiter's policy is to fail fast,
+    or when the wait would be longer than its ``max_wait``.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        key: str | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Initialize a rate limit exceeded error.
+
+        Args:
+            message: Error description
+            key: The rate-limited API or endpoint, e.g. "/otm/v2"
+            retry_after: Seconds until a request would be allowed
+        """
+        context: dict[str, Any] = {}
+        if key:
+            context["key"] = key
+        if retry_after is not None:
+            context["retry_after"] = round(retry_after, 1)
+
+        super().__init__(message, context)
+        self.key = key
+        self.retry_after = retry_after
+
+    def error_type(self) -> str:
+        return "RateLimitExceededError"
+
+
+class DeadlineExceededError(HttpError):
+    """
+    A call did not finish within its time limit.
+
+    Returned by the batch helpers for calls that ran past their per-call
+    timeout, or that had not finished when the batch's deadline passed.
+    """
+
+    def __init__(self, message: str, timeout: float | None = None) -> None:
+        """
+        Initialize a deadline exceeded error.
+
+        Args:
+            message: Error description
+            timeout: The time limit in seconds that was exceeded
+        """
+        context: dict[str, Any] = {}
+        if timeout is not None:
+            context["timeout"] = timeout
+
+        super().__init__(message, context)
+        self.timeout = timeout
+
+    def error_type(self) -> str:
+        return "DeadlineExceededError"
+
+
 # ============================================================================
 # HTTP Status Errors - 4xx and 5xx response codes
 # ============================================================================
@@ -479,6 +702,35 @@ class RequestValidationError(HttpError):
         return "RequestValidationError"
 
 
+class UnexpectedError(HttpError):
+    """
+    A call raised an exception that is not an HttpError.
+
+    Returned by the bulk and batch helpers, which report every call's outcome
+    as a Result instead of letting one exception abort the rest.
+    """
+
+    def __init__(self, message: str, original_error: Exception) -> None:
+        """
+        Initialize an unexpected error.
+
+        Args:
+            message: Error description
+            original_error: The exception that was raised
+        """
+        super().__init__(
+            message,
+            {
+                "original_error": str(original_error),
+                "original_type": type(original_error).__name__,
+            },
+        )
+        self.original_error = original_error
+
+    def error_type(self) -> str:
+        return "UnexpectedError"
+
+
 __all__ = [
     "HttpError",
     # Transport errors
@@ -487,6 +739,12 @@ __all__ = [
     "ReadTimeoutError",
     "SSLError",
     "ProxyError",
+    "IncompleteDownloadError",
+    "ChecksumMismatchError",
+    "ArchiveError",
+    "CircuitOpenError",
+    "RateLimitExceededError",
+    "DeadlineExceededError",
     # HTTP status errors
     "HttpStatusError",
     "ClientError",
@@ -496,4 +754,5 @@ __all__ = [
     "TextDecodeError",
     # Validation errors
     "RequestValidationError",
+    "UnexpectedError",
 ]
@@ -1,13 +1,19 @@
 import pytest
 
 from satvu.http.errors import (
+    ArchiveError,
+    ChecksumMismatchError,
+    CircuitOpenError,
     ClientError,
     ConnectionTimeoutError,
+    DeadlineExceededError,
     HttpError,
     HttpStatusError,
+    IncompleteDownloadError,
     JsonDecodeError,
     NetworkError,
     ProxyError,
+    RateLimitExceededError,
     ReadTimeoutError,
     RequestValidationError,
     ServerError,
@@ -139,6 +145,110 @@ class TestProxyError:
         assert err.context.get("proxy") == "http://proxy:8080"
 
 
+class TestIncompleteDownloadError:
+    """Tests for IncompleteDownloadError."""
+
+    def test_construction(self):
+        """IncompleteDownloadError records expected and received sizes."""
+        err = IncompleteDownloadError(
+            "Download ended early",
+            url="https://files.example.com/order.zip",
+            expected_bytes=100,
+            received_bytes=40,
+        )
+        assert err.expected_bytes == 100
+        assert err.received_bytes == 40
+        assert err.context == {
+            "url": "https://files.example.com/order.zip",
+            "expected_bytes": 100,
+            "received_bytes": 40,
+        }
+
+    def test_error_type(self):
+        """error_type() returns correct identifier."""
+        assert IncompleteDownloadError("test").error_type() == "IncompleteDownloadError"
+
+
+class TestChecksumMismatchError:
+    """Tests for ChecksumMismatchError."""
+
+    def test_construction(self):
+        err = ChecksumMismatchError(
+            "CRC-32 mismatch",
+            url="https://files.example.com/order.zip",
+            algorithm="crc32",
+            expected="0000abcd",
+            actual="0000dcba",
+        )
+        assert err.algorithm == "crc32"
+        assert err.context == {
+            "url": "https://files.example.com/order.zip",
+            "algorithm": "crc32",
+            "expected": "0000abcd",
+            "actual": "0000dcba",
+        }
+        assert err.error_type() == "ChecksumMismatchError"
+
+
+class TestArchiveError:
+    """Tests for ArchiveError."""
+
+    def test_construction(self):
+        err = ArchiveError("Encrypted member", member="image.tif")
+        assert err.member == "image.tif"
+        assert err.context == {"member": "image.tif"}
+        assert err.error_type() == "ArchiveError"
+
+
+class TestCircuitOpenError:
+    """Tests for CircuitOpenError."""
+
+    def test_construction(self):
+        """CircuitOpenError records the endpoint and time until the next probe."""
+        err = CircuitOpenError(
+            "Circuit open", endpoint="GET /otm/{contract_id}/", retry_after=12.345
+        )
+        assert err.endpoint == "GET /otm/{contract_id}/"
+        assert err.retry_after == 12.345
+        assert err.context == {
+            "endpoint": "GET /otm/{contract_id}/",
+            "retry_after": 12.3,
+        }
+
+    def test_error_type(self):
+        """error_type() returns correct identifier."""
+        assert CircuitOpenError("test").error_type() == "CircuitOpenError"
+
+
+class TestRateLimitExceededError:
+    """Tests for RateLimitExceededError."""
+
+    def test_construction(self):
+        """RateLimitExceededError records the limiter key and time until allowed."""
+        err = RateLimitExceededError("Rate limited", key="/otm/v2", retry_after=0.456)
+        assert err.key == "/otm/v2"
+        assert err.retry_after == 0.456
+        assert err.context == {"key": "/otm/v2", "retry_after": 0.5}
+
+    def test_error_type(self):
+        """error_type() returns correct identifier."""
+        assert RateLimitExceededError("test").error_type() == "RateLimitExceededError"
+
+
+class TestDeadlineExceededError:
+    """Tests for DeadlineExceededError."""
+
+    def test_construction(self):
+        """DeadlineExceededError records the exceeded time limit."""
+        err = DeadlineExceededError("Too slow", timeout=2.5)
+        assert err.timeout == 2.5
+        assert err.context == {"timeout": 2.5}
+
+    def test_error_type(self):
+        """error_type() returns correct identifier."""
+        assert DeadlineExceededError("test").error_type() == "DeadlineExceededError"
+
+
 class TestHttpStatusError:
     """Tests for HttpStatusError base class."""
 
@@ -327,6 +437,7 @@ class TestErrorHierarchy:
             JsonDecodeError("test"),
             TextDecodeError("test"),
             RequestValidationError("test"),
+            CircuitOpenError("test"),
         ]
         for err in errors:
             assert isinstance(err, HttpError)
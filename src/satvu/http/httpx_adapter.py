@@ -1,7 +1,8 @@
 """HTTPX HTTP adapter."""
 
+import inspect
 import json as json_lib
-from collections.abc import Callable, Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Any, cast
 
 try:
@@ -12,6 +13,7 @@ except ImportError as exc:
         'Install it with: pip install "satvu[http-httpx]"'
     ) from exc
 
+from satvu.http.buffers import BytesReader, ChunkReader, byte_view
 from satvu.http.errors import (
     ClientError,
     ConnectionTimeoutError,
@@ -23,7 +25,8 @@ from satvu.http.errors import (
     SSLError,
     TextDecodeError,
 )
-from satvu.http.protocol import HttpMethod, HttpResponse
+from satvu.http.protocol import AsyncHttpResponse, HttpMethod, HttpResponse
+from satvu.http.trace import RequestTrace, current_trace
 from satvu.result import Err, Ok, Result, is_err
 
 
@@ -32,6 +35,7 @@ class HttpxResponse:
 
     def __init__(self, response: httpx.Response):
         self._response = response
+        self._reader: BytesReader | ChunkReader | None = None
 
     @property
     def status_code(self) -> int:
@@ -43,7 +47,8 @@ class HttpxResponse:
 
     @property
     def body(self) -> bytes:
-        return self._response.content
+        # read() returns the content, reading it first for streamed responses
+        return self._response.read()
 
     def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes]:
         """
@@ -72,9 +77,36 @@ class HttpxResponse:
         # It handles all the complexity: chunked encoding, compression, etc.
         return self._response.iter_bytes(chunk_size=chunk_size)
 
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Copy the next part of the body into a preallocated buffer."""
+        return self._body_reader(len(byte_view(buffer))).readinto(buffer)
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[memoryview]:
+        """
+        Yield the body as memoryviews of up to len(buffer) bytes.
+
+        httpx has no readinto() on its responses. A body already in memory is
+        yielded as slices of it; a streamed one as views of the chunks httpx
+        decodes from the connection. Neither is copied into ``buffer``.
+        """
+        return self._body_reader(len(byte_view(buffer))).iter_into(buffer)
+
+    def _body_reader(self, chunk_size: int) -> BytesReader | ChunkReader:
+        if self._reader is None:
+            try:
+                self._reader = BytesReader(self._response.content)
+            except httpx.ResponseNotRead:
+                self._reader = ChunkReader(self._response.iter_bytes(chunk_size))
+        return self._reader
+
+    def close(self) -> None:
+        """Release the connection of a streamed response that was not read."""
+        self._response.close()
+
     @property
     def text(self) -> Result[str, TextDecodeError]:
         """Decode response body as text with error handling."""
+        self._response.read()
         try:
             return Ok(self._response.text)
         except UnicodeDecodeError as e:
@@ -134,7 +166,8 @@ class HttpxAdapter:
         Args:
             base_url: Optional base URL for all requests. Relative URLs will be joined to this.
             client: Optional pre-configured httpx.Client instance. If not provided,
-                   a new client will be created.
+                   a new client will be created. A client can be shared by several
+                   adapters with different base URLs.
             get_token: Optional callback to get the current access token. Will be called
                       before each request to support token refresh.
         """
@@ -142,15 +175,23 @@ class HttpxAdapter:
         if client is not None:
             self.client = client
             self._owns_client = False
+            # A shared client serves several base URLs, so join them here
+            self.base_url = base_url.rstrip("/") if base_url else ""
         else:
             self.client = httpx.Client(base_url=base_url or "")
             self._owns_client = True
+            self.base_url = ""
 
     def __del__(self):
         """Clean up client if we own it."""
         if self._owns_client and hasattr(self, "client"):
             self.client.close()
 
+    def _full_url(self, url: str) -> str:
+        if self.base_url and not url.startswith(("http://", "https://")):
+            return f"{self.base_url}/{url.lstrip('/')}"
+        return url
+
     def request(
         self,
         method: HttpMethod,
@@ -162,6 +203,7 @@ class HttpxAdapter:
         data: dict[str, str] | None = None,
         timeout: float = 5.0,
         follow_redirects: bool = False,
+        stream: bool = False,
     ) -> Result[
         HttpResponse,
         ClientError
@@ -183,118 +225,279 @@ class HttpxAdapter:
         if params:
             params = {k: v for k, v in params.items() if v is not None}
 
+        trace = current_trace()
         try:
-            response = self.client.request(
+            request = self.client.build_request(
                 method=method,
-                url=url,
+                url=self._full_url(url),
                 headers=req_headers,
                 params=params,
                 json=json,
                 data=data,
                 timeout=timeout,
-                follow_redirects=follow_redirects,
+                extensions={"trace": _trace_callback(trace)} if trace else None,
             )
+            response = self.client.send(
+                request, follow_redirects=follow_redirects, stream=stream
+            )
+            if trace is not None and trace.ttfb is None:
+                trace.responded()
 
-            response_wrapper = HttpxResponse(response)
-
-            # Check for error status codes
-            if 400 <= response.status_code < 500:
-                return Err(
-                    ClientError(
-                        message=f"Client error: {response.status_code}",
-                        status_code=response.status_code,
-                        url=str(response.url),
-                        response_body=response.content,
-                        response_headers=dict(response.headers.items()),
-                    )
-                )
-            elif 500 <= response.status_code < 600:
-                return Err(
-                    ServerError(
-                        message=f"Server error: {response.status_code}",
-                        status_code=response.status_code,
-                        url=str(response.url),
-                        response_body=response.content,
-                        response_headers=dict(response.headers.items()),
-                    )
-                )
+            if stream and response.is_error:
+                response.read()
+            status_error = _status_error(response)
+            if status_error is not None:
+                return Err(status_error)
 
-            return Ok(cast(HttpResponse, response_wrapper))
+            return Ok(cast(HttpResponse, HttpxResponse(response)))
 
-        except httpx.ConnectTimeout as e:
-            return Err(
-                ConnectionTimeoutError(
-                    message=f"Connection timeout after {timeout} seconds",
-                    url=url,
-                    timeout=timeout,
-                    original_error=e,
-                )
-            )
+        except httpx.HTTPError as e:
+            return Err(_transport_error(e, url, timeout))
 
-        except httpx.ReadTimeout as e:
-            return Err(
-                ReadTimeoutError(
-                    message=f"Read timeout after {timeout} seconds",
-                    url=url,
-                    timeout=timeout,
-                    original_error=e,
-                )
-            )
 
-        except httpx.TimeoutException as e:
-            # Generic timeout (could be connect, read, write, or pool)
-            return Err(
-                ReadTimeoutError(
-                    message=f"Request timeout after {timeout} seconds",
-                    url=url,
-                    timeout=timeout,
-                    original_error=e,
-                )
-            )
+class AsyncHttpxResponse(HttpxResponse):
+    """Wrapper for httpx Response returned by an AsyncClient."""
 
-        except httpx.ProxyError as e:
-            return Err(
-                ProxyError(
-                    message=f"Proxy error: {e}",
-                    url=url,
-                    original_error=e,
-                )
-            )
+    def aiter_bytes(self, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+        """
+        Asynchronously stream response body in chunks.
 
-        except httpx.ConnectError as e:
-            # SSL/TLS errors are a type of ConnectError in httpx
-            if "SSL" in str(e) or "TLS" in str(e) or "certificate" in str(e).lower():
-                return Err(
-                    SSLError(
-                        message=f"SSL/TLS error: {e}",
-                        url=url,
-                        original_error=e,
-                    )
-                )
-            return Err(
-                NetworkError(
-                    message=f"Connection error: {e}",
-                    url=url,
-                    original_error=e,
-                )
-            )
+        Args:
+            chunk_size: Number of bytes to read per chunk (default: 8KB)
 
-        except httpx.NetworkError as e:
-            # Generic network error (base class for connect, timeout, etc.)
-            return Err(
-                NetworkError(
-                    message=f"Network error: {e}",
-                    url=url,
-                    original_error=e,
-                )
+        Yields:
+            Chunks of bytes from the response body
+        """
+        return self._response.aiter_bytes(chunk_size=chunk_size)
+
+    async def aclose(self) -> None:
+        """Release the connection of a streamed response that was not read."""
+        await self._response.aclose()
+
+
+class AsyncHttpxAdapter:
+    """
+    Asynchronous HTTP client adapter using httpx.AsyncClient.
+
+    Lets a single event loop keep many requests in flight over one
+    connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        get_token: Callable[[], Awaitable[str] | str] | None = None,
+    ):
+        """
+        Initialize the async httpx adapter.
+
+        Args:
+            base_url: Optional base URL for all requests. Relative URLs will be joined to this.
+            client: Optional pre-configured httpx.AsyncClient instance. If not provided,
+                   a new client will be created. A client can be shared by several
+                   adapters with different base URLs.
+            get_token: Optional callback to get the current access token. May be a
+                      coroutine function. Will be called before each request to support
+                      token refresh.
+        """
+        self.get_token = get_token
+        if client is not None:
+            self.client = client
+            self._owns_client = False
+            # A shared client serves several base URLs, so join them here
+            self.base_url = base_url.rstrip("/") if base_url else ""
+        else:
+            self.client = httpx.AsyncClient(base_url=base_url or "")
+            self._owns_client = True
+            self.base_url = ""
+
+    async def aclose(self) -> None:
+        """Close the underlying client if we own it."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    def _full_url(self, url: str) -> str:
+        if self.base_url and not url.startswith(("http://", "https://")):
+            return f"{self.base_url}/{url.lstrip('/')}"
+        return url
+
+    async def request(
+        self,
+        method: HttpMethod,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | list | None = None,
+        data: dict[str, str] | None = None,
+        timeout: float = 5.0,
+        follow_redirects: bool = False,
+        stream: bool = False,
+    ) -> Result[
+        AsyncHttpResponse,
+        ClientError
+        | ServerError
+        | NetworkError
+        | ConnectionTimeoutError
+        | ReadTimeoutError
+        | SSLError
+        | ProxyError,
+    ]:
+        """Make an HTTP request using httpx.AsyncClient."""
+        req_headers = headers.copy() if headers else {}
+        if self.get_token:
+            token = self.get_token()
+            if inspect.isawaitable(token):
+                token = await token
+            req_headers["Authorization"] = f"Bearer {token}"
+
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+
+        trace = current_trace()
+        try:
+            request = self.client.build_request(
+                method=method,
+                url=self._full_url(url),
+                headers=req_headers,
+                params=params,
+                json=json,
+                data=data,
+                timeout=timeout,
+                extensions={"trace": _async_trace_callback(trace)} if trace else None,
             )
+            response = await self.client.send(
+                request, follow_redirects=follow_redirects, stream=stream
+            )
+            if trace is not None and trace.ttfb is None:
+                trace.responded()
+
+            if stream and response.is_error:
+                await response.aread()
+            status_error = _status_error(response)
+            if status_error is not None:
+                return Err(status_error)
+
+            return Ok(cast(AsyncHttpResponse, AsyncHttpxResponse(response)))
 
         except httpx.HTTPError as e:
-            # Catch-all for any other httpx HTTP errors
-            return Err(
-                NetworkError(
-                    message=f"HTTP error: {e}",
-                    url=url,
-                    original_error=e,
-                )
+            return Err(_transport_error(e, url, timeout))
+
+
+def _record_phase(trace: RequestTrace, event_name: str) -> None:
+    """Record the phase an httpcore trace event ends or starts."""
+    if event_name == "connection.connect_tcp.started":
+        trace.connecting()
+    elif event_name in (
+        "connection.connect_tcp.complete",
+        "connection.start_tls.complete",
+    ):
+        trace.connected()
+    elif event_name.endswith(".receive_response_headers.complete"):
+        trace.responded()
+    elif event_name.endswith(".receive_response_body.complete"):
+        trace.downloaded()
+
+
+def _trace_callback(trace: RequestTrace) -> Callable[[str, dict[str, Any]], None]:
+    def callback(event_name: str, info: dict[str, Any]) -> None:
+        _record_phase(trace, event_name)
+
+    return callback
+
+
+def _async_trace_callback(
+    trace: RequestTrace,
+) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+    async def callback(event_name: str, info: dict[str, Any]) -> None:
+        _record_phase(trace, event_name)
+
+    return callback
+
+
+def _status_error(response: httpx.Response) -> ClientError | ServerError | None:
+    """Build the error for a 4xx/5xx response, or None for any other status."""
+    if 400 <= response.status_code < 500:
+        return ClientError(
+            message=f"Client error: {response.status_code}",
+            status_code=response.status_code,
+            url=str(response.url),
+            response_body=response.content,
+            response_headers=dict(response.headers.items()),
+        )
+    elif 500 <= response.status_code < 600:
+        return ServerError(
+            message=f"Server error: {response.status_code}",
+            status_code=response.status_code,
+            url=str(response.url),
+            response_body=response.content,
+            response_headers=dict(response.headers.items()),
+        )
+    return None
+
+
+def _transport_error(
+    e: httpx.HTTPError, url: str, timeout: float
+) -> NetworkError | ConnectionTimeoutError | ReadTimeoutError | SSLError | ProxyError:
+    """Map an httpx exception onto the SDK's transport error types."""
+    if isinstance(e, httpx.ConnectTimeout):
+        return ConnectionTimeoutError(
+            message=f"Connection timeout after {timeout} seconds",
+            url=url,
+            timeout=timeout,
+            original_error=e,
+        )
+
+    if isinstance(e, httpx.ReadTimeout):
+        return ReadTimeoutError(
+            message=f"Read timeout after {timeout} seconds",
+            url=url,
+            timeout=timeout,
+            original_error=e,
+        )
+
+    if isinstance(e, httpx.TimeoutException):
+        # Generic timeout (could be connect, read, write, or pool)
+        return ReadTimeoutError(
+            message=f"Request timeout after {timeout} seconds",
+            url=url,
+            timeout=timeout,
+            original_error=e,
+        )
+
+    if isinstance(e, httpx.ProxyError):
+        return ProxyError(
+            message=f"Proxy error: {e}",
+            url=url,
+            original_error=e,
+        )
+
+    if isinstance(e, httpx.ConnectError):
+        # SSL/TLS errors are a type of ConnectError in httpx
+        if "SSL" in str(e) or "TLS" in str(e) or "certificate" in str(e).lower():
+            return SSLError(
+                message=f"SSL/TLS error: {e}",
+                url=url,
+                original_error=e,
             )
+        return NetworkError(
+            message=f"Connection error: {e}",
+            url=url,
+            original_error=e,
+        )
+
+    if isinstance(e, httpx.NetworkError):
+        # Generic network error (base class for connect, timeout, etc.)
+        return NetworkError(
+            message=f"Network error: {e}",
+            url=url,
+            original_error=e,
+        )
+
+    # Catch-all for any other httpx HTTP errors
+    return NetworkError(
+        message=f"HTTP error: {e}",
+        url=url,
+        original_error=e,
+    )
@@ -1,11 +1,20 @@
 """Tests for HttpxAdapter."""
 
+import asyncio
+
 import httpx
 import pook
 import pytest
 
-from satvu.http import is_ok
-from satvu.http.httpx_adapter import HttpxAdapter
+from satvu.http import is_err, is_ok
+from satvu.http.errors import NetworkError, ServerError
+from satvu.http.httpx_adapter import (
+    AsyncHttpxAdapter,
+    AsyncHttpxResponse,
+    HttpxAdapter,
+    HttpxResponse,
+)
+from satvu.http.trace import tracing
 
 
 @pytest.fixture
@@ -234,3 +243,222 @@ def test_adapter_cleanup():
     # Client should be closed (attempting to use it will raise an error)
     with pytest.raises(RuntimeError, match="close"):
         adapter.client.get("/test")
+
+
+def _async_adapter(handler, **kwargs) -> AsyncHttpxAdapter:
+    """Create an AsyncHttpxAdapter answering requests with ``handler``."""
+    client = httpx.AsyncClient(
+        base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+    )
+    return AsyncHttpxAdapter(client=client, **kwargs)
+
+
+def test_async_get_request():
+    """Test basic async GET request."""
+    adapter = _async_adapter(
+        lambda request: httpx.Response(200, json={"users": ["alice", "bob"]})
+    )
+
+    result = asyncio.run(adapter.request("GET", "/users"))
+
+    assert is_ok(result), f"Expected Ok but got: {result}"
+    assert result.unwrap().json().unwrap() == {"users": ["alice", "bob"]}
+
+
+def test_async_server_error():
+    """Test async 5xx responses map to ServerError."""
+    adapter = _async_adapter(lambda request: httpx.Response(503))
+
+    result = asyncio.run(adapter.request("GET", "/users"))
+
+    assert is_err(result)
+    error = result.error()
+    assert isinstance(error, ServerError)
+    assert error.status_code == 503
+
+
+def test_async_connect_error():
+    """Test async transport errors map to NetworkError."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    adapter = _async_adapter(handler)
+
+    result = asyncio.run(adapter.request("GET", "/users"))
+
+    assert is_err(result)
+    assert isinstance(result.error(), NetworkError)
+
+
+def test_async_token_callback():
+    """Test sync and coroutine token callbacks both set the Authorization header."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200)
+
+    async def async_token() -> str:
+        return "async-token"
+
+    asyncio.run(_async_adapter(handler, get_token=async_token).request("GET", "/"))
+    asyncio.run(
+        _async_adapter(handler, get_token=lambda: "sync-token").request("GET", "/")
+    )
+
+    assert seen == ["Bearer async-token", "Bearer sync-token"]
+
+
+def test_async_aiter_bytes():
+    """Test async response body streaming."""
+    adapter = _async_adapter(lambda request: httpx.Response(200, content=b"a" * 100))
+
+    async def collect() -> bytes:
+        result = await adapter.request("GET", "/file")
+        return b"".join([c async for c in result.unwrap().aiter_bytes(chunk_size=30)])
+
+    assert asyncio.run(collect()) == b"a" * 100
+
+
+def test_async_adapter_aclose():
+    """Test that the async adapter closes the client it owns."""
+    adapter = AsyncHttpxAdapter(base_url="https://api.example.com")
+    assert adapter._owns_client is True
+
+    asyncio.run(adapter.aclose())
+
+    assert adapter.client.is_closed
+
+
+def test_iter_into_slices_body():
+    """Test that iter_into yields memoryview slices of the loaded body."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b"a" * 100)
+        )
+    )
+    response = HttpxAdapter(client=client).request("GET", "https://x/file").unwrap()
+
+    chunks = list(response.iter_into(bytearray(30)))
+
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert b"".join(chunks) == b"a" * 100
+
+
+def test_readinto():
+    """Test reading the body into a preallocated buffer."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b"abcdef")
+        )
+    )
+    response = HttpxAdapter(client=client).request("GET", "https://x/file").unwrap()
+    buffer = bytearray(4)
+
+    assert response.readinto(buffer) == 4
+    assert buffer == b"abcd"
+    assert response.readinto(buffer) == 2
+    assert buffer[:2] == b"ef"
+    assert response.readinto(buffer) == 0
+
+
+def test_trace_without_trace_events():
+    """Transports that emit no trace events still get a time to first byte."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200))
+    )
+
+    with tracing() as trace:
+        HttpxAdapter(client=client).request("GET", "https://x/a")
+
+    assert trace.ttfb is not None
+    assert trace.connect is None
+
+
+def test_stream_reads_body_lazily():
+    """With stream=True the body is read as it is iterated, not before."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=iter([b"ab", b"cd"]))
+        )
+    )
+    result = HttpxAdapter(client=client).request("GET", "https://x/file", stream=True)
+    response = result.unwrap()
+
+    assert isinstance(response, HttpxResponse)
+    assert not response._response.is_stream_consumed
+    assert b"".join(response.iter_bytes()) == b"abcd"
+
+
+def test_stream_close_releases_unread_body():
+    """close() releases a streamed response that was not read to the end."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=iter([b"ab", b"cd"]))
+        )
+    )
+    response = (
+        HttpxAdapter(client=client).request("GET", "https://x/f", stream=True).unwrap()
+    )
+    assert isinstance(response, HttpxResponse)
+
+    response.close()
+
+    assert response._response.is_closed
+
+
+def test_stream_error_response_keeps_body():
+    """Error responses to streamed requests still carry their body."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(503, content=iter([b"busy"]))
+        )
+    )
+    result = HttpxAdapter(client=client).request("GET", "https://x/file", stream=True)
+
+    assert is_err(result)
+    error = result.error()
+    assert isinstance(error, ServerError)
+    assert error.response_body == b"busy"
+
+
+def test_async_stream_aclose():
+    """Async streamed responses are read lazily and closed with aclose()."""
+
+    async def body():
+        yield b"ab"
+        yield b"cd"
+
+    adapter = _async_adapter(lambda request: httpx.Response(200, content=body()))
+
+    async def run():
+        response = (await adapter.request("GET", "/file", stream=True)).unwrap()
+        assert isinstance(response, AsyncHttpxResponse)
+        consumed = response._response.is_stream_consumed
+        await response.aclose()
+        return consumed, response._response.is_closed
+
+    assert asyncio.run(run()) == (False, True)
+
+
+def test_stream_readinto_reads_from_connection():
+    """readinto() on a streamed response reads chunks as they arrive."""
+    client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=iter([b"abc", b"def"]))
+        )
+    )
+    response = (
+        HttpxAdapter(client=client).request("GET", "https://x/f", stream=True).unwrap()
+    )
+    assert isinstance(response, HttpxResponse)
+    buffer = bytearray(4)
+
+    reads = []
+    while n := response.readinto(buffer):
+        reads.append(bytes(buffer[:n]))
+
+    assert b"".join(reads) == b"abcdef"
+    assert response._response.is_stream_consumed
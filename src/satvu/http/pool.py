@@ -0,0 +1,223 @@
+"""
+Connection pools shared by several HTTP clients.
+
+By default every SDK service creates its own HTTP client, so each keeps its
+own idle connections and performs its own TLS handshakes, although most of
+them talk to the same host. A ConnectionPool holds one pooled client of the
+chosen backend; ``client(base_url)`` returns lightweight adapters that send
+their requests through it, each with its own base URL and credentials.
+"""
+
+import importlib.util
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal, cast
+
+from satvu.http.protocol import AsyncHttpClient, HttpClient
+
+PoolBackend = Literal["auto", "httpx", "requests", "urllib3", "stdlib"]
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+def http2_available() -> bool:
+    """Whether httpx can negotiate HTTP/2 (the ``h2`` package is installed)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class ConnectionPool:
+    """
+    One pooled HTTP client shared by many SDK services.
+
+    Example:
+        >>> pool = ConnectionPool(max_connections=50, keepalive_expiry=30)
+        >>> sdk = SatVuSDK(client_id, client_secret, connection_pool=pool)
+        >>> ...
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        backend: PoolBackend = "auto",
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool | None = None,
+    ):
+        """
+        Args:
+            backend: HTTP library to pool connections with. "auto" picks the
+                first installed of httpx, requests and urllib3, falling back
+                to stdlib.
+            max_connections: Maximum number of open connections (per host
+                for requests and urllib3; stdlib does not limit them)
+            max_keepalive_connections: Maximum number of idle connections kept
+                open (per host for stdlib; requests and urllib3 keep up to
+                max_connections)
+            keepalive_expiry: Seconds an idle connection is kept open
+                (httpx and stdlib)
+            http2: Multiplex requests over HTTP/2 connections (httpx only).
+                None enables it when the ``h2`` package is installed.
+
+        Raises:
+            ImportError: If the requested backend is not installed
+        """
+        self.backend = _resolve_backend(backend)
+        self.http2 = self.backend == "httpx" and (
+            http2_available() if http2 is None else http2
+        )
+
+        if self.backend == "httpx":
+            import httpx
+
+            self._client: Any = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                http2=self.http2,
+            )
+        elif self.backend == "requests":
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._client = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=max_connections)
+            self._client.mount("https://", adapter)
+            self._client.mount("http://", adapter)
+        elif self.backend == "urllib3":
+            import urllib3
+
+            self._client = urllib3.PoolManager(maxsize=max_connections)
+        else:
+            from satvu.http.stdlib_adapter import KeepAlivePool
+
+            self._client = KeepAlivePool(
+                maxsize=max_keepalive_connections, keepalive_expiry=keepalive_expiry
+            )
+
+    def client(
+        self,
+        base_url: str | None = None,
+        get_token: Callable[[], str] | None = None,
+    ) -> HttpClient:
+        """
+        Create an HTTP client that sends its requests through this pool.
+
+        Args:
+            base_url: Base URL that relative request URLs are joined to
+            get_token: Callback returning the access token for each request
+
+        Returns:
+            HttpClient: An adapter using the shared pooled client
+        """
+        if self.backend == "httpx":
+            from satvu.http.httpx_adapter import HttpxAdapter
+
+            adapter: Any = HttpxAdapter(
+                base_url=base_url, client=self._client, get_token=get_token
+            )
+        elif self.backend == "requests":
+            from satvu.http.requests_adapter import RequestsAdapter
+
+            adapter = RequestsAdapter(
+                base_url=base_url, session=self._client, get_token=get_token
+            )
+        elif self.backend == "urllib3":
+            from satvu.http.urllib3_adapter import Urllib3Adapter
+
+            adapter = Urllib3Adapter(
+                base_url=base_url, pool_manager=self._client, get_token=get_token
+            )
+        else:
+            from satvu.http.stdlib_adapter import StdlibAdapter
+
+            adapter = StdlibAdapter(
+                base_url=base_url, get_token=get_token, pool=self._client
+            )
+        return cast(HttpClient, adapter)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if self.backend in ("urllib3", "stdlib"):
+            self._client.clear()
+        else:
+            self._client.close()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class AsyncConnectionPool:
+    """
+    One pooled httpx.AsyncClient shared by many async SDK services.
+
+    Async counterpart of ConnectionPool; see it for the options.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool | None = None,
+    ):
+        import httpx
+
+        self.http2 = http2_available() if http2 is None else http2
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=self.http2,
+        )
+
+    def client(
+        self,
+        base_url: str | None = None,
+        get_token: Callable[[], Awaitable[str] | str] | None = None,
+    ) -> AsyncHttpClient:
+        """Create an async HTTP client that sends its requests through this pool."""
+        from satvu.http.httpx_adapter import AsyncHttpxAdapter
+
+        return cast(
+            AsyncHttpClient,
+            AsyncHttpxAdapter(
+                base_url=base_url, client=self._client, get_token=get_token
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncConnectionPool":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+def _resolve_backend(backend: PoolBackend) -> str:
+    if backend == "stdlib":
+        return backend
+    if backend != "auto":
+        if importlib.util.find_spec(backend) is None:
+            raise ImportError(f'The "{backend}" backend is not installed')
+        return backend
+    for name in ("httpx", "requests", "urllib3"):
+        if importlib.util.find_spec(name) is not None:
+            return name
+    return "stdlib"
+
+
+__all__ = ["AsyncConnectionPool", "ConnectionPool", "http2_available"]
@@ -0,0 +1,111 @@
+"""Tests for ConnectionPool and AsyncConnectionPool."""
+
+import asyncio
+
+import pook
+import pytest
+
+from satvu.http import is_ok
+from satvu.http.pool import AsyncConnectionPool, ConnectionPool
+
+
+@pytest.mark.parametrize("backend", ["httpx", "requests", "urllib3", "stdlib"])
+@pook.on
+def test_clients_share_the_pooled_client(backend):
+    """Clients of one pool send through the same client with their own base URLs."""
+    pook.get("https://api.example.com/catalog/v1/search").reply(200).json({"a": 1})
+    pook.get("https://api.example.com/otm/v2/orders").reply(200).json({"b": 2})
+
+    with ConnectionPool(backend) as pool:
+        catalog = pool.client("https://api.example.com/catalog/v1/")
+        otm = pool.client("https://api.example.com/otm/v2")
+
+        assert pool.backend == backend
+        catalog_result = catalog.request("GET", "/search")
+        otm_result = otm.request("GET", "orders")
+
+    assert is_ok(catalog_result), f"Expected Ok but got: {catalog_result}"
+    assert catalog_result.unwrap().json().unwrap() == {"a": 1}
+    assert is_ok(otm_result), f"Expected Ok but got: {otm_result}"
+    assert otm_result.unwrap().json().unwrap() == {"b": 2}
+
+
+def test_httpx_clients_use_one_client():
+    with ConnectionPool("httpx") as pool:
+        first = pool.client("https://api.example.com/catalog/v1")
+        second = pool.client("https://api.example.com/otm/v2")
+
+        assert first.client is second.client  # type: ignore[attr-defined]
+        assert first.client is pool._client  # type: ignore[attr-defined]
+
+
+def test_limits_configure_httpx_client():
+    with ConnectionPool(
+        "httpx", max_connections=7, max_keepalive_connections=3, keepalive_expiry=9
+    ) as pool:
+        pool_limits = pool._client._transport._pool
+        assert pool_limits._max_connections == 7
+        assert pool_limits._max_keepalive_connections == 3
+        assert pool_limits._keepalive_expiry == 9
+
+
+def test_http2_defaults_to_h2_availability(monkeypatch):
+    monkeypatch.setattr("satvu.http.pool.http2_available", lambda: False)
+    with ConnectionPool("httpx") as pool:
+        assert pool.http2 is False
+
+
+def test_http2_only_applies_to_httpx():
+    with ConnectionPool("requests", http2=True) as pool:
+        assert pool.http2 is False
+
+
+@pook.on
+def test_absolute_urls_are_not_joined():
+    """Signed download URLs are absolute and bypass the base URL."""
+    pook.get("https://downloads.example.com/file.zip").reply(200).body(b"zip")
+
+    with ConnectionPool("httpx") as pool:
+        client = pool.client("https://api.example.com/catalog/v1")
+        result = client.request("GET", "https://downloads.example.com/file.zip")
+
+    assert is_ok(result), f"Expected Ok but got: {result}"
+    assert result.unwrap().body == b"zip"
+
+
+@pook.on
+def test_token_is_per_client():
+    pook.get("https://api.example.com/a").header(
+        "Authorization", "Bearer secret"
+    ).reply(200)
+    pook.get("https://api.example.com/b").reply(200)
+
+    with ConnectionPool("httpx") as pool:
+        authed = pool.client("https://api.example.com", get_token=lambda: "secret")
+        anonymous = pool.client("https://api.example.com")
+
+        assert is_ok(authed.request("GET", "/a"))
+        assert is_ok(anonymous.request("GET", "/b"))
+        assert anonymous.get_token is None  # type: ignore[attr-defined]
+
+
+def test_backend_not_installed(monkeypatch):
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    with pytest.raises(ImportError):
+        ConnectionPool("requests")
+
+
+@pook.on
+def test_async_pool():
+    pook.get("https://api.example.com/catalog/v1/search").reply(200).json({"a": 1})
+
+    async def run():
+        async with AsyncConnectionPool(http2=False) as pool:
+            first = pool.client("https://api.example.com/catalog/v1")
+            second = pool.client("https://api.example.com/otm/v2")
+            assert first.client is second.client  # type: ignore[attr-defined]
+            return await first.request("GET", "/search")
+
+    result = asyncio.run(run())
+    assert is_ok(result), f"Expected Ok but got: {result}"
+    assert result.unwrap().json().unwrap() == {"a": 1}
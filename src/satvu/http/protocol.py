@@ -1,6 +1,6 @@
 """HTTP client protocol definitions for SDK adapters."""
 
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 if TYPE_CHECKING:
@@ -60,6 +60,43 @@ class HttpResponse(Protocol):
         """
         ...
 
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """
+        Read the next part of the body into a preallocated buffer.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            Number of bytes read, which may be less than len(buffer), or 0 at
+            the end of the body
+
+        Important:
+            Like iter_bytes(), this consumes the response stream
+        """
+        ...
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[memoryview]:
+        """
+        Stream the body through one reused buffer instead of a new bytes
+        object per chunk.
+
+        Args:
+            buffer: Writable buffer; its size sets the chunk size
+
+        Yields:
+            memoryview of each chunk, valid only until the next one is
+            requested. Chunks are read into ``buffer``, except when the body
+            is already in memory: then slices of it are yielded directly.
+
+        Example:
+            >>> buffer = bytearray(1024 * 1024)
+            >>> with open("output.zip", "wb") as f:
+            ...     for chunk in response.iter_into(buffer):
+            ...         f.write(chunk)
+        """
+        ...
+
     @property
     def text(self) -> "Result[str, TextDecodeError]":
         """
@@ -94,6 +131,7 @@ class HttpClient(Protocol):
         data: dict[str, str] | None = None,
         timeout: float = 5.0,
         follow_redirects: bool = False,
+        stream: bool = False,
     ) -> "Result[HttpResponse, HttpError]":
         """
         Make an HTTP request.
@@ -107,6 +145,10 @@ class HttpClient(Protocol):
             data: Optional form data (for form-encoded requests)
             timeout: Request timeout in seconds
             follow_redirects: Whether to follow redirects
+            stream: Return once the headers arrive and read the body from the
+                connection as it is iterated, instead of reading it first.
+                Responses that are not read to the end should be closed with
+                their close() method, if they have one.
 
         Returns:
             Result containing either:
@@ -130,3 +172,65 @@ class HttpClient(Protocol):
             ...         print(f"Failed: {error}")
         """
         ...
+
+
+class AsyncHttpResponse(HttpResponse, Protocol):
+    """
+    Protocol for responses returned by an AsyncHttpClient.
+
+    Extends HttpResponse with an asynchronous streaming iterator. The body, text
+    and json accessors behave exactly as they do for synchronous responses.
+    """
+
+    def aiter_bytes(self, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+        """
+        Asynchronously stream the response body in chunks.
+
+        Args:
+            chunk_size: Number of bytes to read per chunk (default: 8KB)
+
+        Yields:
+            Chunks of bytes from the response body
+
+        Example:
+            >>> result = await client.request("GET", "https://api.example.com/file.zip")
+            >>> response = result.unwrap()
+            >>> async for chunk in response.aiter_bytes(chunk_size=65536):
+            ...     handle(chunk)
+        """
+        ...
+
+
+class AsyncHttpClient(Protocol):
+    """Protocol defining the interface for asynchronous HTTP clients."""
+
+    async def request(
+        self,
+        method: HttpMethod,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | list | None = None,
+        data: dict[str, str] | None = None,
+        timeout: float = 5.0,
+        follow_redirects: bool = False,
+        stream: bool = False,
+    ) -> "Result[AsyncHttpResponse, HttpError]":
+        """
+        Make an HTTP request without blocking the event loop.
+
+        Accepts the same arguments and returns the same Result variants as
+        HttpClient.request(), see its documentation for details. Streamed
+        responses are closed with their aclose() method.
+
+        Example:
+            >>> result = await client.request("GET", "https://api.example.com/data")
+            >>> if is_ok(result):
+            ...     print(result.unwrap().status_code)
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Release any connections held by the client."""
+        ...
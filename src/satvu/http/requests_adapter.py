@@ -12,6 +12,7 @@ except ImportError as exc:
         'Install it with: pip install "satvu[http-requests]"'
     ) from exc
 
+from satvu.http.buffers import BytesReader
 from satvu.http.errors import (
     ClientError,
     ConnectionTimeoutError,
@@ -24,6 +25,7 @@ from satvu.http.errors import (
     TextDecodeError,
 )
 from satvu.http.protocol import HttpMethod, HttpResponse
+from satvu.http.trace import current_trace
 from satvu.result import Err, Ok, Result, is_err
 
 
@@ -32,6 +34,7 @@ class RequestsResponse:
 
     def __init__(self, response: requests.Response):
         self._response = response
+        self._reader: BytesReader | None = None
 
     @property
     def status_code(self) -> int:
@@ -73,6 +76,28 @@ class RequestsResponse:
         # decode_unicode=False ensures we get bytes, not strings
         return self._response.iter_content(chunk_size=chunk_size, decode_unicode=False)
 
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """Copy the next part of the body into a preallocated buffer."""
+        return self._body_reader().readinto(buffer)
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[memoryview]:
+        """
+        Yield the body as memoryview slices of len(buffer) bytes.
+
+        requests has no readinto() on its responses, but the adapter has already
+        read the whole body, so its slices are yielded without copying.
+        """
+        return self._body_reader().iter_into(buffer)
+
+    def _body_reader(self) -> BytesReader:
+        if self._reader is None:
+            self._reader = BytesReader(self._response.content)
+        return self._reader
+
+    def close(self) -> None:
+        """Release the connection of a streamed response that was not read."""
+        self._response.close()
+
     @property
     def text(self) -> Result[str, TextDecodeError]:
         """Decode response body as text with error handling."""
@@ -163,6 +188,7 @@ class RequestsAdapter:
         data: dict[str, str] | None = None,
         timeout: float = 5.0,
         follow_redirects: bool = False,
+        stream: bool = False,
     ) -> Result[
         HttpResponse,
         ClientError
@@ -201,7 +227,15 @@ class RequestsAdapter:
                 data=data,
                 timeout=timeout,
                 allow_redirects=follow_redirects,
+                stream=stream,
             )
+            trace = current_trace()
+            if trace is not None:
+                # Unless streaming, requests reads the body before returning;
+                # elapsed stops at the headers
+                trace.responded(response.elapsed.total_seconds())
+                if not stream:
+                    trace.downloaded()
 
             response_wrapper = RequestsResponse(response)
 
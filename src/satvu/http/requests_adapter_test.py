@@ -282,3 +282,50 @@ def test_adapter_cleanup():
     # Session should be closed (attempting to use it will raise an error)
     # Note: requests doesn't actually prevent usage after close, but we test ownership
     assert adapter._owns_session is True
+
+
+@pook.on
+def test_iter_bytes(adapter):
+    """Test streaming the response body in chunks."""
+    pook.get("https://api.example.com/file").reply(200).body(b"a" * 100)
+
+    response = adapter.request("GET", "/file", follow_redirects=True).unwrap()
+
+    assert b"".join(response.iter_bytes(chunk_size=30)) == b"a" * 100
+
+
+@pook.on
+def test_iter_into(adapter):
+    """Test streaming the response body through a preallocated buffer."""
+    pook.get("https://api.example.com/file").reply(200).body(b"a" * 100)
+
+    response = adapter.request("GET", "/file", follow_redirects=True).unwrap()
+    chunks = [bytes(chunk) for chunk in response.iter_into(bytearray(30))]
+
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert b"".join(chunks) == b"a" * 100
+
+
+@pook.on
+def test_readinto(adapter):
+    """Test reading the response body into a preallocated buffer."""
+    pook.get("https://api.example.com/file").reply(200).body(b"abcdef")
+
+    response = adapter.request("GET", "/file", follow_redirects=True).unwrap()
+    buffer = bytearray(4)
+
+    assert response.readinto(buffer) == 4
+    assert buffer == b"abcd"
+    assert response.readinto(buffer) == 2
+    assert response.readinto(buffer) == 0
+
+
+@pook.on
+def test_stream_reads_body_lazily(adapter):
+    """With stream=True the body is read as it is iterated, not before."""
+    pook.get("https://api.example.com/file").reply(200).body(b"a" * 100)
+
+    response = adapter.request("GET", "/file", stream=True).unwrap()
+
+    assert response._response._content is False
+    assert b"".join(response.iter_bytes(chunk_size=30)) == b"a" * 100
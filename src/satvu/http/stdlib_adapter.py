@@ -1,15 +1,30 @@
-"""Standard library HTTP adapter using urllib."""
+"""
+Standard library HTTP adapter using http.client.
+
+Requests are sent over keep-alive connections held in a KeepAlivePool, so
+repeated requests to the same host reuse one TCP and TLS connection instead
+of performing a new handshake each time. Requests that go through a proxy
+configured in the environment are sent with urllib instead.
+"""
 
 import json as json_lib
+import select
 import socket
+import ssl
+import sys
+import threading
+import time
 import warnings
+from collections import deque
 from collections.abc import Callable, Iterator
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from http.client import HTTPResponse as StdlibHTTPResponse
 from typing import Any, cast
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode, urljoin
-from urllib.request import Request, urlopen
+from urllib.parse import urlencode, urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
+from satvu.http.buffers import BytesReader, iter_into
 from satvu.http.errors import (
     ClientError,
     ConnectionTimeoutError,
@@ -22,17 +37,40 @@ from satvu.http.errors import (
     TextDecodeError,
 )
 from satvu.http.protocol import HttpMethod, HttpResponse
+from satvu.http.trace import current_trace
 from satvu.result import Err, Ok, Result, is_err
+from satvu.retry import IDEMPOTENT_METHODS
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+_MAX_REDIRECTS = 10
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
 
 
 class StdlibResponse:
-    """Wrapper for urllib HTTP response to conform to HttpResponse protocol."""
+    """Wrapper for http.client and urllib responses to conform to HttpResponse protocol."""
 
-    def __init__(self, response: StdlibHTTPResponse | HTTPError, url: str):
+    def __init__(
+        self,
+        response: StdlibHTTPResponse | HTTPError,
+        url: str,
+        release: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            response: The underlying response
+            url: The requested URL
+            release: Called once the body has been read, to return the
+                connection to its pool
+        """
         self._response = response
         self._url = url
         self._body: bytes | None = None
         self._consumed = False  # Track if response stream has been consumed
+        self._release = release
+        self._reader: BytesReader | None = None
 
     @property
     def status_code(self) -> int:
@@ -47,9 +85,10 @@ class StdlibResponse:
     def body(self) -> bytes:
         if self._body is None:
             self._body = self._response.read()
+            self._done()
         return self._body
 
-    def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes]:
+    def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes | memoryview]:
         """
         Stream response body in chunks without loading it all into memory.
 
@@ -60,14 +99,15 @@ class StdlibResponse:
             chunk_size: Number of bytes to read per chunk (default: 8KB)
 
         Yields:
-            Chunks of bytes from the response body
+            Chunks of the response body, as memoryview slices when the body is
+            already in memory
 
         Raises:
             RuntimeError: If response stream has already been consumed by a previous
                          call to iter_bytes()
 
         Implementation Notes:
-            - If .body property was already called, the cached body is yielded in chunks
+            - If .body property was already called, memoryview slices of the cached body are yielded
             - Otherwise, reads directly from the urllib response object in a streaming fashion
             - Marks response as consumed after first streaming call to prevent double consumption
         """
@@ -78,10 +118,9 @@ class StdlibResponse:
             )
 
         # Case 1: Body was already loaded via .body property
-        # In this case, we yield the cached body in chunks (still useful for uniform API)
+        # In this case, we yield memoryview slices of the cached body (no copies)
         if self._body is not None:
-            for i in range(0, len(self._body), chunk_size):
-                yield self._body[i : i + chunk_size]
+            yield from self._body_reader().iter_bytes(chunk_size)
             return
 
         # Case 2: Stream directly from the underlying response (memory-efficient)
@@ -102,6 +141,46 @@ class StdlibResponse:
                 # End of response reached
                 break
             yield chunk
+        self._done()
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """
+        Read the next part of the body into a preallocated buffer.
+
+        Uses http.client's readinto(), which fills the buffer straight from
+        the socket without allocating intermediate bytes objects.
+        """
+        if self._body is not None or self._response.isclosed():
+            # Body already read (or provided by a mock without a stream)
+            return self._body_reader().readinto(buffer)
+        self._consumed = True
+        n = self._response.readinto(buffer)
+        if not n:
+            self._done()
+        return n
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[memoryview]:
+        """Stream the body through one reused buffer; see HttpResponse.iter_into."""
+        if self._body is not None:
+            return self._body_reader().iter_into(buffer)
+        return iter_into(self.readinto, buffer)
+
+    def _body_reader(self) -> BytesReader:
+        if self._reader is None:
+            self._reader = BytesReader(self.body)
+        return self._reader
+
+    def close(self) -> None:
+        """Close the response, dropping its connection unless it was read."""
+        # Released first: the pool only keeps connections whose body was read
+        self._done()
+        self._response.close()
+
+    def _done(self) -> None:
+        """Return the connection to the pool once the body has been read."""
+        if self._release is not None:
+            release, self._release = self._release, None
+            release()
 
     @property
     def text(self) -> Result[str, TextDecodeError]:
@@ -144,15 +223,111 @@ class StdlibResponse:
             )
 
 
+class KeepAlivePool:
+    """
+    Thread-safe pool of idle keep-alive connections, kept per host.
+
+    A connection is returned to the pool once its response body has been
+    read completely. Idle connections are dropped after ``keepalive_expiry``
+    seconds, or when the server has closed them in the meantime.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of idle connections kept per host
+            keepalive_expiry: Seconds an idle connection is kept open
+            ssl_context: SSL context for HTTPS connections, defaults to
+                ssl.create_default_context()
+        """
+        self.maxsize = maxsize
+        self.keepalive_expiry = keepalive_expiry
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._idle: dict[tuple[str, str, int], deque[tuple[HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, scheme: str, host: str, port: int, timeout: float
+    ) -> HTTPConnection:
+        """
+        Take an idle connection to the host, or create a new one.
+
+        Connections are opened lazily by the first request sent over them;
+        ``connection.sock`` is not None for a reused connection.
+        """
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get((scheme, host, port))
+            while idle:
+                conn, idle_since = idle.pop()
+                if now - idle_since < self.keepalive_expiry and not _is_dropped(conn):
+                    conn.timeout = timeout
+                    conn.sock.settimeout(timeout)  # type: ignore[union-attr]
+                    return conn
+                conn.close()
+
+        if scheme == "https":
+            return HTTPSConnection(
+                host, port, timeout=timeout, context=self.ssl_context
+            )
+        return HTTPConnection(host, port, timeout=timeout)
+
+    def release(self, conn: HTTPConnection, response: StdlibHTTPResponse) -> None:
+        """Return a connection whose response has been read, or close it."""
+        if conn.sock is None or not response.isclosed() or response.will_close:
+            conn.close()
+            return
+        scheme = "https" if isinstance(conn, HTTPSConnection) else "http"
+        with self._lock:
+            idle = self._idle.setdefault((scheme, conn.host, conn.port), deque())
+            if len(idle) < self.maxsize:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+
+def _is_dropped(conn: HTTPConnection) -> bool:
+    """
+    Whether an idle connection can no longer be used.
+
+    An idle socket becomes readable when the server closes it (or sends data
+    it should not), so it is only safe to reuse while nothing is readable.
+    """
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
 class StdlibAdapter:
     """
-    HTTP client adapter using Python's standard library (urllib).
+    HTTP client adapter using Python's standard library (http.client).
 
     Zero external dependencies. Suitable for minimal installations.
+    Connections are kept alive and reused between requests to the same host.
     """
 
     def __init__(
-        self, base_url: str | None = None, get_token: Callable[[], str] | None = None
+        self,
+        base_url: str | None = None,
+        get_token: Callable[[], str] | None = None,
+        pool: KeepAlivePool | None = None,
     ):
         """
         Initialize the stdlib adapter.
@@ -161,9 +336,20 @@ class StdlibAdapter:
             base_url: Optional base URL for all requests. Relative URLs will be joined to this.
             get_token: Optional callback to get the current access token. Will be called
                       before each request to support token refresh.
+            pool: Optional connection pool, which can be shared by several
+                  adapters. If not provided, a new pool is created.
         """
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.get_token = get_token
+        self._owns_pool = pool is None
+        self.pool = pool if pool is not None else KeepAlivePool()
+        # Read once, like urllib's default opener
+        self._proxies = getproxies()
+
+    def __del__(self):
+        """Close idle connections if we own the pool."""
+        if getattr(self, "_owns_pool", False):
+            self.pool.clear()
 
     def request(
         self,
@@ -176,6 +362,7 @@ class StdlibAdapter:
         data: dict[str, str] | None = None,
         timeout: float = 5.0,
         follow_redirects: bool = False,
+        stream: bool = False,
     ) -> Result[
         HttpResponse,
         ClientError
@@ -186,16 +373,12 @@ class StdlibAdapter:
         | SSLError
         | ProxyError,
     ]:
-        """Make an HTTP request using urllib."""
-        # Warn if follow_redirects is False (urllib always follows redirects)
-        if not follow_redirects:
-            warnings.warn(
-                "StdlibAdapter does not support follow_redirects=False. "
-                "Redirects will be followed automatically by urllib.",
-                UserWarning,
-                stacklevel=2,
-            )
+        """
+        Make an HTTP request using http.client.
 
+        Bodies are always read from the connection as they are accessed, so
+        ``stream`` needs no special handling.
+        """
         # Build full URL
         if self.base_url and not url.startswith(("http://", "https://")):
             full_url = urljoin(self.base_url + "/", url.lstrip("/"))
@@ -226,7 +409,193 @@ class StdlibAdapter:
             body_data = urlencode(data).encode("utf-8")
             req_headers["Content-Type"] = "application/x-www-form-urlencoded"
 
-        # Create request
+        if self._uses_proxy(full_url):
+            # urllib always follows redirects
+            if not follow_redirects:
+                warnings.warn(
+                    "StdlibAdapter does not support follow_redirects=False "
+                    "through a proxy. Redirects will be followed automatically.",
+                    UserWarning,
+                    stacklevel=2,
+                )
+            return self._urlopen(method, full_url, req_headers, body_data, timeout)
+
+        req_headers.setdefault("User-Agent", _USER_AGENT)
+        try:
+            response_wrapper = self._send(
+                method, full_url, req_headers, body_data, timeout, follow_redirects
+            )
+        except _TooManyRedirects as e:
+            return Err(
+                NetworkError(
+                    message=f"Exceeded {_MAX_REDIRECTS} redirects",
+                    url=full_url,
+                    original_error=e,
+                )
+            )
+        except _ConnectTimeout as e:
+            return Err(
+                ConnectionTimeoutError(
+                    message=f"Connection timed out after {timeout} seconds",
+                    url=full_url,
+                    timeout=timeout,
+                    original_error=e,
+                )
+            )
+        except TimeoutError as e:
+            return Err(
+                ReadTimeoutError(
+                    message=f"Request timed out after {timeout} seconds",
+                    url=full_url,
+                    timeout=timeout,
+                    original_error=e,
+                )
+            )
+        except (ssl.SSLError, ssl.CertificateError) as e:
+            return Err(
+                SSLError(
+                    message=f"SSL/TLS error: {e}",
+                    url=full_url,
+                    original_error=e,
+                )
+            )
+        except (HTTPException, OSError) as e:
+            return Err(
+                NetworkError(
+                    message=f"Network error: {e!r}",
+                    url=full_url,
+                    original_error=e,
+                )
+            )
+
+        return _status_result(response_wrapper, full_url)
+
+    def _uses_proxy(self, url: str) -> bool:
+        """Whether a proxy from the environment applies to the URL."""
+        parts = urlsplit(url)
+        return bool(self._proxies.get(parts.scheme.lower())) and not proxy_bypass(
+            parts.hostname or ""
+        )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+        follow_redirects: bool = True,
+    ) -> StdlibResponse:
+        """
+        Send a request over a pooled connection, following redirects unless
+        ``follow_redirects`` is False, in which case the 3xx response is
+        returned.
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            conn, response = self._send_once(method, url, headers, body, timeout)
+            wrapper = StdlibResponse(
+                response,
+                url,
+                release=lambda c=conn, r=response: self.pool.release(c, r),
+            )
+            location = response.getheader("Location")
+            if (
+                not follow_redirects
+                or response.status not in _REDIRECT_CODES
+                or not location
+            ):
+                return wrapper
+
+            # Read the (small) redirect body so the connection can be reused
+            wrapper.body  # noqa: B018
+            new_url = urljoin(url, location)
+            if response.status == 303 or (
+                response.status in (301, 302) and method == "POST"
+            ):
+                method = "GET" if method != "HEAD" else method
+                body = None
+                headers = {
+                    k: v
+                    for k, v in headers.items()
+                    if k.lower() not in ("content-type", "content-length")
+                }
+            if _origin(new_url) != _origin(url):
+                # Don't leak credentials to another host, e.g. a signed URL
+                headers = {
+                    k: v for k, v in headers.items() if k.lower() != "authorization"
+                }
+            url = new_url
+
+        raise _TooManyRedirects(url)
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+    ) -> tuple[HTTPConnection, StdlibHTTPResponse]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        trace = current_trace()
+        while True:
+            conn = self.pool.acquire(scheme, host, port, timeout)
+            reused = conn.sock is not None
+            sent = False
+            try:
+                if trace is not None and not reused:
+                    trace.connecting()
+                    conn.connect()
+                    trace.connected()
+                conn.request(method, target, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                if trace is not None:
+                    trace.responded()
+                return conn, response
+            except (ConnectionResetError, BrokenPipeError, HTTPException):
+                conn.close()
+                # The server may close an idle connection just as it is
+                # reused. Retry on a new connection, unless a request with
+                # side effects may already have been processed.
+                if reused and (not sent or method in IDEMPOTENT_METHODS):
+                    continue
+                raise
+            except TimeoutError as e:
+                connected = conn.sock is not None
+                conn.close()
+                if not connected:
+                    raise _ConnectTimeout() from e
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+    def _urlopen(
+        self,
+        method: str,
+        full_url: str,
+        req_headers: dict[str, str],
+        body_data: bytes | None,
+        timeout: float,
+    ) -> Result[
+        HttpResponse,
+        ClientError
+        | ServerError
+        | NetworkError
+        | ConnectionTimeoutError
+        | ReadTimeoutError
+        | SSLError
+        | ProxyError,
+    ]:
+        """Make a request with urllib, which handles proxies from the environment."""
         request = Request(
             full_url,
             data=body_data,
@@ -234,69 +603,26 @@ class StdlibAdapter:
             method=method,
         )
 
-        # Make request
         try:
             response = urlopen(request, timeout=timeout)
-            response_wrapper = StdlibResponse(response, full_url)
-
-            # Check for error status codes
-            if 400 <= response_wrapper.status_code < 500:
-                return Err(
-                    ClientError(
-                        message=f"Client error: {response_wrapper.status_code}",
-                        status_code=response_wrapper.status_code,
-                        url=full_url,
-                        response_body=response_wrapper.body,
-                        response_headers=response_wrapper.headers,
-                    )
-                )
-            elif 500 <= response_wrapper.status_code < 600:
-                return Err(
-                    ServerError(
-                        message=f"Server error: {response_wrapper.status_code}",
-                        status_code=response_wrapper.status_code,
-                        url=full_url,
-                        response_body=response_wrapper.body,
-                        response_headers=response_wrapper.headers,
-                    )
-                )
-
-            return Ok(cast(HttpResponse, response_wrapper))
+            trace = current_trace()
+            if trace is not None:
+                trace.responded()
+            return _status_result(StdlibResponse(response, full_url), full_url)
 
         except HTTPError as e:
             # HTTPError has response data and status code
             response_wrapper = StdlibResponse(e, full_url)
-            status_code = response_wrapper.status_code
-
-            if 400 <= status_code < 500:
-                return Err(
-                    ClientError(
-                        message=f"Client error: {status_code}",
-                        status_code=status_code,
-                        url=full_url,
-                        response_body=response_wrapper.body,
-                        response_headers=response_wrapper.headers,
-                    )
-                )
-            elif 500 <= status_code < 600:
-                return Err(
-                    ServerError(
-                        message=f"Server error: {status_code}",
-                        status_code=status_code,
-                        url=full_url,
-                        response_body=response_wrapper.body,
-                        response_headers=response_wrapper.headers,
-                    )
-                )
-            else:
-                # Shouldn't happen, but treat as network error
-                return Err(
-                    NetworkError(
-                        message=f"Unexpected HTTP error: {e}",
-                        url=full_url,
-                        original_error=e,
-                    )
+            if 400 <= response_wrapper.status_code < 600:
+                return _status_result(response_wrapper, full_url)
+            # Shouldn't happen, but treat as network error
+            return Err(
+                NetworkError(
+                    message=f"Unexpected HTTP error: {e}",
+                    url=full_url,
+                    original_error=e,
                 )
+            )
 
         except TimeoutError as e:
             # Socket timeout - could be connection or read timeout
@@ -363,3 +689,53 @@ class StdlibAdapter:
                     original_error=e,
                 )
             )
+
+
+class _TooManyRedirects(Exception):
+    pass
+
+
+class _ConnectTimeout(TimeoutError):
+    pass
+
+
+def _status_result(
+    response_wrapper: StdlibResponse, full_url: str
+) -> Result[
+    HttpResponse,
+    ClientError
+    | ServerError
+    | NetworkError
+    | ConnectionTimeoutError
+    | ReadTimeoutError
+    | SSLError
+    | ProxyError,
+]:
+    """Wrap a response in Ok, or in Err for 4xx and 5xx statuses."""
+    status_code = response_wrapper.status_code
+    if 400 <= status_code < 500:
+        return Err(
+            ClientError(
+                message=f"Client error: {status_code}",
+                status_code=status_code,
+                url=full_url,
+                response_body=response_wrapper.body,
+                response_headers=response_wrapper.headers,
+            )
+        )
+    elif 500 <= status_code < 600:
+        return Err(
+            ServerError(
+                message=f"Server error: {status_code}",
+                status_code=status_code,
+                url=full_url,
+                response_body=response_wrapper.body,
+                response_headers=response_wrapper.headers,
+            )
+        )
+    return Ok(cast(HttpResponse, response_wrapper))
+
+
+def _origin(url: str) -> tuple[str, str | None, int | None]:
+    parts = urlsplit(url)
+    return parts.scheme.lower(), parts.hostname, parts.port
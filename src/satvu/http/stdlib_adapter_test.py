@@ -1,12 +1,18 @@
 """Tests for StdlibAdapter."""
 
+import json
+import threading
+import time
 import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pook
 import pytest
 
-from satvu.http import is_ok
-from satvu.http.stdlib_adapter import StdlibAdapter
+from satvu.http import is_err, is_ok
+from satvu.http.errors import ReadTimeoutError
+from satvu.http.stdlib_adapter import KeepAlivePool, StdlibAdapter
+from satvu.http.trace import tracing
 
 
 @pytest.fixture
@@ -179,17 +185,15 @@ def test_http_error_response(adapter):
 
 
 @pook.on
-def test_follow_redirects_warning(adapter):
-    """Test that warning is emitted when follow_redirects=False."""
+def test_follow_redirects_false_without_warning(adapter):
+    """follow_redirects=False is supported on pooled connections."""
     pook.get("https://api.example.com/test").reply(200).body("ok")
 
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
         adapter.request("GET", "/test", follow_redirects=False)
 
-        assert len(w) == 1
-        assert "follow_redirects=False" in str(w[0].message)
-        assert issubclass(w[0].category, UserWarning)
+        assert w == []
 
 
 @pook.on
@@ -206,3 +210,195 @@ def test_absolute_url_ignores_base_url():
     response = result.unwrap()
 
     assert response.status_code == 200
+
+
+class _Server(ThreadingHTTPServer):
+    """Test server recording the client address of every request."""
+
+    connections: set[tuple[str, int]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.path == "/slow":
+            time.sleep(0.5)
+        if self.path == "/redirect":
+            port = self.server.server_port
+            self.send_response(302)
+            self.send_header("Location", f"http://localhost:{port}/headers")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/headers":
+            body = json.dumps(
+                {"authorization": self.headers.get("Authorization")}
+            ).encode()
+        else:
+            body = b"x" * 100_000
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close without announcing it, like a server whose keep-alive expired
+        self.close_connection = self.path == "/close"
+
+
+def _read(adapter, path):
+    return adapter.request("GET", path, follow_redirects=True).unwrap().body
+
+
+@pytest.fixture
+def server():
+    httpd = _Server(("127.0.0.1", 0), _Handler)
+    httpd.connections = set()
+    # Clients hanging up early (timeout tests) are expected
+    httpd.handle_error = lambda request, client_address: None
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def local_adapter(server):
+    port = server.server_address[1]
+    adapter = StdlibAdapter(base_url=f"http://127.0.0.1:{port}")
+    yield adapter
+    adapter.pool.clear()
+
+
+class TestKeepAlive:
+    """Tests for connection reuse against a local HTTP/1.1 server."""
+
+    def test_connection_reused(self, server, local_adapter):
+        for _ in range(3):
+            result = local_adapter.request("GET", "/data", follow_redirects=True)
+            assert len(result.unwrap().body) == 100_000
+
+        assert len(server.connections) == 1
+
+    def test_connection_reused_after_streaming(self, server, local_adapter):
+        for _ in range(2):
+            response = local_adapter.request(
+                "GET", "/data", follow_redirects=True
+            ).unwrap()
+            assert sum(len(chunk) for chunk in response.iter_bytes(4096)) == 100_000
+
+        assert len(server.connections) == 1
+
+    def test_readinto_streams_from_socket(self, server, local_adapter):
+        buffer = bytearray(30_000)
+        for _ in range(2):
+            response = local_adapter.request(
+                "GET", "/data", follow_redirects=True
+            ).unwrap()
+            chunks = [len(chunk) for chunk in response.iter_into(buffer)]
+            assert sum(chunks) == 100_000
+            assert max(chunks) <= 30_000
+
+        assert len(server.connections) == 1
+
+    def test_unread_response_not_reused(self, server, local_adapter):
+        local_adapter.request("GET", "/data", follow_redirects=True)
+        _read(local_adapter, "/data")
+
+        assert len(server.connections) == 2
+
+    def test_closed_connection_detected(self, server, local_adapter):
+        _read(local_adapter, "/close")
+        time.sleep(0.1)
+        result = local_adapter.request("GET", "/data", follow_redirects=True)
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert len(server.connections) == 2
+
+    def test_retry_on_reset(self, server, local_adapter, monkeypatch):
+        """A reused connection closed by the server is replaced transparently."""
+        monkeypatch.setattr("satvu.http.stdlib_adapter._is_dropped", lambda _: False)
+        _read(local_adapter, "/close")
+        time.sleep(0.1)
+        result = local_adapter.request("GET", "/data", follow_redirects=True)
+
+        assert is_ok(result), f"Expected Ok but got: {result}"
+        assert len(server.connections) == 2
+
+    def test_expired_connection_not_reused(self, server):
+        port = server.server_address[1]
+        adapter = StdlibAdapter(
+            base_url=f"http://127.0.0.1:{port}",
+            pool=KeepAlivePool(keepalive_expiry=0),
+        )
+        for _ in range(2):
+            _read(adapter, "/data")
+
+        assert len(server.connections) == 2
+
+    def test_shared_pool(self, server):
+        port = server.server_address[1]
+        pool = KeepAlivePool()
+        first = StdlibAdapter(base_url=f"http://127.0.0.1:{port}", pool=pool)
+        second = StdlibAdapter(base_url=f"http://127.0.0.1:{port}/", pool=pool)
+
+        _read(first, "/data")
+        _read(second, "data")
+
+        assert len(server.connections) == 1
+        pool.clear()
+
+    def test_redirect_not_followed(self, server):
+        port = server.server_address[1]
+        adapter = StdlibAdapter(base_url=f"http://127.0.0.1:{port}")
+
+        result = adapter.request("GET", "/redirect", follow_redirects=False)
+
+        response = result.unwrap()
+        assert response.status_code == 302
+        assert response.headers["Location"].endswith("/headers")
+        adapter.pool.clear()
+
+    def test_redirect_to_other_host_drops_token(self, server):
+        port = server.server_address[1]
+        adapter = StdlibAdapter(
+            base_url=f"http://127.0.0.1:{port}", get_token=lambda: "secret"
+        )
+
+        result = adapter.request("GET", "/redirect", follow_redirects=True)
+
+        assert result.unwrap().json().unwrap() == {"authorization": None}
+        adapter.pool.clear()
+
+    def test_read_timeout(self, local_adapter):
+        result = local_adapter.request(
+            "GET", "/slow", timeout=0.1, follow_redirects=True
+        )
+
+        assert result.is_err()
+        assert isinstance(result.error(), ReadTimeoutError)
+
+    def test_trace(self, local_adapter):
+        """Connect time is recorded for new connections only."""
+        with tracing() as first:
+            _read(local_adapter, "/data")
+        with tracing() as second:
+            _read(local_adapter, "/data")
+
+        assert first.connect is not None
+        assert second.connect is None
+        assert first.ttfb is not None and first.ttfb > 0
+        assert second.ttfb is not None and second.ttfb > 0
+
+    def test_connection_refused(self):
+        adapter = StdlibAdapter(base_url="http://127.0.0.1:1")
+
+        result = adapter.request("GET", "/data", follow_redirects=True)
+
+        assert is_err(result)
+        assert result.error().error_type() == "NetworkError"
@@ -0,0 +1,88 @@
+"""
+Phase timings of HTTP requests, recorded by the adapters.
+
+While an SDK client observes a request it installs a RequestTrace with
+tracing(). Adapters record the phases their library lets them see into
+current_trace(), which is None when nobody is observing, so untraced requests
+only pay for one context variable lookup.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class RequestTrace:
+    """
+    Timings of one request attempt, in seconds.
+
+    Phases an adapter cannot measure stay None. Adapters that cannot see the
+    connection being established count it as part of ``ttfb``, and those that
+    read the body before returning the response record it as ``download``.
+    """
+
+    __slots__ = ("connect", "download", "started", "ttfb", "_mark")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.connect: float | None = None
+        self.ttfb: float | None = None
+        self.download: float | None = None
+        self._mark = self.started
+
+    def connecting(self) -> None:
+        """A new connection (DNS, TCP and TLS) is being established."""
+        self._mark = time.perf_counter()
+
+    def connected(self) -> None:
+        """The connection is established and the request is being sent."""
+        now = time.perf_counter()
+        self.connect = (self.connect or 0.0) + now - self._mark
+        self._mark = now
+
+    def responded(self, ttfb: float | None = None) -> None:
+        """
+        The response headers have arrived.
+
+        Args:
+            ttfb: Time to the response headers, if the library measured it;
+                otherwise the time since the request was sent
+        """
+        now = time.perf_counter()
+        if ttfb is None:
+            self.ttfb = now - self._mark
+            self._mark = now
+        else:
+            self.ttfb = ttfb
+            self._mark = self.started + ttfb
+
+    def downloaded(self) -> None:
+        """The adapter has read the whole body."""
+        self.download = time.perf_counter() - self._mark
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+_current: ContextVar[RequestTrace | None] = ContextVar("satvu_trace", default=None)
+
+
+def current_trace() -> RequestTrace | None:
+    """The trace of the request being sent in this thread or task, if any."""
+    return _current.get()
+
+
+@contextmanager
+def tracing() -> Iterator[RequestTrace]:
+    """Trace the requests sent within the block."""
+    trace = RequestTrace()
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+
+
+__all__ = ["RequestTrace", "current_trace", "tracing"]
@@ -13,6 +13,7 @@ except ImportError as exc:
         'Install it with: pip install "satvu[http-urllib3]"'
     ) from exc
 
+from satvu.http.buffers import BytesReader, iter_into
 from satvu.http.errors import (
     ClientError,
     ConnectionTimeoutError,
@@ -25,6 +26,7 @@ from satvu.http.errors import (
     TextDecodeError,
 )
 from satvu.http.protocol import HttpMethod, HttpResponse
+from satvu.http.trace import current_trace
 from satvu.result import Err, Ok, Result, is_err
 
 
@@ -35,6 +37,7 @@ class Urllib3Response:
         self._response = response
         self._body: bytes | None = None
         self._consumed = False  # Track if response stream has been consumed
+        self._reader: BytesReader | None = None
 
     @property
     def status_code(self) -> int:
@@ -52,7 +55,7 @@ class Urllib3Response:
         assert self._body is not None  # nosec B101
         return self._body
 
-    def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes]:
+    def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes | memoryview]:
         """
         Stream response body in chunks without loading it all into memory.
 
@@ -63,14 +66,16 @@ class Urllib3Response:
             chunk_size: Number of bytes to read per chunk (default: 8KB)
 
         Yields:
-            Chunks of bytes from the response body
+            Chunks of the response body, as memoryview slices when the body is
+            already in memory
 
         Raises:
             RuntimeError: If response stream has already been consumed by a previous
                          call to iter_bytes()
 
         Implementation Notes:
-            - If .body/.data was already accessed, the cached body is yielded in chunks
+            - If the body is already in memory (.body/.data was accessed, or urllib3
+              preloaded it), memoryview slices of it are yielded
             - Otherwise, reads directly from urllib3's response stream
             - urllib3's stream() method handles chunked transfer encoding automatically
             - Marks response as consumed after first streaming call to prevent double consumption
@@ -81,10 +86,10 @@ class Urllib3Response:
                 "Each response can only be streamed once."
             )
 
-        # Case 1: Body was already loaded via .body/.data property
-        if self._body is not None:
-            for i in range(0, len(self._body), chunk_size):
-                yield self._body[i : i + chunk_size]
+        # Case 1: Body was already loaded, via .body/.data or by urllib3
+        # preloading it. Yield memoryview slices of it without copying.
+        if not self._streams_natively():
+            yield from self._body_reader().iter_bytes(chunk_size)
             return
 
         # Case 2: Stream directly from urllib3 response (memory-efficient)
@@ -92,6 +97,38 @@ class Urllib3Response:
         # urllib3's stream() method yields chunks as they arrive
         yield from self._response.stream(amt=chunk_size)
 
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        """
+        Read the next part of the body into a preallocated buffer.
+
+        Uses urllib3's readinto() while the body is still being streamed from
+        the connection, otherwise copies from the body in memory.
+        """
+        if self._streams_natively():
+            self._consumed = True
+            return self._response.readinto(buffer)
+        return self._body_reader().readinto(buffer)
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[memoryview]:
+        """Stream the body through one reused buffer; see HttpResponse.iter_into."""
+        if self._streams_natively():
+            return iter_into(self.readinto, buffer)
+        return self._body_reader().iter_into(buffer)
+
+    def _streams_natively(self) -> bool:
+        """Whether the body is read from the connection rather than from memory."""
+        return self._consumed or (self._body is None and not self._response.closed)
+
+    def _body_reader(self) -> BytesReader:
+        if self._reader is None:
+            self._reader = BytesReader(self.body)
+        return self._reader
+
+    def close(self) -> None:
+        """Release the connection of a streamed response that was not read."""
+        self._response.close()
+        self._response.release_conn()
+
     @property
     def text(self) -> Result[str, TextDecodeError]:
         """Decode response body as text with error handling."""
@@ -182,6 +219,7 @@ class Urllib3Adapter:
         data: dict[str, str] | None = None,
         timeout: float = 5.0,
         follow_redirects: bool = False,
+        stream: bool = False,
     ) -> Result[
         HttpResponse,
         ClientError
@@ -232,7 +270,11 @@ class Urllib3Adapter:
                 body=body_data,
                 timeout=timeout,
                 redirect=follow_redirects,
+                preload_content=not stream,
             )
+            trace = current_trace()
+            if trace is not None:
+                trace.responded()
 
             response_wrapper = Urllib3Response(response)
 
@@ -0,0 +1,285 @@
+"""
+Client-side rate limiting of API requests.
+
+Each rate-limited API (a service base path such as ``/otm/v2``) or, with
+``per_endpoint=True``, each endpoint gets a RateLimiter. It implements the
+generic cell rate algorithm (GCRA): requests are spaced ``1 / rate`` seconds
+apart, with up to ``burst`` sent back to back after a quiet period. A request
+that comes too early waits for its slot, or fails with RateLimitExceededError
+if the wait would exceed ``max_wait``.
+
+Limiters tune themselves from responses: a 429 or 503 with ``Retry-After``
+pauses the API, and ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` (or the
+unprefixed ``RateLimit-*`` headers) pace requests so the remaining quota lasts
+until the window resets.
+"""
+
+import re
+import threading
+import time
+from collections.abc import Mapping
+from typing import Literal
+
+from pydantic import BaseModel
+
+from satvu.http.errors import RateLimitExceededError
+from satvu.retry import (
+    RETRY_AFTER_STATUS_CODES,
+    parse_retry_after,
+    retry_after_header,
+)
+
+RateLimitPolicy = Literal["block", "fail"]
+
+# X-RateLimit-Reset values above this are Unix timestamps rather than seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+_WINDOW = re.compile(r";\s*w=(\d+)")
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    """Case-insensitive lookup of ``X-RateLimit-<name>`` or ``RateLimit-<name>``."""
+    names = (f"x-ratelimit-{name}", f"ratelimit-{name}")
+    return next((val for key, val in headers.items() if key.lower() in names), None)
+
+
+def _leading_number(value: str | None) -> float | None:
+    """First number of a header value such as ``"100"`` or ``"100, 100;w=60"``."""
+    match = re.match(r"\s*(\d+(?:\.\d+)?)", value or "")
+    return float(match[1]) if match else None
+
+
+class RateLimitStats(BaseModel):
+    """Snapshot of one rate limiter, for metrics."""
+
+    key: str
+    rate: float | None
+    server_rate: float | None
+    requests: int
+    delayed: int
+    rejected: int
+    total_wait: float
+
+
+class RateLimiter:
+    """GCRA rate limiter for a single API or endpoint."""
+
+    def __init__(
+        self,
+        key: str,
+        rate: float | None = None,
+        *,
+        burst: int = 1,
+        policy: RateLimitPolicy = "block",
+        max_wait: float | None = None,
+        auto_tune: bool = True,
+    ):
+        """
+        Args:
+            key: Name of the API or endpoint, used in errors and stats
+            rate: Requests per second, or None to only follow the server's
+                rate limit headers
+            burst: Requests that may be sent back to back after a quiet period
+            policy: "block" to wait for a free slot, "fail" to return
+                RateLimitExceededError immediately instead
+            max_wait: With "block", the longest wait in seconds before
+                failing instead. None waits as long as needed.
+            auto_tune: Adjust to the server's rate limit and Retry-After headers
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive or None, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.key = key
+        self.configured_rate = rate
+        self.burst = burst
+        self.policy = policy
+        self.max_wait = max_wait
+        self.auto_tune = auto_tune
+
+        self.server_rate: float | None = None
+        self.requests = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        # Theoretical arrival time of the next request
+        self._tat = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float | None:
+        """Requests per second currently enforced, or None if unlimited."""
+        rates = [r for r in (self.configured_rate, self.server_rate) if r is not None]
+        return min(rates) if rates else None
+
+    def reserve(self) -> float | RateLimitExceededError:
+        """
+        Reserve the next slot for a request.
+
+        Returns:
+            Seconds to wait before sending the request (0 to send it now), or
+            the error to fail it with if the policy does not allow waiting that
+            long. No slot is reserved in that case.
+        """
+        with self._lock:
+            now = time.monotonic()
+            rate = self.rate
+            interval = 1 / rate if rate is not None else 0.0
+            tat = max(self._tat, now)
+            wait = max(tat - (self.burst - 1) * interval - now, 0.0)
+
+            limit = 0.0 if self.policy == "fail" else self.max_wait
+            if wait > 0 and limit is not None and wait > limit:
+                self.rejected += 1
+                return RateLimitExceededError(
+                    f"Client-side rate limit for {self.key} reached",
+                    key=self.key,
+                    retry_after=wait,
+                )
+
+            self._tat = tat + interval
+            self.requests += 1
+            if wait > 0:
+                self.delayed += 1
+                self.total_wait += wait
+            return wait
+
+    def observe(self, status_code: int, headers: Mapping[str, str] | None) -> None:
+        """
+        Tune the limiter from a response's status and headers.
+
+        Args:
+            status_code: Response status code
+            headers: Response headers
+        """
+        if not self.auto_tune or not headers:
+            return
+        retry_after = None
+        if status_code in RETRY_AFTER_STATUS_CODES:
+            retry_after = parse_retry_after(retry_after_header(headers))
+        remaining = _leading_number(_header(headers, "remaining"))
+        reset = _leading_number(_header(headers, "reset"))
+        limit_header = _header(headers, "limit")
+        limit = _leading_number(limit_header)
+        window = _WINDOW.search(_header(headers, "policy") or limit_header or "")
+
+        now = time.monotonic()
+        if reset is not None and reset > _EPOCH_THRESHOLD:
+            reset = max(reset - time.time(), 0.0)
+
+        with self._lock:
+            if remaining is not None and reset is not None and reset > 0:
+                # Spread the remaining quota over the rest of the window
+                self.server_rate = max(remaining, 1) / reset
+                if remaining < 1:
+                    self._pause_until(now + reset)
+            elif limit is not None and window is not None:
+                self.server_rate = limit / int(window[1])
+            if retry_after is not None:
+                self._pause_until(now + retry_after)
+
+    def stats(self) -> RateLimitStats:
+        """Snapshot of the limiter's rate and counters."""
+        with self._lock:
+            return RateLimitStats(
+                key=self.key,
+                rate=self.rate,
+                server_rate=self.server_rate,
+                requests=self.requests,
+                delayed=self.delayed,
+                rejected=self.rejected,
+                total_wait=self.total_wait,
+            )
+
+    def _pause_until(self, resume_at: float) -> None:
+        """Allow no request before ``resume_at``. Lock must be held."""
+        rate = self.rate
+        interval = 1 / rate if rate is not None else 0.0
+        self._tat = max(self._tat, resume_at + (self.burst - 1) * interval)
+
+
+class RateLimits:
+    """
+    Rate limiters for every API, created on first use.
+
+    Pass one instance to SatVuSDK to rate limit all its services. Requests are
+    limited per service base path, or per endpoint (method, base path and
+    route template) with ``per_endpoint=True``. ``limits`` overrides the rate
+    for individual keys; an endpoint without its own entry uses its API's.
+
+    Example:
+        >>> limits = RateLimits(
+        ...     rate=20, burst=5, limits={"/otm/v2": 5, "POST /catalog/v1/search": 2},
+        ...     per_endpoint=True,
+        ... )
+        >>> sdk = SatVuSDK(client_id, client_secret, rate_limits=limits)
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        *,
+        burst: int = 1,
+        policy: RateLimitPolicy = "block",
+        max_wait: float | None = None,
+        auto_tune: bool = True,
+        per_endpoint: bool = False,
+        limits: Mapping[str, float | None] | None = None,
+    ):
+        """
+        Args:
+            rate: Default requests per second, or None to only follow the
+                server's rate limit headers
+            burst: Requests that may be sent back to back after a quiet period
+            policy: "block" to wait for a free slot, "fail" to fail fast
+            max_wait: With "block", the longest wait before failing instead
+            auto_tune: Adjust to the server's rate limit and Retry-After headers
+            per_endpoint: Limit each endpoint separately instead of each API
+            limits: Requests per second by base path (e.g. "/otm/v2") or
+                endpoint (e.g. "GET /otm/v2/{contract_id}/tasking/orders/")
+        """
+        self.rate = rate
+        self.burst = burst
+        self.policy: RateLimitPolicy = policy
+        self.max_wait = max_wait
+        self.auto_tune = auto_tune
+        self.per_endpoint = per_endpoint
+        self.limits = dict(limits or {})
+        self._limiters: dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_path: str, endpoint: str) -> RateLimiter:
+        """
+        Return the limiter for a request, creating it if needed.
+
+        Args:
+            base_path: Service base path, e.g. "/otm/v2"
+            endpoint: Method, base path and route template of the request
+        """
+        key = endpoint if self.per_endpoint else base_path
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(key)
+                if limiter is None:
+                    limiter = RateLimiter(
+                        key,
+                        self.limits.get(key, self.limits.get(base_path, self.rate)),
+                        burst=self.burst,
+                        policy=self.policy,
+                        max_wait=self.max_wait,
+                        auto_tune=self.auto_tune,
+                    )
+                    self._limiters[key] = limiter
+        return limiter
+
+    def stats(self) -> list[RateLimitStats]:
+        """Snapshots of all limiters, for exporting as metrics."""
+        return [limiter.stats() for limiter in list(self._limiters.values())]
+
+
+__all__ = [
+    "RateLimitPolicy",
+    "RateLimitStats",
+    "RateLimiter",
+    "RateLimits",
+]
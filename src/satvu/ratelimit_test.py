@@ -0,0 +1,215 @@
+"""Tests for client-side rate limiting."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from satvu.http.errors import ClientError, RateLimitExceededError
+from satvu.ratelimit import RateLimiter, RateLimits
+from satvu.result import Err, Ok, is_err
+from satvu.retry import RetryPolicy
+
+
+class FakeClock:
+    """Stands in for time.monotonic() in the ratelimit module."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("satvu.ratelimit.time.monotonic", new=fake):
+        yield fake
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_spaces_requests(self, clock):
+        """Requests beyond the burst wait one interval each."""
+        limiter = RateLimiter("/otm/v2", rate=10, burst=2)
+
+        waits = [limiter.reserve() for _ in range(4)]
+
+        assert waits == pytest.approx([0, 0, 0.1, 0.2])
+        assert limiter.stats().delayed == 2
+
+    def test_burst_refills_when_idle(self, clock):
+        limiter = RateLimiter("/otm/v2", rate=10, burst=2)
+        for _ in range(3):
+            limiter.reserve()
+
+        clock.now += 1
+
+        assert [limiter.reserve() for _ in range(2)] == [0, 0]
+
+    def test_unlimited(self, clock):
+        limiter = RateLimiter("/otm/v2")
+
+        assert all(limiter.reserve() == 0 for _ in range(100))
+
+    def test_fail_policy(self, clock):
+        """With "fail", a request without a free slot is rejected, not queued."""
+        limiter = RateLimiter("/otm/v2", rate=10, policy="fail")
+        limiter.reserve()
+
+        error = limiter.reserve()
+
+        assert isinstance(error, RateLimitExceededError)
+        assert error.retry_after == pytest.approx(0.1)
+        clock.now += 0.1
+        assert limiter.reserve() == 0
+        assert limiter.stats().rejected == 1
+
+    def test_max_wait(self, clock):
+        limiter = RateLimiter("/otm/v2", rate=10, max_wait=0.15)
+
+        waits = [limiter.reserve() for _ in range(3)]
+
+        assert waits[:2] == pytest.approx([0, 0.1])
+        assert isinstance(waits[2], RateLimitExceededError)
+
+    @pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+    def test_invalid(self, rate, burst):
+        with pytest.raises(ValueError):
+            RateLimiter("/otm/v2", rate=rate, burst=burst)
+
+
+class TestAutoTune:
+    """Tests for tuning limiters from response headers."""
+
+    def test_retry_after_pauses(self, clock):
+        limiter = RateLimiter("/otm/v2")
+
+        limiter.observe(429, {"Retry-After": "5"})
+
+        assert limiter.reserve() == pytest.approx(5)
+
+    def test_retry_after_ignored_on_success(self, clock):
+        limiter = RateLimiter("/otm/v2")
+
+        limiter.observe(200, {"Retry-After": "5"})
+
+        assert limiter.reserve() == 0
+
+    def test_remaining_quota_is_spread(self, clock):
+        """The remaining requests are paced evenly until the window resets."""
+        limiter = RateLimiter("/otm/v2", rate=100)
+
+        limiter.observe(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"})
+
+        assert limiter.rate == 2
+        assert [limiter.reserve() for _ in range(2)] == pytest.approx([0, 0.5])
+
+    def test_exhausted_quota_waits_for_reset(self, clock):
+        limiter = RateLimiter("/otm/v2")
+
+        limiter.observe(200, {"ratelimit-remaining": "0", "ratelimit-reset": "3"})
+
+        assert limiter.reserve() == pytest.approx(3)
+
+    def test_reset_as_timestamp(self, clock):
+        limiter = RateLimiter("/otm/v2")
+
+        with patch("satvu.ratelimit.time.time", return_value=1_700_000_000):
+            limiter.observe(
+                200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000004"}
+            )
+
+        assert limiter.reserve() == pytest.approx(4)
+
+    def test_policy_header(self, clock):
+        limiter = RateLimiter("/otm/v2")
+
+        limiter.observe(200, {"RateLimit-Policy": "100;w=60", "RateLimit-Limit": "100"})
+
+        assert limiter.rate == pytest.approx(100 / 60)
+
+    def test_configured_rate_is_upper_bound(self, clock):
+        limiter = RateLimiter("/otm/v2", rate=1)
+
+        limiter.observe(200, {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "1"})
+
+        assert limiter.rate == 1
+
+    def test_disabled(self, clock):
+        limiter = RateLimiter("/otm/v2", auto_tune=False)
+
+        limiter.observe(429, {"Retry-After": "5"})
+
+        assert limiter.reserve() == 0
+
+
+class TestRateLimits:
+    """Tests for the RateLimits registry."""
+
+    def test_per_api_by_default(self):
+        limits = RateLimits(rate=5)
+
+        limiter = limits.get("/otm/v2", "GET /otm/v2/{id}")
+
+        assert limiter is limits.get("/otm/v2", "POST /otm/v2/search")
+        assert limiter.key == "/otm/v2"
+        assert limiter.rate == 5
+
+    def test_per_endpoint_overrides(self):
+        limits = RateLimits(
+            rate=5,
+            per_endpoint=True,
+            limits={"/otm/v2": 2, "POST /otm/v2/search": 1},
+        )
+
+        assert limits.get("/otm/v2", "POST /otm/v2/search").rate == 1
+        assert limits.get("/otm/v2", "GET /otm/v2/{id}").rate == 2
+        assert limits.get("/catalog/v1", "GET /catalog/v1/").rate == 5
+        assert len(limits.stats()) == 3
+
+
+def test_client_waits_for_slot(clock, make_client, make_response):
+    """make_request sleeps until the limiter allows the request."""
+    client = make_client(*[Ok(make_response())] * 3, rate_limits=RateLimits(rate=4))
+
+    with patch("satvu.core.time.sleep") as sleep:
+        for _ in range(3):
+            assert client.make_request("GET", "/orders").is_ok()
+
+    assert [call.args[0] for call in sleep.call_args_list] == pytest.approx([0.25, 0.5])
+
+
+def test_client_fails_fast(clock, make_client, make_response):
+    http_client = MagicMock()
+    http_client.request.return_value = Ok(make_response())
+    client = make_client(
+        http_client=http_client, rate_limits=RateLimits(rate=1, policy="fail")
+    )
+
+    client.make_request("GET", "/orders")
+    result = client.make_request("GET", "/orders")
+
+    assert is_err(result)
+    assert isinstance(result.error(), RateLimitExceededError)
+    assert result.error().context["key"] == "/otm/v2"
+    assert http_client.request.call_count == 1
+
+
+def test_client_learns_from_429(clock, make_client):
+    """A 429's Retry-After holds back the next request to the same API."""
+    limits = RateLimits()
+    client = make_client(
+        Err(
+            ClientError(
+                "Too many", status_code=429, response_headers={"Retry-After": "7"}
+            )
+        ),
+        retry_policy=RetryPolicy(max_attempts=1),
+        rate_limits=limits,
+    )
+
+    client.make_request("GET", "/orders")
+
+    assert limits.get("/otm/v2", "").reserve() == pytest.approx(7)
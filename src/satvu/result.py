@@ -10,6 +10,7 @@ from typing import Generic, NoReturn, TypeGuard, TypeVar, Union
 
 T = TypeVar("T")  # Success value type
 E = TypeVar("E")  # Error value type
+E_co = TypeVar("E_co", covariant=True)  # Error value type of Err
 U = TypeVar("U")  # Mapped success value type (for transformations)
 F = TypeVar("F")  # Mapped error value type (for transformations)
 
@@ -154,12 +155,12 @@ class Ok(Generic[T]):
         return hash(("Ok", self._value))
 
 
-class Err(Generic[E]):
+class Err(Generic[E_co]):
     """Represents a failed result containing an error."""
 
     __slots__ = ("_error",)
 
-    def __init__(self, error: E) -> None:
+    def __init__(self, error: E_co) -> None:
         """
         Initialize an Err result.
 
@@ -206,7 +207,7 @@ class Err(Generic[E]):
         """
         return default
 
-    def unwrap_or_else(self, op: Callable[[E], T]) -> T:
+    def unwrap_or_else(self, op: Callable[[E_co], T]) -> T:
         """
         Get the contained value or compute from error.
 
@@ -238,7 +239,7 @@ class Err(Generic[E]):
         """
         raise ValueError(f"{msg}: {self._error!r}")
 
-    def map(self, op: Callable[[T], U]) -> "Err[E]":
+    def map(self, op: Callable[[T], U]) -> "Err[E_co]":
         """
         Map the contained value (no-op for Err).
 
@@ -250,7 +251,7 @@ class Err(Generic[E]):
         """
         return self
 
-    def map_err(self, op: Callable[[E], F]) -> "Err[F]":
+    def map_err(self, op: Callable[[E_co], F]) -> "Err[F]":
         """
         Map the error.
 
@@ -266,7 +267,7 @@ class Err(Generic[E]):
         """
         return Err(op(self._error))
 
-    def and_then(self, op: Callable[[T], "Result[U, E]"]) -> "Err[E]":
+    def and_then(self, op: Callable[[T], "Result[U, E_co]"]) -> "Err[E_co]":
         """
         Chain operations that may fail (no-op for Err).
 
@@ -278,7 +279,7 @@ class Err(Generic[E]):
         """
         return self
 
-    def or_else(self, op: Callable[[E], "Result[T, F]"]) -> "Result[T, F]":
+    def or_else(self, op: Callable[[E_co], "Result[T, F]"]) -> "Result[T, F]":
         """
         Provide alternative on error.
 
@@ -294,7 +295,7 @@ class Err(Generic[E]):
         """
         return op(self._error)
 
-    def error(self) -> E:
+    def error(self) -> E_co:
         """
         Get the contained error.
 
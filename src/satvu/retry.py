@@ -0,0 +1,205 @@
+"""
+Retry policy for transient request failures.
+
+SDKClient.make_request() consults a RetryPolicy whenever a request fails.
+Server errors, rate limiting, timeouts and network errors are retried with
+exponential backoff and full jitter, honouring the server's ``Retry-After``
+for 429 and 503 responses. Only idempotent methods are retried unless the
+policy opts in to others, and every retry spends a token from a RetryBudget
+so that during an outage retries stay a small fraction of the traffic
+instead of multiplying it.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Collection, Mapping
+from email.utils import parsedate_to_datetime
+
+from satvu.http.errors import (
+    ConnectionTimeoutError,
+    HttpError,
+    HttpStatusError,
+    NetworkError,
+    ReadTimeoutError,
+)
+
+DEFAULT_RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+"""Response statuses that indicate a transient failure."""
+
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+"""Statuses whose Retry-After header sets the delay before the next attempt."""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""Methods that can be repeated without changing the result."""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is missing or
+        invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def retry_after_header(headers: Mapping[str, str] | None) -> str | None:
+    """Case-insensitive lookup of the Retry-After header."""
+    if not headers:
+        return None
+    return next(
+        (val for key, val in headers.items() if key.lower() == "retry-after"), None
+    )
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of requests.
+
+    Every request adds ``ratio`` tokens, up to ``capacity``, and every retry
+    spends one. While requests succeed the bucket stays full; when most of
+    them fail it drains, and further failures are returned to the caller
+    instead of being retried. Share one budget between clients to cap their
+    combined retries.
+    """
+
+    def __init__(self, capacity: float = 10.0, ratio: float = 0.2):
+        """
+        Args:
+            capacity: Maximum number of retries that can be made in a burst
+            ratio: Retries earned per request, e.g. 0.2 allows one retry for
+                every five requests once the burst is spent
+        """
+        self.capacity = capacity
+        self.ratio = ratio
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        """Number of retries that can currently be made."""
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Earn retry tokens for a new request."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Spend a token for a retry, returning False if the budget is spent."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried, and how long to wait first.
+
+    Example:
+        >>> policy = RetryPolicy(
+        ...     max_attempts=3,
+        ...     retry_methods=IDEMPOTENT_METHODS | {"POST"},
+        ... )
+        >>> sdk = SatVuSDK(client_id, client_secret, retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 300.0,
+        status_codes: Collection[int] = DEFAULT_RETRY_STATUS_CODES,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        budget: RetryBudget | None = None,
+    ):
+        """
+        Args:
+            max_attempts: Maximum number of attempts per request, including
+                the first. 1 disables retries.
+            backoff: Upper bound of the first retry delay in seconds, doubled
+                for each further retry. The delay is drawn uniformly between
+                0 and this bound (full jitter).
+            max_backoff: Upper bound of any backoff delay in seconds
+            max_retry_after: Upper bound of a server-provided Retry-After delay
+            status_codes: Response statuses to retry
+            retry_methods: HTTP methods to retry. POST is not included by
+                default, because repeating it may repeat its side effects.
+            budget: Retry budget, shared by every client using this policy.
+                A new budget is created if not given.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.status_codes = frozenset(status_codes)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_retryable(self, method: str, error: HttpError) -> bool:
+        """
+        Whether a failed request is worth retrying, ignoring the budget.
+
+        A connection timeout means the request was never sent, so it is
+        retried for any method.
+        """
+        if isinstance(error, ConnectionTimeoutError):
+            return True
+        if method.upper() not in self.retry_methods:
+            return False
+        if isinstance(error, HttpStatusError):
+            return error.status_code in self.status_codes
+        return isinstance(error, NetworkError | ReadTimeoutError)
+
+    def should_retry(self, method: str, error: HttpError, attempt: int) -> bool:
+        """
+        Whether to retry after ``attempt`` failed with ``error``.
+
+        Spends a token from the budget when the answer is yes.
+        """
+        return (
+            attempt < self.max_attempts
+            and self.is_retryable(method, error)
+            and self.budget.try_acquire()
+        )
+
+    def delay(self, attempt: int, error: HttpError) -> float:
+        """Seconds to wait before the retry following ``attempt``."""
+        if (
+            isinstance(error, HttpStatusError)
+            and error.status_code in RETRY_AFTER_STATUS_CODES
+        ):
+            retry_after = parse_retry_after(retry_after_header(error.response_headers))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+__all__ = [
+    "DEFAULT_RETRY_STATUS_CODES",
+    "IDEMPOTENT_METHODS",
+    "RETRY_AFTER_STATUS_CODES",
+    "RetryBudget",
+    "RetryPolicy",
+    "parse_retry_after",
+    "retry_after_header",
+]
@@ -0,0 +1,145 @@
+"""Tests for the retry policy."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from satvu.http.errors import (
+    ClientError,
+    ConnectionTimeoutError,
+    NetworkError,
+    ReadTimeoutError,
+    ServerError,
+)
+from satvu.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def server_error(status_code: int = 503, headers: dict[str, str] | None = None):
+    return ServerError(
+        "Server error", status_code=status_code, response_headers=headers
+    )
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after()."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("5", 5.0),
+            ("2.5", 2.5),
+            ("-3", 0.0),
+            (None, None),
+            ("", None),
+            ("soon", None),
+        ],
+    )
+    def test_seconds(self, value, expected):
+        """Numeric values are seconds; invalid values are ignored."""
+        assert parse_retry_after(value) == expected
+
+    def test_http_date(self):
+        """An HTTP-date is converted to the seconds remaining until it."""
+        value = format_datetime(
+            datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True
+        )
+
+        delay = parse_retry_after(value)
+
+        assert delay is not None
+        assert 28 <= delay <= 30
+
+    def test_http_date_in_the_past(self):
+        """A date that has passed means retry immediately."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestRetryBudget:
+    """Tests for RetryBudget."""
+
+    def test_spends_and_earns_tokens(self):
+        """Retries spend tokens, requests earn a fraction back."""
+        budget = RetryBudget(capacity=2, ratio=0.5)
+
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+        budget.record_request()
+        assert not budget.try_acquire()
+        budget.record_request()
+        assert budget.try_acquire()
+
+    def test_capped_at_capacity(self):
+        """Tokens never exceed the capacity."""
+        budget = RetryBudget(capacity=1, ratio=1)
+        for _ in range(5):
+            budget.record_request()
+
+        assert budget.available == 1
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    @pytest.mark.parametrize(
+        ("error", "retryable"),
+        [
+            (server_error(500), True),
+            (server_error(503), True),
+            (server_error(501), False),
+            (ClientError("Too many", status_code=429), True),
+            (ClientError("Not found", status_code=404), False),
+            (NetworkError("refused"), True),
+            (ReadTimeoutError("slow"), True),
+            (ConnectionTimeoutError("slow"), True),
+        ],
+    )
+    def test_classification(self, error, retryable):
+        """Transient errors are retried, permanent ones are not."""
+        assert RetryPolicy().is_retryable("GET", error) is retryable
+
+    def test_post_is_opt_in(self):
+        """POST is only retried when the policy allows it."""
+        error = server_error(503)
+
+        assert not RetryPolicy().is_retryable("POST", error)
+        assert RetryPolicy(retry_methods={"GET", "post"}).is_retryable("POST", error)
+
+    def test_connection_timeout_retried_for_any_method(self):
+        """A request that never connected is safe to send again."""
+        assert RetryPolicy().is_retryable("POST", ConnectionTimeoutError("slow"))
+
+    def test_should_retry_respects_attempts_and_budget(self):
+        """No retry after the last attempt or once the budget is spent."""
+        policy = RetryPolicy(max_attempts=3, budget=RetryBudget(capacity=1))
+        error = server_error()
+
+        assert not policy.should_retry("GET", error, attempt=3)
+        assert policy.should_retry("GET", error, attempt=1)
+        assert not policy.should_retry("GET", error, attempt=2)
+
+    @pytest.mark.parametrize("attempt", [1, 2, 3, 10])
+    def test_full_jitter_backoff(self, attempt):
+        """Delays are drawn between 0 and the capped exponential bound."""
+        policy = RetryPolicy(backoff=1.0, max_backoff=5.0)
+        ceiling = min(5.0, 2 ** (attempt - 1))
+
+        delays = [policy.delay(attempt, server_error(500)) for _ in range(200)]
+
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert max(delays) > ceiling / 2
+
+    def test_retry_after_sets_delay(self):
+        """429 and 503 responses wait for Retry-After, capped."""
+        policy = RetryPolicy(max_retry_after=60)
+
+        assert policy.delay(1, server_error(503, {"Retry-After": "7"})) == 7.0
+        assert policy.delay(1, server_error(503, {"retry-after": "600"})) == 60.0
+        assert (
+            policy.delay(
+                1, ClientError("x", 429, response_headers={"Retry-After": "3"})
+            )
+            == 3.0
+        )
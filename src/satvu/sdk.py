@@ -1,12 +1,37 @@
-from satvu.auth import AuthService, TokenCache
-from satvu.http import HttpClient
+from collections.abc import Sequence
+
+from satvu.auth import (
+    DEFAULT_REFRESH_SKEW,
+    AsyncAuthService,
+    AuthService,
+    TokenCache,
+)
+from satvu.cache import ResponseCache
+from satvu.circuit import CircuitBreakers
+from satvu.coalesce import RequestCoalescer
+from satvu.http import AsyncHttpClient, HttpClient
+from satvu.http.pool import AsyncConnectionPool, ConnectionPool
+from satvu.ratelimit import RateLimits
+from satvu.retry import RetryPolicy
 from satvu.services.catalog.api import CatalogService
+from satvu.services.catalog.async_api import AsyncCatalogService
 from satvu.services.cos.api import CosService
+from satvu.services.cos.async_api import AsyncCosService
 from satvu.services.id.api import IdService
+from satvu.services.id.async_api import AsyncIdService
 from satvu.services.otm.api import OtmService
+from satvu.services.otm.async_api import AsyncOtmService
 from satvu.services.policy.api import PolicyService
+from satvu.services.policy.async_api import AsyncPolicyService
 from satvu.services.reseller.api import ResellerService
+from satvu.services.reseller.async_api import AsyncResellerService
 from satvu.services.wallet.api import WalletService
+from satvu.services.wallet.async_api import AsyncWalletService
+from satvu.telemetry import RequestHooks
+from satvu.throttle import BandwidthLimiter
+
+SERVICES = ("catalog", "cos", "id", "otm", "policy", "reseller", "wallet")
+"""Names of the API services of an SDK."""
 
 
 class SatVuSDK:
@@ -22,6 +47,15 @@ class SatVuSDK:
         timeout: int = 30,
         max_retry_attempts: int = 5,
         max_retry_after_seconds: float = 300.0,
+        token_refresh_skew: float = DEFAULT_REFRESH_SKEW,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        connection_pool: ConnectionPool | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        rate_limits: RateLimits | None = None,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        hooks: Sequence[RequestHooks] | None = None,
     ):
         """
         Initialize the SatVuSDK.
@@ -34,7 +68,32 @@ class SatVuSDK:
         :param timeout: request timeout in seconds, defaults to 30 seconds
         :param max_retry_attempts: maximum number of retry attempts, default 5
         :param max_retry_after_seconds: maximum seconds to wait for Retry-After, default 300 seconds
+        :param token_refresh_skew: seconds before expiry at which the access token is refreshed, default 60 seconds
+        :param retry_policy: policy for retrying failed requests, shared by all services
+            so they draw on one retry budget. Defaults to one built from
+            max_retry_attempts and max_retry_after_seconds.
+        :param circuit_breakers: circuit breakers shared by all services, failing
+            requests to unhealthy endpoints fast. Disabled by default.
+        :param connection_pool: connection pool shared by all services, so that
+            they reuse each other's connections. Cannot be combined with
+            http_client. The pool is not closed by the SDK.
+        :param bandwidth_limiter: limiter capping the combined rate of all
+            downloads to disk, shared fairly between them. Unlimited by default.
+        :param rate_limits: client-side request rate limits shared by all
+            services, smoothing bursts before they reach the APIs. Disabled
+            by default.
+        :param response_cache: cache of GET responses shared by all services,
+            scoped to client_id so that clients never see each other's
+            responses. Disabled by default.
+        :param request_coalescer: lets identical GET requests made while one
+            is in flight share its result, scoped to client_id. Disabled by
+            default.
+        :param hooks: observers told about every request of all services,
+            with timings of its phases, e.g. OpenTelemetryHooks or
+            PrometheusHooks
         """
+        if http_client is not None and connection_pool is not None:
+            raise ValueError("Pass either http_client or connection_pool, not both")
         self.client_id = client_id
         self.client_secret = client_secret
         self.token_cache = token_cache
@@ -43,6 +102,24 @@ class SatVuSDK:
         self.timeout = timeout
         self.max_retry_attempts = max_retry_attempts
         self.max_retry_after_seconds = max_retry_after_seconds
+        self.token_refresh_skew = token_refresh_skew
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=max_retry_attempts,
+            max_retry_after=max_retry_after_seconds,
+        )
+        self.circuit_breakers = circuit_breakers
+        self.connection_pool = connection_pool
+        self.bandwidth_limiter = bandwidth_limiter
+        self.rate_limits = rate_limits
+        self.response_cache = (
+            response_cache.scoped(client_id) if response_cache is not None else None
+        )
+        self.request_coalescer = (
+            request_coalescer.scoped(client_id)
+            if request_coalescer is not None
+            else None
+        )
+        self.hooks = hooks
 
         # for lazy service initialisation
         self._auth = None
@@ -58,6 +135,21 @@ class SatVuSDK:
         """Get authentication token, unwrapping the Result or raising on error."""
         return self.auth.token(self.client_id, self.client_secret).unwrap()
 
+    def warmup(self, services: Sequence[str] | None = None) -> None:
+        """
+        Build the response parsers of services ahead of their first requests.
+
+        Parsers are otherwise built as each endpoint returns its first
+        response, adding a few milliseconds to it. Call this at startup, e.g.
+        while a serverless function initialises, to take that cost out of the
+        first requests.
+
+        :param services: names of the services to warm up, e.g. ["otm"],
+            defaults to all of them
+        """
+        for name in services or SERVICES:
+            getattr(self, name).warmup()
+
     @property
     def auth(self) -> AuthService:
         if not self._auth:
@@ -66,6 +158,8 @@ class SatVuSDK:
                 token_cache=self.token_cache,
                 http_client=self.http_client,
                 timeout=self.timeout,
+                refresh_skew=self.token_refresh_skew,
+                connection_pool=self.connection_pool,
             )
         return self._auth
 
@@ -79,6 +173,14 @@ class SatVuSDK:
                 timeout=self.timeout,
                 max_retry_attempts=self.max_retry_attempts,
                 max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
             )
         return self._catalog
 
@@ -92,6 +194,14 @@ class SatVuSDK:
                 timeout=self.timeout,
                 max_retry_attempts=self.max_retry_attempts,
                 max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
             )
         return self._cos
 
@@ -105,6 +215,14 @@ class SatVuSDK:
                 timeout=self.timeout,
                 max_retry_attempts=self.max_retry_attempts,
                 max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
             )
         return self._id
 
@@ -118,6 +236,14 @@ class SatVuSDK:
                 timeout=self.timeout,
                 max_retry_attempts=self.max_retry_attempts,
                 max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
             )
         return self._otm
 
@@ -131,6 +257,14 @@ class SatVuSDK:
                 timeout=self.timeout,
                 max_retry_attempts=self.max_retry_attempts,
                 max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
             )
         return self._policy
 
@@ -144,6 +278,14 @@ class SatVuSDK:
                 timeout=self.timeout,
                 max_retry_attempts=self.max_retry_attempts,
                 max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
             )
         return self._reseller
 
@@ -157,5 +299,319 @@ class SatVuSDK:
                 timeout=self.timeout,
                 max_retry_attempts=self.max_retry_attempts,
                 max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
+            )
+        return self._wallet
+
+
+class AsyncSatVuSDK:
+    """
+    Asynchronous unified client for accessing SatVu's API services.
+
+    Every service method is a coroutine and every ``*_iter`` paginator is an
+    async generator. Use it as an async context manager, or call ``aclose()``,
+    to release pooled connections.
+
+    Example:
+        >>> async with AsyncSatVuSDK(client_id, client_secret) as sdk:
+        ...     results = await sdk.catalog.get_search(contract_id=contract_id)
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        env: str | None = None,
+        token_cache: TokenCache | None = None,
+        http_client: AsyncHttpClient | None = None,
+        timeout: int = 30,
+        max_retry_attempts: int = 5,
+        max_retry_after_seconds: float = 300.0,
+        token_refresh_skew: float = DEFAULT_REFRESH_SKEW,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        connection_pool: AsyncConnectionPool | None = None,
+        bandwidth_limiter: BandwidthLimiter | None = None,
+        rate_limits: RateLimits | None = None,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        hooks: Sequence[RequestHooks] | None = None,
+    ):
+        """
+        Initialize the AsyncSatVuSDK.
+
+        :param client_id: the client ID for authentication
+        :param client_secret: the client secret for authentication
+        :param env: the environment to use
+        :param token_cache: the token cache to use
+        :param http_client: the async HTTP client to use
+        :param timeout: request timeout in seconds, defaults to 30 seconds
+        :param max_retry_attempts: maximum number of retry attempts, default 5
+        :param max_retry_after_seconds: maximum seconds to wait for Retry-After, default 300 seconds
+        :param token_refresh_skew: seconds before expiry at which the access token is refreshed, default 60 seconds
+        :param retry_policy: policy for retrying failed requests, shared by all services
+            so they draw on one retry budget. Defaults to one built from
+            max_retry_attempts and max_retry_after_seconds.
+        :param circuit_breakers: circuit breakers shared by all services, failing
+            requests to unhealthy endpoints fast. Disabled by default.
+        :param connection_pool: connection pool shared by all services, so that
+            they reuse each other's connections. Cannot be combined with
+            http_client. The pool is not closed by the SDK.
+        :param bandwidth_limiter: limiter capping the combined rate of all
+            downloads to disk, shared fairly between them. Unlimited by default.
+        :param rate_limits: client-side request rate limits shared by all
+            services, smoothing bursts before they reach the APIs. Disabled
+            by default.
+        :param response_cache: cache of GET responses shared by all services,
+            scoped to client_id so that clients never see each other's
+            responses. Disabled by default.
+        :param request_coalescer: lets identical GET requests made while one
+            is in flight share its result, scoped to client_id. Disabled by
+            default.
+        :param hooks: observers told about every request of all services,
+            with timings of its phases, e.g. OpenTelemetryHooks or
+            PrometheusHooks
+        """
+        if http_client is not None and connection_pool is not None:
+            raise ValueError("Pass either http_client or connection_pool, not both")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token_cache = token_cache
+        self.env = env
+        self.http_client = http_client
+        self.timeout = timeout
+        self.max_retry_attempts = max_retry_attempts
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self.token_refresh_skew = token_refresh_skew
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=max_retry_attempts,
+            max_retry_after=max_retry_after_seconds,
+        )
+        self.circuit_breakers = circuit_breakers
+        self.connection_pool = connection_pool
+        self.bandwidth_limiter = bandwidth_limiter
+        self.rate_limits = rate_limits
+        self.response_cache = (
+            response_cache.scoped(client_id) if response_cache is not None else None
+        )
+        self.request_coalescer = (
+            request_coalescer.scoped(client_id)
+            if request_coalescer is not None
+            else None
+        )
+        self.hooks = hooks
+
+        # for lazy service initialisation
+        self._auth = None
+        self._catalog = None
+        self._cos = None
+        self._id = None
+        self._otm = None
+        self._policy = None
+        self._reseller = None
+        self._wallet = None
+
+    async def __aenter__(self) -> "AsyncSatVuSDK":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients of all services created so far."""
+        for service in (
+            self._auth,
+            self._catalog,
+            self._cos,
+            self._id,
+            self._otm,
+            self._policy,
+            self._reseller,
+            self._wallet,
+        ):
+            if service is not None:
+                await service.aclose()
+
+    async def get_token(self) -> str:
+        """Get authentication token, unwrapping the Result or raising on error."""
+        result = await self.auth.token(self.client_id, self.client_secret)
+        return result.unwrap()
+
+    def warmup(self, services: Sequence[str] | None = None) -> None:
+        """
+        Build the response parsers of services, see SatVuSDK.warmup().
+
+        No requests are made, so this is not a coroutine.
+
+        :param services: names of the services to warm up, e.g. ["otm"],
+            defaults to all of them
+        """
+        for name in services or SERVICES:
+            getattr(self, name).warmup()
+
+    @property
+    def auth(self) -> AsyncAuthService:
+        if not self._auth:
+            self._auth = AsyncAuthService(
+                env=self.env,
+                token_cache=self.token_cache,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                refresh_skew=self.token_refresh_skew,
+                connection_pool=self.connection_pool,
+            )
+        return self._auth
+
+    @property
+    def catalog(self) -> AsyncCatalogService:
+        if not self._catalog:
+            self._catalog = AsyncCatalogService(
+                env=self.env,
+                get_token=self.get_token,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                max_retry_attempts=self.max_retry_attempts,
+                max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
+            )
+        return self._catalog
+
+    @property
+    def cos(self) -> AsyncCosService:
+        if not self._cos:
+            self._cos = AsyncCosService(
+                env=self.env,
+                get_token=self.get_token,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                max_retry_attempts=self.max_retry_attempts,
+                max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
+            )
+        return self._cos
+
+    @property
+    def id(self) -> AsyncIdService:
+        if not self._id:
+            self._id = AsyncIdService(
+                env=self.env,
+                get_token=self.get_token,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                max_retry_attempts=self.max_retry_attempts,
+                max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
+            )
+        return self._id
+
+    @property
+    def otm(self) -> AsyncOtmService:
+        if not self._otm:
+            self._otm = AsyncOtmService(
+                env=self.env,
+                get_token=self.get_token,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                max_retry_attempts=self.max_retry_attempts,
+                max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
+            )
+        return self._otm
+
+    @property
+    def policy(self) -> AsyncPolicyService:
+        if not self._policy:
+            self._policy = AsyncPolicyService(
+                env=self.env,
+                get_token=self.get_token,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                max_retry_attempts=self.max_retry_attempts,
+                max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
+            )
+        return self._policy
+
+    @property
+    def reseller(self) -> AsyncResellerService:
+        if not self._reseller:
+            self._reseller = AsyncResellerService(
+                env=self.env,
+                get_token=self.get_token,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                max_retry_attempts=self.max_retry_attempts,
+                max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
+            )
+        return self._reseller
+
+    @property
+    def wallet(self) -> AsyncWalletService:
+        if not self._wallet:
+            self._wallet = AsyncWalletService(
+                env=self.env,
+                get_token=self.get_token,
+                http_client=self.http_client,
+                timeout=self.timeout,
+                max_retry_attempts=self.max_retry_attempts,
+                max_retry_after_seconds=self.max_retry_after_seconds,
+                retry_policy=self.retry_policy,
+                circuit_breakers=self.circuit_breakers,
+                connection_pool=self.connection_pool,
+                bandwidth_limiter=self.bandwidth_limiter,
+                rate_limits=self.rate_limits,
+                response_cache=self.response_cache,
+                request_coalescer=self.request_coalescer,
+                hooks=self.hooks,
             )
         return self._wallet
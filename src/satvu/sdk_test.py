@@ -1,7 +1,19 @@
 """Tests for the SatVuSDK main entry point."""
 
-from satvu.auth import MemoryCache
-from satvu.sdk import SatVuSDK
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from satvu.auth import AsyncAuthService, MemoryCache
+from satvu.cache import ResponseCache
+from satvu.coalesce import RequestCoalescer
+from satvu.http.httpx_adapter import AsyncHttpxAdapter, HttpxAdapter
+from satvu.http.pool import AsyncConnectionPool, ConnectionPool
+from satvu.ratelimit import RateLimits
+from satvu.result import Ok
+from satvu.sdk import SERVICES, AsyncSatVuSDK, SatVuSDK
+from satvu.throttle import BandwidthLimiter
 
 
 class TestSatVuSDKInit:
@@ -140,3 +152,201 @@ class TestConfigPropagation:
             token_cache=cache,
         )
         assert sdk.auth.cache is cache
+
+    def test_bandwidth_limiter_shared_by_services(self):
+        """One bandwidth limiter caps downloads of every service."""
+        limiter = BandwidthLimiter(10 * 1024 * 1024)
+        sdk = SatVuSDK(
+            client_id="test_id",
+            client_secret="test_secret",  # pragma: allowlist secret
+            bandwidth_limiter=limiter,
+        )
+        assert sdk.cos.bandwidth_limiter is limiter
+        assert sdk.otm.bandwidth_limiter is limiter
+
+    def test_rate_limits_shared_by_services(self):
+        """One set of rate limits paces requests of every service."""
+        limits = RateLimits(rate=10)
+        sdk = SatVuSDK(
+            client_id="test_id",
+            client_secret="test_secret",  # pragma: allowlist secret
+            rate_limits=limits,
+        )
+        assert sdk.catalog.rate_limits is limits
+        assert sdk.otm.rate_limits is limits
+
+    def test_response_cache_scoped_to_client(self):
+        """Services share one cache view, private to the SDK's client ID."""
+        cache = ResponseCache()
+        sdk = SatVuSDK(
+            client_id="test_id",
+            client_secret="test_secret",  # pragma: allowlist secret
+            response_cache=cache,
+        )
+        other = SatVuSDK(
+            client_id="other_id",
+            client_secret="test_secret",  # pragma: allowlist secret
+            response_cache=cache,
+        )
+        assert sdk.id.response_cache is sdk.wallet.response_cache
+        assert sdk.id.response_cache is not None
+        assert other.id.response_cache is not None
+        assert sdk.id.response_cache.identity != other.id.response_cache.identity
+
+    def test_request_coalescer_scoped_to_client(self):
+        coalescer = RequestCoalescer()
+        sdk = SatVuSDK(
+            client_id="test_id",
+            client_secret="test_secret",  # pragma: allowlist secret
+            request_coalescer=coalescer,
+        )
+        assert sdk.catalog.request_coalescer is sdk.cos.request_coalescer
+        assert sdk.catalog.request_coalescer is not None
+        assert sdk.catalog.request_coalescer.identity != coalescer.identity
+
+
+class TestWarmup:
+    """Tests for building response parsers ahead of requests."""
+
+    def test_warms_up_all_services(self):
+        sdk = SatVuSDK(
+            client_id="test_id", client_secret="test_secret"
+        )  # pragma: allowlist secret
+        services = {name: MagicMock() for name in SERVICES}
+        for name, service in services.items():
+            setattr(sdk, f"_{name}", service)
+
+        sdk.warmup()
+
+        for service in services.values():
+            service.warmup.assert_called_once_with()
+
+    def test_warms_up_given_services(self):
+        sdk = AsyncSatVuSDK(
+            client_id="test_id", client_secret="test_secret"
+        )  # pragma: allowlist secret
+
+        sdk.warmup(["otm"])
+
+        assert sdk._otm is not None
+        assert sdk._catalog is None
+
+
+class TestConnectionPool:
+    """Tests for sharing a connection pool between services."""
+
+    def test_services_share_pool(self):
+        """All services send through the pool's client with their own base URL."""
+        with ConnectionPool("httpx") as pool:
+            sdk = SatVuSDK(
+                client_id="test_id",
+                client_secret="test_secret",  # pragma: allowlist secret
+                env="qa",
+                connection_pool=pool,
+            )
+            assert isinstance(sdk.auth.client, HttpxAdapter)
+            assert isinstance(sdk.catalog.client, HttpxAdapter)
+            assert isinstance(sdk.otm.client, HttpxAdapter)
+            clients = [sdk.auth.client, sdk.catalog.client, sdk.otm.client]
+
+            assert all(client.client is pool._client for client in clients)
+            assert sdk.catalog.client.base_url == sdk.catalog.base_url.rstrip("/")
+            assert sdk.auth.client.get_token is None
+            assert sdk.catalog.client.get_token == sdk.get_token
+
+    def test_transfer_client_has_no_token(self):
+        """Signed download URLs are fetched through the pool without a token."""
+        with ConnectionPool("httpx") as pool:
+            sdk = SatVuSDK(
+                client_id="test_id",
+                client_secret="test_secret",  # pragma: allowlist secret
+                connection_pool=pool,
+            )
+            transfer = sdk.catalog.transfer_client
+
+            assert isinstance(transfer, HttpxAdapter)
+            assert transfer.client is pool._client
+            assert transfer.get_token is None
+
+    def test_pool_and_http_client_are_exclusive(self):
+        with (
+            ConnectionPool("httpx") as pool,
+            pytest.raises(ValueError, match="http_client or connection_pool"),
+        ):
+            SatVuSDK(
+                client_id="test_id",
+                client_secret="test_secret",  # pragma: allowlist secret
+                http_client=MagicMock(),
+                connection_pool=pool,
+            )
+
+
+class TestAsyncSatVuSDK:
+    """Tests for AsyncSatVuSDK."""
+
+    def test_services_lazy_and_cached(self):
+        """Async services are created on first access and cached."""
+        sdk = AsyncSatVuSDK(
+            client_id="test_id", client_secret="test_secret"
+        )  # pragma: allowlist secret
+        assert sdk._catalog is None
+        catalog = sdk.catalog
+        assert catalog is sdk.catalog
+        assert isinstance(sdk.auth, AsyncAuthService)
+
+    def test_config_propagated(self):
+        """Timeout and retry configuration reach async services."""
+        sdk = AsyncSatVuSDK(
+            client_id="test_id",
+            client_secret="test_secret",  # pragma: allowlist secret
+            timeout=120,
+            max_retry_attempts=10,
+        )
+        assert sdk.auth.timeout == 120
+        assert sdk.catalog.timeout == 120
+        assert sdk.catalog.max_retry_attempts == 10
+
+    def test_context_manager_closes_services(self):
+        """Leaving the async context closes the services' HTTP clients."""
+
+        async def use_sdk():
+            async with AsyncSatVuSDK(
+                client_id="test_id", client_secret="test_secret"
+            ) as sdk:  # pragma: allowlist secret
+                catalog = sdk.catalog
+            return catalog
+
+        catalog = asyncio.run(use_sdk())
+        assert isinstance(catalog.client, AsyncHttpxAdapter)
+        assert catalog.client.client.is_closed
+
+    def test_get_token_uses_auth_service(self):
+        """get_token awaits the async auth service and unwraps the result."""
+        sdk = AsyncSatVuSDK(
+            client_id="test_id", client_secret="test_secret"
+        )  # pragma: allowlist secret
+        sdk._auth = MagicMock()
+        sdk._auth.token = AsyncMock(return_value=Ok("token"))
+
+        assert asyncio.run(sdk.get_token()) == "token"
+        sdk._auth.token.assert_awaited_once_with("test_id", "test_secret")
+
+    def test_shared_pool_outlives_sdk(self):
+        """Closing the SDK leaves a shared connection pool open."""
+
+        async def use_sdk():
+            async with AsyncConnectionPool(http2=False) as pool:
+                async with AsyncSatVuSDK(
+                    client_id="test_id",
+                    client_secret="test_secret",  # pragma: allowlist secret
+                    connection_pool=pool,
+                ) as sdk:
+                    client = sdk.catalog.client
+                    transfer = sdk.catalog.transfer_client
+                    assert isinstance(client, AsyncHttpxAdapter)
+                    assert isinstance(transfer, AsyncHttpxAdapter)
+                    assert client.client is pool._client
+                    assert transfer.get_token is None
+                return pool._client.is_closed
+
+        assert asyncio.run(use_sdk()) is False
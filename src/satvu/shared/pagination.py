@@ -0,0 +1,223 @@
+"""
+Page and item iteration for the generated ``*_iter`` and ``*_items`` methods.
+
+Pages are fetched by following the ``next`` token of each page. With
+``prefetch`` enabled, the following pages are fetched in the background
+while the caller processes the current one, so network latency and
+per-page processing overlap instead of adding up.
+"""
+
+import asyncio
+import contextlib
+import queue
+import threading
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+)
+from typing import Any, TypeVar
+
+PageT = TypeVar("PageT")
+
+_DONE = object()
+
+
+class _Failure:
+    """An exception raised while fetching, re-raised where the page is consumed."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _pages(
+    fetch_page: Callable[[str | None], PageT],
+    next_token: Callable[[PageT], str | None],
+    max_pages: int | None,
+) -> Generator[PageT, None, None]:
+    token = None
+    page_count = 0
+    while not max_pages or page_count < max_pages:
+        page = fetch_page(token)
+        page_count += 1
+        yield page
+        token = next_token(page)
+        if not token:
+            break
+
+
+def paginate(
+    fetch_page: Callable[[str | None], PageT],
+    next_token: Callable[[PageT], str | None],
+    *,
+    max_pages: int | None = None,
+    prefetch: int = 0,
+) -> Generator[PageT, None, None]:
+    """
+    Yield pages, optionally fetching up to ``prefetch`` pages ahead.
+
+    Args:
+        fetch_page: Fetches the page for a token (None for the first page)
+        next_token: Extracts the next token from a page, None on the last page
+        max_pages: Stop after this many pages (default: unlimited)
+        prefetch: Number of pages to buffer ahead on a background thread.
+            0 fetches each page only when the caller asks for it.
+
+    Yields:
+        Pages in order. An exception raised while fetching a page is
+        re-raised when the caller reaches that page. Closing the generator
+        stops the background thread before it fetches another page.
+    """
+    if prefetch <= 0:
+        yield from _pages(fetch_page, next_token, max_pages)
+        return
+
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Poll so a closed consumer never leaves the worker blocked on a full buffer
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker() -> None:
+        try:
+            for page in _pages(fetch_page, next_token, max_pages):
+                if not put(page) or stop.is_set():
+                    return
+        except BaseException as exc:
+            put(_Failure(exc))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=worker, name="satvu-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+async def _apages(
+    fetch_page: Callable[[str | None], Awaitable[PageT]],
+    next_token: Callable[[PageT], str | None],
+    max_pages: int | None,
+) -> AsyncGenerator[PageT, None]:
+    token = None
+    page_count = 0
+    while not max_pages or page_count < max_pages:
+        page = await fetch_page(token)
+        page_count += 1
+        yield page
+        token = next_token(page)
+        if not token:
+            break
+
+
+async def apaginate(
+    fetch_page: Callable[[str | None], Awaitable[PageT]],
+    next_token: Callable[[PageT], str | None],
+    *,
+    max_pages: int | None = None,
+    prefetch: int = 0,
+) -> AsyncGenerator[PageT, None]:
+    """
+    Async counterpart of paginate(); prefetching runs as a task on the event loop.
+    """
+    if prefetch <= 0:
+        async for page in _apages(fetch_page, next_token, max_pages):
+            yield page
+        return
+
+    buffer: asyncio.Queue[Any] = asyncio.Queue(maxsize=prefetch)
+
+    async def worker() -> None:
+        try:
+            async for page in _apages(fetch_page, next_token, max_pages):
+                await buffer.put(page)
+        except Exception as exc:
+            await buffer.put(_Failure(exc))
+            return
+        await buffer.put(_DONE)
+
+    task = asyncio.ensure_future(worker())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def iter_items(
+    pages: Iterator[Any], items_field: str, *, max_items: int | None = None
+) -> Generator[Any, None, None]:
+    """
+    Yield the items of each page in turn, stopping after ``max_items``.
+
+    Only the current page (plus any prefetched pages) is held in memory. The
+    page iterator is closed once the cap is reached, so no further pages are
+    requested.
+
+    Args:
+        pages: Page iterator, typically from a ``*_iter`` method
+        items_field: Name of the page attribute holding the items
+        max_items: Stop after this many items (default: unlimited)
+    """
+    count = 0
+    try:
+        if max_items is not None and max_items <= 0:
+            return
+        for page in pages:
+            for item in getattr(page, items_field, None) or []:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        close = getattr(pages, "close", None)
+        if close is not None:
+            close()
+
+
+async def aiter_items(
+    pages: AsyncIterator[Any], items_field: str, *, max_items: int | None = None
+) -> AsyncGenerator[Any, None]:
+    """Async counterpart of iter_items()."""
+    count = 0
+    try:
+        if max_items is not None and max_items <= 0:
+            return
+        async for page in pages:
+            for item in getattr(page, items_field, None) or []:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        aclose = getattr(pages, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+__all__ = ["aiter_items", "apaginate", "iter_items", "paginate"]
@@ -0,0 +1,204 @@
+"""Tests for page and item iteration helpers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from satvu.shared.pagination import aiter_items, apaginate, iter_items, paginate
+
+
+def make_pages(count: int, fail_at: int | None = None):
+    """Pages are ints; page N's next token is "N+1" until ``count`` pages."""
+    fetched = []
+
+    def fetch_page(token):
+        page = int(token or 0)
+        if page == fail_at:
+            raise RuntimeError(f"page {page} failed")
+        fetched.append(page)
+        return page
+
+    def next_token(page):
+        return str(page + 1) if page + 1 < count else None
+
+    return fetch_page, next_token, fetched
+
+
+class TestPaginate:
+    """Tests for paginate()."""
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_yields_all_pages_in_order(self, prefetch):
+        """Pages follow next tokens until the last page."""
+        fetch_page, next_token, _ = make_pages(5)
+
+        pages = paginate(fetch_page, next_token, prefetch=prefetch)
+
+        assert list(pages) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_max_pages(self, prefetch):
+        """No more than max_pages pages are fetched."""
+        fetch_page, next_token, fetched = make_pages(10)
+
+        pages = list(paginate(fetch_page, next_token, max_pages=3, prefetch=prefetch))
+
+        assert pages == [0, 1, 2]
+        assert fetched == [0, 1, 2]
+
+    def test_prefetch_overlaps_processing(self):
+        """The next page is fetched while the caller holds the current one."""
+        second_fetched = threading.Event()
+        fetch_page, next_token, _ = make_pages(3)
+
+        def fetch(token):
+            page = fetch_page(token)
+            if page == 1:
+                second_fetched.set()
+            return page
+
+        pages = paginate(fetch, next_token, prefetch=1)
+
+        assert next(pages) == 0
+        assert second_fetched.wait(timeout=5)
+        pages.close()
+
+    def test_error_is_raised_at_consumption(self):
+        """A failed fetch is raised after the pages before it are yielded."""
+        fetch_page, next_token, _ = make_pages(5, fail_at=2)
+        pages = paginate(fetch_page, next_token, prefetch=2)
+
+        assert next(pages) == 0
+        assert next(pages) == 1
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            next(pages)
+
+    def test_close_stops_prefetching(self):
+        """Closing the generator stops the background fetches."""
+        fetch_page, next_token, fetched = make_pages(1000)
+        pages = paginate(fetch_page, next_token, prefetch=2)
+
+        next(pages)
+        pages.close()
+        count = len(fetched)
+        threading.Event().wait(0.3)
+
+        assert len(fetched) <= count + 1
+        assert len(fetched) < 10
+
+
+class TestAPaginate:
+    """Tests for apaginate()."""
+
+    @staticmethod
+    def collect(prefetch: int, **kwargs):
+        fetch_page, next_token, _ = make_pages(**kwargs)
+
+        async def fetch(token):
+            return fetch_page(token)
+
+        async def run():
+            return [
+                page async for page in apaginate(fetch, next_token, prefetch=prefetch)
+            ]
+
+        return asyncio.run(run())
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_yields_all_pages_in_order(self, prefetch):
+        """Pages follow next tokens until the last page."""
+        assert self.collect(prefetch, count=4) == [0, 1, 2, 3]
+
+    def test_error_is_raised_at_consumption(self):
+        """A failed fetch is raised from the async iterator."""
+        with pytest.raises(RuntimeError, match="page 1 failed"):
+            self.collect(2, count=4, fail_at=1)
+
+    def test_break_cancels_prefetch(self):
+        """Leaving the loop early cancels the prefetch task."""
+        fetch_page, next_token, fetched = make_pages(1000)
+
+        async def fetch(token):
+            await asyncio.sleep(0)
+            return fetch_page(token)
+
+        async def run():
+            pages = apaginate(fetch, next_token, prefetch=2)
+            async for _page in pages:
+                break
+            await pages.aclose()
+            count = len(fetched)
+            await asyncio.sleep(0.05)
+            return count
+
+        count = asyncio.run(run())
+
+        assert len(fetched) == count
+        assert count < 10
+
+
+class Page:
+    def __init__(self, number: int, size: int = 3):
+        self.number = number
+        self.features = [f"{number}-{i}" for i in range(size)]
+
+
+def feature_pages(count: int):
+    fetched = []
+
+    def pages():
+        for number in range(count):
+            fetched.append(number)
+            yield Page(number)
+
+    return pages(), fetched
+
+
+class TestIterItems:
+    """Tests for iter_items() and aiter_items()."""
+
+    def test_flattens_pages(self):
+        """Items of all pages are yielded in order."""
+        pages, _ = feature_pages(2)
+
+        assert list(iter_items(pages, "features")) == [
+            "0-0",
+            "0-1",
+            "0-2",
+            "1-0",
+            "1-1",
+            "1-2",
+        ]
+
+    def test_max_items_stops_fetching(self):
+        """Pages after the one reaching max_items are never requested."""
+        pages, fetched = feature_pages(100)
+
+        items = list(iter_items(pages, "features", max_items=4))
+
+        assert items == ["0-0", "0-1", "0-2", "1-0"]
+        assert fetched == [0, 1]
+
+    def test_missing_items_field(self):
+        """Pages without items are skipped."""
+        assert list(iter_items(iter([object()]), "features")) == []
+
+    def test_async_max_items(self):
+        """The async variant honours max_items and closes the pages."""
+        closed = []
+
+        async def pages():
+            try:
+                for number in range(100):
+                    yield Page(number)
+            finally:
+                closed.append(True)
+
+        async def run():
+            return [
+                item async for item in aiter_items(pages(), "features", max_items=2)
+            ]
+
+        assert asyncio.run(run()) == ["0-0", "0-1"]
+        assert closed == [True]
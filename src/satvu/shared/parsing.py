@@ -7,15 +7,99 @@ models, and type coercion.
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import Any
 
 from pydantic import TypeAdapter, ValidationError
 
 logger = logging.getLogger(__name__)
 
-# Cache for TypeAdapters to avoid recreating them
-# Key: id of type annotation -> Value: TypeAdapter instance
-_type_adapter_cache: dict[int, TypeAdapter] = {}
+TYPE_ADAPTER_CACHE_SIZE = 512
+"""TypeAdapters kept for annotations parsed without a ResponseAdapter."""
+
+# Least recently used TypeAdapters, keyed by their annotation
+_type_adapter_cache: OrderedDict[Hashable, TypeAdapter] = OrderedDict()
+_type_adapter_lock = threading.Lock()
+
+
+def annotation_key(annotation: Any) -> Hashable | None:
+    """
+    Key identifying an annotation in caches, None if it is unhashable.
+
+    Equal annotations share a key even when created separately, e.g. by
+    Union[A, B] at each call site. Unions compare equal regardless of the
+    order of their members, which changes how they validate, so the repr is
+    part of the key.
+    """
+    if isinstance(annotation, ResponseAdapter):
+        annotation = annotation.annotation
+    if isinstance(annotation, type):
+        return annotation
+    try:
+        hash(annotation)
+    except TypeError:
+        return None
+    return (annotation, repr(annotation))
+
+
+def type_adapter(annotation: Any) -> TypeAdapter:
+    """
+    The TypeAdapter for an annotation, built on first use.
+
+    Adapters are cached for the TYPE_ADAPTER_CACHE_SIZE most recently used
+    annotations.
+    """
+    key = annotation_key(annotation)
+    if key is None:
+        return TypeAdapter(annotation)
+    with _type_adapter_lock:
+        adapter = _type_adapter_cache.get(key)
+        if adapter is not None:
+            _type_adapter_cache.move_to_end(key)
+            return adapter
+
+    logger.debug(f"Creating new TypeAdapter for {annotation}")
+    adapter = TypeAdapter(annotation)
+    with _type_adapter_lock:
+        adapter = _type_adapter_cache.setdefault(key, adapter)
+        while len(_type_adapter_cache) > TYPE_ADAPTER_CACHE_SIZE:
+            _type_adapter_cache.popitem(last=False)
+    return adapter
+
+
+class ResponseAdapter:
+    """
+    The response type of an endpoint, with its TypeAdapter.
+
+    Generated services define one per endpoint response at import, so each
+    call parses through the same adapter. The adapter is built on first use,
+    or ahead of time by warmup().
+
+    Example:
+        >>> ORDER = ResponseAdapter(Union[SimpleOrder, ResellerOrder])
+        >>> parse_response(data, ORDER)
+    """
+
+    __slots__ = ("_adapter", "annotation")
+
+    def __init__(self, annotation: Any):
+        self.annotation = annotation
+        self._adapter: TypeAdapter | None = None
+
+    @property
+    def adapter(self) -> TypeAdapter:
+        self.warmup()
+        return self._adapter  # type: ignore[return-value]
+
+    def warmup(self) -> None:
+        """Build the TypeAdapter now rather than on the first response."""
+        if self._adapter is None:
+            self._adapter = type_adapter(self.annotation)
+
+    def __repr__(self) -> str:
+        return f"ResponseAdapter({self.annotation!r})"
 
 
 def parse_response(
@@ -34,7 +118,8 @@ def parse_response(
 
     Args:
         data: Raw JSON-like data (dict, list, or primitive)
-        annotation: Target type annotation (Union[...], list[...], BaseModel, etc.)
+        annotation: Target type annotation (Union[...], list[...], BaseModel, etc.),
+            or a ResponseAdapter holding one
 
     Returns:
         Parsed object matching the annotation type
@@ -60,18 +145,11 @@ def parse_response(
         >>> result.amount == 200  # Coerced to int
         True
     """
-    # Use annotation's id as cache key (safe because types are immutable)
-    cache_key = id(annotation)
-
-    # Get or create TypeAdapter for this annotation
-    if cache_key not in _type_adapter_cache:
-        logger.debug(f"Creating new TypeAdapter for {annotation}")
-        adapter = TypeAdapter(annotation)
-        _type_adapter_cache[cache_key] = adapter
+    if isinstance(annotation, ResponseAdapter):
+        adapter = annotation.adapter
+        annotation = annotation.annotation
     else:
-        logger.debug(f"TypeAdapter cache hit for {annotation}")
-
-    adapter = _type_adapter_cache[cache_key]
+        adapter = type_adapter(annotation)
 
     try:
         # Let Pydantic handle everything: validation, coercion, Union resolution
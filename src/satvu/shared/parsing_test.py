@@ -13,7 +13,9 @@ from typing import Union
 import pytest
 from pydantic import BaseModel, Field
 
+from satvu.shared import parsing
 from satvu.shared.parsing import (
+    ResponseAdapter,
     _type_adapter_cache,
     parse_response,
 )
@@ -249,6 +251,65 @@ class TestCaching:
 
         assert len(_type_adapter_cache) == 2
 
+    def test_recreated_union_reuses_cache_entry(self):
+        """Unions created at each call site should share one TypeAdapter"""
+        data = {"id": "O1", "name": "Test", "amount": 100}
+
+        parse_response(data, Union[SimpleOrder, ResellerOrder])
+        parse_response(data, Union[SimpleOrder, ResellerOrder])
+
+        assert len(_type_adapter_cache) == 1
+
+    def test_union_member_order_is_kept(self):
+        """Unions differing only in member order should not share a TypeAdapter"""
+        parse_response(1, Union[int, str])
+        parse_response(1, Union[str, int])
+
+        assert len(_type_adapter_cache) == 2
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Should evict the least recently used TypeAdapter when full"""
+        monkeypatch.setattr(parsing, "TYPE_ADAPTER_CACHE_SIZE", 2)
+
+        parse_response(1, int)
+        parse_response("a", str)
+        parse_response(1, int)
+        parse_response(1.0, float)
+
+        assert list(_type_adapter_cache) == [int, float]
+
+
+class TestResponseAdapter:
+    """Tests for precomputed response adapters"""
+
+    def setup_method(self):
+        _type_adapter_cache.clear()
+
+    def test_parses_annotation(self):
+        """Should parse into its annotation"""
+        adapter = ResponseAdapter(Union[SimpleOrder, ResellerOrder])
+
+        result = parse_response({"id": "O1", "name": "Test", "amount": 1}, adapter)
+
+        assert isinstance(result, SimpleOrder)
+
+    def test_builds_type_adapter_once(self):
+        """Should build its TypeAdapter lazily and keep it"""
+        adapter = ResponseAdapter(SimpleOrder)
+        assert adapter._adapter is None
+
+        adapter.warmup()
+        built = adapter.adapter
+        parse_response({"id": "O1", "name": "Test", "amount": 1}, adapter)
+
+        assert adapter.adapter is built
+        assert len(_type_adapter_cache) == 1
+
+    def test_errors_name_annotation(self):
+        """Validation errors should name the annotation, not the adapter"""
+        with pytest.raises(ValueError, match="Failed to parse data as <class"):
+            parse_response({}, ResponseAdapter(SimpleOrder))
+
 
 # ============================================================================
 # Test Error Handling
@@ -0,0 +1,222 @@
+"""
+Incremental parsing of the item array in large JSON responses.
+
+Search responses are objects such as STAC FeatureCollections, whose bulk is a
+single array field (``features``). Rather than decoding the whole body to
+text and then to a dict tree, the stream decodes one array element at a time
+as bytes arrive, so peak memory is proportional to one item. The object's
+other members (``links``, ``context``, ...) are collected in ``fields``.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[,\]}\s]")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _ValueScanner:
+    """
+    Finds where one JSON value ends in a growing buffer.
+
+    Scanning resumes where the previous call stopped, so a large value
+    arriving over many chunks is only scanned once.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.pos: int | None = None
+        self.depth = 0
+        self.in_string = False
+
+    def shift(self, offset: int) -> None:
+        if self.pos is not None:
+            self.pos -= offset
+
+    def scan(self, buf: str, start: int, final: bool) -> int | None:
+        """Return the end index of the value at ``start``, or None if incomplete."""
+        if self.pos is None and buf[start] not in '{["':
+            match = _SCALAR_END.search(buf, start)
+            if match:
+                return match.start()
+            return len(buf) if final else None
+
+        pos = start if self.pos is None else self.pos
+        while True:
+            if self.in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    self.pos = len(buf)
+                    return None
+                if match.group() == "\\":
+                    if match.end() >= len(buf):
+                        # The escaped character has not arrived yet
+                        self.pos = match.start()
+                        return None
+                    pos = match.end() + 1
+                    continue
+                self.in_string = False
+                pos = match.end()
+                if self.depth == 0:
+                    return pos
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                self.pos = len(buf)
+                return None
+            char, pos = match.group(), match.end()
+            if char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    return pos
+
+
+class _ArrayFieldParser:
+    """Push parser yielding the elements of one array member of a JSON object."""
+
+    def __init__(self, field: str):
+        self.field = field
+        self.fields: dict[str, Any] = {}
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._key: str | None = None
+        self._scanner = _ValueScanner()
+
+    def feed(self, text: str, final: bool = False) -> list[Any]:
+        """Add decoded text and return the array elements completed by it."""
+        # Drop everything already parsed so the buffer holds at most one value
+        self._scanner.shift(self._pos)
+        buf = self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        items: list[Any] = []
+
+        while True:
+            pos = _WHITESPACE.match(buf, self._pos).end()  # type: ignore[union-attr]
+            self._pos = pos
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+
+            if self._state == "start":
+                self._expect(char, "{")
+                self._pos, self._state = pos + 1, "key"
+            elif self._state == "key":
+                if char == "}":
+                    self._pos, self._state = pos + 1, "done"
+                elif char == ",":
+                    self._pos = pos + 1
+                else:
+                    self._expect(char, '"')
+                    key = self._value(buf, pos, final)
+                    if key is _INCOMPLETE:
+                        break
+                    self._key, self._state = key, "colon"
+            elif self._state == "colon":
+                self._expect(char, ":")
+                self._pos, self._state = pos + 1, "value"
+            elif self._state == "value":
+                if self._key == self.field and char == "[":
+                    self._pos, self._state = pos + 1, "items"
+                    continue
+                value = self._value(buf, pos, final)
+                if value is _INCOMPLETE:
+                    break
+                self.fields[str(self._key)] = value
+                self._state = "key"
+            elif self._state == "items":
+                if char == "]":
+                    self._pos, self._state = pos + 1, "key"
+                elif char == ",":
+                    self._pos = pos + 1
+                else:
+                    item = self._value(buf, pos, final)
+                    if item is _INCOMPLETE:
+                        break
+                    items.append(item)
+            else:
+                raise ValueError(f"Unexpected data after JSON object: {char!r}")
+
+        if final and self._state != "done":
+            raise ValueError("Incomplete JSON object")
+        return items
+
+    def _value(self, buf: str, pos: int, final: bool) -> Any:
+        end = self._scanner.scan(buf, pos, final)
+        if end is None:
+            return _INCOMPLETE
+        self._scanner.reset()
+        self._pos = end
+        return json.loads(buf[pos:end])
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"Expected {expected!r}, found {char!r}")
+
+
+_INCOMPLETE = object()
+
+
+class JsonArrayStream:
+    """
+    Iterate the elements of ``field`` in a JSON object read from byte chunks.
+
+    Elements are yielded as plain Python values as soon as each one is
+    complete. The object's other members are available in ``fields`` once
+    iteration has finished.
+
+    Example:
+        >>> stream = JsonArrayStream(response.iter_bytes(65536), "features")
+        >>> for feature in stream:
+        ...     print(feature["id"])
+        >>> stream.fields["links"]
+    """
+
+    def __init__(self, chunks: Iterable[bytes], field: str):
+        self._chunks = chunks
+        self._parser = _ArrayFieldParser(field)
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        return self._parser.fields
+
+    def __iter__(self) -> Iterator[Any]:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in self._chunks:
+            yield from self._parser.feed(decoder.decode(chunk))
+        yield from self._parser.feed(decoder.decode(b"", final=True), final=True)
+
+
+class AsyncJsonArrayStream:
+    """Async counterpart of JsonArrayStream, reading from an async byte iterator."""
+
+    def __init__(self, chunks: AsyncIterable[bytes], field: str):
+        self._chunks = chunks
+        self._parser = _ArrayFieldParser(field)
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        return self._parser.fields
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        async for chunk in self._chunks:
+            for item in self._parser.feed(decoder.decode(chunk)):
+                yield item
+        for item in self._parser.feed(decoder.decode(b"", final=True), final=True):
+            yield item
+
+
+__all__ = ["AsyncJsonArrayStream", "JsonArrayStream"]
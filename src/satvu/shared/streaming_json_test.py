@@ -0,0 +1,109 @@
+"""Tests for incremental JSON array parsing."""
+
+import asyncio
+import json
+
+import pytest
+
+from satvu.shared.streaming_json import AsyncJsonArrayStream, JsonArrayStream
+
+DOCUMENT = {
+    "type": "FeatureCollection",
+    "features": [
+        {"id": "a", "properties": {"tags": ["x", "y"], "cloud": 0.5}},
+        {"id": 'quote " and \\ backslash', "nested": [[1, 2], {"k": "}]"}]},
+        {"id": "unicode é中\U0001f6f0", "value": None},
+        42,
+        "plain",
+        True,
+        -1.5e3,
+    ],
+    "links": [{"rel": "next", "href": "https://example.com/?token=abc"}],
+    "context": {"returned": 7},
+}
+
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonArrayStream:
+    """Tests for JsonArrayStream."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+    def test_matches_json_loads(self, size):
+        """Items and fields match a full parse for any chunking."""
+        data = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+        stream = JsonArrayStream(chunked(data, size), "features")
+
+        assert list(stream) == DOCUMENT["features"]
+        assert stream.fields == {
+            "type": "FeatureCollection",
+            "links": DOCUMENT["links"],
+            "context": {"returned": 7},
+        }
+
+    def test_pretty_printed(self):
+        """Whitespace between tokens is skipped."""
+        data = json.dumps(DOCUMENT, indent=4).encode()
+
+        assert (
+            list(JsonArrayStream(chunked(data, 5), "features")) == DOCUMENT["features"]
+        )
+
+    def test_items_yielded_before_body_ends(self):
+        """Each item is available as soon as its bytes have arrived."""
+        received = []
+
+        def chunks():
+            yield b'{"features": [{"id": 1}, '
+            received.append("second chunk")
+            yield b'{"id": 2}]}'
+
+        items = iter(JsonArrayStream(chunks(), "features"))
+
+        assert next(items) == {"id": 1}
+        assert received == []
+        assert next(items) == {"id": 2}
+
+    def test_missing_field(self):
+        """Objects without the field yield nothing and keep other fields."""
+        stream = JsonArrayStream([b'{"links": []}'], "features")
+
+        assert list(stream) == []
+        assert stream.fields == {"links": []}
+
+    def test_field_that_is_not_an_array(self):
+        """A non-array value for the field is kept in fields."""
+        stream = JsonArrayStream([b'{"features": null}'], "features")
+
+        assert list(stream) == []
+        assert stream.fields == {"features": None}
+
+    @pytest.mark.parametrize(
+        "data",
+        [b'{"features": [{"id": 1}', b"[1, 2]", b'{"features": [1]} trailing', b""],
+    )
+    def test_invalid_documents(self, data):
+        """Truncated or malformed bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            list(JsonArrayStream([data], "features"))
+
+
+def test_async_stream():
+    """AsyncJsonArrayStream yields the same items from an async iterator."""
+    data = json.dumps(DOCUMENT).encode()
+
+    async def chunks():
+        for chunk in chunked(data, 3):
+            yield chunk
+
+    async def run():
+        stream = AsyncJsonArrayStream(chunks(), "features")
+        return [item async for item in stream], stream.fields
+
+    items, fields = asyncio.run(run())
+
+    assert items == DOCUMENT["features"]
+    assert fields["links"] == DOCUMENT["links"]
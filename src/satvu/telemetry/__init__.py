@@ -0,0 +1,16 @@
+"""
+Observability of the SatVu SDK's requests.
+
+RequestHooks receive request events and phase timings. Exporters for
+OpenTelemetry (satvu.telemetry.otel) and Prometheus (satvu.telemetry.prometheus)
+are optional extras.
+"""
+
+from satvu.telemetry.hooks import (
+    RequestEnd,
+    RequestHooks,
+    RequestInfo,
+    ResponseRead,
+)
+
+__all__ = ["RequestEnd", "RequestHooks", "RequestInfo", "ResponseRead"]
@@ -0,0 +1,315 @@
+"""
+Hooks observing the requests of SDK services.
+
+Pass RequestHooks to SatVuSDK to be told when each request starts, is retried
+and finishes, and when its response body has been read, with the time spent
+in each phase:
+
+- connect: establishing a new connection (DNS, TCP and TLS)
+- ttfb: from sending the request to its response headers
+- download: reading the response body
+- decode: decoding the body as JSON
+- validation: validating the JSON into models
+"""
+
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from satvu.cache import CachedResponse
+from satvu.http.buffers import aclose_response, close_response
+from satvu.http.errors import HttpError, HttpStatusError
+from satvu.http.protocol import HttpResponse
+from satvu.http.trace import RequestTrace, tracing
+from satvu.result import Ok, Result, is_err
+from satvu.shared.parsing import parse_response
+
+logger = logging.getLogger(__name__)
+
+_request_ids = itertools.count(1)
+
+
+class RequestInfo(BaseModel):
+    """A request made by an SDK service."""
+
+    id: int = Field(default_factory=lambda: next(_request_ids))
+    """Unique within the process, to match up the events of a request."""
+    service: str
+    """API of the request, e.g. "otm"."""
+    endpoint: str
+    """Method and route template, e.g. "GET /otm/v2/{contract_id}/tasking/orders/"."""
+    method: str
+    url: str
+
+
+class RequestEnd(BaseModel):
+    """Outcome and timings of a finished request, in seconds."""
+
+    status_code: int | None
+    """Status of the response, None for transport errors."""
+    error: str | None
+    """Type of the error, e.g. "ReadTimeoutError", None on success."""
+    attempts: int
+    """Requests sent, 0 if answered from the cache or by another caller's request."""
+    duration: float
+    connect: float | None
+    ttfb: float | None
+    download: float | None
+    """Set if the HTTP backend read the body before returning the response."""
+
+
+class ResponseRead(BaseModel):
+    """Size of a response body and the time spent reading it, in seconds."""
+
+    status_code: int
+    bytes: int
+    download: float
+    decode: float | None
+    """Time decoding JSON, None if the body was not decoded."""
+    validation: float | None
+    """Time validating models, None if the body was not parsed into models."""
+
+
+class RequestHooks:
+    """
+    Receives the events of an SDK's requests.
+
+    Subclass it and override the events you need; the default implementations
+    do nothing. Hooks are called on the thread or task making the request, so
+    they should be quick. Exceptions they raise are logged, not propagated.
+
+    Example:
+        >>> class SlowRequests(RequestHooks):
+        ...     def request_finished(self, request, end):
+        ...         if end.duration > 5:
+        ...             print(f"{request.endpoint} took {end.duration:.1f}s")
+        >>> sdk = SatVuSDK(client_id, client_secret, hooks=[SlowRequests()])
+    """
+
+    def request_started(self, request: RequestInfo) -> None:
+        """A request is about to be sent (or looked up in the cache)."""
+
+    def request_retried(
+        self,
+        request: RequestInfo,
+        attempt: int,
+        delay: float,
+        error: HttpError | None,
+    ) -> None:
+        """
+        Attempt ``attempt`` failed with ``error`` (None for a 202 Accepted
+        with Retry-After) and is retried after ``delay`` seconds.
+        """
+
+    def request_finished(self, request: RequestInfo, end: RequestEnd) -> None:
+        """A request returned a response or gave up with an error."""
+
+    def response_read(self, request: RequestInfo, read: ResponseRead) -> None:
+        """The body of a successful request's response has been read."""
+
+
+class RequestObservation:
+    """Tells hooks about one call of SDKClient.make_request()."""
+
+    def __init__(self, hooks: Sequence[RequestHooks], request: RequestInfo):
+        self.hooks = hooks
+        self.request = request
+        self.attempts = 0
+        self.trace: RequestTrace | None = None
+        self._started = time.perf_counter()
+        self.emit("request_started")
+
+    def emit(self, event: str, *args: Any) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(self.request, *args)
+            except Exception:
+                logger.exception(f"{type(hook).__name__}.{event} failed")
+
+    @contextmanager
+    def attempt(self) -> Iterator[RequestTrace]:
+        """Trace one attempt at sending the request."""
+        self.attempts += 1
+        with tracing() as trace:
+            self.trace = trace
+            yield trace
+
+    def retried(self, attempt: int, delay: float, error: HttpError | None) -> None:
+        self.emit("request_retried", attempt, delay, error)
+
+    def finish(
+        self, result: Result[HttpResponse, HttpError]
+    ) -> Result[HttpResponse, HttpError]:
+        """Report a request's result, observing how its body is read."""
+        status_code = None
+        error = result.error() if is_err(result) else None
+        if error is None:
+            status_code = result.unwrap().status_code
+        elif isinstance(error, HttpStatusError):
+            status_code = error.status_code
+        trace = self.trace
+        self.emit(
+            "request_finished",
+            RequestEnd(
+                status_code=status_code,
+                error=error.error_type() if error is not None else None,
+                attempts=self.attempts,
+                duration=time.perf_counter() - self._started,
+                connect=trace.connect if trace else None,
+                ttfb=trace.ttfb if trace else None,
+                download=trace.download if trace else None,
+            ),
+        )
+        if is_err(result):
+            return result
+        return Ok(ObservedResponse(result.unwrap(), self))
+
+
+class ObservedResponse:
+    """
+    A response that reports to hooks how long reading and parsing it took.
+
+    Conforms to the HttpResponse and AsyncHttpResponse protocols of the
+    response it wraps.
+    """
+
+    def __init__(self, response: HttpResponse, observation: RequestObservation):
+        self.response = response
+        self._observation = observation
+        self._bytes = 0
+        self._download = observation.trace.download if observation.trace else None
+        self._reading = 0.0
+        self._reported = False
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return self.response.headers
+
+    @property
+    def body(self) -> bytes:
+        body = self._read_body()
+        self._report()
+        return body
+
+    def iter_bytes(self, chunk_size: int = 8192) -> Iterator[bytes]:
+        chunks = self.response.iter_bytes(chunk_size)
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            self._reading += time.perf_counter() - started
+            if chunk is None:
+                self._report()
+                return
+            self._bytes += len(chunk)
+            yield chunk
+
+    async def aiter_bytes(self, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+        chunks = self.response.aiter_bytes(chunk_size)  # type: ignore[attr-defined]
+        while True:
+            started = time.perf_counter()
+            chunk = await anext(chunks, None)
+            self._reading += time.perf_counter() - started
+            if chunk is None:
+                self._report()
+                return
+            self._bytes += len(chunk)
+            yield chunk
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        started = time.perf_counter()
+        n = self.response.readinto(buffer)
+        self._reading += time.perf_counter() - started
+        self._bytes += n
+        if n == 0:
+            self._report()
+        return n
+
+    def iter_into(self, buffer: bytearray | memoryview) -> Iterator[memoryview]:
+        chunks = self.response.iter_into(buffer)
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            self._reading += time.perf_counter() - started
+            if chunk is None:
+                self._report()
+                return
+            self._bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        close_response(self.response)
+
+    async def aclose(self) -> None:
+        await aclose_response(self.response)
+
+    @property
+    def text(self):
+        self._read_body()
+        return self.response.text
+
+    def json(self):
+        self._read_body()
+        started = time.perf_counter()
+        result = self.response.json()
+        self._report(decode=time.perf_counter() - started)
+        return result
+
+    def parse(self, annotation: Any) -> Any:
+        """Parse the JSON body into ``annotation``, timing each step."""
+        self._read_body()
+        response = self.response
+        if isinstance(response, CachedResponse):
+            started = time.perf_counter()
+            parsed = response.parsed(annotation)
+            self._report(validation=time.perf_counter() - started)
+            return parsed
+        started = time.perf_counter()
+        data = response.json().unwrap()
+        decoded = time.perf_counter()
+        parsed = parse_response(data, annotation)
+        self._report(decode=decoded - started, validation=time.perf_counter() - decoded)
+        return parsed
+
+    def _read_body(self) -> bytes:
+        started = time.perf_counter()
+        body = self.response.body
+        if not self._bytes:
+            self._reading += time.perf_counter() - started
+            self._bytes = len(body)
+        return body
+
+    def _report(
+        self, decode: float | None = None, validation: float | None = None
+    ) -> None:
+        if self._reported:
+            return
+        self._reported = True
+        self._observation.emit(
+            "response_read",
+            ResponseRead(
+                status_code=self.response.status_code,
+                bytes=self._bytes,
+                download=(self._download or 0.0) + self._reading,
+                decode=decode,
+                validation=validation,
+            ),
+        )
+
+
+__all__ = [
+    "ObservedResponse",
+    "RequestEnd",
+    "RequestHooks",
+    "RequestInfo",
+    "RequestObservation",
+    "ResponseRead",
+]
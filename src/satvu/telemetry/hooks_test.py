@@ -0,0 +1,164 @@
+"""Tests for request hooks."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from satvu.cache import ResponseCache
+from satvu.http.errors import ServerError
+from satvu.http.trace import current_trace
+from satvu.result import Err, Ok
+from satvu.retry import RetryPolicy
+from satvu.telemetry import RequestHooks
+
+
+class Item(BaseModel):
+    id: str
+
+
+ITEM = {"id": "a"}
+
+
+class Recorder(RequestHooks):
+    def __init__(self):
+        self.events = []
+
+    def request_started(self, request):
+        self.events.append(("started", request))
+
+    def request_retried(self, request, attempt, delay, error):
+        self.events.append(("retried", attempt, error))
+
+    def request_finished(self, request, end):
+        self.events.append(("finished", end))
+
+    def response_read(self, request, read):
+        self.events.append(("read", read))
+
+    def names(self):
+        return [event[0] for event in self.events]
+
+
+@pytest.fixture
+def make_client(make_client):
+    """Clients with a Recorder hook, returned together with the Recorder."""
+
+    def make(*results, **options):
+        hooks = Recorder()
+        options.setdefault("hooks", [hooks])
+        return make_client(*results, **options), hooks
+
+    return make
+
+
+class TestSDKClient:
+    def test_events(self, make_client, make_response):
+        client, hooks = make_client(Ok(make_response(ITEM)))
+
+        response = client.make_request("GET", "/c1/orders/o1", route="/{c}/orders/{o}")
+        item = client.parse_json(response.unwrap(), Item)
+
+        assert item == Item(id="a")
+        assert hooks.names() == ["started", "finished", "read"]
+        request = hooks.events[0][1]
+        assert request.service == "otm"
+        assert request.endpoint == "GET /otm/v2/{c}/orders/{o}"
+        end = hooks.events[1][1]
+        assert (end.status_code, end.error, end.attempts) == (200, None, 1)
+        read = hooks.events[2][1]
+        assert read.bytes == 11
+        assert read.decode is not None
+        assert read.validation is not None
+
+    def test_retries(self, make_client):
+        error = ServerError("Unavailable", status_code=503)
+        client, hooks = make_client(
+            Err(error),
+            Err(error),
+            retry_policy=RetryPolicy(max_attempts=2, backoff=0),
+        )
+
+        client.make_request("GET", "/orders")
+
+        assert hooks.names() == ["started", "retried", "finished"]
+        assert hooks.events[1][1:] == (1, error)
+        end = hooks.events[2][1]
+        assert (end.status_code, end.error, end.attempts) == (
+            503,
+            "ServerError",
+            2,
+        )
+
+    def test_streamed_body(self, make_client, make_response):
+        client, hooks = make_client(Ok(make_response(ITEM)))
+
+        response = client.make_request("GET", "/orders").unwrap()
+        assert b"".join(response.iter_bytes(4)) == b'{"id": "a"}'
+
+        read = hooks.events[-1][1]
+        assert (read.bytes, read.decode, read.validation) == (11, None, None)
+
+    def test_cached_response(self, make_client, make_response):
+        client, hooks = make_client(
+            Ok(make_response(ITEM)), response_cache=ResponseCache()
+        )
+        client.make_request("GET", "/orders")
+
+        client.make_request("GET", "/orders")
+
+        assert hooks.events[-1][1].attempts == 0
+
+    def test_attempts_are_traced(self, make_client, make_response):
+        traces = []
+
+        def request(*args, **kwargs):
+            traces.append(current_trace())
+            return Ok(make_response(ITEM))
+
+        client, hooks = make_client()
+        client.client.request.side_effect = request
+
+        client.make_request("GET", "/orders")
+
+        assert traces[0] is not None
+        assert current_trace() is None
+
+    def test_failing_hook_does_not_fail_request(
+        self, caplog, make_client, make_response
+    ):
+        class Broken(RequestHooks):
+            def request_started(self, request):
+                raise RuntimeError("broken")
+
+        client, _ = make_client(Ok(make_response(ITEM)))
+        client.hooks = [Broken()]
+
+        result = client.make_request("GET", "/orders")
+
+        assert result.is_ok()
+        assert "Broken.request_started failed" in caplog.text
+
+    def test_no_hooks(self, make_client, make_response):
+        response = make_response(ITEM)
+        client, _ = make_client(Ok(response), hooks=None)
+
+        assert client.make_request("GET", "/orders").unwrap() is response
+
+
+def test_async_events(make_async_client, make_response):
+    hooks = Recorder()
+
+    async def request(*args, **kwargs):
+        return Ok(make_response(ITEM))
+
+    async def run():
+        http_client = MagicMock()
+        http_client.request = request
+        client = make_async_client(http_client, hooks=[hooks])
+        response = await client.make_request("GET", "/orders")
+        return client.parse_json(response.unwrap(), Item)
+
+    assert asyncio.run(run()) == Item(id="a")
+    assert hooks.names() == ["started", "finished", "read"]
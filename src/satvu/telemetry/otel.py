@@ -0,0 +1,133 @@
+"""OpenTelemetry spans for the SDK's requests."""
+
+import threading
+import time
+from collections import OrderedDict
+from contextvars import Token
+from typing import Any
+
+try:
+    from opentelemetry import context, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError as exc:
+    raise ImportError(
+        "opentelemetry-api is required to use OpenTelemetryHooks. "
+        'Install it with: pip install "satvu[otel]"'
+    ) from exc
+
+from satvu.http.errors import HttpError
+from satvu.telemetry.hooks import RequestEnd, RequestHooks, RequestInfo, ResponseRead
+
+READ_SPANS = 1024
+"""Finished requests remembered to parent the span reading their response."""
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """
+    Records each request as a client span, and reading its response as a
+    child span.
+
+    Request spans are named after the endpoint, e.g.
+    "GET /otm/v2/{contract_id}/tasking/orders/", and carry the status code,
+    number of attempts and the connect and TTFB timings. Retries are span
+    events. The "satvu.read" child span holds the response size and the
+    download, decode and validation timings.
+
+    Example:
+        >>> sdk = SatVuSDK(client_id, client_secret, hooks=[OpenTelemetryHooks()])
+    """
+
+    def __init__(self, tracer_provider: Any = None):
+        """
+        Args:
+            tracer_provider: TracerProvider to create spans with, defaults to
+                the global one
+        """
+        self.tracer = trace.get_tracer("satvu", tracer_provider=tracer_provider)
+        self._spans: dict[int, tuple[Any, Token[context.Context]]] = {}
+        self._finished: OrderedDict[int, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def request_started(self, request: RequestInfo) -> None:
+        span = self.tracer.start_span(
+            request.endpoint,
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.request.method": request.method,
+                "url.path": request.url,
+                "satvu.service": request.service,
+                "satvu.endpoint": request.endpoint,
+            },
+        )
+        # Make the span current, so spans of instrumented HTTP libraries nest in it
+        token = context.attach(trace.set_span_in_context(span))
+        with self._lock:
+            self._spans[request.id] = (span, token)
+
+    def request_retried(
+        self,
+        request: RequestInfo,
+        attempt: int,
+        delay: float,
+        error: HttpError | None,
+    ) -> None:
+        with self._lock:
+            span, _ = self._spans.get(request.id, (None, None))
+        if span is not None:
+            span.add_event(
+                "retry",
+                {
+                    "satvu.attempt": attempt,
+                    "satvu.delay": delay,
+                    "error.type": error.error_type() if error else "Accepted",
+                },
+            )
+
+    def request_finished(self, request: RequestInfo, end: RequestEnd) -> None:
+        with self._lock:
+            started = self._spans.pop(request.id, None)
+        if started is None:
+            return
+        span, token = started
+        context.detach(token)
+        attributes = {
+            "satvu.attempts": end.attempts,
+            "satvu.connect": end.connect,
+            "satvu.ttfb": end.ttfb,
+        }
+        if end.status_code is not None:
+            attributes["http.response.status_code"] = end.status_code
+        if end.error is not None:
+            attributes["error.type"] = end.error
+            span.set_status(Status(StatusCode.ERROR, end.error))
+        span.set_attributes({k: v for k, v in attributes.items() if v is not None})
+        span.end()
+        if end.error is None:
+            with self._lock:
+                self._finished[request.id] = span.get_span_context()
+                while len(self._finished) > READ_SPANS:
+                    self._finished.popitem(last=False)
+
+    def response_read(self, request: RequestInfo, read: ResponseRead) -> None:
+        with self._lock:
+            parent = self._finished.pop(request.id, None)
+        if parent is None:
+            return
+        elapsed = read.download + (read.decode or 0.0) + (read.validation or 0.0)
+        now = time.time_ns()
+        attributes = {
+            "satvu.bytes": read.bytes,
+            "satvu.download": read.download,
+            "satvu.decode": read.decode,
+            "satvu.validation": read.validation,
+        }
+        span = self.tracer.start_span(
+            "satvu.read",
+            context=trace.set_span_in_context(trace.NonRecordingSpan(parent)),
+            start_time=now - int(elapsed * 1e9),
+            attributes={k: v for k, v in attributes.items() if v is not None},
+        )
+        span.end(end_time=now)
+
+
+__all__ = ["OpenTelemetryHooks"]
@@ -0,0 +1,62 @@
+"""Tests for OpenTelemetry spans."""
+
+import pytest
+from pydantic import BaseModel
+
+from satvu.http.errors import ServerError
+from satvu.result import Err, Ok
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+export = pytest.importorskip("opentelemetry.sdk.trace.export")
+in_memory = pytest.importorskip(
+    "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+)
+otel = pytest.importorskip("satvu.telemetry.otel")
+
+
+class Item(BaseModel):
+    id: str
+
+
+@pytest.fixture
+def exporter():
+    return in_memory.InMemorySpanExporter()
+
+
+@pytest.fixture
+def make_client(make_client, exporter):
+    """Clients tracing into the in-memory exporter."""
+
+    def make(*results):
+        provider = sdk_trace.TracerProvider()
+        provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+        return make_client(
+            *results, hooks=[otel.OpenTelemetryHooks(tracer_provider=provider)]
+        )
+
+    return make
+
+
+def test_request_and_read_spans(exporter, make_client, make_response):
+    client = make_client(Ok(make_response({"id": "a"})))
+
+    result = client.make_request("GET", "/c1/orders", route="/{contract_id}/orders")
+    client.parse_json(result.unwrap(), Item)
+
+    request, read = sorted(exporter.get_finished_spans(), key=lambda s: s.start_time)
+    assert request.name == "GET /otm/v2/{contract_id}/orders"
+    assert request.attributes["http.response.status_code"] == 200
+    assert request.attributes["satvu.service"] == "otm"
+    assert read.name == "satvu.read"
+    assert read.parent.span_id == request.context.span_id
+    assert read.attributes["satvu.bytes"] == 11
+
+
+def test_error_status(exporter, make_client):
+    client = make_client(Err(ServerError("Down", status_code=500)))
+
+    client.make_request("POST", "/c1/orders", json={})
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == otel.StatusCode.ERROR
+    assert span.attributes["error.type"] == "ServerError"
@@ -0,0 +1,134 @@
+"""Prometheus metrics of the SDK's requests."""
+
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    from prometheus_client import REGISTRY, Counter, Histogram
+except ImportError as exc:
+    raise ImportError(
+        "prometheus-client is required to use PrometheusHooks. "
+        'Install it with: pip install "satvu[prometheus]"'
+    ) from exc
+
+from satvu.http.errors import HttpError
+from satvu.telemetry.hooks import RequestEnd, RequestHooks, RequestInfo, ResponseRead
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Histogram buckets in seconds."""
+
+
+def _status(status_code: int | None, error: str | None) -> str:
+    return str(status_code) if status_code is not None else error or ""
+
+
+class PrometheusHooks(RequestHooks):
+    """
+    Records request durations and phase timings as Prometheus histograms.
+
+    Metrics, labelled with service, endpoint and status (the status code, or
+    the error type if there was no response):
+
+    - ``satvu_request_duration_seconds``: time until the response or error
+    - ``satvu_request_phase_seconds``: time per phase, labelled
+      connect, ttfb, download, decode or validation
+    - ``satvu_request_retries_total``: retried attempts
+    - ``satvu_response_bytes_total``: bytes of response bodies read
+
+    Create one instance per registry, as the metrics are registered with it.
+
+    Example:
+        >>> from prometheus_client import start_http_server
+        >>> start_http_server(9100)
+        >>> sdk = SatVuSDK(client_id, client_secret, hooks=[PrometheusHooks()])
+    """
+
+    def __init__(
+        self,
+        registry: Any = REGISTRY,
+        namespace: str = "satvu",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+            registry: CollectorRegistry to register the metrics with
+            namespace: Prefix of the metric names
+            buckets: Histogram buckets in seconds
+        """
+        labels = ["service", "endpoint", "status"]
+        self.duration = Histogram(
+            "request_duration_seconds",
+            "Duration of SatVu API requests",
+            labels,
+            namespace=namespace,
+            registry=registry,
+            buckets=buckets,
+        )
+        self.phases = Histogram(
+            "request_phase_seconds",
+            "Time spent in each phase of SatVu API requests",
+            [*labels, "phase"],
+            namespace=namespace,
+            registry=registry,
+            buckets=buckets,
+        )
+        self.retries = Counter(
+            "request_retries",
+            "Retried attempts of SatVu API requests",
+            ["service", "endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.bytes = Counter(
+            "response_bytes",
+            "Bytes of SatVu API response bodies read",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def request_retried(
+        self,
+        request: RequestInfo,
+        attempt: int,
+        delay: float,
+        error: HttpError | None,
+    ) -> None:
+        self.retries.labels(request.service, request.endpoint).inc()
+
+    def request_finished(self, request: RequestInfo, end: RequestEnd) -> None:
+        labels = (
+            request.service,
+            request.endpoint,
+            _status(end.status_code, end.error),
+        )
+        self.duration.labels(*labels).observe(end.duration)
+        for phase in ("connect", "ttfb"):
+            seconds = getattr(end, phase)
+            if seconds is not None:
+                self.phases.labels(*labels, phase).observe(seconds)
+
+    def response_read(self, request: RequestInfo, read: ResponseRead) -> None:
+        labels = (request.service, request.endpoint, str(read.status_code))
+        self.bytes.labels(*labels).inc(read.bytes)
+        for phase in ("download", "decode", "validation"):
+            seconds = getattr(read, phase)
+            if seconds is not None:
+                self.phases.labels(*labels, phase).observe(seconds)
+
+
+__all__ = ["DEFAULT_BUCKETS", "PrometheusHooks"]
@@ -0,0 +1,71 @@
+"""Tests for Prometheus metrics."""
+
+import pytest
+
+from satvu.http.errors import ReadTimeoutError
+from satvu.result import Err, Ok
+from satvu.retry import RetryPolicy
+
+prometheus_client = pytest.importorskip("prometheus_client")
+prometheus = pytest.importorskip("satvu.telemetry.prometheus")
+
+
+@pytest.fixture
+def registry():
+    return prometheus_client.CollectorRegistry()
+
+
+@pytest.fixture
+def make_client(make_client, registry):
+    """Clients recording metrics into the test registry."""
+
+    def make(*results, **options):
+        return make_client(
+            *results, hooks=[prometheus.PrometheusHooks(registry=registry)], **options
+        )
+
+    return make
+
+
+def test_histograms(registry, make_client, make_response):
+    client = make_client(Ok(make_response()))
+
+    result = client.make_request("GET", "/c1/orders", route="/{contract_id}/orders")
+    assert result.unwrap().body == b"{}"
+
+    labels = {
+        "service": "otm",
+        "endpoint": "GET /otm/v2/{contract_id}/orders",
+        "status": "200",
+    }
+    assert (
+        registry.get_sample_value("satvu_request_duration_seconds_count", labels) == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "satvu_request_phase_seconds_count", {**labels, "phase": "download"}
+        )
+        == 1
+    )
+    assert registry.get_sample_value("satvu_response_bytes_total", labels) == 2
+
+
+def test_errors_and_retries(registry, make_client):
+    error = ReadTimeoutError("Timed out")
+    client = make_client(
+        Err(error),
+        Err(error),
+        retry_policy=RetryPolicy(max_attempts=2, backoff=0),
+    )
+
+    client.make_request("GET", "/orders")
+
+    endpoint = {"service": "otm", "endpoint": "GET /otm/v2/orders"}
+    assert registry.get_sample_value("satvu_request_retries_total", endpoint) == 1
+    assert (
+        registry.get_sample_value(
+            "satvu_request_duration_seconds_count",
+            {**endpoint, "status": "ReadTimeoutError"},
+        )
+        == 1
+    )
@@ -0,0 +1,205 @@
+"""
+Bandwidth limiting shared by concurrent downloads.
+
+A BandwidthLimiter is a token bucket filled at ``rate`` bytes per second.
+Downloads take tokens for every chunk they read, so the combined rate of all
+downloads drawing from one limiter stays below ``rate`` while API requests
+on the same process are not throttled.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import threading
+import time
+from collections.abc import Callable
+
+MIN_BURST = 64 * 1024
+"""Smallest default bucket size in bytes (64 KiB)."""
+
+BURST_SECONDS = 0.25
+"""Default bucket size, in seconds of traffic at the configured rate."""
+
+_MAX_WAIT = 0.1
+# Waiters re-check at least this often (seconds), so rate changes apply promptly
+
+
+class BandwidthShare:
+    """
+    One download's draw on a BandwidthLimiter.
+
+    ``received`` counts the bytes granted to the download. It starts at the
+    limiter's current virtual time, so a download that joins late competes
+    evenly with those already running instead of catching up on their bytes.
+    """
+
+    def __init__(self, limiter: "BandwidthLimiter", received: int):
+        self.limiter = limiter
+        self.received = received
+
+    def acquire(self, nbytes: int) -> None:
+        """Block until ``nbytes`` may be read."""
+        self.limiter.acquire(nbytes, self)
+
+    async def acquire_async(self, nbytes: int) -> None:
+        """Wait on the event loop until ``nbytes`` may be read."""
+        await self.limiter.acquire_async(nbytes, self)
+
+
+class BandwidthLimiter:
+    """
+    Cap the combined rate at which downloads read response bodies.
+
+    One limiter can be shared by any number of threads and event loops. Each
+    download draws through its own BandwidthShare, and while downloads wait
+    for tokens, the one that has received the fewest bytes is served first
+    (start-time fair queuing). A download fetching four byte ranges at once
+    therefore gets the same bandwidth as one reading a single stream.
+
+    A chunk larger than the bucket is granted once the bucket is full and
+    leaves it in debt, so the average rate holds for any chunk size.
+
+    Example:
+        limiter = BandwidthLimiter(50 * 1024 * 1024)  # 50 MiB/s
+        sdk = SatVuSDK(client_id, client_secret, bandwidth_limiter=limiter)
+        ...
+        limiter.rate = 10 * 1024 * 1024  # throttle further while running
+    """
+
+    def __init__(self, rate: float | None, burst: int | None = None):
+        """
+        Args:
+            rate: Bytes per second, or None for no limit
+            burst: Bytes that may be read at once after a pause (default:
+                a quarter of a second at ``rate``, at least 64 KiB)
+        """
+        self._validate(rate)
+        self._rate = rate
+        self._burst = burst
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._virtual = 0
+        self._tickets = itertools.count()
+        self._waiting: dict[int, BandwidthShare] = {}
+        # Wake-up callbacks of waiters sleeping on an event loop
+        self._wakers: dict[int, Callable[[], None]] = {}
+
+    @staticmethod
+    def _validate(rate: float | None) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive or None, got {rate}")
+
+    @property
+    def rate(self) -> float | None:
+        """Bytes per second, or None for no limit. Can be changed at any time."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float | None) -> None:
+        self._validate(rate)
+        with self._changed:
+            self._refill()
+            self._rate = rate
+            self._tokens = min(self._tokens, self.burst)
+            self._notify()
+
+    @property
+    def burst(self) -> int:
+        """Bucket size in bytes."""
+        if self._burst is not None:
+            return self._burst
+        return max(int((self._rate or 0) * BURST_SECONDS), MIN_BURST)
+
+    def share(self) -> BandwidthShare:
+        """Start drawing for a new download."""
+        with self._lock:
+            return BandwidthShare(self, self._virtual)
+
+    def acquire(self, nbytes: int, share: BandwidthShare | None = None) -> None:
+        """
+        Block until ``nbytes`` may be read.
+
+        Args:
+            nbytes: Size of the chunk about to be read or just read
+            share: The download's share; a one-off share if None
+        """
+        share = share or self.share()
+        with self._changed:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = share
+            try:
+                while (delay := self._take(ticket, share, nbytes)) > 0:
+                    self._changed.wait(min(delay, _MAX_WAIT))
+            finally:
+                self._waiting.pop(ticket, None)
+
+    async def acquire_async(
+        self, nbytes: int, share: BandwidthShare | None = None
+    ) -> None:
+        """Async counterpart of acquire(), sleeping on the event loop."""
+        share = share or self.share()
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+
+        def wake() -> None:
+            # Wakers may be called from other threads
+            loop.call_soon_threadsafe(woken.set)
+
+        with self._lock:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = share
+            self._wakers[ticket] = wake
+        try:
+            while True:
+                with self._lock:
+                    woken.clear()
+                    delay = self._take(ticket, share, nbytes)
+                if delay <= 0:
+                    return
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(woken.wait(), min(delay, _MAX_WAIT))
+        finally:
+            with self._lock:
+                self._waiting.pop(ticket, None)
+                self._wakers.pop(ticket, None)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._rate is not None:
+            self._tokens = min(
+                self._tokens + (now - self._updated) * self._rate, self.burst
+            )
+        self._updated = now
+
+    def _take(self, ticket: int, share: BandwidthShare, nbytes: int) -> float:
+        """
+        Grant ``nbytes`` to a waiter if it is next in line and tokens remain.
+
+        Must be called with the lock held. Returns 0 once granted, otherwise
+        the seconds to wait before trying again.
+        """
+        self._refill()
+        if self._rate is not None:
+            if self._tokens < min(nbytes, self.burst):
+                return (min(nbytes, self.burst) - self._tokens) / self._rate
+            ahead = min(self._waiting, key=lambda t: (self._waiting[t].received, t))
+            if ahead != ticket:
+                return _MAX_WAIT
+            self._tokens -= nbytes
+        self._virtual = max(self._virtual, share.received)
+        share.received += nbytes
+        del self._waiting[ticket]
+        self._wakers.pop(ticket, None)
+        self._notify()
+        return 0.0
+
+    def _notify(self) -> None:
+        """Wake all waiters to check whether they are next. Lock must be held."""
+        self._changed.notify_all()
+        for wake in self._wakers.values():
+            wake()
+
+
+__all__ = ["BandwidthLimiter", "BandwidthShare"]
@@ -0,0 +1,117 @@
+"""Tests for the shared bandwidth limiter."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from satvu.throttle import MIN_BURST, BandwidthLimiter
+
+CHUNK = 16 * 1024
+
+
+def drain(limiter: BandwidthLimiter, total: int, share=None) -> float:
+    """Acquire ``total`` bytes in chunks and return the seconds it took."""
+    started = time.monotonic()
+    for _ in range(total // CHUNK):
+        limiter.acquire(CHUNK, share)
+    return time.monotonic() - started
+
+
+class TestBandwidthLimiter:
+    def test_caps_rate(self):
+        limiter = BandwidthLimiter(1024 * 1024, burst=CHUNK)
+
+        elapsed = drain(limiter, 16 * CHUNK)
+
+        # The first chunk comes from the full bucket, the rest at 1 MiB/s
+        assert elapsed >= 15 * CHUNK / (1024 * 1024) * 0.9
+
+    def test_unlimited(self):
+        limiter = BandwidthLimiter(None)
+
+        assert drain(limiter, 1000 * CHUNK) < 0.5
+
+    def test_default_burst(self):
+        assert BandwidthLimiter(None).burst == MIN_BURST
+        assert BandwidthLimiter(100 * 1024 * 1024).burst == 25 * 1024 * 1024
+
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_invalid_rate(self, rate):
+        with pytest.raises(ValueError):
+            BandwidthLimiter(rate)
+
+        limiter = BandwidthLimiter(None)
+        with pytest.raises(ValueError):
+            limiter.rate = rate
+
+    def test_chunk_larger_than_burst(self):
+        """Oversized chunks are granted from a full bucket, leaving it in debt."""
+        limiter = BandwidthLimiter(1024 * 1024, burst=CHUNK)
+
+        started = time.monotonic()
+        limiter.acquire(4 * CHUNK)
+        limiter.acquire(CHUNK)
+
+        assert time.monotonic() - started >= 4 * CHUNK / (1024 * 1024) * 0.9
+
+    def test_rate_change_wakes_waiters(self):
+        limiter = BandwidthLimiter(1024, burst=CHUNK)
+        limiter.acquire(CHUNK)
+        done = threading.Event()
+
+        def wait():
+            limiter.acquire(CHUNK)
+            done.set()
+
+        threading.Thread(target=wait).start()
+        time.sleep(0.05)
+        assert not done.is_set()  # would take 16s at 1 KiB/s
+
+        limiter.rate = None
+
+        assert done.wait(1)
+
+    def test_fair_share_between_downloads(self):
+        """A download using four connections gets no more than one using one."""
+        limiter = BandwidthLimiter(4 * 1024 * 1024, burst=CHUNK)
+        wide, narrow = limiter.share(), limiter.share()
+        stop = threading.Event()
+
+        def run(share):
+            while not stop.is_set():
+                limiter.acquire(CHUNK, share)
+
+        threads = [threading.Thread(target=run, args=(wide,)) for _ in range(4)]
+        threads.append(threading.Thread(target=run, args=(narrow,)))
+        for thread in threads:
+            thread.start()
+        time.sleep(0.5)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        assert narrow.received > 0
+        assert abs(wide.received - narrow.received) <= 4 * CHUNK
+
+    def test_late_share_starts_at_virtual_time(self):
+        limiter = BandwidthLimiter(None)
+        early = limiter.share()
+        for _ in range(10):
+            early.acquire(CHUNK)
+
+        late = limiter.share()
+
+        assert late.received == 9 * CHUNK
+
+    def test_acquire_async(self):
+        limiter = BandwidthLimiter(1024 * 1024, burst=CHUNK)
+
+        async def run() -> float:
+            share = limiter.share()
+            started = time.monotonic()
+            await asyncio.gather(*(share.acquire_async(CHUNK) for _ in range(8)))
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 7 * CHUNK / (1024 * 1024) * 0.9